@@ -0,0 +1,174 @@
+"""Benchmark: plex.tv user listing via plexapi vs the streaming parser.
+
+Compares the two ways PlexClient can list an account's friends and home
+users on a synthetic plex.tv response:
+
+- plexapi: MyPlexAccount.users(), then reading home/servers per user
+  (what PlexClient.list_users did before the streaming parser)
+- stream: stream_account_users(), which feeds the response body through
+  an incremental XML parser and builds ExternalUser structs directly
+
+Both paths run against the same in-memory response served through a
+requests.Session subclass, so network time is excluded. Each path runs in
+its own subprocess so peak RSS is not shared between them; the reported
+peak is ru_maxrss growth over a baseline taken after the response body
+has been built.
+
+Usage:
+    uv run python benchmarks/plex_users_listing.py --users 5000 --shares 3
+"""
+
+import argparse
+import gc
+import io
+import json
+import resource
+import subprocess
+import sys
+import time
+from xml.sax.saxutils import quoteattr
+
+from zondarr.media.providers.plex.users_xml import stream_account_users
+
+MACHINE_ID = "benchmark-server"
+
+_ACCOUNT_XML = (
+    b'<user id="1" uuid="admin" username="admin" email="admin@example.com"'
+    b' scrobbleTypes=""><subscription active="0"/><profile/></user>'
+)
+
+
+def build_users_xml(users: int, shares: int) -> bytes:
+    """Build a plex.tv /api/users/ document with `shares` servers per user."""
+    parts = [f'<?xml version="1.0" encoding="UTF-8"?>\n<MediaContainer size="{users}">']
+    for i in range(users):
+        name = quoteattr(f"friend{i}")
+        parts.append(
+            f'<User id="{100000 + i}" title={name} username={name}'
+            f' email="friend{i}@example.com" recommendationsPlaylistId=""'
+            f' thumb="https://plex.tv/users/{i:x}/avatar" protected="0"'
+            f' home="{int(i % 50 == 0)}" allowTuners="0" allowSync="1"'
+            f' allowCameraUpload="0" allowChannels="0" filterAll=""'
+            f' filterMovies="" filterMusic="" filterPhotos="" filterTelevision=""'
+            f' restricted="0">'
+        )
+        for s in range(shares):
+            machine = MACHINE_ID if (i + s) % 3 == 0 else f"other-{s}"
+            parts.append(
+                f'<Server id="{i * 10 + s}" serverId="{s}"'
+                f' machineIdentifier="{machine}" name="Server {s}"'
+                f' lastSeenAt="1700000000" numLibraries="4" allLibraries="0"'
+                f' owned="1" pending="0"/>'
+            )
+        parts.append("</User>")
+    parts.append("</MediaContainer>")
+    return "".join(parts).encode()
+
+
+def _make_account(body: bytes):
+    import requests
+    from plexapi.myplex import MyPlexAccount
+
+    class FakePlexTvSession(requests.Session):
+        def request(self, method, url, *args, **kwargs):
+            response = requests.Response()
+            response.url = url
+            response.status_code = 200
+            response.encoding = "utf-8"
+            response.headers["Content-Type"] = "application/xml; charset=utf-8"
+            if "/api/v2/user" in url:
+                response._content = _ACCOUNT_XML
+            else:
+                response.raw = io.BytesIO(body)
+            return response
+
+    return MyPlexAccount(token="benchmark", session=FakePlexTvSession())  # noqa: S106
+
+
+def list_with_plexapi(account) -> int:
+    count = 0
+    for user in account.users():
+        if user.home:
+            user_type = "home"
+        elif any(s.machineIdentifier == MACHINE_ID for s in user.servers):
+            user_type = "shared"
+        else:
+            user_type = "friend"
+        count += bool(user_type and user.id)
+    return count
+
+
+def list_with_stream(account) -> int:
+    return len(list(stream_account_users(account, machine_id=MACHINE_ID)))
+
+
+def run_worker(path: str, users: int, shares: int, repeat: int) -> dict[str, float]:
+    """Measure one path in this process and return its results."""
+    body = build_users_xml(users, shares)
+    account = _make_account(body)
+    listing = list_with_plexapi if path == "plexapi" else list_with_stream
+    gc.collect()
+
+    baseline_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    timings: list[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        listed = listing(account)
+        timings.append(time.perf_counter() - started)
+        if listed != users:
+            raise SystemExit(f"{path} listed {listed} of {users} users")
+    peak_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    return {
+        "body_mib": len(body) / 2**20,
+        "best_ms": min(timings) * 1000,
+        "median_ms": sorted(timings)[len(timings) // 2] * 1000,
+        "peak_rss_mib": (peak_kib - baseline_kib) / 1024,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    _ = parser.add_argument("--users", type=int, default=5000)
+    _ = parser.add_argument("--shares", type=int, default=3)
+    _ = parser.add_argument("--repeat", type=int, default=5)
+    _ = parser.add_argument("--worker", choices=["plexapi", "stream"])
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_worker(args.worker, args.users, args.shares, args.repeat)))
+        return
+
+    results: dict[str, dict[str, float]] = {}
+    for path in ("plexapi", "stream"):
+        output = subprocess.run(  # noqa: S603
+            [
+                sys.executable,
+                __file__,
+                "--worker",
+                path,
+                f"--users={args.users}",
+                f"--shares={args.shares}",
+                f"--repeat={args.repeat}",
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        results[path] = json.loads(output.strip().splitlines()[-1])
+
+    body_mib = results["stream"]["body_mib"]
+    print(
+        f"{args.users} users, {args.shares} shares each, "
+        f"{body_mib:.1f} MiB response, best of {args.repeat}"
+    )
+    print(f"{'path':<8} {'best ms':>10} {'median ms':>10} {'peak RSS MiB':>13}")
+    for path, result in results.items():
+        print(
+            f"{path:<8} {result['best_ms']:>10.1f} {result['median_ms']:>10.1f}"
+            f" {result['peak_rss_mib']:>13.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""sync run expiry type
+
+Revision ID: 3c1f7a9d2e84
+Revises: 879656e4f2f5
+Create Date: 2026-10-16 09:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# Revision identifiers, used by Alembic.
+revision: str = "3c1f7a9d2e84"
+down_revision: str | None = "879656e4f2f5"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Apply migration changes."""
+    with op.batch_alter_table("sync_runs", schema=None) as batch_op:
+        batch_op.drop_constraint("ck_sync_runs_sync_type", type_="check")
+        batch_op.create_check_constraint(
+            "ck_sync_runs_sync_type",
+            "sync_type IN ('libraries', 'users', 'expiry')",
+        )
+
+
+def downgrade() -> None:
+    """Revert migration changes."""
+    op.execute("DELETE FROM sync_runs WHERE sync_type = 'expiry'")
+    with op.batch_alter_table("sync_runs", schema=None) as batch_op:
+        batch_op.drop_constraint("ck_sync_runs_sync_type", type_="check")
+        batch_op.create_check_constraint(
+            "ck_sync_runs_sync_type",
+            "sync_type IN ('libraries', 'users')",
+        )
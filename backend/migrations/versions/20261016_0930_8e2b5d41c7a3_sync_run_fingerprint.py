@@ -0,0 +1,31 @@
+"""sync run fingerprint
+
+Revision ID: 8e2b5d41c7a3
+Revises: 3c1f7a9d2e84
+Create Date: 2026-10-16 09:30:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# Revision identifiers, used by Alembic.
+revision: str = "8e2b5d41c7a3"
+down_revision: str | None = "3c1f7a9d2e84"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Apply migration changes."""
+    with op.batch_alter_table("sync_runs", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column("fingerprint", sa.String(length=64), nullable=True)
+        )
+
+
+def downgrade() -> None:
+    """Revert migration changes."""
+    with op.batch_alter_table("sync_runs", schema=None) as batch_op:
+        batch_op.drop_column("fingerprint")
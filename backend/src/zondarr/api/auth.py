@@ -25,6 +25,7 @@ from zondarr.repositories.admin import AdminAccountRepository, RefreshTokenRepos
 from zondarr.repositories.app_setting import AppSettingRepository
 from zondarr.services.auth import AuthService
 from zondarr.services.settings import SettingsService
+from zondarr.services.totp import backup_codes_need_regeneration
 
 from .schemas import (
     AdminEmailUpdate,
@@ -370,10 +371,11 @@ class AuthController(Controller):
         service = self._create_auth_service(session)
         onboarding_required, onboarding_step = await service.get_onboarding_status()
 
-        # Look up totp_enabled from the database
+        # Look up TOTP status from the database
         admin_repo = AdminAccountRepository(session)
         admin = await admin_repo.get_by_id(user.id)
         totp_enabled = admin.totp_enabled if admin else False
+        need_regeneration = backup_codes_need_regeneration(admin) if admin else False
 
         return AdminMeResponse(
             id=user.id,
@@ -381,6 +383,7 @@ class AuthController(Controller):
             email=user.email,
             auth_method=user.auth_method,
             totp_enabled=totp_enabled,
+            backup_codes_need_regeneration=need_regeneration,
             onboarding_required=onboarding_required,
             onboarding_step=onboarding_step,
         )
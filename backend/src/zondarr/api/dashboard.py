@@ -2,24 +2,94 @@
 
 Provides a single endpoint that returns counts and recent activity
 across invitations, users, media servers, and sync runs.
+
+All counts come from one conditional-aggregate statement and the activity
+feed from one UNION of lightweight (type, label, timestamp) rows. The
+response is cached per application for a few seconds and dropped as soon
+as any ORM write is committed, so many dashboards polling at once do not
+multiply database load.
 """
 
+import time
 from collections.abc import Sequence
 from datetime import UTC, datetime
+from typing import final
 
 from litestar import Controller, get
-from sqlalchemy import func, or_, select
+from litestar.datastructures import State
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    case,
+    func,
+    literal,
+    or_,
+    select,
+    true,
+    union_all,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
 
 from zondarr.api.schemas import (
     DashboardStatsResponse,
     RecentActivityItem,
 )
+from zondarr.core.database import READ_ONLY_SESSION, write_generation
 from zondarr.models.identity import User
 from zondarr.models.invitation import Invitation
 from zondarr.models.media_server import MediaServer
 from zondarr.models.sync_run import SyncRun
 
+# Seconds a computed stats payload is served before it is recomputed
+_CACHE_TTL = 5.0
+
+# Key of the per-application cache in app.state
+_CACHE_STATE_KEY = "dashboard_stats_cache"
+
+# Number of events returned in the recent activity feed
+_RECENT_ACTIVITY_LIMIT = 10
+
+# Activity type -> description template for the row label
+_ACTIVITY_DESCRIPTIONS: dict[str, str] = {
+    "user_created": "User '{}' was created",
+    "invitation_created": "Invitation '{}' was created",
+    "sync_completed": "Sync ({}) completed",
+    "server_added": "Server '{}' was added",
+}
+
+
+@final
+class _DashboardStatsCache:
+    """Short-lived cache for the dashboard payload.
+
+    An entry is valid for _CACHE_TTL seconds and only while no ORM write
+    has been committed since it was computed.
+    """
+
+    __slots__ = ("_fetched_at", "_generation", "_value")
+
+    def __init__(self) -> None:
+        self._value: DashboardStatsResponse | None = None
+        self._fetched_at: float = 0.0
+        self._generation: int = -1
+
+    def get(self) -> DashboardStatsResponse | None:
+        """Return the cached payload, or None if it is stale."""
+        if (
+            self._value is not None
+            and self._generation == write_generation()
+            and time.monotonic() - self._fetched_at < _CACHE_TTL
+        ):
+            return self._value
+        return None
+
+    def set(self, value: DashboardStatsResponse, *, generation: int) -> None:
+        """Store a payload computed while the write generation was `generation`."""
+        self._value = value
+        self._generation = generation
+        self._fetched_at = time.monotonic()
+
 
 class DashboardController(Controller):
     """Controller for dashboard statistics endpoint."""
@@ -31,20 +101,34 @@ class DashboardController(Controller):
         "/stats",
         summary="Get dashboard statistics",
         description="Returns aggregated counts and recent activity for the admin dashboard.",
+        opt={READ_ONLY_SESSION: True},
     )
     async def get_stats(
         self,
         session: AsyncSession,
+        state: State,
     ) -> DashboardStatsResponse:
         """Return aggregated dashboard statistics."""
+        cache: _DashboardStatsCache | None = state.get(_CACHE_STATE_KEY)  # pyright: ignore[reportAny]
+        if cache is None:
+            cache = _DashboardStatsCache()
+            state[_CACHE_STATE_KEY] = cache
+        elif (cached := cache.get()) is not None:
+            return cached
+
+        # Read the generation first so a write committed mid-query
+        # leaves the stored payload already stale
+        generation = write_generation()
+        stats = await self._compute_stats(session)
+        cache.set(stats, generation=generation)
+        return stats
+
+    @classmethod
+    async def _compute_stats(cls, session: AsyncSession) -> DashboardStatsResponse:
+        """Query all counts and the recent activity feed."""
         now = datetime.now(UTC)
 
-        # --- Invitation counts ---
-        total_invitations = (
-            await session.scalar(select(func.count(Invitation.id)))
-        ) or 0
-
-        active_filter = (
+        active_invitation = (
             (Invitation.enabled.is_(True))
             & (
                 or_(
@@ -59,54 +143,54 @@ class DashboardController(Controller):
                 )
             )
         )
-        active_invitations = (
-            await session.scalar(select(func.count(Invitation.id)).where(active_filter))
-        ) or 0
-
-        pending_invitations = (
-            await session.scalar(
-                select(func.count(Invitation.id)).where(
-                    active_filter, Invitation.use_count == 0
-                )
-            )
-        ) or 0
-
-        # --- User counts ---
-        total_users = (await session.scalar(select(func.count(User.id)))) or 0
-
-        active_users = (
-            await session.scalar(
-                select(func.count(User.id)).where(
-                    User.enabled.is_(True),
-                    or_(
-                        User.expires_at.is_(None),
-                        User.expires_at > now,
-                    ),
-                )
-            )
-        ) or 0
-
-        # --- Server counts ---
-        total_servers = (await session.scalar(select(func.count(MediaServer.id)))) or 0
+        active_user = User.enabled.is_(True) & or_(
+            User.expires_at.is_(None),
+            User.expires_at > now,
+        )
 
-        enabled_servers = (
-            await session.scalar(
-                select(func.count(MediaServer.id)).where(MediaServer.enabled.is_(True))
+        invitation_counts = select(
+            func.count(Invitation.id).label("total"),
+            func.count(case((active_invitation, 1))).label("active"),
+            func.count(
+                case((active_invitation & (Invitation.use_count == 0), 1))
+            ).label("pending"),
+        ).subquery()
+        user_counts = select(
+            func.count(User.id).label("total"),
+            func.count(case((active_user, 1))).label("active"),
+        ).subquery()
+        server_counts = select(
+            func.count(MediaServer.id).label("total"),
+            func.count(case((MediaServer.enabled.is_(True), 1))).label("enabled"),
+        ).subquery()
+
+        # Each subquery yields exactly one row, so the joins stay one row
+        counts = (
+            await session.execute(
+                select(
+                    invitation_counts.c.total,
+                    invitation_counts.c.active,
+                    invitation_counts.c.pending,
+                    user_counts.c.total,
+                    user_counts.c.active,
+                    server_counts.c.total,
+                    server_counts.c.enabled,
+                )
+                .select_from(invitation_counts)
+                .join(user_counts, true())
+                .join(server_counts, true())
             )
-        ) or 0
-
-        # --- Recent activity (last 10 events) ---
-        recent_activity = await self._build_recent_activity(session)
+        ).one()
 
         return DashboardStatsResponse(
-            total_invitations=total_invitations,
-            active_invitations=active_invitations,
-            total_users=total_users,
-            active_users=active_users,
-            total_servers=total_servers,
-            enabled_servers=enabled_servers,
-            pending_invitations=pending_invitations,
-            recent_activity=recent_activity,
+            total_invitations=counts[0] or 0,
+            active_invitations=counts[1] or 0,
+            pending_invitations=counts[2] or 0,
+            total_users=counts[3] or 0,
+            active_users=counts[4] or 0,
+            total_servers=counts[5] or 0,
+            enabled_servers=counts[6] or 0,
+            recent_activity=await cls._build_recent_activity(session),
         )
 
     @staticmethod
@@ -114,71 +198,50 @@ class DashboardController(Controller):
         session: AsyncSession,
     ) -> list[RecentActivityItem]:
         """Query the 10 most recent events across entity types."""
-        items: list[RecentActivityItem] = []
-
-        # Recent users
-        user_rows = (
-            await session.scalars(
-                select(User).order_by(User.created_at.desc()).limit(10)
-            )
-        ).all()
-        for u in user_rows:
-            items.append(
-                RecentActivityItem(
-                    type="user_created",
-                    description=f"User '{u.username}' was created",
-                    timestamp=u.created_at,
-                )
-            )
-
-        # Recent invitations
-        inv_rows = (
-            await session.scalars(
-                select(Invitation).order_by(Invitation.created_at.desc()).limit(10)
-            )
-        ).all()
-        for inv in inv_rows:
-            items.append(
-                RecentActivityItem(
-                    type="invitation_created",
-                    description=f"Invitation '{inv.code}' was created",
-                    timestamp=inv.created_at,
-                )
-            )
 
-        # Recent successful sync runs
-        sync_rows = (
-            await session.scalars(
-                select(SyncRun)
-                .where(SyncRun.status == "success")
-                .order_by(SyncRun.finished_at.desc())
-                .limit(10)
-            )
-        ).all()
-        for sr in sync_rows:
-            items.append(
-                RecentActivityItem(
-                    type="sync_completed",
-                    description=f"Sync ({sr.sync_type}) completed",
-                    timestamp=sr.finished_at,
+        def latest(
+            activity_type: str,
+            label: InstrumentedAttribute[str],
+            timestamp: InstrumentedAttribute[datetime],
+            *criteria: ColumnElement[bool],
+        ) -> Select[tuple[str, str, datetime]]:
+            # Wrapped in a subquery because compound members cannot carry
+            # their own ORDER BY / LIMIT on every backend
+            inner = (
+                select(
+                    literal(activity_type).label("type"),
+                    label.label("label"),
+                    timestamp.label("timestamp"),
                 )
+                .where(*criteria)
+                .order_by(timestamp.desc())
+                .limit(_RECENT_ACTIVITY_LIMIT)
+                .subquery()
             )
-
-        # Recent media servers
-        server_rows = (
-            await session.scalars(
-                select(MediaServer).order_by(MediaServer.created_at.desc()).limit(10)
-            )
-        ).all()
-        for ms in server_rows:
-            items.append(
-                RecentActivityItem(
-                    type="server_added",
-                    description=f"Server '{ms.name}' was added",
-                    timestamp=ms.created_at,
-                )
+            return select(inner.c.type, inner.c.label, inner.c.timestamp)
+
+        feed = union_all(
+            latest("user_created", User.username, User.created_at),
+            latest("invitation_created", Invitation.code, Invitation.created_at),
+            latest(
+                "sync_completed",
+                SyncRun.sync_type,
+                SyncRun.finished_at,
+                SyncRun.status == "success",
+            ),
+            latest("server_added", MediaServer.name, MediaServer.created_at),
+        ).subquery()
+
+        rows = await session.execute(
+            select(feed.c.type, feed.c.label, feed.c.timestamp)
+            .order_by(feed.c.timestamp.desc())
+            .limit(_RECENT_ACTIVITY_LIMIT)
+        )
+        return [
+            RecentActivityItem(
+                type=activity_type,
+                description=_ACTIVITY_DESCRIPTIONS[activity_type].format(label),
+                timestamp=timestamp,
             )
-
-        # Sort all items by timestamp descending and take top 10
-        items.sort(key=lambda item: item.timestamp, reverse=True)
-        return items[:10]
+            for activity_type, label, timestamp in rows.tuples()
+        ]
@@ -4,6 +4,7 @@ Provides exception handlers for:
 - ValidationError: Returns HTTP 400 with field-level error details
 - NotFoundError: Returns HTTP 404 with resource type and identifier
 - ExternalServiceError: Returns HTTP 502 with service identification
+- ServiceBusyError: Returns HTTP 503 with a Retry-After header
 - Generic exceptions: Returns HTTP 500 with correlation ID
 
 All error responses include:
@@ -27,6 +28,7 @@ from litestar.status_codes import (
     HTTP_404_NOT_FOUND,
     HTTP_500_INTERNAL_SERVER_ERROR,
     HTTP_502_BAD_GATEWAY,
+    HTTP_503_SERVICE_UNAVAILABLE,
 )
 
 from ..core.exceptions import (
@@ -34,6 +36,7 @@ from ..core.exceptions import (
     ExternalServiceError,
     NotFoundError,
     RedemptionError,
+    ServiceBusyError,
     ValidationError,
 )
 from .schemas import (
@@ -317,3 +320,40 @@ def external_service_error_handler(
         ),
         status_code=HTTP_502_BAD_GATEWAY,
     )
+
+
+def service_busy_error_handler(
+    request: Request[object, object, State],
+    exc: ServiceBusyError,
+) -> Response[ErrorResponse]:
+    """Handle ServiceBusyError exceptions.
+
+    Returns HTTP 503 with a Retry-After header so clients back off
+    instead of retrying immediately.
+
+    Args:
+        request: The incoming request.
+        exc: The ServiceBusyError exception.
+
+    Returns:
+        Response with ErrorResponse body and HTTP 503 status.
+    """
+    correlation_id = _generate_correlation_id()
+
+    logger.warning(
+        "Request shed, resource saturated",
+        correlation_id=correlation_id,
+        resource=exc.resource,
+        path=str(request.url.path),
+    )
+
+    return Response(
+        ErrorResponse(
+            detail="Server is busy, please retry shortly",
+            error_code=exc.error_code,
+            timestamp=datetime.now(UTC),
+            correlation_id=correlation_id,
+        ),
+        status_code=HTTP_503_SERVICE_UNAVAILABLE,
+        headers={"Retry-After": "1"},
+    )
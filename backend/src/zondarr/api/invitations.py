@@ -16,12 +16,15 @@ from typing import Annotated
 from uuid import UUID
 
 from litestar import Controller, delete, get, patch, post
+from litestar.datastructures import State
 from litestar.di import Provide
 from litestar.params import Parameter
 from litestar.status_codes import HTTP_201_CREATED, HTTP_204_NO_CONTENT
 from litestar.types import AnyCallable
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from zondarr.core.database import READ_ONLY_SESSION, write_generation
+from zondarr.core.pagination import decode_cursor, encode_cursor, get_count_cache
 from zondarr.media.registry import registry
 from zondarr.models.invitation import Invitation
 from zondarr.models.wizard import Wizard
@@ -150,9 +153,11 @@ class InvitationController(Controller):
         "/",
         summary="List invitations",
         description="List invitations with pagination, filtering, and sorting.",
+        opt={READ_ONLY_SESSION: True},
     )
     async def list_invitations(
         self,
+        state: State,
         invitation_repository: InvitationRepository,
         invitation_service: InvitationService,
         page: Annotated[
@@ -188,13 +193,27 @@ class InvitationController(Controller):
             str,
             Parameter(description="Sort order (asc, desc)"),
         ] = "desc",
+        cursor: Annotated[
+            str | None,
+            Parameter(
+                description=(
+                    "Opaque next_cursor from a previous page. "
+                    "When set, page is ignored and the page is fetched by keyset"
+                ),
+            ),
+        ] = None,
     ) -> InvitationListResponse:
         """List invitations with pagination.
 
         Supports filtering by enabled status and expiration status,
         with configurable sorting and pagination.
 
+        Every page that has a successor carries a next_cursor. Following it
+        uses keyset pagination, whose cost does not grow with depth, and
+        reuses a cached total instead of counting again.
+
         Args:
+            state: Application state holding the total count cache.
             invitation_repository: InvitationRepository from DI.
             invitation_service: InvitationService from DI.
             page: Page number (1-indexed).
@@ -203,9 +222,14 @@ class InvitationController(Controller):
             expired: Filter by expiration status.
             sort_by: Field to sort by.
             sort_order: Sort direction.
+            cursor: next_cursor from a previous response, or None.
 
         Returns:
             Paginated list of invitations.
+
+        Raises:
+            ValidationError: If the cursor is malformed or does not match
+                sort_by and sort_order.
         """
         # Validate sort_by parameter
         valid_sort_fields = {"created_at", "expires_at", "use_count"}
@@ -216,25 +240,59 @@ class InvitationController(Controller):
         if sort_order not in {"asc", "desc"}:
             sort_order = "desc"
 
-        items, total = await invitation_repository.list_paginated(
-            page=page,
-            page_size=page_size,
-            enabled=enabled,
-            expired=expired,
-            sort_by=sort_by,  # pyright: ignore[reportArgumentType]
-            sort_order=sort_order,  # pyright: ignore[reportArgumentType]
-        )
+        count_cache = get_count_cache(state)
+        count_key = ("invitations", enabled, expired)
+
+        if cursor is None:
+            generation = write_generation()
+            items, total = await invitation_repository.list_paginated(
+                page=page,
+                page_size=page_size,
+                enabled=enabled,
+                expired=expired,
+                sort_by=sort_by,  # pyright: ignore[reportArgumentType]
+                sort_order=sort_order,  # pyright: ignore[reportArgumentType]
+            )
+            # Seed the cache so cursor pages that follow skip the COUNT
+            count_cache.set(count_key, total, generation=generation)
+            has_next = (page * page_size) < total
+        else:
+            decoded = decode_cursor(cursor, sort_by=sort_by, sort_order=sort_order)
+            page = decoded.page
+            items, has_next = await invitation_repository.list_after(
+                after=decoded.position,
+                page_size=page_size,
+                enabled=enabled,
+                expired=expired,
+                sort_by=sort_by,  # pyright: ignore[reportArgumentType]
+                sort_order=sort_order,  # pyright: ignore[reportArgumentType]
+            )
+            total = await count_cache.get_or_count(
+                count_key,
+                lambda: invitation_repository.count(enabled=enabled, expired=expired),
+            )
 
         response_items = [
             self._to_response(invitation, invitation_service) for invitation in items
         ]
 
+        next_cursor = None
+        if has_next and items:
+            last = items[-1]
+            next_cursor = encode_cursor(
+                sort_by,
+                sort_order,
+                page + 1,
+                (getattr(last, sort_by), last.id),  # pyright: ignore[reportAny]
+            )
+
         return InvitationListResponse(
             items=response_items,
             total=total,
             page=page,
             page_size=page_size,
-            has_next=(page * page_size) < total,
+            has_next=has_next,
+            next_cursor=next_cursor,
         )
 
     @get(
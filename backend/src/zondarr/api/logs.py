@@ -2,6 +2,10 @@
 
 Provides a Server-Sent Events (SSE) endpoint that streams structlog output
 to the browser in real-time, with optional level and source filtering.
+
+Entries are sent in batches as ``logs`` events whose data is a JSON array.
+A ``dropped`` event ({"dropped": n}) tells the client that n lines were
+skipped because it fell behind the shared log stream.
 """
 
 import asyncio
@@ -12,19 +16,13 @@ from litestar import Controller, get
 from litestar.response import ServerSentEvent, ServerSentEventMessage
 
 from zondarr.core.log_buffer import LogEntry, log_buffer
-
-_LEVEL_ORDER: dict[str, int] = {
-    "DEBUG": 10,
-    "INFO": 20,
-    "WARNING": 30,
-    "ERROR": 40,
-    "CRITICAL": 50,
-}
+from zondarr.core.log_stream import LEVEL_ORDER, log_stream_hub
 
 _encoder = msgspec.json.Encoder()
 
 _BACKFILL_LIMIT = 500
 _BACKFILL_BATCH = 50
+_HEARTBEAT_SECONDS = 30.0
 
 
 class LogController(Controller):
@@ -53,52 +51,43 @@ class LogController(Controller):
         Returns:
             ServerSentEvent response streaming log entries.
         """
-        min_level = _LEVEL_ORDER.get(level.upper(), 0) if level else 0
+        min_level = LEVEL_ORDER.get(level.upper(), 0) if level else 0
 
         async def _generate() -> AsyncGenerator[ServerSentEventMessage | str]:
-            last_seq = 0
-
+            # Backfill and subscribe with no await in between, so the
+            # subscriber starts exactly where the backfill ends
+            entries, last_seq = log_buffer.get_entries_since(0)
+            subscriber = log_stream_hub.subscribe(
+                after_seq=last_seq, min_level=min_level, source=source
+            )
             try:
                 # Send initial backfill (limited to most recent entries)
-                entries, last_seq = log_buffer.get_entries_since(0)
-                backfill = _filter_entries(entries, min_level, source)
-                # Only send the tail if there are too many
-                if len(backfill) > _BACKFILL_LIMIT:
-                    backfill = backfill[-_BACKFILL_LIMIT:]
-
-                for i, entry in enumerate(backfill):
-                    yield ServerSentEventMessage(
-                        data=_encoder.encode(entry).decode(),
-                        event="log",
-                    )
-                    # Yield to event loop periodically during backfill
-                    if (i + 1) % _BACKFILL_BATCH == 0:
-                        await asyncio.sleep(0)
+                backfill = subscriber.filter(entries)[-_BACKFILL_LIMIT:]
+                for start in range(0, len(backfill), _BACKFILL_BATCH):
+                    yield _batch_message(backfill[start : start + _BACKFILL_BATCH])
+                    # Yield to event loop between backfill batches
+                    await asyncio.sleep(0)
 
                 # Stream new entries
                 while True:
-                    try:
-                        _ = await asyncio.wait_for(
-                            log_buffer.wait_for_new(after_seq=last_seq, timeout=30.0),
-                            timeout=35.0,
+                    batch, dropped = await subscriber.next_batch(
+                        timeout=_HEARTBEAT_SECONDS
+                    )
+                    if dropped:
+                        yield ServerSentEventMessage(
+                            data=_encoder.encode({"dropped": dropped}).decode(),
+                            event="dropped",
                         )
-                    except TimeoutError:
-                        pass
-
-                    entries, current_seq = log_buffer.get_entries_since(last_seq)
-                    if entries:
-                        last_seq = current_seq
-                        for entry in _filter_entries(entries, min_level, source):
-                            yield ServerSentEventMessage(
-                                data=_encoder.encode(entry).decode(),
-                                event="log",
-                            )
-                    else:
+                    if batch:
+                        yield _batch_message(batch)
+                    elif not dropped:
                         # Heartbeat comment to keep connection alive
                         yield ServerSentEventMessage(comment="heartbeat")
 
             except asyncio.CancelledError, GeneratorExit:
                 return
+            finally:
+                log_stream_hub.unsubscribe(subscriber)
 
         return ServerSentEvent(
             _generate(),
@@ -107,18 +96,9 @@ class LogController(Controller):
         )
 
 
-def _filter_entries(
-    entries: list[LogEntry],
-    min_level: int,
-    source: str | None,
-) -> list[LogEntry]:
-    """Filter entries by level and source prefix."""
-    result: list[LogEntry] = []
-    for entry in entries:
-        entry_level = _LEVEL_ORDER.get(entry.level, 0)
-        if entry_level < min_level:
-            continue
-        if source and not entry.logger_name.startswith(source):
-            continue
-        result.append(entry)
-    return result
+def _batch_message(entries: list[LogEntry]) -> ServerSentEventMessage:
+    """Build one ``logs`` event carrying `entries` as a JSON array."""
+    return ServerSentEventMessage(
+        data="[" + ",".join(entry.json for entry in entries) + "]",
+        event="logs",
+    )
@@ -85,16 +85,13 @@ class OAuthController(Controller):
             OAuthPinResponse with pin_id, code, auth_url, and expires_at.
         """
         flow = _resolve_flow(provider, settings)
-        try:
-            pin = await flow.create_pin()
-            return OAuthPinResponse(
-                pin_id=pin.pin_id,
-                code=pin.code,
-                auth_url=pin.auth_url,
-                expires_at=pin.expires_at,
-            )
-        finally:
-            await flow.close()
+        pin = await flow.create_pin()
+        return OAuthPinResponse(
+            pin_id=pin.pin_id,
+            code=pin.code,
+            auth_url=pin.auth_url,
+            expires_at=pin.expires_at,
+        )
 
     @get(
         "/pin/{pin_id:int}",
@@ -123,13 +120,10 @@ class OAuthController(Controller):
             OAuthCheckResponse with authenticated status and email if successful.
         """
         flow = _resolve_flow(provider, settings)
-        try:
-            result = await flow.check_pin(pin_id)
-            return OAuthCheckResponse(
-                authenticated=result.authenticated,
-                auth_token=result.auth_token,
-                email=result.email,
-                error=result.error,
-            )
-        finally:
-            await flow.close()
+        result = await flow.check_pin(pin_id)
+        return OAuthCheckResponse(
+            authenticated=result.authenticated,
+            auth_token=result.auth_token,
+            email=result.email,
+            error=result.error,
+        )
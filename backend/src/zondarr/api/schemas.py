@@ -279,6 +279,23 @@ class LibraryResponse(msgspec.Struct, omit_defaults=True):
     updated_at: datetime | None = None
 
 
+class ServerCircuitResponse(msgspec.Struct, kw_only=True, omit_defaults=True):
+    """Circuit breaker state of a media server.
+
+    Attributes:
+        state: "closed" (healthy), "open" (failing fast) or "half_open"
+            (the next operation is a trial).
+        consecutive_failures: Connection failures since the last success.
+        retry_at: When an open circuit allows the next trial.
+        last_error: The most recent connection failure.
+    """
+
+    state: str
+    consecutive_failures: int = 0
+    retry_at: datetime | None = None
+    last_error: str | None = None
+
+
 class MediaServerWithLibrariesResponse(msgspec.Struct, omit_defaults=True):
     """Media server response including libraries.
 
@@ -291,6 +308,7 @@ class MediaServerWithLibrariesResponse(msgspec.Struct, omit_defaults=True):
         created_at: When the server was added.
         updated_at: When the server was last modified.
         libraries: List of libraries on this server.
+        circuit: Circuit breaker state of the server in this process.
     """
 
     id: UUID
@@ -302,6 +320,7 @@ class MediaServerWithLibrariesResponse(msgspec.Struct, omit_defaults=True):
     libraries: list[LibraryResponse]
     updated_at: datetime | None = None
     supported_permissions: list[str] | None = None
+    circuit: ServerCircuitResponse | None = None
 
 
 class SyncChannelStatusResponse(msgspec.Struct, kw_only=True, omit_defaults=True):
@@ -332,6 +351,7 @@ class MediaServerDetailResponse(msgspec.Struct, omit_defaults=True):
     sync_status: ServerSyncStatusResponse
     updated_at: datetime | None = None
     supported_permissions: list[str] | None = None
+    circuit: ServerCircuitResponse | None = None
 
 
 # =============================================================================
@@ -743,6 +763,9 @@ class InvitationListResponse(msgspec.Struct, kw_only=True):
         page: Current page number (1-indexed).
         page_size: Number of items per page.
         has_next: Whether there are more pages available.
+        next_cursor: Opaque cursor for the next page, or None on the last page.
+            Passing it back as `cursor` fetches the next page by keyset
+            instead of by offset.
     """
 
     items: list[InvitationResponse]
@@ -750,6 +773,7 @@ class InvitationListResponse(msgspec.Struct, kw_only=True):
     page: int
     page_size: int
     has_next: bool
+    next_cursor: str | None = None
 
 
 # =============================================================================
@@ -936,6 +960,9 @@ class UserListResponse(msgspec.Struct, kw_only=True):
         page: Current page number (1-indexed).
         page_size: Number of items per page.
         has_next: Whether there are more pages available.
+        next_cursor: Opaque cursor for the next page, or None on the last page.
+            Passing it back as `cursor` fetches the next page by keyset
+            instead of by offset.
     """
 
     items: list[UserDetailResponse]
@@ -943,6 +970,7 @@ class UserListResponse(msgspec.Struct, kw_only=True):
     page: int
     page_size: int
     has_next: bool
+    next_cursor: str | None = None
 
 
 # Sort field options for user listing
@@ -1375,6 +1403,8 @@ class AdminMeResponse(msgspec.Struct, kw_only=True):
         email: Optional email address.
         auth_method: Authentication method used.
         totp_enabled: Whether TOTP two-factor authentication is active.
+        backup_codes_need_regeneration: True if stored backup codes predate
+            lookup tags and should be regenerated.
         onboarding_required: True if onboarding is still in progress.
         onboarding_step: Current onboarding step to resume.
     """
@@ -1384,6 +1414,7 @@ class AdminMeResponse(msgspec.Struct, kw_only=True):
     onboarding_required: bool
     onboarding_step: OnboardingStep
     totp_enabled: bool = False
+    backup_codes_need_regeneration: bool = False
     email: str | None = None
     auth_method: str = "local"
 
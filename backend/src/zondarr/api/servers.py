@@ -29,6 +29,7 @@ from zondarr.core.exceptions import ValidationError
 from zondarr.core.tasks import BackgroundTaskManager
 from zondarr.media.exceptions import MediaClientError
 from zondarr.media.registry import registry
+from zondarr.models.media_server import MediaServer
 from zondarr.models.sync_run import SyncRun
 from zondarr.repositories.admin import AdminAccountRepository
 from zondarr.repositories.app_setting import AppSettingRepository
@@ -53,6 +54,7 @@ from .schemas import (
     MediaServerCreate,
     MediaServerDetailResponse,
     MediaServerWithLibrariesResponse,
+    ServerCircuitResponse,
     ServerSyncStatusResponse,
     SyncChannelStatusResponse,
     SyncRequest,
@@ -266,6 +268,17 @@ class ServerController(Controller):
             updated_at=updated_at,
         )
 
+    @staticmethod
+    def _to_circuit_response(server: MediaServer, /) -> ServerCircuitResponse:
+        """Build the server's circuit breaker state from the registry."""
+        snapshot = registry.circuit_snapshot(server)
+        return ServerCircuitResponse(
+            state=snapshot.state.value,
+            consecutive_failures=snapshot.consecutive_failures,
+            retry_at=snapshot.retry_at,
+            last_error=snapshot.last_error,
+        )
+
     @staticmethod
     def _resolve_next_scheduled_at(
         manager: BackgroundTaskManager | None,
@@ -512,6 +525,7 @@ class ServerController(Controller):
                 supported_permissions=sorted(
                     registry.get_supported_permissions(server.server_type)
                 ),
+                circuit=self._to_circuit_response(server),
             )
             for server in servers
         ]
@@ -726,6 +740,7 @@ class ServerController(Controller):
             supported_permissions=sorted(
                 registry.get_supported_permissions(server.server_type)
             ),
+            circuit=self._to_circuit_response(server),
         )
 
     @delete(
@@ -29,7 +29,7 @@ from zondarr.models.admin import AdminAccount
 from zondarr.repositories.admin import AdminAccountRepository, RefreshTokenRepository
 from zondarr.repositories.app_setting import AppSettingRepository
 from zondarr.services.auth import AuthService
-from zondarr.services.password import verify_password
+from zondarr.services.password import verify_password_async
 from zondarr.services.totp import TOTPService
 
 from .schemas import (
@@ -250,7 +250,7 @@ class TOTPController(Controller):
         totp_service.check_rate_limit(admin)
 
         # Verify backup code
-        if not totp_service.verify_backup_code(admin, data.code):
+        if not await totp_service.verify_backup_code(admin, data.code):
             totp_service.record_failed_attempt(admin)
             await session.commit()
             raise AuthenticationError("Invalid backup code", "INVALID_BACKUP_CODE")
@@ -303,7 +303,7 @@ class TOTPController(Controller):
         """Generate TOTP secret, provisioning URI, QR code, and backup codes."""
         admin = await self._get_admin_account(request, session)
         totp_service = TOTPService(secret_key=settings.secret_key)
-        uri, qr_svg, backup_codes = totp_service.generate_setup(admin)
+        uri, qr_svg, backup_codes = await totp_service.generate_setup(admin)
 
         return TOTPSetupResponse(
             provisioning_uri=uri,
@@ -332,7 +332,7 @@ class TOTPController(Controller):
 
         # Backup codes were generated during setup and are already stored.
         # Regenerate fresh ones so the user can see the plaintext codes.
-        backup_codes = totp_service.regenerate_backup_codes(admin)
+        backup_codes = await totp_service.regenerate_backup_codes(admin)
 
         return TOTPConfirmSetupResponse(backup_codes=backup_codes)
 
@@ -352,7 +352,7 @@ class TOTPController(Controller):
         admin = await self._get_admin_account(request, session)
 
         # Verify password
-        if admin.password_hash is None or not verify_password(
+        if admin.password_hash is None or not await verify_password_async(
             admin.password_hash, data.password
         ):
             raise AuthenticationError("Invalid password", "INVALID_PASSWORD")
@@ -386,5 +386,5 @@ class TOTPController(Controller):
         if not totp_service.verify_code(admin, data.code):
             raise AuthenticationError("Invalid TOTP code", "INVALID_TOTP_CODE")
 
-        codes = totp_service.regenerate_backup_codes(admin)
+        codes = await totp_service.regenerate_backup_codes(admin)
         return TOTPBackupCodesResponse(backup_codes=codes)
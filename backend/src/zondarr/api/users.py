@@ -16,11 +16,14 @@ from typing import Annotated
 from uuid import UUID
 
 from litestar import Controller, delete, get, patch, post
+from litestar.datastructures import State
 from litestar.di import Provide
 from litestar.params import Parameter
 from litestar.types import AnyCallable
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from zondarr.core.database import READ_ONLY_SESSION, write_generation
+from zondarr.core.pagination import decode_cursor, encode_cursor, get_count_cache
 from zondarr.media.registry import registry
 from zondarr.models.identity import User
 from zondarr.repositories.identity import IdentityRepository
@@ -122,9 +125,11 @@ class UserController(Controller):
         "/",
         summary="List users",
         description="List users with pagination, filtering, and sorting.",
+        opt={READ_ONLY_SESSION: True},
     )
     async def list_users(
         self,
+        state: State,
         user_service: UserService,
         page: Annotated[
             int,
@@ -173,6 +178,15 @@ class UserController(Controller):
             str,
             Parameter(description="Sort order (asc, desc)"),
         ] = "desc",
+        cursor: Annotated[
+            str | None,
+            Parameter(
+                description=(
+                    "Opaque next_cursor from a previous page. "
+                    "When set, page is ignored and the page is fetched by keyset"
+                ),
+            ),
+        ] = None,
     ) -> UserListResponse:
         """List users with pagination.
 
@@ -180,7 +194,12 @@ class UserController(Controller):
         and expiration status. Supports sorting by created_at, username, and
         expires_at. Enforces page_size max of 100.
 
+        Every page that has a successor carries a next_cursor. Following it
+        uses keyset pagination, whose cost does not grow with depth, and
+        reuses a cached total instead of counting again.
+
         Args:
+            state: Application state holding the total count cache.
             user_service: UserService from DI.
             page: Page number (1-indexed). Defaults to 1.
             page_size: Number of items per page. Defaults to 50, max 100.
@@ -190,9 +209,14 @@ class UserController(Controller):
             expired: Filter by expiration status.
             sort_by: Field to sort by.
             sort_order: Sort direction.
+            cursor: next_cursor from a previous response, or None.
 
         Returns:
             Paginated list of users with relationships.
+
+        Raises:
+            ValidationError: If the cursor is malformed or does not match
+                sort_by and sort_order.
         """
         # Validate sort_by parameter
         valid_sort_fields = {"created_at", "username", "expires_at"}
@@ -208,25 +232,66 @@ class UserController(Controller):
         # also caps it for defense in depth
         capped_page_size = min(page_size, 100)
 
-        items, total = await user_service.list_users(
-            page=page,
-            page_size=capped_page_size,
-            media_server_id=server_id,
-            invitation_id=invitation_id,
-            enabled=enabled,
-            expired=expired,
-            sort_by=sort_by,  # pyright: ignore[reportArgumentType]
-            sort_order=sort_order,  # pyright: ignore[reportArgumentType]
-        )
+        count_cache = get_count_cache(state)
+        count_key = ("users", server_id, invitation_id, enabled, expired)
+
+        if cursor is None:
+            generation = write_generation()
+            items, total = await user_service.list_users(
+                page=page,
+                page_size=capped_page_size,
+                media_server_id=server_id,
+                invitation_id=invitation_id,
+                enabled=enabled,
+                expired=expired,
+                sort_by=sort_by,  # pyright: ignore[reportArgumentType]
+                sort_order=sort_order,  # pyright: ignore[reportArgumentType]
+            )
+            # Seed the cache so cursor pages that follow skip the COUNT
+            count_cache.set(count_key, total, generation=generation)
+            has_next = (page * capped_page_size) < total
+        else:
+            decoded = decode_cursor(cursor, sort_by=sort_by, sort_order=sort_order)
+            page = decoded.page
+            items, has_next = await user_service.list_users_after(
+                after=decoded.position,
+                page_size=capped_page_size,
+                media_server_id=server_id,
+                invitation_id=invitation_id,
+                enabled=enabled,
+                expired=expired,
+                sort_by=sort_by,  # pyright: ignore[reportArgumentType]
+                sort_order=sort_order,  # pyright: ignore[reportArgumentType]
+            )
+            total = await count_cache.get_or_count(
+                count_key,
+                lambda: user_service.count_users(
+                    media_server_id=server_id,
+                    invitation_id=invitation_id,
+                    enabled=enabled,
+                    expired=expired,
+                ),
+            )
 
         response_items = [self._to_detail_response(user) for user in items]
 
+        next_cursor = None
+        if has_next and items:
+            last = items[-1]
+            next_cursor = encode_cursor(
+                sort_by,
+                sort_order,
+                page + 1,
+                (getattr(last, sort_by), last.id),  # pyright: ignore[reportAny]
+            )
+
         return UserListResponse(
             items=response_items,
             total=total,
             page=page,
             page_size=capped_page_size,
-            has_next=(page * capped_page_size) < total,
+            has_next=has_next,
+            next_cursor=next_cursor,
         )
 
     @get(
@@ -43,6 +43,7 @@ from zondarr.api.errors import (
     litestar_http_exception_handler,
     not_found_handler,
     redemption_error_handler,
+    service_busy_error_handler,
     validation_error_handler,
 )
 from zondarr.api.health import HealthController
@@ -65,12 +66,15 @@ from zondarr.core.exceptions import (
     ExternalServiceError,
     NotFoundError,
     RedemptionError,
+    ServiceBusyError,
     ValidationError,
 )
 from zondarr.core.log_buffer import capture_log_processor, log_buffer
+from zondarr.core.log_stream import log_stream_hub
 from zondarr.core.tasks import background_tasks_lifespan
 from zondarr.media.providers import register_all_providers
 from zondarr.media.registry import registry
+from zondarr.services.password import configure_hashing, shutdown_hashing
 
 
 def provide_settings(state: State) -> Settings:
@@ -186,21 +190,52 @@ def _create_cors_config(settings: Settings) -> CORSConfig | None:
 
 @asynccontextmanager
 async def _log_stream_lifespan(_app: Litestar):
-    """Bind the log buffer to the running event loop on startup."""
+    """Bind the log buffer and start the SSE fan-out hub on startup."""
     log_buffer.bind_loop(asyncio.get_running_loop())
+    log_stream_hub.start()
     try:
         yield
     finally:
+        await log_stream_hub.stop()
         log_buffer.unbind_loop()
 
 
+@asynccontextmanager
+async def _password_hashing_lifespan(app: Litestar):
+    """Size the Argon2 hashing pool from settings and stop it on shutdown."""
+    settings: Settings = app.state.settings  # pyright: ignore[reportAny]
+    configure_hashing(
+        max_concurrency=settings.password_hash_max_concurrency,
+        max_queue=settings.password_hash_max_queue,
+    )
+    try:
+        yield
+    finally:
+        shutdown_hashing()
+
+
+@asynccontextmanager
+async def _media_client_pool_lifespan(_app: Litestar):
+    """Evict idle pooled media clients and disconnect them all on shutdown."""
+    eviction = asyncio.create_task(
+        registry.run_idle_eviction(), name="media-client-eviction"
+    )
+    try:
+        yield
+    finally:
+        _ = eviction.cancel()
+        _ = await asyncio.gather(eviction, return_exceptions=True)
+        await registry.close_clients()
+        await registry.close_providers()
+
+
 def create_app(settings: Settings | None = None) -> Litestar:
     """Application factory for creating Litestar app instances.
 
     Creates a fully configured Litestar application with:
     - Database connection pool management via lifespan
     - Dependency injection for database sessions
-    - Media client registry initialization
+    - Media client registry initialization and client pool shutdown
     - OpenAPI documentation with Swagger and Scalar
     - Structured logging with structlog
     - Exception handlers for domain errors
@@ -269,7 +304,13 @@ def create_app(settings: Settings | None = None) -> Litestar:
 
     return Litestar(
         route_handlers=route_handlers,
-        lifespan=[db_lifespan, _log_stream_lifespan, background_tasks_lifespan],
+        lifespan=[
+            db_lifespan,
+            _log_stream_lifespan,
+            _password_hashing_lifespan,
+            _media_client_pool_lifespan,
+            background_tasks_lifespan,
+        ],
         state=State({"settings": settings}),
         dependencies={
             "session": Provide(provide_db_session),
@@ -288,6 +329,7 @@ def create_app(settings: Settings | None = None) -> Litestar:
             ValidationError: validation_error_handler,
             NotFoundError: not_found_handler,
             ExternalServiceError: external_service_error_handler,
+            ServiceBusyError: service_busy_error_handler,
             LitestarHTTPException: litestar_http_exception_handler,
             Exception: internal_error_handler,
         },
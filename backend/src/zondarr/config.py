@@ -4,7 +4,7 @@ Uses msgspec.Struct for high-performance serialization and validation.
 """
 
 import os
-from typing import Annotated
+from typing import Annotated, Literal
 
 import msgspec
 
@@ -22,6 +22,87 @@ class Settings(msgspec.Struct, kw_only=True, forbid_unknown_fields=True):
             description="Database connection URL (sqlite+aiosqlite:// or postgresql+asyncpg://)"
         ),
     ] = "sqlite+aiosqlite:///./zondarr.db"
+    sqlite_performance_mode: Annotated[
+        bool,
+        msgspec.Meta(
+            description=(
+                "Apply WAL journal, synchronous=NORMAL, mmap, cache and"
+                " temp_store pragmas to SQLite connections"
+            )
+        ),
+    ] = True
+    sqlite_mmap_size: Annotated[
+        int,
+        msgspec.Meta(
+            ge=0,
+            description="SQLite mmap_size in bytes when performance mode is on (0 disables mmap)",
+        ),
+    ] = 268_435_456
+    sqlite_cache_size_kib: Annotated[
+        int,
+        msgspec.Meta(
+            ge=0,
+            description="SQLite page cache per connection in KiB when performance mode is on",
+        ),
+    ] = 65_536
+    sqlite_read_pool_size: Annotated[
+        int,
+        msgspec.Meta(
+            ge=0,
+            le=64,
+            description=(
+                "Connections in the read-only SQLite pool used by list and"
+                " dashboard reads (0 = share the read-write pool)"
+            ),
+        ),
+    ] = 4
+    postgres_pool_size: Annotated[
+        int,
+        msgspec.Meta(
+            ge=1,
+            le=200,
+            description="PostgreSQL connections kept open per worker process",
+        ),
+    ] = 10
+    postgres_max_overflow: Annotated[
+        int,
+        msgspec.Meta(
+            ge=0,
+            le=200,
+            description="Extra PostgreSQL connections opened per worker under load, closed when returned",
+        ),
+    ] = 10
+    postgres_pool_timeout_seconds: Annotated[
+        int,
+        msgspec.Meta(
+            ge=1,
+            description="Seconds a request waits for a free PostgreSQL connection before failing",
+        ),
+    ] = 30
+    postgres_pool_recycle_seconds: Annotated[
+        int,
+        msgspec.Meta(
+            ge=0,
+            description="Replace PostgreSQL connections older than this many seconds (0 = never)",
+        ),
+    ] = 1800
+    postgres_statement_cache_size: Annotated[
+        int,
+        msgspec.Meta(
+            ge=0,
+            description=(
+                "Prepared statements cached per asyncpg connection"
+                " (0 disables, required behind PgBouncer transaction pooling)"
+            ),
+        ),
+    ] = 100
+    postgres_statement_timeout_ms: Annotated[
+        int,
+        msgspec.Meta(
+            ge=0,
+            description="Server-side statement_timeout in milliseconds (0 = server default)",
+        ),
+    ] = 0
 
     # Server
     host: str = "0.0.0.0"  # noqa: S104
@@ -77,6 +158,97 @@ class Settings(msgspec.Struct, kw_only=True, forbid_unknown_fields=True):
             description="Interval in seconds for syncing media servers (default: 15 minutes)",
         ),
     ] = 900
+    sync_max_concurrency: Annotated[
+        int,
+        msgspec.Meta(
+            ge=1,
+            le=32,
+            description="Maximum number of media servers fetched concurrently during background sync",
+        ),
+    ] = 4
+    sync_server_timeout_seconds: Annotated[
+        int,
+        msgspec.Meta(
+            ge=5,
+            description="Per-server timeout in seconds for fetching remote state during background sync",
+        ),
+    ] = 120
+    user_expiry_action: Annotated[
+        Literal["disable", "delete"],
+        msgspec.Meta(
+            description=(
+                "What happens to a media server user when its expires_at passes:"
+                " disable the account or delete it"
+            )
+        ),
+    ] = "disable"
+    user_expiry_batch_size: Annotated[
+        int,
+        msgspec.Meta(
+            ge=1,
+            le=10_000,
+            description="Maximum number of expired users processed per enforcement pass",
+        ),
+    ] = 500
+    user_expiry_max_attempts: Annotated[
+        int,
+        msgspec.Meta(
+            ge=1,
+            le=10,
+            description="Attempts per server when expiring users fails with a connection error or timeout",
+        ),
+    ] = 3
+    media_client_idle_seconds: Annotated[
+        int,
+        msgspec.Meta(
+            ge=0,
+            description="Seconds an unused pooled media client stays connected (0 disables pooling)",
+        ),
+    ] = 300
+    media_client_health_check_seconds: Annotated[
+        int,
+        msgspec.Meta(
+            ge=0,
+            description="Minimum seconds between health checks of a reused media client",
+        ),
+    ] = 60
+    media_circuit_failure_threshold: Annotated[
+        int,
+        msgspec.Meta(
+            ge=1,
+            le=100,
+            description="Consecutive connection failures that open a media server's circuit breaker",
+        ),
+    ] = 3
+    media_circuit_open_seconds: Annotated[
+        int,
+        msgspec.Meta(
+            ge=1,
+            description="Seconds a media server's circuit stays open after it first trips (doubles on each repeat)",
+        ),
+    ] = 15
+    media_circuit_max_open_seconds: Annotated[
+        int,
+        msgspec.Meta(
+            ge=1,
+            description="Upper bound in seconds for a media server's circuit open period",
+        ),
+    ] = 600
+    password_hash_max_concurrency: Annotated[
+        int,
+        msgspec.Meta(
+            ge=1,
+            le=32,
+            description="Argon2 password hashes or verifies running at once (~64 MiB each)",
+        ),
+    ] = 2
+    password_hash_max_queue: Annotated[
+        int,
+        msgspec.Meta(
+            ge=0,
+            description="Argon2 operations allowed to wait for a worker before requests are rejected with 503",
+        ),
+    ] = 16
 
 
 def load_settings() -> Settings:
@@ -100,6 +272,27 @@ def load_settings() -> Settings:
         "database_url": os.environ.get(
             "DATABASE_URL", "sqlite+aiosqlite:///./zondarr.db"
         ),
+        "sqlite_performance_mode": os.environ.get(
+            "SQLITE_PERFORMANCE_MODE", "true"
+        ).lower()
+        in ("true", "1", "yes"),
+        "sqlite_mmap_size": int(os.environ.get("SQLITE_MMAP_SIZE", "268435456")),
+        "sqlite_cache_size_kib": int(os.environ.get("SQLITE_CACHE_SIZE_KIB", "65536")),
+        "sqlite_read_pool_size": int(os.environ.get("SQLITE_READ_POOL_SIZE", "4")),
+        "postgres_pool_size": int(os.environ.get("POSTGRES_POOL_SIZE", "10")),
+        "postgres_max_overflow": int(os.environ.get("POSTGRES_MAX_OVERFLOW", "10")),
+        "postgres_pool_timeout_seconds": int(
+            os.environ.get("POSTGRES_POOL_TIMEOUT_SECONDS", "30")
+        ),
+        "postgres_pool_recycle_seconds": int(
+            os.environ.get("POSTGRES_POOL_RECYCLE_SECONDS", "1800")
+        ),
+        "postgres_statement_cache_size": int(
+            os.environ.get("POSTGRES_STATEMENT_CACHE_SIZE", "100")
+        ),
+        "postgres_statement_timeout_ms": int(
+            os.environ.get("POSTGRES_STATEMENT_TIMEOUT_MS", "0")
+        ),
         "host": os.environ.get("HOST", "0.0.0.0"),  # noqa: S104
         "port": int(os.environ.get("PORT", "8000")),
         "debug": os.environ.get("DEBUG", "").lower() in ("true", "1", "yes"),
@@ -120,6 +313,34 @@ def load_settings() -> Settings:
             os.environ.get("EXPIRATION_CHECK_INTERVAL_SECONDS", "3600")
         ),
         "sync_interval_seconds": int(os.environ.get("SYNC_INTERVAL_SECONDS", "900")),
+        "sync_max_concurrency": int(os.environ.get("SYNC_MAX_CONCURRENCY", "4")),
+        "sync_server_timeout_seconds": int(
+            os.environ.get("SYNC_SERVER_TIMEOUT_SECONDS", "120")
+        ),
+        "user_expiry_action": os.environ.get("USER_EXPIRY_ACTION", "disable").lower(),
+        "user_expiry_batch_size": int(os.environ.get("USER_EXPIRY_BATCH_SIZE", "500")),
+        "user_expiry_max_attempts": int(
+            os.environ.get("USER_EXPIRY_MAX_ATTEMPTS", "3")
+        ),
+        "media_client_idle_seconds": int(
+            os.environ.get("MEDIA_CLIENT_IDLE_SECONDS", "300")
+        ),
+        "media_client_health_check_seconds": int(
+            os.environ.get("MEDIA_CLIENT_HEALTH_CHECK_SECONDS", "60")
+        ),
+        "media_circuit_failure_threshold": int(
+            os.environ.get("MEDIA_CIRCUIT_FAILURE_THRESHOLD", "3")
+        ),
+        "media_circuit_open_seconds": int(
+            os.environ.get("MEDIA_CIRCUIT_OPEN_SECONDS", "15")
+        ),
+        "media_circuit_max_open_seconds": int(
+            os.environ.get("MEDIA_CIRCUIT_MAX_OPEN_SECONDS", "600")
+        ),
+        "password_hash_max_concurrency": int(
+            os.environ.get("PASSWORD_HASH_MAX_CONCURRENCY", "2")
+        ),
+        "password_hash_max_queue": int(os.environ.get("PASSWORD_HASH_MAX_QUEUE", "16")),
     }
 
     # msgspec.convert validates constraints
@@ -3,10 +3,13 @@
 Provides:
 - AdminUser: Lightweight struct stored in request.user after JWT validation
 - retrieve_user_handler: Verifies admin exists and is enabled
+- invalidate_admin_principal: Drops a cached principal after an account change
 - create_jwt_auth: Factory for configured JWTCookieAuth instance
 """
 
-from typing import Any, override
+import time
+from collections import OrderedDict
+from typing import Any, final, override
 from uuid import UUID
 
 import msgspec
@@ -19,7 +22,9 @@ from litestar.middleware.authentication import (
 )
 from litestar.security.jwt import JWTCookieAuth, Token
 from litestar.security.jwt.middleware import JWTCookieAuthenticationMiddleware
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
 
 from zondarr.config import Settings
 from zondarr.repositories.admin import AdminAccountRepository
@@ -50,6 +55,13 @@ _AUTH_EXCLUDE_PATHS_DOCS = [
     "/schema",
 ]
 
+# Seconds a verified principal is served without re-reading the account.
+# Account changes invalidate explicitly; the TTL bounds anything else.
+_PRINCIPAL_CACHE_TTL = 60.0
+
+# Maximum number of cached principals (least recently used is evicted)
+_PRINCIPAL_CACHE_MAX_ENTRIES = 128
+
 
 class AdminUser(msgspec.Struct):
     """Lightweight admin user data stored in request.user after JWT validation.
@@ -85,6 +97,91 @@ class DevSkipAuthMiddleware(AbstractAuthenticationMiddleware):
         return AuthenticationResult(user=DEV_ADMIN, auth=None)
 
 
+@final
+class _AdminPrincipalCache:
+    """TTL/LRU cache of verified AdminUser principals keyed by admin id.
+
+    Every invalidation bumps an epoch. A lookup that missed records the
+    epoch before reading the database and only stores its result if no
+    invalidation happened meanwhile, so a concurrent account change cannot
+    be overwritten by the pre-change row.
+    """
+
+    __slots__ = ("_entries", "_epoch")
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[UUID, tuple[AdminUser, float]] = OrderedDict()
+        self._epoch: int = 0
+
+    @property
+    def epoch(self) -> int:
+        """Return the current invalidation epoch."""
+        return self._epoch
+
+    def get(self, admin_id: UUID, /) -> AdminUser | None:
+        """Return the cached principal, or None if missing or expired."""
+        entry = self._entries.get(admin_id)
+        if entry is None:
+            return None
+        principal, cached_at = entry
+        if time.monotonic() - cached_at >= _PRINCIPAL_CACHE_TTL:
+            del self._entries[admin_id]
+            return None
+        self._entries.move_to_end(admin_id)
+        return principal
+
+    def set(self, principal: AdminUser, /, *, epoch: int) -> None:
+        """Store a principal read while the epoch was `epoch`."""
+        if epoch != self._epoch:
+            return
+        self._entries[principal.id] = (principal, time.monotonic())
+        self._entries.move_to_end(principal.id)
+        if len(self._entries) > _PRINCIPAL_CACHE_MAX_ENTRIES:
+            _ = self._entries.popitem(last=False)
+
+    def invalidate(self, admin_id: UUID | None = None, /) -> None:
+        """Drop one principal, or all of them when no id is given."""
+        self._epoch += 1
+        if admin_id is None:
+            self._entries.clear()
+        else:
+            _ = self._entries.pop(admin_id, None)
+
+
+_principal_cache = _AdminPrincipalCache()
+
+
+def invalidate_admin_principal(
+    admin_id: UUID,
+    /,
+    *,
+    session: AsyncSession | Session | None = None,
+) -> None:
+    """Drop the cached principal for an admin whose account changed.
+
+    Call this whenever an admin is disabled, has tokens revoked, changes
+    password, or changes TOTP state. When the change is made in `session`,
+    the entry is dropped again once that session commits, so a request
+    that re-read the account before the commit cannot keep the old state.
+
+    Args:
+        admin_id: The admin account UUID.
+        session: Session holding the uncommitted change, if any (keyword-only).
+    """
+    _principal_cache.invalidate(admin_id)
+    if session is None:
+        return
+
+    sync_session = (
+        session.sync_session if isinstance(session, AsyncSession) else session
+    )
+
+    def _invalidate_after_commit(_session: Session) -> None:
+        _principal_cache.invalidate(admin_id)
+
+    event.listen(sync_session, "after_commit", _invalidate_after_commit, once=True)
+
+
 async def retrieve_user_handler(
     token: Token,
     connection: ASGIConnection[Any, Any, Any, Any],  # pyright: ignore[reportExplicitAny]
@@ -92,7 +189,9 @@ async def retrieve_user_handler(
     """Retrieve and verify admin user from JWT token.
 
     Called by JWTCookieAuth on every authenticated request.
-    Queries the database to verify the admin still exists and is enabled.
+    Verified principals are cached for a short time, so most requests are
+    served without opening a database session. On a miss, queries the
+    database to verify the admin still exists and is enabled.
 
     Args:
         token: The decoded JWT token.
@@ -110,6 +209,11 @@ async def retrieve_user_handler(
     except ValueError, TypeError:
         return None
 
+    cached = _principal_cache.get(admin_id)
+    if cached is not None:
+        return cached
+
+    epoch = _principal_cache.epoch
     try:
         session_factory: async_sessionmaker[AsyncSession] = (  # pyright: ignore[reportAny]
             connection.app.state.session_factory
@@ -121,12 +225,14 @@ async def retrieve_user_handler(
             if admin is None or not admin.enabled:
                 return None
 
-            return AdminUser(
+            principal = AdminUser(
                 id=admin.id,
                 username=admin.username,
                 email=admin.email,
                 auth_method=admin.auth_method,
             )
+        _principal_cache.set(principal, epoch=epoch)
+        return principal
     except Exception:
         logger.exception("Failed to retrieve admin user from token")
         return None
@@ -2,27 +2,144 @@
 
 Provides:
 - create_engine_from_url: Creates async SQLAlchemy engine with proper configuration
+- sqlite_pragmas: Connect-time SQLite pragmas for the configured performance mode
+- postgres_connect_args: asyncpg statement cache and timeout options from Settings
 - create_session_factory: Creates async session factory with expire_on_commit=False
 - db_lifespan: Lifespan context manager for connection pool management
-- provide_db_session: Generator dependency for session management with auto commit/rollback
+- provide_db_session: Generator dependency for session management with auto commit/rollback,
+  served from the query-only SQLite pool for handlers marked READ_ONLY_SESSION
+- write_generation: Counter bumped whenever a session commits ORM writes, used
+  to invalidate in-process read caches
 
 Uses SQLAlchemy 2.0 async patterns with proper connection pooling.
 """
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Mapping
 from contextlib import asynccontextmanager
 from typing import cast
 
-from litestar import Litestar
+from litestar import Litestar, Request
 from litestar.datastructures import State
+from sqlalchemy import event, make_url
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.orm import ORMExecuteState, Session, UOWTransaction
+from sqlalchemy.pool import ConnectionPoolEntry
 
 from zondarr.config import Settings
+from zondarr.core.db_pool import PoolMetrics, metered_pool_class
+
+# session.info key marking a transaction that wrote through the ORM
+_WROTE_KEY = "zondarr_wrote"
+
+_write_generation = 0
+
+# Route handler opt key marking handlers served from the read-only pool
+READ_ONLY_SESSION = "read_only_session"
+
+
+def write_generation() -> int:
+    """Return a counter that increases after every committed ORM write.
+
+    Read caches record the generation they were computed at and treat
+    themselves as stale once it changes. Writes made outside an ORM
+    Session (raw connections, other processes) are not observed, so such
+    caches must also use a short TTL.
+
+    Returns:
+        The current write generation.
+    """
+    return _write_generation
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flush_write(session: Session, _flush_context: UOWTransaction) -> None:  # pyright: ignore[reportUnusedFunction]
+    session.info[_WROTE_KEY] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_dml_write(orm_execute_state: ORMExecuteState) -> None:  # pyright: ignore[reportUnusedFunction]
+    if (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        orm_execute_state.session.info[_WROTE_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_write_generation(session: Session) -> None:  # pyright: ignore[reportUnusedFunction]
+    global _write_generation
+    if session.info.pop(_WROTE_KEY, False):
+        _write_generation += 1
+
+
+@event.listens_for(Session, "after_rollback")
+def _clear_write_mark(session: Session) -> None:  # pyright: ignore[reportUnusedFunction]
+    _ = session.info.pop(_WROTE_KEY, None)
+
+
+def sqlite_pragmas(settings: Settings, /) -> dict[str, str | int]:
+    """Return the pragmas applied to each new SQLite connection.
+
+    Performance mode uses the WAL journal so readers never block the
+    writer (and vice versa), relaxes fsync to synchronous=NORMAL (safe
+    under WAL), memory-maps the file, enlarges the page cache, keeps temp
+    tables in memory and enforces foreign keys.
+
+    Args:
+        settings: Application settings.
+
+    Returns:
+        Pragma name to value, empty when performance mode is off.
+    """
+    if not settings.sqlite_performance_mode:
+        return {}
+    return {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": settings.sqlite_mmap_size,
+        # Negative cache_size is in KiB rather than pages
+        "cache_size": -settings.sqlite_cache_size_kib,
+        "temp_store": "MEMORY",
+        "foreign_keys": "ON",
+    }
+
+
+def is_sqlite_file_url(database_url: str, /) -> bool:
+    """Whether `database_url` points at an on-disk SQLite database.
+
+    In-memory databases are private to each connection, so they cannot be
+    shared with a separate read-only pool.
+    """
+    url = make_url(database_url)
+    if url.get_backend_name() != "sqlite":
+        return False
+    database = url.database or ""
+    return database not in ("", ":memory:") and url.query.get("mode") != "memory"
+
+
+def postgres_connect_args(settings: Settings, /) -> dict[str, object]:
+    """Return asyncpg connect arguments from settings.
+
+    Args:
+        settings: Application settings.
+
+    Returns:
+        DBAPI connect arguments for create_engine_from_url.
+    """
+    connect_args: dict[str, object] = {
+        "prepared_statement_cache_size": settings.postgres_statement_cache_size,
+    }
+    if settings.postgres_statement_timeout_ms > 0:
+        connect_args["server_settings"] = {
+            "statement_timeout": str(settings.postgres_statement_timeout_ms),
+        }
+    return connect_args
 
 
 def create_engine_from_url(
@@ -31,6 +148,14 @@ def create_engine_from_url(
     *,
     debug: bool = False,
     pool_pre_ping: bool = True,
+    sqlite_pragmas: Mapping[str, str | int] | None = None,
+    read_only: bool = False,
+    pool_size: int | None = None,
+    max_overflow: int | None = None,
+    pool_timeout: int | None = None,
+    pool_recycle: int | None = None,
+    connect_args: Mapping[str, object] | None = None,
+    pool_metrics: PoolMetrics | None = None,
 ) -> AsyncEngine:
     """Create an async SQLAlchemy engine from a database URL.
 
@@ -38,6 +163,16 @@ def create_engine_from_url(
         database_url: Database connection URL (sqlite+aiosqlite:// or postgresql+asyncpg://).
         debug: Enable SQL echo logging for debugging.
         pool_pre_ping: Enable connection health checks before use.
+        sqlite_pragmas: SQLite only: pragmas to run on every new connection.
+        read_only: SQLite only: set query_only on every connection so the
+            engine can never write.
+        pool_size: Number of pooled connections (driver default if None).
+        max_overflow: Connections allowed beyond pool_size under load.
+        pool_timeout: Seconds to wait for a free connection.
+        pool_recycle: Replace connections older than this many seconds (-1 never).
+        connect_args: Extra DBAPI connect arguments.
+        pool_metrics: Record checkout counts and waits on a queue pool.
+            Not usable with in-memory SQLite, which needs a static pool.
 
     Returns:
         Configured AsyncEngine instance.
@@ -46,12 +181,44 @@ def create_engine_from_url(
         "echo": debug,
         "pool_pre_ping": pool_pre_ping,
     }
+    pool_options = {
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": pool_timeout,
+        "pool_recycle": pool_recycle,
+    }
+    kwargs.update({k: v for k, v in pool_options.items() if v is not None})
+    if pool_metrics is not None:
+        kwargs["poolclass"] = metered_pool_class(pool_metrics)
+
+    is_sqlite = database_url.startswith("sqlite")
+    kwargs["connect_args"] = dict(connect_args or {})
+    if is_sqlite:
+        # SQLite: add busy timeout so writers wait instead of failing immediately
+        kwargs["connect_args"] = {"timeout": 30, **(connect_args or {})}
+
+    engine = create_async_engine(database_url, **kwargs)
+    if pool_metrics is not None:
+        pool_metrics.attach(engine.sync_engine)
+    if not is_sqlite:
+        return engine
+
+    pragmas = dict(sqlite_pragmas or {})
+    if read_only:
+        pragmas["query_only"] = "ON"
+    if pragmas:
 
-    # SQLite: add busy timeout so writers wait instead of failing immediately
-    if database_url.startswith("sqlite"):
-        kwargs["connect_args"] = {"timeout": 30}
+        @event.listens_for(engine.sync_engine, "connect")
+        def _apply_pragmas(  # pyright: ignore[reportUnusedFunction]
+            dbapi_connection: object,
+            _connection_record: ConnectionPoolEntry,
+        ) -> None:
+            cursor = dbapi_connection.cursor()  # pyright: ignore[reportUnknownMemberType, reportAttributeAccessIssue, reportUnknownVariableType]
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")  # pyright: ignore[reportUnknownMemberType]
+            cursor.close()  # pyright: ignore[reportUnknownMemberType]
 
-    return create_async_engine(database_url, **kwargs)
+    return engine
 
 
 def create_session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
@@ -74,7 +241,11 @@ async def db_lifespan(app: Litestar) -> AsyncGenerator[None]:
     """Manage database connection pool lifecycle.
 
     Creates the engine and session factory on startup, stores them in app state,
-    and disposes the engine on shutdown.
+    and disposes the engine on shutdown. For on-disk SQLite a second,
+    query-only engine backs ``read_session_factory``; otherwise it is the
+    same factory as ``session_factory``. PostgreSQL pool sizing and asyncpg
+    options come from the postgres_* settings. Pool checkout metrics are
+    kept in ``db_pool_metrics`` and logged on shutdown.
 
     Args:
         app: The Litestar application instance.
@@ -88,17 +259,68 @@ async def db_lifespan(app: Litestar) -> AsyncGenerator[None]:
     """
     # Cast is safe here - app factory guarantees Settings is in state
     settings = cast(Settings, app.state.settings)
-    engine = create_engine_from_url(
-        settings.database_url,
-        debug=settings.debug,
-    )
+    is_sqlite = settings.database_url.startswith("sqlite")
+    sqlite_file = is_sqlite_file_url(settings.database_url)
+    pragmas = sqlite_pragmas(settings)
+
+    # In-memory SQLite uses a static pool, which has no checkout wait
+    metrics = PoolMetrics("primary") if sqlite_file or not is_sqlite else None
+    if is_sqlite:
+        engine = create_engine_from_url(
+            settings.database_url,
+            debug=settings.debug,
+            sqlite_pragmas=pragmas,
+            pool_metrics=metrics,
+        )
+    else:
+        # Each worker process has its own pool, so the server needs
+        # workers * (pool_size + max_overflow) connections available
+        engine = create_engine_from_url(
+            settings.database_url,
+            debug=settings.debug,
+            pool_size=settings.postgres_pool_size,
+            max_overflow=settings.postgres_max_overflow,
+            pool_timeout=settings.postgres_pool_timeout_seconds,
+            # SQLAlchemy uses -1 to disable recycling
+            pool_recycle=settings.postgres_pool_recycle_seconds or -1,
+            connect_args=postgres_connect_args(settings),
+            pool_metrics=metrics,
+        )
     app.state.engine = engine
     app.state.session_factory = create_session_factory(engine)
-    yield
-    await engine.dispose()
+    pool_metrics = [metrics] if metrics is not None else []
+
+    read_engine: AsyncEngine | None = None
+    if settings.sqlite_read_pool_size > 0 and sqlite_file:
+        read_metrics = PoolMetrics("sqlite_read")
+        read_engine = create_engine_from_url(
+            settings.database_url,
+            debug=settings.debug,
+            sqlite_pragmas=pragmas,
+            read_only=True,
+            pool_size=settings.sqlite_read_pool_size,
+            pool_metrics=read_metrics,
+        )
+        app.state.read_session_factory = create_session_factory(read_engine)
+        pool_metrics.append(read_metrics)
+    else:
+        app.state.read_session_factory = app.state.session_factory
+    app.state.db_pool_metrics = pool_metrics
 
+    try:
+        yield
+    finally:
+        for pool in pool_metrics:
+            pool.log_summary()
+        if read_engine is not None:
+            await read_engine.dispose()
+        await engine.dispose()
 
-async def provide_db_session(state: State) -> AsyncGenerator[AsyncSession]:
+
+async def provide_db_session(
+    state: State,
+    request: Request[object, object, State],
+) -> AsyncGenerator[AsyncSession]:
     """Provide a database session with automatic commit/rollback.
 
     This is a generator dependency that:
@@ -107,8 +329,14 @@ async def provide_db_session(state: State) -> AsyncGenerator[AsyncSession]:
     - Commits on success
     - Rolls back on exception
 
+    Handlers that opt in with ``opt={READ_ONLY_SESSION: True}`` get a
+    session from ``read_session_factory`` instead. With on-disk SQLite its
+    connections are query-only, so list and dashboard reads do not queue
+    behind writers; every code path of such a handler must be read-only.
+
     Args:
         state: The application state containing the session factory.
+        request: The current request, used to pick the pool.
 
     Yields:
         An AsyncSession instance for database operations.
@@ -122,6 +350,11 @@ async def provide_db_session(state: State) -> AsyncGenerator[AsyncSession]:
         async_sessionmaker[AsyncSession],
         state.session_factory,
     )
+    if request.route_handler.opt.get(READ_ONLY_SESSION):
+        session_factory = cast(
+            async_sessionmaker[AsyncSession],
+            state.get("read_session_factory", session_factory),
+        )
     async with session_factory() as session:
         try:
             yield session
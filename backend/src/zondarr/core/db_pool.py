@@ -0,0 +1,174 @@
+"""Connection pool metrics for the database engines.
+
+Provides:
+- PoolMetrics: Counters for pool checkouts, checkout waits and timeouts
+- metered_pool_class: AsyncAdaptedQueuePool subclass that times checkout waits
+
+Checkout waits longer than SLOW_CHECKOUT_SECONDS are logged as warnings
+(at most once per SLOW_CHECKOUT_LOG_INTERVAL_SECONDS) together with the
+current counters, and a summary is logged every REPORT_INTERVAL_SECONDS
+of activity and on shutdown. A pool that is too small for the number of
+concurrent requests shows up as rising waits long before requests time out.
+"""
+
+import time
+from typing import final, override
+
+import structlog
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import (
+    AsyncAdaptedQueuePool,
+    ConnectionPoolEntry,
+    PoolProxiedConnection,
+)
+
+logger: structlog.stdlib.BoundLogger = structlog.get_logger(__name__)  # pyright: ignore[reportAny]
+
+# A checkout waiting longer than this is reported
+SLOW_CHECKOUT_SECONDS = 0.1
+
+# Minimum seconds between slow-checkout warnings
+SLOW_CHECKOUT_LOG_INTERVAL_SECONDS = 30.0
+
+# Minimum seconds between periodic pool summaries
+REPORT_INTERVAL_SECONDS = 300.0
+
+
+@final
+class PoolMetrics:
+    """Checkout and wait counters for one engine's connection pool.
+
+    Updated from pool events and the metered pool's checkout path, which
+    all run on the event loop thread.
+    """
+
+    __slots__ = (
+        "_last_report",
+        "_last_slow_log",
+        "checked_out",
+        "checkouts",
+        "max_wait_seconds",
+        "name",
+        "peak_checked_out",
+        "slow_checkouts",
+        "timeouts",
+        "total_wait_seconds",
+    )
+
+    def __init__(self, name: str, /) -> None:
+        self.name = name
+        self.checkouts = 0
+        self.checked_out = 0
+        self.peak_checked_out = 0
+        self.slow_checkouts = 0
+        self.timeouts = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self._last_slow_log = 0.0
+        self._last_report = time.monotonic()
+
+    def snapshot(self) -> dict[str, int | float]:
+        """Return the current counters for logging or inspection."""
+        return {
+            "checkouts": self.checkouts,
+            "checked_out": self.checked_out,
+            "peak_checked_out": self.peak_checked_out,
+            "slow_checkouts": self.slow_checkouts,
+            "timeouts": self.timeouts,
+            "avg_wait_ms": round(
+                self.total_wait_seconds * 1000 / max(self.checkouts, 1), 3
+            ),
+            "max_wait_ms": round(self.max_wait_seconds * 1000, 3),
+        }
+
+    def record_wait(self, seconds: float, /) -> None:
+        """Record how long a checkout waited for a connection."""
+        self.total_wait_seconds += seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+        if seconds < SLOW_CHECKOUT_SECONDS:
+            return
+        self.slow_checkouts += 1
+        now = time.monotonic()
+        if now - self._last_slow_log >= SLOW_CHECKOUT_LOG_INTERVAL_SECONDS:
+            self._last_slow_log = now
+            logger.warning(
+                "db_pool_checkout_slow",
+                pool=self.name,
+                wait_ms=round(seconds * 1000, 3),
+                **self.snapshot(),
+            )
+
+    def record_timeout(self) -> None:
+        """Record a checkout that gave up waiting for a connection."""
+        self.timeouts += 1
+        logger.error("db_pool_checkout_timeout", pool=self.name, **self.snapshot())
+
+    def log_summary(self) -> None:
+        """Log the current counters at INFO level."""
+        self._last_report = time.monotonic()
+        logger.info("db_pool_stats", pool=self.name, **self.snapshot())
+
+    def attach(self, pool_events_target: object, /) -> None:
+        """Track checked-out connections via pool events.
+
+        Args:
+            pool_events_target: An Engine (its events carry over to pools
+                recreated by dispose()) or a Pool.
+        """
+
+        @event.listens_for(pool_events_target, "checkout")
+        def _on_checkout(  # pyright: ignore[reportUnusedFunction]
+            _dbapi_connection: object,
+            _record: ConnectionPoolEntry,
+            _proxy: PoolProxiedConnection,
+        ) -> None:
+            self.checkouts += 1
+            self.checked_out += 1
+            self.peak_checked_out = max(self.peak_checked_out, self.checked_out)
+            if time.monotonic() - self._last_report >= REPORT_INTERVAL_SECONDS:
+                self.log_summary()
+
+        @event.listens_for(pool_events_target, "checkin")
+        def _on_checkin(  # pyright: ignore[reportUnusedFunction]
+            _dbapi_connection: object,
+            _record: ConnectionPoolEntry,
+        ) -> None:
+            self.checked_out = max(self.checked_out - 1, 0)
+
+
+def metered_pool_class(metrics: PoolMetrics, /) -> type[AsyncAdaptedQueuePool]:
+    """Build a queue pool class that reports checkout waits to `metrics`.
+
+    The class (not an instance) is returned so that pools recreated by
+    ``engine.dispose()`` keep reporting to the same metrics. Only checkouts
+    made while the pool is at capacity are timed, so opening new
+    connections is not reported as waiting. Checkout and checkin counts
+    come from PoolMetrics.attach() on the engine.
+
+    Args:
+        metrics: Counters to update.
+
+    Returns:
+        An AsyncAdaptedQueuePool subclass for ``create_async_engine(poolclass=...)``.
+    """
+
+    class _MeteredQueuePool(AsyncAdaptedQueuePool):
+        # _do_get is where QueuePool blocks for a free connection; SQLAlchemy
+        # has no public event that fires before the wait starts
+        @override
+        def _do_get(self) -> ConnectionPoolEntry:
+            # Below capacity _do_get hands out an idle connection or opens a
+            # new one without queueing; connect time is not a checkout wait
+            if self._max_overflow < 0 or self._overflow < self._max_overflow:
+                return super()._do_get()
+            started = time.perf_counter()
+            try:
+                return super()._do_get()
+            except PoolTimeoutError:
+                metrics.record_timeout()
+                raise
+            finally:
+                metrics.record_wait(time.perf_counter() - started)
+
+    return _MeteredQueuePool
@@ -184,3 +184,25 @@ class ExternalServiceError(ZondarrError):
         )
         self.service_name = service_name
         self.original = original
+
+
+class ServiceBusyError(ZondarrError):
+    """Raised when a bounded internal resource is saturated.
+
+    The request is shed instead of queued; clients should retry shortly.
+
+    Attributes:
+        resource: Name of the saturated resource.
+    """
+
+    resource: str
+
+    def __init__(self, message: str, /, *, resource: str) -> None:
+        """Initialize a ServiceBusyError.
+
+        Args:
+            message: Human-readable error description.
+            resource: Name of the saturated resource.
+        """
+        super().__init__(message, "SERVICE_BUSY", resource=resource)
+        self.resource = resource
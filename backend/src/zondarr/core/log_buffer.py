@@ -2,7 +2,7 @@
 
 Provides:
 - LogEntry: msgspec Struct for serialized log records
-- LogBuffer: Thread-safe ring buffer with async notification for SSE consumers
+- LogBuffer: Thread-safe ring buffer with async notification for the SSE hub
 - capture_log_processor: structlog processor that captures entries into the buffer
 
 The buffer bridges sync structlog processors with async SSE consumers via
@@ -11,13 +11,15 @@ The buffer bridges sync structlog processors with async SSE consumers via
 
 import asyncio
 import threading
-from collections import deque
+from functools import cached_property
 
 import msgspec
 from structlog.types import EventDict, WrappedLogger
 
+_encoder = msgspec.json.Encoder()
+
 
-class LogEntry(msgspec.Struct, frozen=True):
+class LogEntry(msgspec.Struct, frozen=True, dict=True):
     """A single captured log record."""
 
     seq: int
@@ -33,6 +35,11 @@ class LogEntry(msgspec.Struct, frozen=True):
     fields: dict[str, str]
     """Extra structured key-value pairs, stringified."""
 
+    @cached_property
+    def json(self) -> str:
+        """JSON encoding of the entry, computed once and shared by all viewers."""
+        return _encoder.encode(self).decode()
+
 
 _KNOWN_KEYS = frozenset(
     {
@@ -48,40 +55,48 @@ _KNOWN_KEYS = frozenset(
 _MAX_MESSAGE_LENGTH = 2048
 _MAX_FIELD_LENGTH = 1024
 
-_encoder = msgspec.json.Encoder()
-
 
 class LogBuffer:
     """Thread-safe ring buffer with async notification for SSE consumers.
 
-    Stores up to ``maxlen`` LogEntry instances in a deque. An asyncio.Condition
-    is used to notify waiting SSE consumers when new entries arrive. The
+    Stores up to ``maxlen`` LogEntry instances in a fixed-size list. Entry
+    ``seq`` lives in slot ``(seq - 1) % maxlen``, so the entries after a
+    given sequence number are found by arithmetic and copied with at most
+    two slices, costing O(new entries) rather than O(buffer size).
+
+    An asyncio.Event wakes the async consumer when new entries arrive. The
     ``loop.call_soon_threadsafe()`` bridge allows the sync structlog processor
-    to wake async waiters.
+    to set it; at most one wakeup is scheduled at a time, so a burst of lines
+    costs a single callback on the event loop.
     """
 
-    _deque: deque[LogEntry]
+    _slots: list[LogEntry | None]
+    _maxlen: int
     _seq: int
     _lock: threading.Lock
     _loop: asyncio.AbstractEventLoop | None
-    _condition: asyncio.Condition | None
+    _event: asyncio.Event | None
+    _wakeup_scheduled: bool
 
     def __init__(self, maxlen: int = 5000) -> None:
-        self._deque = deque(maxlen=maxlen)
+        self._slots = [None] * maxlen
+        self._maxlen = maxlen
         self._seq = 0
         self._lock = threading.Lock()
         self._loop = None
-        self._condition = None
+        self._event = None
+        self._wakeup_scheduled = False
 
     def bind_loop(self, loop: asyncio.AbstractEventLoop) -> None:
         """Bind to an asyncio event loop. Must be called during app startup."""
         self._loop = loop
-        self._condition = asyncio.Condition()
+        self._event = asyncio.Event()
+        self._wakeup_scheduled = False
 
     def unbind_loop(self) -> None:
         """Unbind from the event loop. Must be called during app shutdown."""
         self._loop = None
-        self._condition = None
+        self._event = None
 
     def append_entry(
         self,
@@ -94,7 +109,7 @@ class LogBuffer:
     ) -> None:
         """Allocate a seq number and append a log entry atomically.
 
-        Combines sequence allocation and deque insertion under a single lock
+        Combines sequence allocation and slot assignment under a single lock
         to prevent out-of-order entries when called from multiple threads.
         """
         with self._lock:
@@ -107,23 +122,26 @@ class LogBuffer:
                 message=message,
                 fields=fields,
             )
-            self._deque.append(entry)
+            self._slots[(self._seq - 1) % self._maxlen] = entry
+            schedule = not self._wakeup_scheduled
+            self._wakeup_scheduled = True
 
         # Wake async consumers if loop is bound
-        if self._loop is not None and self._condition is not None:
-            _ = self._loop.call_soon_threadsafe(self._notify)
+        loop = self._loop
+        if schedule and loop is not None:
+            try:
+                _ = loop.call_soon_threadsafe(self._notify)
+            except RuntimeError:
+                # Loop closed during shutdown
+                with self._lock:
+                    self._wakeup_scheduled = False
 
     def _notify(self) -> None:
-        """Schedule async notification (runs on the event loop thread)."""
-        if self._condition is not None:
-            task = asyncio.ensure_future(self._do_notify())
-            task.add_done_callback(lambda _: None)  # prevent GC
-
-    async def _do_notify(self) -> None:
-        """Actually notify waiting consumers."""
-        if self._condition is not None:
-            async with self._condition:
-                self._condition.notify_all()
+        """Wake waiting consumers (runs on the event loop thread)."""
+        with self._lock:
+            self._wakeup_scheduled = False
+        if self._event is not None:
+            self._event.set()
 
     def get_entries_since(self, after_seq: int) -> tuple[list[LogEntry], int]:
         """Return entries with seq > after_seq and the current max seq.
@@ -135,21 +153,30 @@ class LogBuffer:
             Tuple of (matching entries, current max sequence number).
         """
         with self._lock:
-            entries = [e for e in self._deque if e.seq > after_seq]
             current_seq = self._seq
-        return entries, current_seq
-
-    def _has_entries_since(self, after_seq: int) -> bool:
-        """Check if any entries exist with seq > after_seq (thread-safe)."""
+            # Oldest seq still held once the ring has wrapped
+            first = max(after_seq + 1, current_seq - self._maxlen + 1, 1)
+            if first > current_seq:
+                return [], current_seq
+            start = (first - 1) % self._maxlen
+            end = start + current_seq - first + 1
+            if end <= self._maxlen:
+                slots = self._slots[start:end]
+            else:
+                slots = self._slots[start:] + self._slots[: end - self._maxlen]
+        return [e for e in slots if e is not None], current_seq
+
+    @property
+    def current_seq(self) -> int:
+        """Sequence number of the newest entry (0 when empty)."""
         with self._lock:
-            return self._seq > after_seq
+            return self._seq
 
     async def wait_for_new(self, after_seq: int, timeout: float = 30.0) -> bool:
         """Wait for new entries with a timeout.
 
-        Checks for entries while holding the Condition lock before waiting,
-        preventing the race where a notification fires between
-        ``get_entries_since()`` and this call.
+        Clears the wakeup event and re-checks the sequence number before
+        waiting, so an entry appended just before this call is not missed.
 
         Args:
             after_seq: Sequence number to check against before waiting.
@@ -158,16 +185,18 @@ class LogBuffer:
         Returns:
             True if new entries are available, False if timed out.
         """
-        if self._condition is None:
+        if self._event is None:
             await asyncio.sleep(timeout)
-            return False
+            return self.current_seq > after_seq
 
+        if self.current_seq > after_seq:
+            return True
+        self._event.clear()
+        if self.current_seq > after_seq:
+            return True
         try:
             async with asyncio.timeout(timeout):
-                async with self._condition:
-                    if self._has_entries_since(after_seq):
-                        return True
-                    _ = await self._condition.wait()
+                _ = await self._event.wait()
             return True
         except TimeoutError:
             return False
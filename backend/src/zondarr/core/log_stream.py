@@ -0,0 +1,255 @@
+"""Shared fan-out of captured log entries to SSE subscribers.
+
+Provides:
+- LogSubscriber: Per-connection filter and bounded queue of pending entries
+- LogStreamHub: Single dispatcher that reads the LogBuffer on a short tick
+  and hands each subscriber only the entries matching its filters
+- log_stream_hub: Module-level hub bound to the log_buffer singleton
+
+One dispatcher task serves every connected log viewer, so the cost of a
+burst of log lines is one buffer read per tick rather than one per viewer.
+A viewer that cannot keep up loses its oldest pending entries and is told
+how many were dropped instead of growing memory without bound.
+"""
+
+import asyncio
+from collections import deque
+from typing import final
+
+import structlog
+
+from zondarr.core.log_buffer import LogBuffer, LogEntry, log_buffer
+
+logger: structlog.stdlib.BoundLogger = structlog.get_logger(__name__)  # pyright: ignore[reportAny]
+
+LEVEL_ORDER: dict[str, int] = {
+    "DEBUG": 10,
+    "INFO": 20,
+    "WARNING": 30,
+    "ERROR": 40,
+    "CRITICAL": 50,
+}
+
+# Seconds the dispatcher waits after a wakeup to gather more lines
+DISPATCH_TICK_SECONDS = 0.1
+
+# Entries a subscriber may have waiting before the oldest are dropped
+MAX_PENDING_ENTRIES = 1000
+
+
+@final
+class LogSubscriber:
+    """One SSE connection's view of the log stream.
+
+    Entries are only ever added by the hub's dispatcher and taken by the
+    connection's generator, both on the event loop thread.
+    """
+
+    __slots__ = (
+        "_dropped",
+        "_event",
+        "_max_pending",
+        "_min_level",
+        "_pending",
+        "_source",
+        "after_seq",
+    )
+
+    def __init__(
+        self,
+        *,
+        after_seq: int,
+        min_level: int,
+        source: str | None,
+        max_pending: int,
+    ) -> None:
+        self.after_seq = after_seq
+        self._min_level = min_level
+        self._source = source
+        self._max_pending = max_pending
+        self._pending: deque[LogEntry] = deque(maxlen=max_pending)
+        self._dropped = 0
+        self._event = asyncio.Event()
+
+    def matches(self, entry: LogEntry, /) -> bool:
+        """Whether `entry` passes this subscriber's level and source filters."""
+        if LEVEL_ORDER.get(entry.level, 0) < self._min_level:
+            return False
+        return not self._source or entry.logger_name.startswith(self._source)
+
+    def filter(self, entries: list[LogEntry], /) -> list[LogEntry]:
+        """Return the entries in `entries` that pass this subscriber's filters."""
+        return [entry for entry in entries if self.matches(entry)]
+
+    def offer(self, entries: list[LogEntry], /) -> None:
+        """Queue matching entries newer than after_seq.
+
+        Entries the buffer overwrote before they could be read, and entries
+        pushed out of the bounded queue, are counted as dropped.
+
+        Args:
+            entries: New entries in sequence order.
+        """
+        if not entries:
+            return
+        # Lines between our position and the first entry were overwritten
+        self._dropped += max(0, entries[0].seq - self.after_seq - 1)
+        fresh = [e for e in entries if e.seq > self.after_seq and self.matches(e)]
+        self.after_seq = max(self.after_seq, entries[-1].seq)
+        self._dropped += max(0, len(self._pending) + len(fresh) - self._max_pending)
+        self._pending.extend(fresh)
+        if self._pending or self._dropped:
+            self._event.set()
+
+    async def next_batch(self, *, timeout: float) -> tuple[list[LogEntry], int]:
+        """Wait for pending entries and take them all.
+
+        Args:
+            timeout: Maximum seconds to wait (keyword-only).
+
+        Returns:
+            Tuple of (entries, dropped count since the previous batch).
+            Both are empty/zero if the timeout elapsed first.
+        """
+        if not self._pending and not self._dropped:
+            try:
+                async with asyncio.timeout(timeout):
+                    _ = await self._event.wait()
+            except TimeoutError:
+                pass
+        self._event.clear()
+        batch = list(self._pending)
+        self._pending.clear()
+        dropped, self._dropped = self._dropped, 0
+        return batch, dropped
+
+
+@final
+class LogStreamHub:
+    """Single dispatcher fanning LogBuffer entries out to subscribers.
+
+    The dispatcher task sleeps while nobody is subscribed. Otherwise it
+    waits for the buffer's wakeup, lets DISPATCH_TICK_SECONDS worth of lines
+    accumulate, reads them once, and offers them to every subscriber.
+    """
+
+    __slots__ = (
+        "_buffer",
+        "_has_subscribers",
+        "_last_seq",
+        "_max_pending",
+        "_subscribers",
+        "_task",
+        "_tick",
+    )
+
+    def __init__(
+        self,
+        buffer: LogBuffer,
+        /,
+        *,
+        tick: float = DISPATCH_TICK_SECONDS,
+        max_pending: int = MAX_PENDING_ENTRIES,
+    ) -> None:
+        self._buffer = buffer
+        self._tick = tick
+        self._max_pending = max_pending
+        self._subscribers: set[LogSubscriber] = set()
+        self._has_subscribers: asyncio.Event | None = None
+        self._last_seq = 0
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of connected subscribers."""
+        return len(self._subscribers)
+
+    def subscribe(
+        self, *, after_seq: int, min_level: int, source: str | None
+    ) -> LogSubscriber:
+        """Register a subscriber that receives entries after `after_seq`.
+
+        Starts the dispatcher if it is not running yet.
+
+        Args:
+            after_seq: Last sequence number the caller already sent
+                (keyword-only).
+            min_level: Minimum LEVEL_ORDER value to deliver (keyword-only).
+            source: Logger name prefix filter (keyword-only).
+
+        Returns:
+            The new subscriber; pass it to unsubscribe() when done.
+        """
+        self.start()
+        if not self._subscribers:
+            # Nothing older than the first subscriber's position is needed
+            self._last_seq = after_seq
+        subscriber = LogSubscriber(
+            after_seq=after_seq,
+            min_level=min_level,
+            source=source,
+            max_pending=self._max_pending,
+        )
+        self._subscribers.add(subscriber)
+        if self._has_subscribers is not None:
+            self._has_subscribers.set()
+        return subscriber
+
+    def unsubscribe(self, subscriber: LogSubscriber, /) -> None:
+        """Remove a subscriber; unknown subscribers are ignored."""
+        self._subscribers.discard(subscriber)
+        if not self._subscribers and self._has_subscribers is not None:
+            self._has_subscribers.clear()
+
+    def start(self) -> None:
+        """Start the dispatcher task on the running loop if not running."""
+        task = self._task
+        if (
+            task is not None
+            and not task.done()
+            and task.get_loop() is asyncio.get_running_loop()
+        ):
+            return
+        self._has_subscribers = asyncio.Event()
+        if self._subscribers:
+            self._has_subscribers.set()
+        self._task = asyncio.create_task(
+            self._run(self._has_subscribers), name="log-stream-hub"
+        )
+
+    async def stop(self) -> None:
+        """Cancel the dispatcher task and wait for it to exit."""
+        task, self._task = self._task, None
+        if task is None:
+            return
+        _ = task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    def dispatch(self) -> None:
+        """Read entries since the last dispatch and offer them to subscribers."""
+        entries, self._last_seq = self._buffer.get_entries_since(self._last_seq)
+        for subscriber in tuple(self._subscribers):
+            subscriber.offer(entries)
+
+    async def _run(self, has_subscribers: asyncio.Event, /) -> None:
+        while True:
+            try:
+                _ = await has_subscribers.wait()
+                if not await self._buffer.wait_for_new(
+                    after_seq=self._last_seq, timeout=30.0
+                ):
+                    continue
+                await asyncio.sleep(self._tick)
+                self.dispatch()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("log_stream_dispatch_failed")
+                await asyncio.sleep(1.0)
+
+
+# Module-level singleton
+log_stream_hub = LogStreamHub(log_buffer)
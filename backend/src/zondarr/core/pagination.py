@@ -0,0 +1,261 @@
+"""Keyset (cursor) pagination helpers.
+
+List endpoints can page either by OFFSET or by an opaque cursor. A cursor
+records the sort field and direction it was issued for, the page number it
+leads to, and the sort value and id of the last row already returned. The
+next page then starts with an indexed range predicate instead of skipping
+rows, so every page costs the same however deep the client has scrolled.
+
+Rows are always ordered by the sort column (NULLs last) and then by id, which
+gives a total order that the keyset predicate can resume from exactly.
+
+Totals for cursor pages come from TotalCountCache, which keeps a COUNT per
+filter combination until a write is committed or a short TTL passes.
+"""
+
+import base64
+import binascii
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from typing import final
+from uuid import UUID
+
+import msgspec
+from litestar.datastructures import State
+from sqlalchemy import ColumnElement, UnaryExpression, and_, or_
+from sqlalchemy.orm import QueryableAttribute
+
+from zondarr.core.database import write_generation
+from zondarr.core.exceptions import ValidationError
+
+type KeysetValue = datetime | str | int | None
+"""Sort value of the last row on the previous page."""
+
+type KeysetPosition = tuple[KeysetValue, UUID]
+"""(sort value, id) of the last row on the previous page."""
+
+type CountCacheKey = tuple[str | bool | UUID | None, ...]
+"""Hashable description of a list query's filters."""
+
+# Seconds a cached total is reused; bounds drift from time-based filters
+_COUNT_CACHE_TTL = 30.0
+
+# Upper bound on distinct filter combinations kept in the cache
+_COUNT_CACHE_MAX_ENTRIES = 256
+
+# Key of the per-application count cache in app.state
+_COUNT_CACHE_STATE_KEY = "pagination_count_cache"
+
+
+class Cursor(msgspec.Struct, frozen=True, kw_only=True):
+    """Decoded pagination cursor.
+
+    Attributes:
+        sort_by: Sort field the cursor was issued for.
+        sort_order: Sort direction the cursor was issued for.
+        page: Page number (1-indexed) the cursor leads to.
+        id: Id of the last row on the previous page.
+        value: Sort value of the last row when it is a string or integer.
+        at: Sort value of the last row when it is a datetime.
+    """
+
+    sort_by: str
+    sort_order: str
+    page: int
+    id: UUID
+    value: str | int | None = None
+    at: datetime | None = None
+
+    @property
+    def position(self) -> KeysetPosition:
+        """Return the (sort value, id) to resume after."""
+        return (self.at if self.at is not None else self.value), self.id
+
+
+def encode_cursor(
+    sort_by: str,
+    sort_order: str,
+    page: int,
+    position: KeysetPosition,
+    /,
+) -> str:
+    """Encode a cursor leading to `page` that resumes after `position`.
+
+    Args:
+        sort_by: Sort field of the listing.
+        sort_order: Sort direction of the listing.
+        page: Page number (1-indexed) the cursor leads to.
+        position: (sort value, id) of the last row on the current page.
+
+    Returns:
+        An opaque URL-safe cursor string.
+    """
+    value, last_id = position
+    cursor = Cursor(
+        sort_by=sort_by,
+        sort_order=sort_order,
+        page=page,
+        id=last_id,
+        value=None if isinstance(value, datetime) else value,
+        at=value if isinstance(value, datetime) else None,
+    )
+    raw = msgspec.json.encode(cursor)
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str, /, *, sort_by: str, sort_order: str) -> Cursor:
+    """Decode a cursor and check it matches the requested ordering.
+
+    Args:
+        cursor: The cursor string from the request.
+        sort_by: Sort field of the current request (keyword-only).
+        sort_order: Sort direction of the current request (keyword-only).
+
+    Returns:
+        The decoded Cursor.
+
+    Raises:
+        ValidationError: If the cursor is malformed or was issued for a
+            different sort field or direction.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        decoded = msgspec.json.decode(
+            base64.urlsafe_b64decode(padded.encode("ascii")), type=Cursor
+        )
+    except binascii.Error, msgspec.DecodeError, UnicodeEncodeError, ValueError:
+        raise ValidationError(
+            "Invalid pagination cursor",
+            field_errors={"cursor": ["Cursor is malformed"]},
+        ) from None
+
+    if decoded.sort_by != sort_by or decoded.sort_order != sort_order:
+        raise ValidationError(
+            "Invalid pagination cursor",
+            field_errors={
+                "cursor": ["Cursor was issued for a different sort field or order"]
+            },
+        )
+    if decoded.page < 2:
+        raise ValidationError(
+            "Invalid pagination cursor",
+            field_errors={"cursor": ["Cursor page must be at least 2"]},
+        )
+    return decoded
+
+
+def keyset_order_by[V](
+    column: QueryableAttribute[V],
+    id_column: QueryableAttribute[UUID],
+    /,
+    *,
+    descending: bool,
+) -> tuple[UnaryExpression[V], UnaryExpression[UUID]]:
+    """Build the total ordering used by both OFFSET and keyset pages.
+
+    Args:
+        column: The sort column.
+        id_column: The primary key column used as tie-breaker.
+        descending: Whether to sort in descending order (keyword-only).
+
+    Returns:
+        ORDER BY clauses: the sort column with NULLs last, then id.
+    """
+    if descending:
+        return column.desc().nulls_last(), id_column.desc()
+    return column.asc().nulls_last(), id_column.asc()
+
+
+def keyset_after[V](
+    column: QueryableAttribute[V],
+    id_column: QueryableAttribute[UUID],
+    position: KeysetPosition,
+    /,
+    *,
+    descending: bool,
+) -> ColumnElement[bool]:
+    """Build the predicate selecting rows after `position` in keyset order.
+
+    Mirrors keyset_order_by: NULL sort values come last in either
+    direction, and ties are broken by id.
+
+    Args:
+        column: The sort column.
+        id_column: The primary key column used as tie-breaker.
+        position: (sort value, id) of the last row already returned.
+        descending: Whether the listing sorts in descending order (keyword-only).
+
+    Returns:
+        A boolean SQL expression for the WHERE clause.
+    """
+    value, last_id = position
+    id_after = id_column < last_id if descending else id_column > last_id
+    if value is None:
+        # Already inside the trailing NULL block; only later ids remain
+        return and_(column.is_(None), id_after)
+    value_after = column < value if descending else column > value
+    return or_(value_after, and_(column == value, id_after), column.is_(None))
+
+
+@final
+class TotalCountCache:
+    """Per-application cache of list totals keyed by filter combination.
+
+    An entry is valid for _COUNT_CACHE_TTL seconds and only while no ORM
+    write has been committed since it was counted.
+    """
+
+    __slots__ = ("_entries",)
+
+    def __init__(self) -> None:
+        self._entries: dict[CountCacheKey, tuple[int, int, float]] = {}
+
+    def get(self, key: CountCacheKey, /) -> int | None:
+        """Return the cached total for `key`, or None if missing or stale."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        total, generation, counted_at = entry
+        if (
+            generation != write_generation()
+            or time.monotonic() - counted_at >= _COUNT_CACHE_TTL
+        ):
+            del self._entries[key]
+            return None
+        return total
+
+    async def get_or_count(
+        self, key: CountCacheKey, count: Callable[[], Awaitable[int]], /
+    ) -> int:
+        """Return the cached total for `key`, running `count` on a miss."""
+        total = self.get(key)
+        if total is None:
+            # Read the generation first so a write committed mid-count
+            # leaves the stored total already stale
+            generation = write_generation()
+            total = await count()
+            self.set(key, total, generation=generation)
+        return total
+
+    def set(self, key: CountCacheKey, total: int, /, *, generation: int) -> None:
+        """Store a total counted while the write generation was `generation`."""
+        if len(self._entries) >= _COUNT_CACHE_MAX_ENTRIES:
+            self._entries.clear()
+        self._entries[key] = (total, generation, time.monotonic())
+
+
+def get_count_cache(state: State, /) -> TotalCountCache:
+    """Return the application's TotalCountCache, creating it on first use.
+
+    Args:
+        state: The Litestar application state.
+
+    Returns:
+        The shared TotalCountCache.
+    """
+    cache: TotalCountCache | None = state.get(_COUNT_CACHE_STATE_KEY)  # pyright: ignore[reportAny]
+    if cache is None:
+        cache = TotalCountCache()
+        state[_COUNT_CACHE_STATE_KEY] = cache
+    return cache
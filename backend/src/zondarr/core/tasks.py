@@ -5,24 +5,43 @@ Provides:
 - background_tasks_lifespan: Lifespan context manager for task lifecycle
 
 Background tasks include:
-- Invitation expiration: Disables expired invitation codes
-- Media server sync: Synchronizes user data with connected servers
+- Invitation expiration: Disables expired invitation codes with one UPDATE,
+  sleeping until the next expires_at and waking early when invitations change
+- User expiry enforcement: Disables or deletes media server accounts whose
+  expires_at has passed, one client session per server, servers in parallel
+- Media server sync: Synchronizes libraries and users with connected servers
+  over one client session per server, fetching remote state for several
+  servers concurrently
 
 Uses asyncio tasks with graceful shutdown support.
 """
 
 import asyncio
+from collections import deque
+from collections.abc import Sequence
 from contextlib import asynccontextmanager
 from datetime import UTC, datetime, timedelta
-from typing import cast
+from typing import Literal, cast
 from uuid import UUID
 
 import structlog
 from litestar import Litestar
 from litestar.datastructures import State
+from sqlalchemy import event, inspect
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session, UOWTransaction
 
+from zondarr.api.schemas import SyncResult
 from zondarr.config import Settings
+from zondarr.core.exceptions import ExternalServiceError
+from zondarr.core.pagination import KeysetPosition
+from zondarr.media.exceptions import CircuitOpenError, MediaClientError
+from zondarr.media.protocol import MediaClient
+from zondarr.media.registry import registry
+from zondarr.media.types import Capability
+from zondarr.models.identity import User
+from zondarr.models.invitation import Invitation
+from zondarr.models.media_server import MediaServer
 from zondarr.models.sync_run import SyncRun
 from zondarr.repositories.admin import RefreshTokenRepository
 from zondarr.repositories.identity import IdentityRepository
@@ -32,16 +51,84 @@ from zondarr.repositories.sync_exclusion import SyncExclusionRepository
 from zondarr.repositories.sync_run import SyncRunRepository
 from zondarr.repositories.user import UserRepository
 from zondarr.services.media_server import MediaServerService
-from zondarr.services.sync import SyncService
+from zondarr.services.sync import (
+    RemoteServerState,
+    SyncService,
+    user_list_fingerprint,
+)
 
 logger: structlog.stdlib.BoundLogger = structlog.get_logger(__name__)  # pyright: ignore[reportAny]
 
+# session.info key marking a transaction that changed an invitation's or
+# user's expiry
+_EXPIRY_CHANGED_KEY = "zondarr_expiry_changed"
+
+# Added to the sleep before a deadline so the sweep runs after it, not just before
+_EXPIRY_SLACK_SECONDS = 0.05
+
+# Wakeup events of running expiration schedulers
+_expiry_wakeups: set[asyncio.Event] = set()
+
+# Failures worth retrying: the server was unreachable or too slow
+_TRANSIENT_ERRORS = (ExternalServiceError, TimeoutError, ConnectionError)
+
+# Delay before the first retry of a server's expiry batch; doubles per attempt
+_EXPIRY_RETRY_BASE_SECONDS = 2.0
+
+# What happened to an expired user on its media server
+type _ExpiryOutcome = Literal["disabled", "shares_removed", "deleted", "missing"]
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_expiry_change(session: Session, _flush_context: UOWTransaction) -> None:  # pyright: ignore[reportUnusedFunction]
+    for obj in session.new:
+        if isinstance(obj, Invitation | User) and obj.expires_at is not None:
+            session.info[_EXPIRY_CHANGED_KEY] = True
+            return
+    for obj in session.dirty:
+        if isinstance(obj, Invitation | User):
+            attrs = inspect(obj).attrs
+            if (
+                attrs.expires_at.history.has_changes()
+                or attrs.enabled.history.has_changes()
+            ):
+                session.info[_EXPIRY_CHANGED_KEY] = True
+                return
+
+
+@event.listens_for(Session, "after_commit")
+def _wake_expiry_schedulers(session: Session) -> None:  # pyright: ignore[reportUnusedFunction]
+    if session.info.pop(_EXPIRY_CHANGED_KEY, False):
+        for wakeup in tuple(_expiry_wakeups):
+            wakeup.set()
+
+
+@event.listens_for(Session, "after_rollback")
+def _clear_expiry_change(session: Session) -> None:  # pyright: ignore[reportUnusedFunction]
+    _ = session.info.pop(_EXPIRY_CHANGED_KEY, None)
+
+
+def _transient_cause(error: BaseException) -> BaseException | None:
+    """Return the transient failure a client error wraps, if any.
+
+    Clients wrap some connection failures in MediaClientError; walking the
+    cause chain tells those apart from errors about the user itself.
+    """
+    seen: set[int] = set()
+    cause = error.__cause__ or error.__context__
+    while cause is not None and id(cause) not in seen:
+        if isinstance(cause, _TRANSIENT_ERRORS):
+            return cause
+        seen.add(id(cause))
+        cause = cause.__cause__ or cause.__context__
+    return None
+
 
 class BackgroundTaskManager:
     """Manages periodic background tasks for Zondarr.
 
-    Runs invitation expiration checks and media server synchronization
-    at configurable intervals using asyncio tasks.
+    Runs invitation expiration checks, user expiry enforcement and media
+    server synchronization at configurable intervals using asyncio tasks.
 
     Attributes:
         settings: Application settings containing task intervals.
@@ -52,6 +139,8 @@ class BackgroundTaskManager:
     _next_sync_run_at: datetime | None
     _libraries_sync_in_progress: set[UUID]
     _users_sync_in_progress: set[UUID]
+    _user_expiry_after: KeysetPosition | None
+    _db_write_lock: asyncio.Lock
     settings: Settings
 
     def __init__(self, settings: Settings, /) -> None:
@@ -65,12 +154,15 @@ class BackgroundTaskManager:
         self._next_sync_run_at = None
         self._libraries_sync_in_progress = set()
         self._users_sync_in_progress = set()
+        self._user_expiry_after = None
+        self._db_write_lock = asyncio.Lock()
         self.settings = settings
 
     async def start(self, state: State, /) -> None:
         """Start all background tasks.
 
-        Creates asyncio tasks for expiration checking and media server sync.
+        Creates asyncio tasks for invitation and user expiration, media
+        server sync and token cleanup.
         Tasks run continuously until stop() is called.
 
         Args:
@@ -84,6 +176,12 @@ class BackgroundTaskManager:
                 name="invitation-expiration",
             )
         )
+        self._tasks.append(
+            asyncio.create_task(
+                self._run_user_expiry_task(state),
+                name="user-expiration",
+            )
+        )
         self._tasks.append(
             asyncio.create_task(
                 self._run_sync_task(state),
@@ -131,23 +229,87 @@ class BackgroundTaskManager:
         return server_id in self._users_sync_in_progress
 
     async def _run_expiration_task(self, state: State, /) -> None:
-        """Periodically check and disable expired invitations.
+        """Disable invitations as they expire.
 
-        Runs at the interval specified by expiration_check_interval_seconds.
+        After each sweep the task sleeps until the next expires_at among
+        enabled invitations, and never longer than
+        expiration_check_interval_seconds (which also catches changes made
+        outside this process). A committed session that creates or edits an
+        invitation's expiry or enabled flag wakes it early to reschedule.
         Errors are logged but don't stop the task from continuing.
 
         Args:
             state: Application state containing session factory (positional-only).
         """
         interval = self.settings.expiration_check_interval_seconds
+        wakeup = asyncio.Event()
+        _expiry_wakeups.add(wakeup)
 
-        while self._running:
-            try:
-                await self._check_expired_invitations(state)
-            except Exception as exc:
-                logger.exception("Expiration task error", exc_info=exc)
+        try:
+            while self._running:
+                # Cleared before the sweep so a commit during it is not lost
+                wakeup.clear()
+                next_expiry: datetime | None = None
+                try:
+                    next_expiry = await self._check_expired_invitations(state)
+                except Exception as exc:
+                    logger.exception("Expiration task error", exc_info=exc)
 
-            await asyncio.sleep(interval)
+                delay = float(interval)
+                if next_expiry is not None:
+                    until = (next_expiry - datetime.now(UTC)).total_seconds()
+                    delay = min(delay, max(until, 0.0) + _EXPIRY_SLACK_SECONDS)
+
+                try:
+                    async with asyncio.timeout(delay):
+                        _ = await wakeup.wait()
+                except TimeoutError:
+                    pass
+        finally:
+            _expiry_wakeups.discard(wakeup)
+
+    async def _run_user_expiry_task(self, state: State, /) -> None:
+        """Disable or delete media server users as they expire.
+
+        Sleeps until the next expires_at among enabled users, never longer
+        than expiration_check_interval_seconds. A pass that filled its batch
+        is followed immediately by another resuming after it. Like the
+        invitation sweep, a committed session that creates a user with an
+        expiry or edits a user's expiry or enabled flag wakes it early.
+        Errors are logged but don't stop the task from continuing.
+
+        Args:
+            state: Application state containing session factory (positional-only).
+        """
+        interval = self.settings.expiration_check_interval_seconds
+        wakeup = asyncio.Event()
+        _expiry_wakeups.add(wakeup)
+
+        try:
+            while self._running:
+                # Cleared before the pass so a commit during it is not lost
+                wakeup.clear()
+                next_expiry: datetime | None = None
+                backlog = False
+                try:
+                    next_expiry, backlog = await self._enforce_user_expiry(state)
+                except Exception as exc:
+                    logger.exception("User expiry task error", exc_info=exc)
+
+                if backlog:
+                    continue
+                delay = float(interval)
+                if next_expiry is not None:
+                    until = (next_expiry - datetime.now(UTC)).total_seconds()
+                    delay = min(delay, max(until, 0.0) + _EXPIRY_SLACK_SECONDS)
+
+                try:
+                    async with asyncio.timeout(delay):
+                        _ = await wakeup.wait()
+                except TimeoutError:
+                    pass
+        finally:
+            _expiry_wakeups.discard(wakeup)
 
     async def _run_sync_task(self, state: State, /) -> None:
         """Periodically sync users with media servers.
@@ -175,15 +337,34 @@ class BackgroundTaskManager:
             self._next_sync_run_at = datetime.now(UTC) + timedelta(seconds=interval)
             await asyncio.sleep(interval)
 
-    async def check_expired_invitations(self, state: State, /) -> None:
+    async def check_expired_invitations(self, state: State, /) -> datetime | None:
         """Check for and disable expired invitations.
 
         Public method for testing. Delegates to internal implementation.
 
         Args:
             state: Application state containing session factory (positional-only).
+
+        Returns:
+            The next future expires_at among enabled invitations, if any.
         """
-        await self._check_expired_invitations(state)
+        return await self._check_expired_invitations(state)
+
+    async def enforce_user_expiry(
+        self, state: State, /
+    ) -> tuple[datetime | None, bool]:
+        """Disable or delete expired media server users.
+
+        Public method for testing. Delegates to internal implementation.
+
+        Args:
+            state: Application state containing session factory (positional-only).
+
+        Returns:
+            Tuple of (next future expires_at among enabled users, whether
+            more expired users may be waiting after this pass's batch).
+        """
+        return await self._enforce_user_expiry(state)
 
     async def sync_all_servers(self, state: State, /) -> None:
         """Sync users with all enabled media servers.
@@ -195,15 +376,17 @@ class BackgroundTaskManager:
         """
         await self._sync_all_servers(state)
 
-    async def _check_expired_invitations(self, state: State, /) -> None:
-        """Check for and disable expired invitations.
+    async def _check_expired_invitations(self, state: State, /) -> datetime | None:
+        """Disable expired invitations and find the next expiry.
 
-        Queries all expired but enabled invitations and disables them.
-        Individual errors are logged but don't stop processing of remaining
-        invitations.
+        Disables every enabled invitation whose expires_at has passed with a
+        single UPDATE, then looks up the earliest future expires_at.
 
         Args:
             state: Application state containing session factory (positional-only).
+
+        Returns:
+            The next future expires_at among enabled invitations, if any.
         """
         session_factory = cast(
             async_sessionmaker[AsyncSession],
@@ -214,148 +397,468 @@ class BackgroundTaskManager:
             repo = InvitationRepository(session)
 
             now = datetime.now(UTC)
-            expired = await repo.get_expired(now)
-
-            disabled_count = 0
-            for invitation in expired:
-                try:
-                    if invitation.enabled:
-                        invitation.enabled = False
-                        _ = await repo.update(invitation)
-                        disabled_count += 1
-                except Exception as exc:
-                    logger.warning(
-                        "Failed to disable expired invitation",
-                        invitation_id=str(invitation.id),
-                        error=str(exc),
-                    )
-
+            async with self._db_write_lock:
+                disabled_count = await repo.disable_expired(now)
+                if disabled_count > 0:
+                    await session.commit()
             if disabled_count > 0:
-                await session.commit()
                 logger.info(
                     "Disabled expired invitations",
                     count=disabled_count,
                     checked_at=now.isoformat(),
                 )
 
-    async def _sync_all_servers(self, state: State, /) -> None:
-        """Sync users with all enabled media servers.
+            return await repo.get_next_expiry(now)
 
-        Uses short-lived sessions per operation to avoid holding SQLite's
-        write lock during external API calls (which can take several seconds).
-        Individual server failures are logged but don't stop processing
-        of remaining servers.
+    async def _enforce_user_expiry(
+        self, state: State, /
+    ) -> tuple[datetime | None, bool]:
+        """Act on users whose expires_at has passed.
+
+        One indexed query finds up to user_expiry_batch_size expired,
+        still-enabled users of enabled servers whose circuit breaker is not
+        open. They are grouped by media server and each server's batch is
+        processed through one client session, up to sync_max_concurrency
+        servers at once. Local records are updated in the writer stage and
+        each server's outcome is recorded as an "expiry" sync run.
+
+        A full batch leaves a keyset cursor so the next pass resumes after
+        it; users that could not be processed stay enabled and are retried
+        once a pass reaches the end and the cursor is reset. A batch of
+        users that keep failing therefore never holds back the rest.
 
         Args:
             state: Application state containing session factory (positional-only).
+
+        Returns:
+            Tuple of (next future expires_at among enabled users, whether
+            more expired users may be waiting after this batch).
         """
         session_factory = cast(
             async_sessionmaker[AsyncSession],
             state.session_factory,
         )
+        batch_size = self.settings.user_expiry_batch_size
+        now = datetime.now(UTC)
 
-        # Fetch enabled servers with a short-lived session
         async with session_factory() as session:
-            server_repo = MediaServerRepository(session)
-            servers = await server_repo.get_enabled()
-            # Detach server data before closing session
-            server_ids_and_names = [(s.id, s.name) for s in servers]
-
-        # Sync libraries per server, each with its own session
-        for server_id, server_name in server_ids_and_names:
-            started_at = datetime.now(UTC)
-            self._libraries_sync_in_progress.add(server_id)
-            try:
-                async with session_factory() as session:
-                    server_repo = MediaServerRepository(session)
-                    media_server_service = MediaServerService(server_repo)
-                    _ = await media_server_service.sync_libraries(server_id)
-                    await session.commit()
-                await self._record_sync_run(
-                    state,
-                    media_server_id=server_id,
-                    sync_type="libraries",
-                    trigger="automatic",
-                    status="success",
-                    started_at=started_at,
-                )
-                logger.info(
-                    "Library sync completed",
-                    server_id=str(server_id),
-                    server_name=server_name,
+            # Users of unreachable servers wait until the breaker lets a trial in
+            unavailable = [
+                server.id
+                for server in await MediaServerRepository(session).get_enabled()
+                if registry.is_circuit_open(server)
+            ]
+            user_repo = UserRepository(session)
+            expired = await user_repo.get_expired_enabled(
+                now,
+                limit=batch_size,
+                after=self._user_expiry_after,
+                exclude_server_ids=unavailable,
+            )
+            next_expiry = await user_repo.get_next_expiry(now)
+
+        backlog = len(expired) >= batch_size
+        self._user_expiry_after = None
+        if backlog:
+            last = expired[-1]
+            self._user_expiry_after = (last.expires_at, last.id)
+
+        by_server: dict[UUID, list[User]] = {}
+        servers: dict[UUID, MediaServer] = {}
+        for user in expired:
+            by_server.setdefault(user.media_server_id, []).append(user)
+            servers[user.media_server_id] = user.media_server
+
+        if not by_server:
+            return next_expiry, False
+
+        semaphore = asyncio.Semaphore(self.settings.sync_max_concurrency)
+
+        async def expire_one(server_id: UUID) -> int:
+            async with semaphore:
+                return await self._expire_server_users(
+                    state, servers[server_id], by_server[server_id]
                 )
-            except Exception as exc:
-                await self._record_sync_run(
-                    state,
-                    media_server_id=server_id,
-                    sync_type="libraries",
-                    trigger="automatic",
-                    status="failed",
-                    started_at=started_at,
-                    error_message=str(exc),
+
+        _ = await asyncio.gather(*(expire_one(sid) for sid in by_server))
+        return next_expiry, backlog
+
+    async def _expire_server_users(
+        self,
+        state: State,
+        server: MediaServer,
+        users: Sequence[User],
+        /,
+    ) -> int:
+        """Expire one server's users remotely, then apply the results locally.
+
+        Returns:
+            The number of users processed (disabled, deleted or found missing).
+        """
+        session_factory = cast(
+            async_sessionmaker[AsyncSession],
+            state.session_factory,
+        )
+        server_id, server_name = server.id, server.name
+        action = self.settings.user_expiry_action
+        started_at = datetime.now(UTC)
+        outcomes, errors = await self._apply_remote_expiry(server, users)
+
+        disable_ids = [
+            user_id
+            for user_id, outcome in outcomes.items()
+            if outcome in ("disabled", "shares_removed")
+            or (outcome == "missing" and action == "disable")
+        ]
+        delete_ids = {
+            user_id
+            for user_id, outcome in outcomes.items()
+            if outcome == "deleted" or (outcome == "missing" and action == "delete")
+        }
+        deleted_users = [user for user in users if user.id in delete_ids]
+
+        try:
+            async with session_factory() as session, self._db_write_lock:
+                user_repo = UserRepository(session)
+                _ = await user_repo.disable_many(disable_ids)
+                _ = await user_repo.bulk_update_external_types(
+                    [
+                        (user_id, "friend")
+                        for user_id, outcome in outcomes.items()
+                        if outcome == "shares_removed"
+                    ]
                 )
+                if deleted_users:
+                    if server.server_type == "plex":
+                        # Keep Plex's cached user list from re-importing them
+                        exclusion_repo = SyncExclusionRepository(session)
+                        for user in deleted_users:
+                            _ = await exclusion_repo.add_exclusion(
+                                user.external_user_id, server_id
+                            )
+                    _ = await user_repo.delete_many(delete_ids)
+                    _ = await IdentityRepository(session).delete_without_users(
+                        {user.identity_id for user in deleted_users}
+                    )
+                await session.commit()
+        except Exception as exc:
+            errors.append(f"Failed to save results: {exc}")
+            outcomes.clear()
+
+        failed = len(users) - len(outcomes)
+        error_message = None
+        if failed:
+            error_message = (
+                f"{failed} of {len(users)} expired users not processed: "
+                + ("; ".join(errors[:5]))
+            )
+        async with self._db_write_lock:
+            await self._record_sync_run(
+                state,
+                media_server_id=server_id,
+                sync_type="expiry",
+                trigger="automatic",
+                status="failed" if failed else "success",
+                started_at=started_at,
+                error_message=error_message,
+            )
+
+        log = logger.warning if failed else logger.info
+        log(
+            "User expiry enforced",
+            server_id=str(server_id),
+            server_name=server_name,
+            action=action,
+            disabled=len(disable_ids) if outcomes else 0,
+            deleted=len(delete_ids) if outcomes else 0,
+            failed=failed,
+        )
+        return len(outcomes)
+
+    async def _apply_remote_expiry(
+        self, server: MediaServer, users: Sequence[User], /
+    ) -> tuple[dict[UUID, _ExpiryOutcome], list[str]]:
+        """Disable or delete users on a server through one client session.
+
+        A connection error or timeout, including one a client wraps in
+        MediaClientError, ends the session (so the pool retires the client
+        and the circuit breaker counts the failure) and the remaining users
+        are retried in a fresh session after a backoff, up to
+        user_expiry_max_attempts sessions. Other client errors fail only the
+        user concerned.
+
+        Returns:
+            Tuple of (outcome per processed user id, error descriptions).
+        """
+        timeout = self.settings.sync_server_timeout_seconds
+        max_attempts = self.settings.user_expiry_max_attempts
+        outcomes: dict[UUID, _ExpiryOutcome] = {}
+        errors: list[str] = []
+        pending = deque(users)
+
+        for attempt in range(1, max_attempts + 1):
+            try:
+                async with registry.client_session(server) as client:
+                    while pending:
+                        user = pending[0]
+                        try:
+                            async with asyncio.timeout(timeout):
+                                outcomes[user.id] = await self._expire_remote_user(
+                                    client, server, user
+                                )
+                        except MediaClientError as exc:
+                            if _transient_cause(exc) is not None:
+                                raise ExternalServiceError(
+                                    server.name, str(exc), original=exc
+                                ) from exc
+                            errors.append(f"{user.username}: {exc}")
+                        _ = pending.popleft()
+                return outcomes, errors
+            except CircuitOpenError as exc:
+                errors.append(str(exc))
+                return outcomes, errors
+            except _TRANSIENT_ERRORS as exc:
+                if attempt == max_attempts:
+                    errors.append(f"Gave up after {attempt} attempts: {exc}")
+                    return outcomes, errors
+                delay = _EXPIRY_RETRY_BASE_SECONDS * 2 ** (attempt - 1)
                 logger.warning(
-                    "Library sync failed",
-                    server_id=str(server_id),
-                    server_name=server_name,
+                    "User expiry attempt failed, retrying",
+                    server_id=str(server.id),
+                    server_name=server.name,
+                    attempt=attempt,
+                    remaining=len(pending),
+                    retry_in_seconds=delay,
                     error=str(exc),
                 )
-            finally:
-                self._libraries_sync_in_progress.discard(server_id)
+                await asyncio.sleep(delay)
+            except Exception as exc:
+                errors.append(str(exc))
+                return outcomes, errors
+        return outcomes, errors
 
-        # Sync users per server, each with its own session
-        for server_id, server_name in server_ids_and_names:
-            started_at = datetime.now(UTC)
-            self._users_sync_in_progress.add(server_id)
-            try:
-                async with session_factory() as session:
-                    server_repo = MediaServerRepository(session)
-                    user_repo = UserRepository(session)
-                    identity_repo = IdentityRepository(session)
-                    sync_exclusion_repo = SyncExclusionRepository(session)
-                    sync_service = SyncService(
-                        server_repo,
-                        user_repo,
-                        identity_repo,
-                        sync_exclusion_repo=sync_exclusion_repo,
+    async def _expire_remote_user(
+        self, client: MediaClient, server: MediaServer, user: User, /
+    ) -> _ExpiryOutcome:
+        """Apply the configured expiry action to one user on its server.
+
+        Servers that cannot disable accounts (Plex) have the user's library
+        shares removed instead, and "delete" falls back to disabling on
+        servers that cannot delete users.
+
+        Raises:
+            MediaClientError: If the server supports neither action.
+        """
+        capabilities = registry.get_capabilities(server.server_type)
+        external_id = user.external_user_id
+
+        if (
+            self.settings.user_expiry_action == "delete"
+            and Capability.DELETE_USER in capabilities
+        ):
+            return "deleted" if await client.delete_user(external_id) else "missing"
+        if Capability.ENABLE_DISABLE_USER in capabilities:
+            if await client.set_user_enabled(external_id, enabled=False):
+                return "disabled"
+            return "missing"
+        if Capability.REMOVE_SHARED_ACCESS in capabilities:
+            if await client.remove_shared_access(external_id):
+                return "shares_removed"
+            return "disabled"
+        raise MediaClientError(
+            f"{server.server_type} servers cannot disable or delete users",
+            operation="expire_user",
+            server_url=server.url,
+        )
+
+    async def _sync_all_servers(self, state: State, /) -> None:
+        """Sync libraries and users with all enabled media servers.
+
+        Remote state is fetched for up to ``sync_max_concurrency`` servers at
+        once. Each server is connected to once for both its libraries and its
+        users, each step bounded by ``sync_server_timeout_seconds``. Database
+        writes run in a separate stage serialized by ``_db_write_lock`` so
+        SQLite only ever sees one writer, and no session holds the write lock
+        during external API calls. Individual server failures are logged and
+        recorded but don't stop processing of remaining servers. Servers
+        whose circuit breaker is open are skipped until it lets a trial in.
+
+        Args:
+            state: Application state containing session factory (positional-only).
+        """
+        session_factory = cast(
+            async_sessionmaker[AsyncSession],
+            state.session_factory,
+        )
+
+        # Fetch enabled servers with a short-lived session. The detached
+        # entities keep their loaded columns, which is all clients need.
+        async with session_factory() as session:
+            server_repo = MediaServerRepository(session)
+            servers = list(await server_repo.get_enabled())
+
+        # Servers whose circuit breaker is open would only fail fast; leave
+        # them for a later cycle instead of recording another failed run
+        skipped = [server for server in servers if registry.is_circuit_open(server)]
+        for server in skipped:
+            logger.info(
+                "Skipping sync of unavailable server",
+                server_id=str(server.id),
+                server_name=server.name,
+            )
+        servers = [server for server in servers if server not in skipped]
+        if not servers:
+            return
+
+        semaphore = asyncio.Semaphore(self.settings.sync_max_concurrency)
+
+        async def sync_one(server: MediaServer) -> None:
+            async with semaphore:
+                await self._sync_server(state, server)
+
+        _ = await asyncio.gather(*(sync_one(server) for server in servers))
+
+    async def _sync_server(self, state: State, server: MediaServer, /) -> None:
+        """Sync a server's libraries and users over a single client session.
+
+        Both lists are fetched through one connection, then both diffs and
+        their ``libraries`` and ``users`` sync runs are written in one
+        transaction in the writer stage. A part that failed to fetch is
+        recorded as a failed run while the other part is still applied.
+
+        The users reconcile is skipped when the fetched list has the same
+        fingerprint as the one the last successful users sync recorded.
+        Manual syncs record no fingerprint, so the next automatic run after
+        one always reconciles in full.
+        """
+        session_factory = cast(
+            async_sessionmaker[AsyncSession],
+            state.session_factory,
+        )
+        server_id, server_name = server.id, server.name
+        started_at = datetime.now(UTC)
+        self._libraries_sync_in_progress.add(server_id)
+        self._users_sync_in_progress.add(server_id)
+        try:
+            async with session_factory() as session:
+                server_repo = MediaServerRepository(session)
+                media_server_service = MediaServerService(server_repo)
+                sync_service = SyncService(
+                    server_repo,
+                    UserRepository(session),
+                    IdentityRepository(session),
+                    sync_exclusion_repo=SyncExclusionRepository(session),
+                )
+                sync_run_repo = SyncRunRepository(session)
+                try:
+                    remote = await sync_service.fetch_server_state(
+                        server, timeout=self.settings.sync_server_timeout_seconds
+                    )
+                except Exception as exc:
+                    remote = RemoteServerState(libraries_error=exc, users_error=exc)
+
+                # An unchanged remote list would reconcile to the same result,
+                # so skip loading local users and the users write entirely
+                fingerprint: str | None = None
+                users_unchanged = False
+                if remote.users is not None:
+                    fingerprint = user_list_fingerprint(remote.users)
+                    previous = await sync_run_repo.get_latest_success_by_type(
+                        server_id, "users"
                     )
-                    result = await sync_service.sync_server(server_id, dry_run=False)
+                    users_unchanged = (
+                        previous is not None and previous.fingerprint == fingerprint
+                    )
+
+                result: SyncResult | None = None
+                async with self._db_write_lock:
+                    if remote.libraries is not None:
+                        _ = await media_server_service.apply_libraries(
+                            server_id, remote.libraries
+                        )
+                    if remote.users is not None and not users_unchanged:
+                        result = await sync_service.reconcile_users(
+                            server_id, remote.users, dry_run=False
+                        )
+                    finished_at = datetime.now(UTC)
+                    for sync_type, error, run_fingerprint in (
+                        ("libraries", remote.libraries_error, None),
+                        ("users", remote.users_error, fingerprint),
+                    ):
+                        _ = await sync_run_repo.create(
+                            SyncRun(
+                                media_server_id=server_id,
+                                sync_type=sync_type,
+                                trigger="automatic",
+                                status="success" if error is None else "failed",
+                                started_at=started_at,
+                                finished_at=finished_at,
+                                error_message=None if error is None else str(error),
+                                fingerprint=run_fingerprint,
+                            )
+                        )
                     await session.commit()
-                await self._record_sync_run(
-                    state,
-                    media_server_id=server_id,
-                    sync_type="users",
-                    trigger="automatic",
-                    status="success",
-                    started_at=started_at,
-                )
-                logger.info(
-                    "Server sync completed",
-                    server_id=str(server_id),
-                    server_name=server_name,
-                    orphaned=len(result.orphaned_users),
-                    stale=len(result.stale_users),
-                    matched=result.matched_users,
-                    imported=result.imported_users,
-                )
-            except Exception as exc:
-                await self._record_sync_run(
-                    state,
-                    media_server_id=server_id,
-                    sync_type="users",
-                    trigger="automatic",
-                    status="failed",
-                    started_at=started_at,
-                    error_message=str(exc),
-                )
-                logger.warning(
-                    "Server sync failed",
-                    server_id=str(server_id),
-                    server_name=server_name,
-                    error=str(exc),
-                )
-            finally:
-                self._users_sync_in_progress.discard(server_id)
+        except Exception as exc:
+            # The transaction was rolled back, so neither diff was applied
+            async with self._db_write_lock:
+                for sync_type in ("libraries", "users"):
+                    await self._record_sync_run(
+                        state,
+                        media_server_id=server_id,
+                        sync_type=sync_type,
+                        trigger="automatic",
+                        status="failed",
+                        started_at=started_at,
+                        error_message=str(exc),
+                    )
+            logger.warning(
+                "Server sync failed",
+                server_id=str(server_id),
+                server_name=server_name,
+                error=str(exc),
+            )
+            return
+        finally:
+            self._libraries_sync_in_progress.discard(server_id)
+            self._users_sync_in_progress.discard(server_id)
+
+        if remote.libraries_error is not None:
+            logger.warning(
+                "Library sync failed",
+                server_id=str(server_id),
+                server_name=server_name,
+                error=str(remote.libraries_error),
+            )
+        else:
+            logger.info(
+                "Library sync completed",
+                server_id=str(server_id),
+                server_name=server_name,
+            )
+        if remote.users_error is not None:
+            logger.warning(
+                "Server sync failed",
+                server_id=str(server_id),
+                server_name=server_name,
+                error=str(remote.users_error),
+            )
+        elif result is None:
+            logger.debug(
+                "Server sync skipped, user list unchanged",
+                server_id=str(server_id),
+                server_name=server_name,
+                users=len(remote.users or ()),
+            )
+        else:
+            logger.info(
+                "Server sync completed",
+                server_id=str(server_id),
+                server_name=server_name,
+                orphaned=len(result.orphaned_users),
+                stale=len(result.stale_users),
+                matched=result.matched_users,
+                imported=result.imported_users,
+            )
 
     async def _record_sync_run(
         self,
@@ -368,6 +871,7 @@ class BackgroundTaskManager:
         status: str,
         started_at: datetime,
         error_message: str | None = None,
+        fingerprint: str | None = None,
     ) -> None:
         """Persist a sync run record in a dedicated short-lived session."""
         session_factory = cast(
@@ -388,6 +892,7 @@ class BackgroundTaskManager:
                         started_at=started_at,
                         finished_at=finished_at,
                         error_message=error_message,
+                        fingerprint=fingerprint,
                     )
                 )
                 await session.commit()
@@ -9,10 +9,11 @@ Provides:
 - LibraryInfo: msgspec Struct for library information from media servers
 - ExternalUser: msgspec Struct for user information from media servers
 - MediaClientError: Exception for media client operation failures
+- CircuitOpenError: Exception for operations refused by a server's circuit breaker
 - UnknownServerTypeError: Exception for unknown server types
 """
 
-from .exceptions import MediaClientError, UnknownServerTypeError
+from .exceptions import CircuitOpenError, MediaClientError, UnknownServerTypeError
 from .protocol import MediaClient
 from .provider import MediaClientClass
 from .registry import ClientRegistry, registry
@@ -20,6 +21,7 @@ from .types import Capability, ExternalUser, LibraryInfo
 
 __all__ = [
     "Capability",
+    "CircuitOpenError",
     "ClientRegistry",
     "ExternalUser",
     "LibraryInfo",
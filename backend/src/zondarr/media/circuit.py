@@ -0,0 +1,210 @@
+"""Per-server circuit breaker for media server connections.
+
+Provides:
+- CircuitState: The closed, open and half-open breaker states
+- CircuitSnapshot: Point-in-time view of a breaker for the API
+- CircuitBreaker: Failure counting and fail-fast gate for one server
+
+A server that fails failure_threshold operations in a row with a connection
+error or timeout opens its circuit. While open, callers fail immediately
+with CircuitOpenError instead of waiting for the connect timeout. Once the
+open period has passed the circuit is half-open: one caller is let through
+as a trial while others keep failing fast. A successful trial closes the
+circuit; a failed one reopens it for twice as long, up to max_open_seconds.
+Operations admitted before the circuit opened neither extend nor close it.
+
+Breakers live in the process's ClientRegistry, so each worker process
+tracks its servers independently.
+"""
+
+import time
+from datetime import UTC, datetime, timedelta
+from enum import StrEnum
+from typing import final
+
+import msgspec
+import structlog
+
+from .exceptions import CircuitOpenError
+
+log: structlog.stdlib.BoundLogger = structlog.get_logger()  # pyright: ignore[reportAny]
+
+
+class CircuitState(StrEnum):
+    """State of a server's circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitSnapshot(msgspec.Struct, frozen=True, kw_only=True):
+    """Point-in-time view of a circuit breaker.
+
+    Attributes:
+        state: Current breaker state.
+        consecutive_failures: Failures since the last success.
+        retry_at: When an open circuit lets the next trial through.
+        last_error: Description of the most recent failure.
+    """
+
+    state: CircuitState
+    consecutive_failures: int = 0
+    retry_at: datetime | None = None
+    last_error: str | None = None
+
+
+@final
+class CircuitBreaker:
+    """Circuit breaker for one media server.
+
+    Only touched from the event loop thread, so no locking is needed.
+    """
+
+    __slots__ = (
+        "_failure_threshold",
+        "_failures",
+        "_is_open",
+        "_last_error",
+        "_max_open_seconds",
+        "_open_seconds",
+        "_open_until",
+        "_retry_at",
+        "_trial_in_flight",
+        "_trips",
+        "name",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        /,
+        *,
+        failure_threshold: int,
+        open_seconds: float,
+        max_open_seconds: float,
+    ) -> None:
+        """Initialize a closed breaker.
+
+        Args:
+            name: Server description used in errors and logs (positional-only).
+            failure_threshold: Consecutive failures that open the circuit
+                (keyword-only).
+            open_seconds: First open period; doubles with each consecutive
+                trip (keyword-only).
+            max_open_seconds: Upper bound for the open period (keyword-only).
+        """
+        self.name = name
+        self._failure_threshold = failure_threshold
+        self._open_seconds = open_seconds
+        self._max_open_seconds = max_open_seconds
+        self._failures = 0
+        self._trips = 0
+        self._is_open = False
+        self._open_until = 0.0
+        self._retry_at: datetime | None = None
+        self._trial_in_flight = False
+        self._last_error: str | None = None
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state; an open circuit past its open period is half-open."""
+        if not self._is_open:
+            return CircuitState.CLOSED
+        if time.monotonic() < self._open_until:
+            return CircuitState.OPEN
+        return CircuitState.HALF_OPEN
+
+    def snapshot(self) -> CircuitSnapshot:
+        """Return the breaker's current state for display."""
+        state = self.state
+        return CircuitSnapshot(
+            state=state,
+            consecutive_failures=self._failures,
+            retry_at=self._retry_at if state is CircuitState.OPEN else None,
+            last_error=self._last_error,
+        )
+
+    def acquire(self) -> bool:
+        """Admit an operation or fail fast.
+
+        Returns:
+            True if the operation is the half-open trial. Pass it back to
+            record_success, record_failure or release.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with a
+                trial operation already in flight.
+        """
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return False
+        if state is CircuitState.OPEN:
+            raise CircuitOpenError(
+                self.name, retry_after=self._open_until - time.monotonic()
+            )
+        if self._trial_in_flight:
+            raise CircuitOpenError(self.name, retry_after=0.0)
+        self._trial_in_flight = True
+        return True
+
+    def record_success(self, *, trial: bool = False) -> None:
+        """Record that the server answered; closes the circuit.
+
+        While the circuit is open only the trial closes it; a late success
+        from an operation admitted before it opened is ignored.
+
+        Args:
+            trial: Whether the operation was the half-open trial (keyword-only).
+        """
+        if self._is_open and not trial:
+            return
+        if self._is_open:
+            log.info("media_server_circuit_closed", server=self.name)
+        self._failures = 0
+        self._trips = 0
+        self._is_open = False
+        self._retry_at = None
+        self._trial_in_flight = False
+        self._last_error = None
+
+    def record_failure(self, error: str, /, *, trial: bool = False) -> None:
+        """Record a connection failure; may open or reopen the circuit.
+
+        While the circuit is open only a failed trial reopens it. Failures
+        of operations admitted before it opened are counted but do not
+        extend the open period.
+
+        Args:
+            error: Description of the failure (positional-only).
+            trial: Whether the operation was the half-open trial (keyword-only).
+        """
+        if trial:
+            self._trial_in_flight = False
+        self._failures += 1
+        self._last_error = error
+        if self._is_open and not trial:
+            return
+        if not trial and self._failures < self._failure_threshold:
+            return
+        open_seconds = min(self._open_seconds * 2**self._trips, self._max_open_seconds)
+        self._trips += 1
+        self._is_open = True
+        self._open_until = time.monotonic() + open_seconds
+        self._retry_at = datetime.now(UTC) + timedelta(seconds=open_seconds)
+        log.warning(
+            "media_server_circuit_opened",
+            server=self.name,
+            consecutive_failures=self._failures,
+            open_seconds=open_seconds,
+            error=error,
+        )
+
+    def release(self, *, trial: bool = False) -> None:
+        """End an operation without a verdict (e.g. it was cancelled).
+
+        Args:
+            trial: Whether the operation was the half-open trial (keyword-only).
+        """
+        if trial:
+            self._trial_in_flight = False
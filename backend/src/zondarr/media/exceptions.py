@@ -2,13 +2,14 @@
 
 Provides domain-specific exceptions for media client operations:
 - MediaClientError: Raised when a media client operation fails
+- CircuitOpenError: Raised instead of contacting a server known to be down
 - UnknownServerTypeError: Raised when an unknown server type is requested
 
 All exceptions inherit from ZondarrError base class and include
 error_code and context for traceability.
 """
 
-from zondarr.core.exceptions import ZondarrError
+from zondarr.core.exceptions import ExternalServiceError, ZondarrError
 
 
 class MediaClientError(ZondarrError):
@@ -61,6 +62,35 @@ class MediaClientError(ZondarrError):
         self.media_error_code = error_code
 
 
+class CircuitOpenError(ExternalServiceError):
+    """Raised when a media server's circuit breaker is rejecting operations.
+
+    The server failed repeatedly with connection errors or timeouts, so
+    the operation is refused immediately instead of waiting for another
+    connect timeout.
+
+    Attributes:
+        retry_after: Seconds until the breaker lets a trial operation through.
+    """
+
+    retry_after: float
+
+    def __init__(self, service_name: str, /, *, retry_after: float) -> None:
+        """Initialize a CircuitOpenError.
+
+        Args:
+            service_name: The media server the breaker protects.
+            retry_after: Seconds until the next trial is allowed.
+        """
+        retry_after = max(retry_after, 0.0)
+        super().__init__(
+            service_name,
+            f"{service_name} is unavailable after repeated connection"
+            + f" failures; retrying in {retry_after:.0f}s",
+        )
+        self.retry_after = retry_after
+
+
 class UnknownServerTypeError(ZondarrError):
     """Raised when an unknown server type is requested from the registry.
 
@@ -206,10 +206,6 @@ class OAuthFlowProvider(Protocol):
         """Check if a PIN has been authenticated."""
         ...
 
-    async def close(self) -> None:
-        """Close resources."""
-        ...
-
 
 class ProviderDescriptor(Protocol):
     """Protocol that each media server provider implements.
@@ -251,5 +247,13 @@ class ProviderDescriptor(Protocol):
     def create_oauth_flow_provider(
         self, settings: Settings
     ) -> OAuthFlowProvider | None:
-        """Create an OAuth flow provider, or None if not supported."""
+        """Create an OAuth flow provider, or None if not supported.
+
+        Flow providers may share resources owned by the provider, so callers
+        do not close them; the provider releases them in close().
+        """
+        ...
+
+    async def close(self) -> None:
+        """Release resources owned by the provider (called on app shutdown)."""
         ...
@@ -95,3 +95,6 @@ class JellyfinProvider:
         """Jellyfin does not support OAuth flows."""
         del settings  # required by ProviderDescriptor protocol
         return None
+
+    async def close(self) -> None:
+        """Jellyfin providers hold no resources."""
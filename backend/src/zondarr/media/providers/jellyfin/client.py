@@ -5,12 +5,15 @@ for communicating with Jellyfin media servers.
 
 Uses jellyfin-sdk (webysther/jellyfin-sdk-python) - a modern Python 3.13+ SDK
 with high-level abstractions, method chaining, and JSONPath support.
+jellyfin-sdk is synchronous, so operations use asyncio.to_thread() to avoid
+blocking the event loop for the duration of each HTTP round trip.
 
 Uses Python 3.14 features:
 - Deferred annotations (no forward reference quotes needed)
 - Self type for proper return type in context manager
 """
 
+import asyncio
 from collections.abc import Sequence
 from typing import TYPE_CHECKING, Self
 
@@ -95,7 +98,8 @@ class JellyfinClient:
     """Jellyfin media server client.
 
     Implements the MediaClient protocol for Jellyfin servers.
-    Uses jellyfin-sdk for server communication.
+    Uses jellyfin-sdk for server communication. jellyfin-sdk is synchronous,
+    so all operations use asyncio.to_thread() for non-blocking behavior.
 
     Attributes:
         url: The Jellyfin server URL.
@@ -143,7 +147,8 @@ class JellyfinClient:
         """Enter async context, establishing connection.
 
         Initializes the jellyfin-sdk API client with the configured
-        URL and API key.
+        URL and API key using asyncio.to_thread(), since importing and
+        constructing the SDK is synchronous.
 
         Returns:
             Self for use in async with statements.
@@ -151,7 +156,8 @@ class JellyfinClient:
         Raises:
             ExternalServiceError: If connection to the Jellyfin server fails.
         """
-        try:
+
+        def _connect() -> jellyfin.Api:
             import warnings
 
             warnings.filterwarnings(
@@ -161,7 +167,10 @@ class JellyfinClient:
             )
             import jellyfin
 
-            self._api = jellyfin.api(self.url, self.api_key)
+            return jellyfin.api(self.url, self.api_key)
+
+        try:
+            self._api = await asyncio.to_thread(_connect)
         except Exception as exc:
             raise _create_external_service_error(
                 f"Failed to connect to Jellyfin server: {exc}",
@@ -200,10 +209,16 @@ class JellyfinClient:
         if self._api is None:
             return False
 
+        api = self._api
+
         try:
-            # Query server system info to verify connectivity and authentication
-            # jellyfin-sdk lacks type stubs, so system.info returns Any
-            info: object = self._api.system.info  # pyright: ignore[reportAny]
+
+            def _query_system_info() -> object:
+                # Query server system info to verify connectivity and authentication
+                # jellyfin-sdk lacks type stubs, so system.info returns Any
+                return api.system.info  # pyright: ignore[reportAny]
+
+            info = await asyncio.to_thread(_query_system_info)
             return info is not None
         except Exception:
             # Handle all connection errors gracefully - return False, don't raise
@@ -228,24 +243,30 @@ class JellyfinClient:
                 cause="API client is None - __aenter__ was not called",
             )
 
+        api = self._api
+
         try:
-            info: object = self._api.system.info  # pyright: ignore[reportAny]
-
-            # Extract ServerName (handle both camelCase and snake_case)
-            server_name: str = "Unknown"
-            if hasattr(info, "ServerName"):
-                server_name = str(info.ServerName)  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType, reportUnknownArgumentType]
-            elif hasattr(info, "server_name"):
-                server_name = str(info.server_name)  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType, reportUnknownArgumentType]
-
-            # Extract Version
-            version: str | None = None
-            if hasattr(info, "Version"):
-                version = str(info.Version)  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType, reportUnknownArgumentType]
-            elif hasattr(info, "version"):
-                version = str(info.version)  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType, reportUnknownArgumentType]
-
-            return ServerInfo(server_name=server_name, version=version)
+
+            def _get_info() -> ServerInfo:
+                info: object = api.system.info  # pyright: ignore[reportAny]
+
+                # Extract ServerName (handle both camelCase and snake_case)
+                server_name: str = "Unknown"
+                if hasattr(info, "ServerName"):
+                    server_name = str(info.ServerName)  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType, reportUnknownArgumentType]
+                elif hasattr(info, "server_name"):
+                    server_name = str(info.server_name)  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType, reportUnknownArgumentType]
+
+                # Extract Version
+                version: str | None = None
+                if hasattr(info, "Version"):
+                    version = str(info.Version)  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType, reportUnknownArgumentType]
+                elif hasattr(info, "version"):
+                    version = str(info.version)  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType, reportUnknownArgumentType]
+
+                return ServerInfo(server_name=server_name, version=version)
+
+            return await asyncio.to_thread(_get_info)
         except Exception as exc:
             if _is_external_service_error(exc):
                 raise _create_external_service_error(
@@ -285,50 +306,55 @@ class JellyfinClient:
                 cause="API client is None - __aenter__ was not called",
             )
 
+        api = self._api
+
         try:
-            # jellyfin-sdk lacks type stubs, so virtual_folders returns Any
-            folders = self._api.library.virtual_folders  # pyright: ignore[reportAny]
-
-            if folders is None:
-                return []
-
-            # Map Jellyfin virtual folders to LibraryInfo structs
-            libraries: list[LibraryInfo] = []
-            for folder in folders:  # pyright: ignore[reportAny]
-                # Extract fields from the folder object
-                # jellyfin-sdk uses attribute access for JSON fields
-                external_id: str = str(
-                    folder.ItemId  # pyright: ignore[reportAny]
-                    if hasattr(folder, "ItemId")  # pyright: ignore[reportAny]
-                    else folder.item_id  # pyright: ignore[reportAny]
-                )
-                name: str = str(
-                    folder.Name  # pyright: ignore[reportAny]
-                    if hasattr(folder, "Name")  # pyright: ignore[reportAny]
-                    else folder.name  # pyright: ignore[reportAny]
-                )
 
-                # CollectionType may be None for mixed/unknown libraries
-                collection_type: str | None = None
-                if hasattr(folder, "CollectionType"):  # pyright: ignore[reportAny]
-                    collection_type = folder.CollectionType  # pyright: ignore[reportAny]
-                elif hasattr(folder, "collection_type"):  # pyright: ignore[reportAny]
-                    collection_type = folder.collection_type  # pyright: ignore[reportAny]
+            def _get_libraries() -> list[LibraryInfo]:
+                # jellyfin-sdk lacks type stubs, so virtual_folders returns Any
+                folders = api.library.virtual_folders  # pyright: ignore[reportAny]
+
+                if folders is None:
+                    return []
+
+                # Map Jellyfin virtual folders to LibraryInfo structs
+                libraries: list[LibraryInfo] = []
+                for folder in folders:  # pyright: ignore[reportAny]
+                    # Extract fields from the folder object
+                    # jellyfin-sdk uses attribute access for JSON fields
+                    external_id: str = str(
+                        folder.ItemId  # pyright: ignore[reportAny]
+                        if hasattr(folder, "ItemId")  # pyright: ignore[reportAny]
+                        else folder.item_id  # pyright: ignore[reportAny]
+                    )
+                    name: str = str(
+                        folder.Name  # pyright: ignore[reportAny]
+                        if hasattr(folder, "Name")  # pyright: ignore[reportAny]
+                        else folder.name  # pyright: ignore[reportAny]
+                    )
 
-                library_type: str = (
-                    str(collection_type) if collection_type else "unknown"
-                )
+                    # CollectionType may be None for mixed/unknown libraries
+                    collection_type: str | None = None
+                    if hasattr(folder, "CollectionType"):  # pyright: ignore[reportAny]
+                        collection_type = folder.CollectionType  # pyright: ignore[reportAny]
+                    elif hasattr(folder, "collection_type"):  # pyright: ignore[reportAny]
+                        collection_type = folder.collection_type  # pyright: ignore[reportAny]
 
-                libraries.append(
-                    LibraryInfo(
-                        external_id=external_id,
-                        name=name,
-                        library_type=library_type,
+                    library_type: str = (
+                        str(collection_type) if collection_type else "unknown"
                     )
-                )
 
-            return libraries
+                    libraries.append(
+                        LibraryInfo(
+                            external_id=external_id,
+                            name=name,
+                            library_type=library_type,
+                        )
+                    )
+
+                return libraries
 
+            return await asyncio.to_thread(_get_libraries)
         except Exception as exc:
             # Wrap external service errors appropriately
             if _is_external_service_error(exc):
@@ -382,45 +408,50 @@ class JellyfinClient:
                 cause="API client is None - __aenter__ was not called",
             )
 
+        api = self._api
+
         try:
-            # Step 1: Create user via jellyfin-sdk users.create
-            # jellyfin-sdk lacks type stubs, so returns Any
-            user = self._api.users.create(name=username)  # pyright: ignore[reportAny]
-
-            # Extract user ID - jellyfin-sdk may use Id or id attribute
-            user_id: str
-            if hasattr(user, "Id"):  # pyright: ignore[reportAny]
-                user_id = str(user.Id)  # pyright: ignore[reportAny]
-            elif hasattr(user, "id"):  # pyright: ignore[reportAny]
-                user_id = str(user.id)  # pyright: ignore[reportAny]
-            else:
-                raise MediaClientError(
-                    "Failed to extract user ID from Jellyfin response",
-                    operation="create_user",
-                    server_url=self.url,
-                    cause="User object has no Id or id attribute",
-                )
 
-            # Extract username - jellyfin-sdk may use Name or name attribute
-            created_username: str
-            if hasattr(user, "Name"):  # pyright: ignore[reportAny]
-                created_username = str(user.Name)  # pyright: ignore[reportAny]
-            elif hasattr(user, "name"):  # pyright: ignore[reportAny]
-                created_username = str(user.name)  # pyright: ignore[reportAny]
-            else:
-                created_username = username
-
-            # Step 2: Set password via users.update_password
-            self._api.users.update_password(  # pyright: ignore[reportAny]
-                user_id, new_password=password
-            )
+            def _create() -> ExternalUser:
+                # Step 1: Create user via jellyfin-sdk users.create
+                # jellyfin-sdk lacks type stubs, so returns Any
+                user = api.users.create(name=username)  # pyright: ignore[reportAny]
 
-            return ExternalUser(
-                external_user_id=user_id,
-                username=created_username,
-                email=email,
-            )
+                # Extract user ID - jellyfin-sdk may use Id or id attribute
+                user_id: str
+                if hasattr(user, "Id"):  # pyright: ignore[reportAny]
+                    user_id = str(user.Id)  # pyright: ignore[reportAny]
+                elif hasattr(user, "id"):  # pyright: ignore[reportAny]
+                    user_id = str(user.id)  # pyright: ignore[reportAny]
+                else:
+                    raise MediaClientError(
+                        "Failed to extract user ID from Jellyfin response",
+                        operation="create_user",
+                        server_url=self.url,
+                        cause="User object has no Id or id attribute",
+                    )
+
+                # Extract username - jellyfin-sdk may use Name or name attribute
+                created_username: str
+                if hasattr(user, "Name"):  # pyright: ignore[reportAny]
+                    created_username = str(user.Name)  # pyright: ignore[reportAny]
+                elif hasattr(user, "name"):  # pyright: ignore[reportAny]
+                    created_username = str(user.name)  # pyright: ignore[reportAny]
+                else:
+                    created_username = username
+
+                # Step 2: Set password via users.update_password
+                api.users.update_password(  # pyright: ignore[reportAny]
+                    user_id, new_password=password
+                )
+
+                return ExternalUser(
+                    external_user_id=user_id,
+                    username=created_username,
+                    email=email,
+                )
 
+            return await asyncio.to_thread(_create)
         except MediaClientError:
             # Re-raise our own errors
             raise
@@ -477,10 +508,16 @@ class JellyfinClient:
                 cause="API client is None - __aenter__ was not called",
             )
 
+        api = self._api
+
         try:
-            # Delete user via jellyfin-sdk users.delete
-            self._api.users.delete(external_user_id)  # pyright: ignore[reportAny]
-            return True
+
+            def _delete() -> bool:
+                # Delete user via jellyfin-sdk users.delete
+                api.users.delete(external_user_id)  # pyright: ignore[reportAny]
+                return True
+
+            return await asyncio.to_thread(_delete)
         except Exception as exc:
             error_msg = str(exc).lower()
             # Check for user not found error - return False
@@ -537,52 +574,57 @@ class JellyfinClient:
                 cause="API client is None - __aenter__ was not called",
             )
 
-        try:
-            # Step 1: Get current user via jellyfin-sdk users.get
-            # jellyfin-sdk lacks type stubs, so returns Any
-            user = self._api.users.get(external_user_id)  # pyright: ignore[reportAny]
+        api = self._api
 
-            if user is None:
-                return False
+        try:
 
-            # Step 2: Get current policy from user
-            # jellyfin-sdk may use Policy or policy attribute
-            # Using Any type since jellyfin-sdk lacks type stubs
-            policy = None
-            if hasattr(user, "Policy"):  # pyright: ignore[reportAny]
-                policy = user.Policy  # pyright: ignore[reportAny]
-            elif hasattr(user, "policy"):  # pyright: ignore[reportAny]
-                policy = user.policy  # pyright: ignore[reportAny]
+            def _set_enabled() -> bool:
+                # Step 1: Get current user via jellyfin-sdk users.get
+                # jellyfin-sdk lacks type stubs, so returns Any
+                user = api.users.get(external_user_id)  # pyright: ignore[reportAny]
+
+                if user is None:
+                    return False
+
+                # Step 2: Get current policy from user
+                # jellyfin-sdk may use Policy or policy attribute
+                # Using Any type since jellyfin-sdk lacks type stubs
+                policy = None
+                if hasattr(user, "Policy"):  # pyright: ignore[reportAny]
+                    policy = user.Policy  # pyright: ignore[reportAny]
+                elif hasattr(user, "policy"):  # pyright: ignore[reportAny]
+                    policy = user.policy  # pyright: ignore[reportAny]
+
+                if policy is None:
+                    raise MediaClientError(
+                        "Failed to retrieve user policy from Jellyfin response",
+                        operation="set_user_enabled",
+                        server_url=self.url,
+                        cause="User object has no Policy or policy attribute",
+                    )
 
-            if policy is None:
-                raise MediaClientError(
-                    "Failed to retrieve user policy from Jellyfin response",
-                    operation="set_user_enabled",
-                    server_url=self.url,
-                    cause="User object has no Policy or policy attribute",
-                )
+                # Step 3: Update IsDisabled flag based on enabled parameter
+                # enabled=True means IsDisabled=False, enabled=False means IsDisabled=True
+                if hasattr(policy, "IsDisabled"):  # pyright: ignore[reportAny]
+                    policy.IsDisabled = not enabled
+                elif hasattr(policy, "is_disabled"):  # pyright: ignore[reportAny]
+                    policy.is_disabled = not enabled
+                else:
+                    raise MediaClientError(
+                        "Failed to update IsDisabled flag in user policy",
+                        operation="set_user_enabled",
+                        server_url=self.url,
+                        cause="Policy object has no IsDisabled or is_disabled attribute",
+                    )
 
-            # Step 3: Update IsDisabled flag based on enabled parameter
-            # enabled=True means IsDisabled=False, enabled=False means IsDisabled=True
-            if hasattr(policy, "IsDisabled"):  # pyright: ignore[reportAny]
-                policy.IsDisabled = not enabled
-            elif hasattr(policy, "is_disabled"):  # pyright: ignore[reportAny]
-                policy.is_disabled = not enabled
-            else:
-                raise MediaClientError(
-                    "Failed to update IsDisabled flag in user policy",
-                    operation="set_user_enabled",
-                    server_url=self.url,
-                    cause="Policy object has no IsDisabled or is_disabled attribute",
+                # Step 4: Update user policy via jellyfin-sdk
+                api.users.update_policy(  # pyright: ignore[reportAny]
+                    external_user_id, policy
                 )
 
-            # Step 4: Update user policy via jellyfin-sdk
-            self._api.users.update_policy(  # pyright: ignore[reportAny]
-                external_user_id, policy
-            )
-
-            return True
+                return True
 
+            return await asyncio.to_thread(_set_enabled)
         except MediaClientError:
             # Re-raise our own errors
             raise
@@ -643,66 +685,71 @@ class JellyfinClient:
                 cause="API client is None - __aenter__ was not called",
             )
 
+        api = self._api
+
         try:
-            # Step 1: Get current user via jellyfin-sdk users.get
-            # jellyfin-sdk lacks type stubs, so returns Any
-            user = self._api.users.get(external_user_id)  # pyright: ignore[reportAny]
 
-            if user is None:
-                return False
+            def _set_access() -> bool:
+                # Step 1: Get current user via jellyfin-sdk users.get
+                # jellyfin-sdk lacks type stubs, so returns Any
+                user = api.users.get(external_user_id)  # pyright: ignore[reportAny]
+
+                if user is None:
+                    return False
+
+                # Step 2: Get current policy from user
+                # jellyfin-sdk may use Policy or policy attribute
+                policy = None
+                if hasattr(user, "Policy"):  # pyright: ignore[reportAny]
+                    policy = user.Policy  # pyright: ignore[reportAny]
+                elif hasattr(user, "policy"):  # pyright: ignore[reportAny]
+                    policy = user.policy  # pyright: ignore[reportAny]
+
+                if policy is None:
+                    raise MediaClientError(
+                        "Failed to retrieve user policy from Jellyfin response",
+                        operation="set_library_access",
+                        server_url=self.url,
+                        cause="User object has no Policy or policy attribute",
+                    )
 
-            # Step 2: Get current policy from user
-            # jellyfin-sdk may use Policy or policy attribute
-            policy = None
-            if hasattr(user, "Policy"):  # pyright: ignore[reportAny]
-                policy = user.Policy  # pyright: ignore[reportAny]
-            elif hasattr(user, "policy"):  # pyright: ignore[reportAny]
-                policy = user.policy  # pyright: ignore[reportAny]
+                # Step 3: Set EnableAllFolders=False
+                # This restricts the user to only the specified libraries
+                if hasattr(policy, "EnableAllFolders"):  # pyright: ignore[reportAny]
+                    policy.EnableAllFolders = False
+                elif hasattr(policy, "enable_all_folders"):  # pyright: ignore[reportAny]
+                    policy.enable_all_folders = False
+                else:
+                    raise MediaClientError(
+                        "Failed to update EnableAllFolders flag in user policy",
+                        operation="set_library_access",
+                        server_url=self.url,
+                        cause="Policy object has no EnableAllFolders or enable_all_folders attribute",
+                    )
 
-            if policy is None:
-                raise MediaClientError(
-                    "Failed to retrieve user policy from Jellyfin response",
-                    operation="set_library_access",
-                    server_url=self.url,
-                    cause="User object has no Policy or policy attribute",
-                )
+                # Step 4: Set EnabledFolders to the library IDs
+                # Convert Sequence to list for the API
+                library_id_list = list(library_ids)
+                if hasattr(policy, "EnabledFolders"):  # pyright: ignore[reportAny]
+                    policy.EnabledFolders = library_id_list
+                elif hasattr(policy, "enabled_folders"):  # pyright: ignore[reportAny]
+                    policy.enabled_folders = library_id_list
+                else:
+                    raise MediaClientError(
+                        "Failed to update EnabledFolders in user policy",
+                        operation="set_library_access",
+                        server_url=self.url,
+                        cause="Policy object has no EnabledFolders or enabled_folders attribute",
+                    )
 
-            # Step 3: Set EnableAllFolders=False
-            # This restricts the user to only the specified libraries
-            if hasattr(policy, "EnableAllFolders"):  # pyright: ignore[reportAny]
-                policy.EnableAllFolders = False
-            elif hasattr(policy, "enable_all_folders"):  # pyright: ignore[reportAny]
-                policy.enable_all_folders = False
-            else:
-                raise MediaClientError(
-                    "Failed to update EnableAllFolders flag in user policy",
-                    operation="set_library_access",
-                    server_url=self.url,
-                    cause="Policy object has no EnableAllFolders or enable_all_folders attribute",
+                # Step 5: Update user policy via jellyfin-sdk
+                api.users.update_policy(  # pyright: ignore[reportAny]
+                    external_user_id, policy
                 )
 
-            # Step 4: Set EnabledFolders to the library IDs
-            # Convert Sequence to list for the API
-            library_id_list = list(library_ids)
-            if hasattr(policy, "EnabledFolders"):  # pyright: ignore[reportAny]
-                policy.EnabledFolders = library_id_list
-            elif hasattr(policy, "enabled_folders"):  # pyright: ignore[reportAny]
-                policy.enabled_folders = library_id_list
-            else:
-                raise MediaClientError(
-                    "Failed to update EnabledFolders in user policy",
-                    operation="set_library_access",
-                    server_url=self.url,
-                    cause="Policy object has no EnabledFolders or enabled_folders attribute",
-                )
-
-            # Step 5: Update user policy via jellyfin-sdk
-            self._api.users.update_policy(  # pyright: ignore[reportAny]
-                external_user_id, policy
-            )
-
-            return True
+                return True
 
+            return await asyncio.to_thread(_set_access)
         except MediaClientError:
             # Re-raise our own errors
             raise
@@ -770,78 +817,83 @@ class JellyfinClient:
                 cause="API client is None - __aenter__ was not called",
             )
 
-        try:
-            # Step 1: Get current user via jellyfin-sdk users.get
-            # jellyfin-sdk lacks type stubs, so returns Any
-            user = self._api.users.get(external_user_id)  # pyright: ignore[reportAny]
+        api = self._api
 
-            if user is None:
-                return False
+        try:
 
-            # Step 2: Get current policy from user
-            # jellyfin-sdk may use Policy or policy attribute
-            policy = None
-            if hasattr(user, "Policy"):  # pyright: ignore[reportAny]
-                policy = user.Policy  # pyright: ignore[reportAny]
-            elif hasattr(user, "policy"):  # pyright: ignore[reportAny]
-                policy = user.policy  # pyright: ignore[reportAny]
+            def _update_permissions() -> bool:
+                # Step 1: Get current user via jellyfin-sdk users.get
+                # jellyfin-sdk lacks type stubs, so returns Any
+                user = api.users.get(external_user_id)  # pyright: ignore[reportAny]
+
+                if user is None:
+                    return False
+
+                # Step 2: Get current policy from user
+                # jellyfin-sdk may use Policy or policy attribute
+                policy = None
+                if hasattr(user, "Policy"):  # pyright: ignore[reportAny]
+                    policy = user.Policy  # pyright: ignore[reportAny]
+                elif hasattr(user, "policy"):  # pyright: ignore[reportAny]
+                    policy = user.policy  # pyright: ignore[reportAny]
+
+                if policy is None:
+                    raise MediaClientError(
+                        "Failed to retrieve user policy from Jellyfin response",
+                        operation="update_permissions",
+                        server_url=self.url,
+                        cause="User object has no Policy or policy attribute",
+                    )
 
-            if policy is None:
-                raise MediaClientError(
-                    "Failed to retrieve user policy from Jellyfin response",
-                    operation="update_permissions",
-                    server_url=self.url,
-                    cause="User object has no Policy or policy attribute",
+                # Step 3: Map universal permissions to Jellyfin policy fields
+                # Only update fields that are provided in the permissions dict
+
+                # can_download -> EnableContentDownloading
+                if "can_download" in permissions:
+                    value = permissions["can_download"]
+                    if hasattr(policy, "EnableContentDownloading"):  # pyright: ignore[reportAny]
+                        policy.EnableContentDownloading = value
+                    elif hasattr(policy, "enable_content_downloading"):  # pyright: ignore[reportAny]
+                        policy.enable_content_downloading = value
+
+                # can_stream -> EnableMediaPlayback
+                if "can_stream" in permissions:
+                    value = permissions["can_stream"]
+                    if hasattr(policy, "EnableMediaPlayback"):  # pyright: ignore[reportAny]
+                        policy.EnableMediaPlayback = value
+                    elif hasattr(policy, "enable_media_playback"):  # pyright: ignore[reportAny]
+                        policy.enable_media_playback = value
+
+                # can_sync -> EnableSyncTranscoding
+                if "can_sync" in permissions:
+                    value = permissions["can_sync"]
+                    if hasattr(policy, "EnableSyncTranscoding"):  # pyright: ignore[reportAny]
+                        policy.EnableSyncTranscoding = value
+                    elif hasattr(policy, "enable_sync_transcoding"):  # pyright: ignore[reportAny]
+                        policy.enable_sync_transcoding = value
+
+                # can_transcode -> EnableAudioPlaybackTranscoding, EnableVideoPlaybackTranscoding
+                if "can_transcode" in permissions:
+                    value = permissions["can_transcode"]
+                    # Set EnableAudioPlaybackTranscoding
+                    if hasattr(policy, "EnableAudioPlaybackTranscoding"):  # pyright: ignore[reportAny]
+                        policy.EnableAudioPlaybackTranscoding = value
+                    elif hasattr(policy, "enable_audio_playback_transcoding"):  # pyright: ignore[reportAny]
+                        policy.enable_audio_playback_transcoding = value
+                    # Set EnableVideoPlaybackTranscoding
+                    if hasattr(policy, "EnableVideoPlaybackTranscoding"):  # pyright: ignore[reportAny]
+                        policy.EnableVideoPlaybackTranscoding = value
+                    elif hasattr(policy, "enable_video_playback_transcoding"):  # pyright: ignore[reportAny]
+                        policy.enable_video_playback_transcoding = value
+
+                # Step 4: Update user policy via jellyfin-sdk
+                api.users.update_policy(  # pyright: ignore[reportAny]
+                    external_user_id, policy
                 )
 
-            # Step 3: Map universal permissions to Jellyfin policy fields
-            # Only update fields that are provided in the permissions dict
-
-            # can_download -> EnableContentDownloading
-            if "can_download" in permissions:
-                value = permissions["can_download"]
-                if hasattr(policy, "EnableContentDownloading"):  # pyright: ignore[reportAny]
-                    policy.EnableContentDownloading = value
-                elif hasattr(policy, "enable_content_downloading"):  # pyright: ignore[reportAny]
-                    policy.enable_content_downloading = value
-
-            # can_stream -> EnableMediaPlayback
-            if "can_stream" in permissions:
-                value = permissions["can_stream"]
-                if hasattr(policy, "EnableMediaPlayback"):  # pyright: ignore[reportAny]
-                    policy.EnableMediaPlayback = value
-                elif hasattr(policy, "enable_media_playback"):  # pyright: ignore[reportAny]
-                    policy.enable_media_playback = value
-
-            # can_sync -> EnableSyncTranscoding
-            if "can_sync" in permissions:
-                value = permissions["can_sync"]
-                if hasattr(policy, "EnableSyncTranscoding"):  # pyright: ignore[reportAny]
-                    policy.EnableSyncTranscoding = value
-                elif hasattr(policy, "enable_sync_transcoding"):  # pyright: ignore[reportAny]
-                    policy.enable_sync_transcoding = value
-
-            # can_transcode -> EnableAudioPlaybackTranscoding, EnableVideoPlaybackTranscoding
-            if "can_transcode" in permissions:
-                value = permissions["can_transcode"]
-                # Set EnableAudioPlaybackTranscoding
-                if hasattr(policy, "EnableAudioPlaybackTranscoding"):  # pyright: ignore[reportAny]
-                    policy.EnableAudioPlaybackTranscoding = value
-                elif hasattr(policy, "enable_audio_playback_transcoding"):  # pyright: ignore[reportAny]
-                    policy.enable_audio_playback_transcoding = value
-                # Set EnableVideoPlaybackTranscoding
-                if hasattr(policy, "EnableVideoPlaybackTranscoding"):  # pyright: ignore[reportAny]
-                    policy.EnableVideoPlaybackTranscoding = value
-                elif hasattr(policy, "enable_video_playback_transcoding"):  # pyright: ignore[reportAny]
-                    policy.enable_video_playback_transcoding = value
-
-            # Step 4: Update user policy via jellyfin-sdk
-            self._api.users.update_policy(  # pyright: ignore[reportAny]
-                external_user_id, policy
-            )
-
-            return True
+                return True
 
+            return await asyncio.to_thread(_update_permissions)
         except MediaClientError:
             # Re-raise our own errors
             raise
@@ -903,49 +955,54 @@ class JellyfinClient:
                 cause="API client is None - __aenter__ was not called",
             )
 
-        try:
-            # Retrieve all users via jellyfin-sdk users.all
-            # jellyfin-sdk lacks type stubs, so returns Any
-            users = self._api.users.all  # pyright: ignore[reportAny]
-
-            if users is None:
-                return []
+        api = self._api
 
-            # Map Jellyfin users to ExternalUser structs
-            external_users: list[ExternalUser] = []
-            for user in users:  # pyright: ignore[reportAny]
-                # Extract user ID - jellyfin-sdk may use Id or id attribute
-                user_id: str
-                if hasattr(user, "Id"):  # pyright: ignore[reportAny]
-                    user_id = str(user.Id)  # pyright: ignore[reportAny]
-                elif hasattr(user, "id"):  # pyright: ignore[reportAny]
-                    user_id = str(user.id)  # pyright: ignore[reportAny]
-                else:
-                    # Skip users without valid ID
-                    continue
+        try:
 
-                # Extract username - jellyfin-sdk may use Name or name attribute
-                username: str
-                if hasattr(user, "Name"):  # pyright: ignore[reportAny]
-                    username = str(user.Name)  # pyright: ignore[reportAny]
-                elif hasattr(user, "name"):  # pyright: ignore[reportAny]
-                    username = str(user.name)  # pyright: ignore[reportAny]
-                else:
-                    # Skip users without valid username
-                    continue
-
-                # Jellyfin users typically don't have email addresses
-                # The email field is included for protocol compatibility
-                external_users.append(
-                    ExternalUser(
-                        external_user_id=user_id,
-                        username=username,
-                        email=None,
+            def _list_users() -> list[ExternalUser]:
+                # Retrieve all users via jellyfin-sdk users.all
+                # jellyfin-sdk lacks type stubs, so returns Any
+                users = api.users.all  # pyright: ignore[reportAny]
+
+                if users is None:
+                    return []
+
+                # Map Jellyfin users to ExternalUser structs
+                external_users: list[ExternalUser] = []
+                for user in users:  # pyright: ignore[reportAny]
+                    # Extract user ID - jellyfin-sdk may use Id or id attribute
+                    user_id: str
+                    if hasattr(user, "Id"):  # pyright: ignore[reportAny]
+                        user_id = str(user.Id)  # pyright: ignore[reportAny]
+                    elif hasattr(user, "id"):  # pyright: ignore[reportAny]
+                        user_id = str(user.id)  # pyright: ignore[reportAny]
+                    else:
+                        # Skip users without valid ID
+                        continue
+
+                    # Extract username - jellyfin-sdk may use Name or name attribute
+                    username: str
+                    if hasattr(user, "Name"):  # pyright: ignore[reportAny]
+                        username = str(user.Name)  # pyright: ignore[reportAny]
+                    elif hasattr(user, "name"):  # pyright: ignore[reportAny]
+                        username = str(user.name)  # pyright: ignore[reportAny]
+                    else:
+                        # Skip users without valid username
+                        continue
+
+                    # Jellyfin users typically don't have email addresses
+                    # The email field is included for protocol compatibility
+                    external_users.append(
+                        ExternalUser(
+                            external_user_id=user_id,
+                            username=username,
+                            email=None,
+                        )
                     )
-                )
 
-            return external_users
+                return external_users
 
+            return await asyncio.to_thread(_list_users)
         except Exception as exc:
             # Wrap external service errors appropriately
             if _is_external_service_error(exc):
@@ -19,6 +19,7 @@ from zondarr.media.provider import (
 
 from .auth import PlexAdminAuth
 from .client import PlexClient
+from .executor import shutdown_plex_executor
 from .oauth_service import PlexOAuthError, PlexOAuthService
 
 if TYPE_CHECKING:
@@ -32,7 +33,10 @@ _DEFAULT_PLEX_CLIENT_ID = "zondarr-oauth-client"
 
 
 class _PlexOAuthFlowAdapter:
-    """Adapts PlexOAuthService to the OAuthFlowProvider protocol."""
+    """Adapts PlexOAuthService to the OAuthFlowProvider protocol.
+
+    The wrapped service is shared and owned by PlexProvider.
+    """
 
     _service: PlexOAuthService
 
@@ -65,10 +69,6 @@ class _PlexOAuthFlowAdapter:
                 error=exc.message,
             )
 
-    async def close(self) -> None:
-        """Close the underlying HTTP client."""
-        await self._service.close()
-
 
 # Module-level cached instances (immutable msgspec Structs / stateless objects)
 _PLEX_METADATA = ProviderMetadata(
@@ -90,7 +90,19 @@ _PLEX_JOIN_FLOW = JoinFlowDescriptor(flow_type=JoinFlowType.OAUTH_LINK)
 
 
 class PlexProvider:
-    """Plex ProviderDescriptor implementation."""
+    """Plex ProviderDescriptor implementation.
+
+    Owns the app-wide PlexOAuthService, created on first use so its pooled
+    HTTP client is bound to the running event loop. close() releases it
+    together with the plexapi thread pool and session.
+    """
+
+    __slots__ = ("_oauth_service",)
+
+    _oauth_service: PlexOAuthService | None
+
+    def __init__(self) -> None:
+        self._oauth_service = None
 
     @property
     def metadata(self) -> ProviderMetadata:
@@ -117,7 +129,15 @@ class PlexProvider:
         return None
 
     def create_oauth_flow_provider(self, settings: Settings) -> _PlexOAuthFlowAdapter:
-        """Create a Plex OAuth flow provider."""
+        """Create a Plex OAuth flow provider backed by the shared service."""
         del settings  # unused; client_id is a fixed default
-        service = PlexOAuthService(client_id=_DEFAULT_PLEX_CLIENT_ID)
-        return _PlexOAuthFlowAdapter(service)
+        if self._oauth_service is None:
+            self._oauth_service = PlexOAuthService(client_id=_DEFAULT_PLEX_CLIENT_ID)
+        return _PlexOAuthFlowAdapter(self._oauth_service)
+
+    async def close(self) -> None:
+        """Close the shared OAuth service, plexapi pool and HTTP connections."""
+        service, self._oauth_service = self._oauth_service, None
+        if service is not None:
+            await service.close()
+        shutdown_plex_executor()
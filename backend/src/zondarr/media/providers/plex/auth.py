@@ -4,7 +4,6 @@ Handles Plex OAuth token verification for admin login.
 Extracted from services/auth.py to be provider-self-contained.
 """
 
-import asyncio
 from collections.abc import Mapping
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
@@ -12,6 +11,8 @@ from typing import TYPE_CHECKING
 from zondarr.core.exceptions import AuthenticationError
 from zondarr.models.admin import AdminAccount
 
+from .executor import plex_session, run_plex
+
 if TYPE_CHECKING:
     from zondarr.config import Settings
     from zondarr.repositories.admin import AdminAccountRepository
@@ -67,7 +68,9 @@ class PlexAdminAuth:
             )
 
         try:
-            account = await asyncio.to_thread(MyPlexAccount, token=auth_token)
+            account = await run_plex(
+                MyPlexAccount, token=auth_token, session=plex_session()
+            )
             _raw_email: object = account.email  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
             _raw_username: object = account.username  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
             plex_email = str(_raw_email)  # pyright: ignore[reportUnknownArgumentType]
@@ -83,8 +86,8 @@ class PlexAdminAuth:
 
         # Verify the authenticating user is the configured Plex server owner
         try:
-            owner_account = await asyncio.to_thread(
-                MyPlexAccount, token=configured_plex_token
+            owner_account = await run_plex(
+                MyPlexAccount, token=configured_plex_token, session=plex_session()
             )
             _raw_owner_email: object = owner_account.email  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
             owner_email = str(_raw_owner_email)  # pyright: ignore[reportUnknownArgumentType]
@@ -4,8 +4,9 @@ Provides the PlexClient class that implements the MediaClient protocol
 for communicating with Plex media servers.
 
 Uses python-plexapi (PlexAPI v4.18+) for server communication.
-PlexAPI is synchronous, so operations use asyncio.to_thread() to avoid
-blocking the event loop.
+PlexAPI is synchronous, so operations run on the dedicated Plex thread
+pool (see executor.py) to avoid blocking the event loop, and all clients
+share one keep-alive HTTP session.
 
 Uses Python 3.14 features:
 - Deferred annotations (no forward reference quotes needed)
@@ -13,6 +14,8 @@ Uses Python 3.14 features:
 """
 
 import asyncio
+import threading
+import time
 from collections.abc import Sequence
 from typing import TYPE_CHECKING, Self, final
 
@@ -26,6 +29,9 @@ from zondarr.core.exceptions import ExternalServiceError
 from zondarr.media.exceptions import MediaClientError
 from zondarr.media.types import Capability, ExternalUser, LibraryInfo, ServerInfo
 
+from .executor import plex_session, run_plex
+from .users_xml import stream_account_users
+
 log: structlog.stdlib.BoundLogger = structlog.get_logger()  # pyright: ignore[reportAny]
 
 
@@ -198,14 +204,142 @@ def _create_external_service_error(
     )
 
 
+# How long a plex.tv user listing is reused for single-user lookups
+_USER_DIRECTORY_TTL_SECONDS: float = 30.0
+
+
+@final
+class _PlexUserDirectory:
+    """Per-client cache of plex.tv account users indexed by user ID.
+
+    MyPlexAccount.users() downloads the full friends/home list from plex.tv,
+    so single-user operations reuse one listing for a short TTL instead of
+    fetching and scanning it every time. A user whose server shares may have
+    changed is marked stale rather than dropped: lookups that rely on the
+    user's shares refetch it, while lookups that only need the user's
+    identity keep using the cached entry. A lookup miss on a cached listing
+    triggers one refresh so users added outside this client are still found.
+
+    Methods are synchronous and must be called from worker threads; the lock
+    also ensures concurrent lookups share a single plex.tv fetch.
+    """
+
+    _ttl_seconds: float
+    _lock: threading.Lock
+    _by_id: dict[str, object]
+    _stale: set[str]
+    _fetched_at: float | None
+
+    def __init__(self, *, ttl_seconds: float = _USER_DIRECTORY_TTL_SECONDS) -> None:
+        """Initialize an empty directory.
+
+        Args:
+            ttl_seconds: How long a listing stays valid (keyword-only).
+        """
+        self._ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._by_id = {}
+        self._stale = set()
+        self._fetched_at = None
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._fetched_at is not None
+            and time.monotonic() - self._fetched_at < self._ttl_seconds
+        )
+
+    def _load(self, account: MyPlexAccount, /) -> list[object]:
+        # plexapi lacks type stubs, users() returns list of MyPlexUser
+        users: list[object] = list(account.users())  # pyright: ignore[reportUnknownArgumentType, reportUnknownMemberType]
+        self._by_id = {
+            user_id: user
+            for user in users
+            if (user_id := str(getattr(user, "id", "") or ""))
+        }
+        self._stale.clear()
+        self._fetched_at = time.monotonic()
+        return users
+
+    def refresh(self, account: MyPlexAccount, /) -> list[object]:
+        """Fetch the account's users from plex.tv and re-index them.
+
+        Args:
+            account: The admin MyPlexAccount (positional-only).
+
+        Returns:
+            The users in the order plex.tv returned them.
+        """
+        with self._lock:
+            return self._load(account)
+
+    def get(
+        self, account: MyPlexAccount, user_id: str, /, *, allow_stale: bool = False
+    ) -> object | None:
+        """Look up a user by ID, fetching from plex.tv only when needed.
+
+        Args:
+            account: The admin MyPlexAccount (positional-only).
+            user_id: The Plex user ID to find (positional-only).
+            allow_stale: Return a stale entry instead of refetching, for
+                callers that do not rely on the user's shares (keyword-only).
+
+        Returns:
+            The MyPlexUser, or None if the account has no such user.
+        """
+        with self._lock:
+            if self._is_fresh() and (allow_stale or user_id not in self._stale):
+                user = self._by_id.get(user_id)
+                if user is not None:
+                    return user
+            _ = self._load(account)
+            return self._by_id.get(user_id)
+
+    def is_stale(self, user_id: str, /) -> bool:
+        """Report whether a user's cached shares may be out of date.
+
+        Args:
+            user_id: The Plex user ID (positional-only).
+
+        Returns:
+            True if the user was marked stale since the last listing.
+        """
+        with self._lock:
+            return user_id in self._stale
+
+    def invalidate(self, user_id: str | None = None, /) -> None:
+        """Mark one user stale, or drop the whole listing when no ID is given.
+
+        Args:
+            user_id: The user whose shares changed (positional-only). When
+                None, the next lookup always fetches from plex.tv.
+        """
+        with self._lock:
+            if user_id is None:
+                self._by_id = {}
+                self._stale.clear()
+                self._fetched_at = None
+            elif user_id in self._by_id:
+                self._stale.add(user_id)
+
+    def discard(self, user_id: str, /) -> None:
+        """Drop a user that was removed from the account.
+
+        Args:
+            user_id: The removed user's Plex ID (positional-only).
+        """
+        with self._lock:
+            _ = self._by_id.pop(user_id, None)
+            self._stale.discard(user_id)
+
+
 class PlexClient:
     """Plex media server client.
 
     Implements the MediaClient protocol for Plex servers.
     Uses python-plexapi for server communication.
 
-    PlexAPI is synchronous, so all operations use asyncio.to_thread()
-    to run without blocking the event loop.
+    PlexAPI is synchronous, so all operations use run_plex() to run on
+    the Plex thread pool without blocking the event loop.
 
     Attributes:
         url: The Plex server URL.
@@ -216,6 +350,8 @@ class PlexClient:
     api_key: str
     _server: PlexServer | None
     _account: MyPlexAccount | None
+    _account_lock: asyncio.Lock
+    _users: _PlexUserDirectory
 
     def __init__(self, *, url: str, api_key: str) -> None:
         """Initialize a PlexClient.
@@ -228,6 +364,8 @@ class PlexClient:
         self.api_key = api_key
         self._server = None
         self._account = None
+        self._account_lock = asyncio.Lock()
+        self._users = _PlexUserDirectory()
 
     @classmethod
     def capabilities(cls) -> set[Capability]:
@@ -254,8 +392,11 @@ class PlexClient:
     async def __aenter__(self) -> Self:
         """Enter async context, establishing connection.
 
-        Initializes the PlexServer and MyPlexAccount connections using
-        asyncio.to_thread() since python-plexapi is synchronous.
+        Connects to the Plex server only, using the Plex thread pool since
+        python-plexapi is synchronous. The server owner's plex.tv account is
+        opened on first use by an operation that needs it (see
+        _ensure_account), so library syncs and connection tests never wait
+        on plex.tv. Both share the pooled plex_session().
 
         Returns:
             Self for use in async with statements.
@@ -266,15 +407,12 @@ class PlexClient:
 
         from plexapi.server import PlexServer
 
-        def _connect() -> tuple[PlexServer, MyPlexAccount]:
-            server = PlexServer(self.url, self.api_key)
-            # plexapi lacks type stubs, myPlexAccount returns MyPlexAccount
-            account: MyPlexAccount = server.myPlexAccount()  # pyright: ignore[reportUnknownVariableType]
-            return server, account  # pyright: ignore[reportUnknownVariableType]
+        def _connect() -> PlexServer:
+            return PlexServer(self.url, self.api_key, session=plex_session())
 
         log.info("plex_client_connecting", url=self.url)
         try:
-            self._server, self._account = await asyncio.to_thread(_connect)
+            self._server = await run_plex(_connect)
         except Exception as exc:
             log.error(
                 "plex_client_connection_failed",
@@ -298,7 +436,8 @@ class PlexClient:
     ) -> None:
         """Exit async context, cleaning up resources.
 
-        Releases the PlexServer and MyPlexAccount instances.
+        Releases the PlexServer and MyPlexAccount instances and drops the
+        cached user directory.
 
         Args:
             exc_type: The exception type if an exception was raised, None otherwise.
@@ -308,6 +447,30 @@ class PlexClient:
         log.info("plex_client_disconnecting", url=self.url)
         self._server = None
         self._account = None
+        self._users.invalidate()
+
+    async def _ensure_account(self) -> None:
+        """Open the plex.tv account for operations that manage users.
+
+        Only user and sharing operations call this; server-local operations
+        (test_connection, get_server_info, get_libraries) never touch
+        plex.tv. The account is cached until the context exits. Errors
+        from plexapi propagate to the caller's own error mapping.
+
+        The asyncio lock makes concurrent operations share one plex.tv
+        sign-in without ever blocking the event loop, even when a sign-in
+        is abandoned and still running in its worker thread.
+        """
+        async with self._account_lock:
+            server = self._server
+            if self._account is not None or server is None:
+                return
+            # plexapi lacks type stubs, myPlexAccount returns MyPlexAccount
+            account: MyPlexAccount = await run_plex(server.myPlexAccount)  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+            # Keep it only if the context was not exited during the sign-in
+            if self._server is server:
+                self._account = account
+                log.info("plex_account_connected", url=self.url)
 
     async def test_connection(self) -> bool:
         """Test connectivity to the Plex server.
@@ -332,7 +495,7 @@ class PlexClient:
                 name: str = self._server.friendlyName  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
                 return name  # pyright: ignore[reportUnknownVariableType]
 
-            server_name = await asyncio.to_thread(_query_server_info)
+            server_name = await run_plex(_query_server_info)
             log.info("plex_connection_test_success", url=self.url, server=server_name)
             return True
         except Exception as exc:
@@ -343,7 +506,7 @@ class PlexClient:
         """Return server name and version metadata.
 
         Accesses plexapi's friendlyName and version attributes.
-        Uses asyncio.to_thread() since plexapi is synchronous.
+        Uses run_plex() since plexapi is synchronous.
 
         Returns:
             A ServerInfo object with the server's name and version.
@@ -366,7 +529,7 @@ class PlexClient:
             version: str = self._server.version  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
             return ServerInfo(server_name=name, version=version)  # pyright: ignore[reportUnknownArgumentType]
 
-        return await asyncio.to_thread(_get_info)
+        return await run_plex(_get_info)
 
     async def get_libraries(self) -> Sequence[LibraryInfo]:
         """Retrieve all libraries (sections) from the Plex server.
@@ -410,7 +573,7 @@ class PlexClient:
                     for section in sections  # pyright: ignore[reportUnknownVariableType]
                 ]
 
-            libraries = await asyncio.to_thread(_get_sections)
+            libraries = await run_plex(_get_sections)
             log.info(
                 "plex_libraries_retrieved",
                 url=self.url,
@@ -460,7 +623,7 @@ class PlexClient:
             MediaClientError: If direct sharing fails.
             ExternalServiceError: If the Plex API is unreachable or returns a server error.
         """
-        if self._account is None or self._server is None:
+        if self._server is None:
             raise _create_media_client_error(
                 "Client not initialized - use async context manager",
                 operation="share_library_direct",
@@ -470,6 +633,7 @@ class PlexClient:
             )
 
         try:
+            await self._ensure_account()
             from plexapi.myplex import MyPlexAccount
 
             def _share_direct() -> ExternalUser:
@@ -523,7 +687,10 @@ class PlexClient:
                     user_type="shared",
                 )
 
-            result = await asyncio.to_thread(_share_direct)
+            try:
+                result = await run_plex(_share_direct)
+            finally:
+                self._users.invalidate()
 
             log.info(
                 "plex_library_shared_direct",
@@ -578,10 +745,11 @@ class PlexClient:
         Returns:
             The number of invites cancelled. Returns 0 on any error.
         """
-        if self._account is None or self._server is None:
+        if self._server is None:
             return 0
 
         try:
+            await self._ensure_account()
 
             def _cancel_invites() -> int:
                 assert self._account is not None  # noqa: S101
@@ -614,7 +782,7 @@ class PlexClient:
 
                 return cancelled
 
-            count = await asyncio.to_thread(_cancel_invites)
+            count = await run_plex(_cancel_invites)
 
             if count > 0:
                 log.info(
@@ -656,7 +824,7 @@ class PlexClient:
             MediaClientError: If the user is already a Friend (USER_ALREADY_EXISTS).
             MediaClientError: If the invitation fails for other reasons.
         """
-        if self._account is None or self._server is None:
+        if self._server is None:
             raise _create_media_client_error(
                 "Client not initialized - use async context manager",
                 operation="create_friend",
@@ -666,6 +834,7 @@ class PlexClient:
             )
 
         try:
+            await self._ensure_account()
 
             def _invite() -> object:
                 assert self._account is not None  # noqa: S101
@@ -677,7 +846,10 @@ class PlexClient:
                     server=self._server,
                 )
 
-            user = await asyncio.to_thread(_invite)
+            try:
+                user = await run_plex(_invite)
+            finally:
+                self._users.invalidate()
             # plexapi MyPlexUser has id and username attributes
             user_id: str = str(getattr(user, "id", email))
             username: str = getattr(user, "username", None) or email
@@ -777,7 +949,7 @@ class PlexClient:
             MediaClientError: If the username is already taken (USERNAME_TAKEN).
             MediaClientError: If Home User creation fails for other reasons.
         """
-        if self._account is None or self._server is None:
+        if self._server is None:
             raise _create_media_client_error(
                 "Client not initialized - use async context manager",
                 operation="create_home_user",
@@ -787,6 +959,7 @@ class PlexClient:
             )
 
         try:
+            await self._ensure_account()
 
             def _create() -> object:
                 assert self._account is not None  # noqa: S101
@@ -797,7 +970,10 @@ class PlexClient:
                     server=self._server,
                 )
 
-            user = await asyncio.to_thread(_create)
+            try:
+                user = await run_plex(_create)
+            finally:
+                self._users.invalidate()
             # plexapi MyPlexUser has id attribute
             user_id: str = str(getattr(user, "id", ""))
 
@@ -900,6 +1076,24 @@ class PlexClient:
         # No email provided - create as Home User
         return await self._create_home_user(username)
 
+    def _shares_server_with(self, user: object, /) -> bool:
+        """Check whether a MyPlexUser has a share on this server.
+
+        Args:
+            user: The MyPlexUser to inspect (positional-only).
+
+        Returns:
+            True if one of the user's server shares is for this server.
+        """
+        assert self._server is not None  # noqa: S101
+
+        machine_id: str = self._server.machineIdentifier  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+        servers: list[object] = getattr(user, "servers", None) or []
+        return any(
+            getattr(share, "machineIdentifier", None) == machine_id
+            for share in servers
+        )
+
     def _remove_shared_server_access_sync(self, external_user_id: str) -> bool:
         """Remove shared server access for a user (synchronous, call from thread).
 
@@ -983,7 +1177,7 @@ class PlexClient:
             MediaClientError: If the client is not initialized.
             MediaClientError: If deletion fails for reasons other than user not found.
         """
-        if self._account is None:
+        if self._server is None:
             raise _create_media_client_error(
                 "Client not initialized - use async context manager",
                 operation="delete_user",
@@ -993,20 +1187,18 @@ class PlexClient:
             )
 
         try:
+            await self._ensure_account()
 
             def _delete() -> bool:
                 assert self._account is not None  # noqa: S101
-                # plexapi lacks type stubs, users() returns list of MyPlexUser
-                users = self._account.users()  # pyright: ignore[reportUnknownVariableType]
 
-                # Path 1: Find the user among Friends/Home Users
+                # Path 1: Find the user among Friends/Home Users; removal only
+                # needs the user's identity, so a stale entry is good enough
                 friend_deleted = False
-                target_user: object | None = None
-                for user in users:  # pyright: ignore[reportUnknownVariableType]
-                    user_id: str = str(getattr(user, "id", ""))  # pyright: ignore[reportUnknownArgumentType]
-                    if user_id == external_user_id:
-                        target_user = user  # pyright: ignore[reportUnknownVariableType]
-                        break
+                target_user = self._users.get(
+                    self._account, external_user_id, allow_stale=True
+                )
+                shares_stale = self._users.is_stale(external_user_id)
 
                 if target_user is not None:
                     is_home_user: bool = getattr(target_user, "home", False)  # pyright: ignore[reportUnknownArgumentType]
@@ -1038,10 +1230,10 @@ class PlexClient:
 
                         # Best-effort verification
                         try:
-                            verify_users = self._account.users()  # pyright: ignore[reportUnknownVariableType]
+                            verify_users = self._users.refresh(self._account)
                             still_present = any(
-                                str(getattr(u, "id", "")) == external_user_id  # pyright: ignore[reportUnknownArgumentType]
-                                for u in verify_users  # pyright: ignore[reportUnknownVariableType]
+                                str(getattr(u, "id", "")) == external_user_id
+                                for u in verify_users
                             )
                             if still_present:
                                 log.warning(
@@ -1060,9 +1252,11 @@ class PlexClient:
                 # Path 2: Remove shared server access (only for users with server access)
                 shared_deleted = False
                 if self._server is not None:
-                    # Only attempt shared server removal when the user has server access
-                    has_shared_access = target_user is not None and bool(
-                        getattr(target_user, "servers", None)  # pyright: ignore[reportUnknownArgumentType]
+                    # Only attempt shared server removal when the user has (or,
+                    # with stale shares, may have) server access
+                    has_shared_access = target_user is not None and (
+                        shares_stale
+                        or bool(getattr(target_user, "servers", None))  # pyright: ignore[reportUnknownArgumentType]
                     )
                     if has_shared_access or target_user is None:
                         try:
@@ -1082,7 +1276,10 @@ class PlexClient:
 
                 return friend_deleted or shared_deleted
 
-            deleted = await asyncio.to_thread(_delete)
+            try:
+                deleted = await run_plex(_delete)
+            finally:
+                self._users.discard(external_user_id)
 
             if deleted:
                 log.info(
@@ -1145,7 +1342,7 @@ class PlexClient:
         Raises:
             MediaClientError: If the client is not initialized or operation fails.
         """
-        if self._account is None or self._server is None:
+        if self._server is None:
             raise _create_media_client_error(
                 "Client not initialized - use async context manager",
                 operation="remove_shared_access",
@@ -1155,9 +1352,13 @@ class PlexClient:
             )
 
         try:
-            removed = await asyncio.to_thread(
-                self._remove_shared_server_access_sync, external_user_id
-            )
+            await self._ensure_account()
+            try:
+                removed = await run_plex(
+                    self._remove_shared_server_access_sync, external_user_id
+                )
+            finally:
+                self._users.invalidate(external_user_id)
             if removed:
                 log.info(
                     "plex_shared_access_removed",
@@ -1235,7 +1436,7 @@ class PlexClient:
             MediaClientError: If the library access update fails for reasons
                 other than user not found.
         """
-        if self._account is None or self._server is None:
+        if self._server is None:
             raise _create_media_client_error(
                 "Client not initialized - use async context manager",
                 operation="set_library_access",
@@ -1245,25 +1446,26 @@ class PlexClient:
             )
 
         try:
+            await self._ensure_account()
+            shares_changed = True
 
             def _set_access() -> bool:
+                nonlocal shares_changed
                 assert self._account is not None  # noqa: S101
                 assert self._server is not None  # noqa: S101
 
-                # Get all users to find the target
-                users = self._account.users()  # pyright: ignore[reportUnknownVariableType]
-
-                # Find the user by ID
-                target_user: object | None = None
-                for user in users:  # pyright: ignore[reportUnknownVariableType]
-                    user_id: str = str(getattr(user, "id", ""))  # pyright: ignore[reportUnknownArgumentType]
-                    if user_id == external_user_id:
-                        target_user = user  # pyright: ignore[reportUnknownVariableType]
-                        break
+                # Find the target via the cached user directory
+                target_user = self._users.get(self._account, external_user_id)
 
                 if target_user is None:
                     return False
 
+                # Changing the sections of an existing share keeps the cached
+                # user valid; creating or revoking a share does not
+                shares_changed = not (
+                    library_ids and self._shares_server_with(target_user)
+                )
+
                 # Get library sections to grant access to
                 # Empty list means revoke all access
                 sections: list[object] = []
@@ -1301,7 +1503,11 @@ class PlexClient:
 
                 return True
 
-            updated = await asyncio.to_thread(_set_access)
+            try:
+                updated = await run_plex(_set_access)
+            finally:
+                if shares_changed:
+                    self._users.invalidate(external_user_id)
 
             if updated:
                 log.info(
@@ -1385,7 +1591,7 @@ class PlexClient:
             MediaClientError: If the permission update fails for reasons
                 other than user not found.
         """
-        if self._account is None or self._server is None:
+        if self._server is None:
             raise _create_media_client_error(
                 "Client not initialized - use async context manager",
                 operation="update_permissions",
@@ -1395,21 +1601,14 @@ class PlexClient:
             )
 
         try:
+            await self._ensure_account()
 
             def _update_permissions() -> bool:
                 assert self._account is not None  # noqa: S101
                 assert self._server is not None  # noqa: S101
 
-                # Get all users to find the target
-                users = self._account.users()  # pyright: ignore[reportUnknownVariableType]
-
-                # Find the user by ID
-                target_user: object | None = None
-                for user in users:  # pyright: ignore[reportUnknownVariableType]
-                    user_id: str = str(getattr(user, "id", ""))  # pyright: ignore[reportUnknownArgumentType]
-                    if user_id == external_user_id:
-                        target_user = user  # pyright: ignore[reportUnknownVariableType]
-                        break
+                # Find the target via the cached user directory
+                target_user = self._users.get(self._account, external_user_id)
 
                 if target_user is None:
                     return False
@@ -1429,7 +1628,8 @@ class PlexClient:
 
                 return True
 
-            updated = await asyncio.to_thread(_update_permissions)
+            # allowSync is a friend setting, so the cached shares stay valid
+            updated = await run_plex(_update_permissions)
 
             if updated:
                 log.info(
@@ -1489,8 +1689,9 @@ class PlexClient:
     async def list_users(self) -> Sequence[ExternalUser]:
         """List all users with access to the Plex server.
 
-        Retrieves all Friends and Home Users from the Plex account
-        and maps them to ExternalUser structs.
+        Retrieves all Friends and Home Users from the Plex account by
+        streaming the plex.tv users XML straight into ExternalUser structs,
+        without building plexapi objects for each user.
 
         Returns:
             A sequence of ExternalUser objects with external_user_id,
@@ -1501,7 +1702,7 @@ class PlexClient:
             MediaClientError: If the client is not initialized.
             MediaClientError: If user listing fails due to connection or API errors.
         """
-        if self._account is None or self._server is None:
+        if self._server is None:
             raise _create_media_client_error(
                 "Client not initialized - use async context manager",
                 operation="list_users",
@@ -1511,6 +1712,7 @@ class PlexClient:
             )
 
         try:
+            await self._ensure_account()
 
             def _list_users() -> list[ExternalUser]:
                 assert self._account is not None  # noqa: S101
@@ -1518,42 +1720,12 @@ class PlexClient:
 
                 machine_id: str = self._server.machineIdentifier  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
 
-                # Get all users (Friends and Home Users)
-                users = self._account.users()  # pyright: ignore[reportUnknownVariableType]
-
-                result: list[ExternalUser] = []
-                for user in users:  # pyright: ignore[reportUnknownVariableType]
-                    user_id: str = str(getattr(user, "id", ""))  # pyright: ignore[reportUnknownArgumentType]
-                    username: str = getattr(user, "username", "") or ""  # pyright: ignore[reportUnknownArgumentType]
-                    email: str | None = getattr(user, "email", None)  # pyright: ignore[reportUnknownArgumentType]
-
-                    if not user_id:
-                        continue
-
-                    # Classify user type based on home status and server shares
-                    is_home: bool = getattr(user, "home", False)  # pyright: ignore[reportUnknownArgumentType]
-                    if is_home:
-                        user_type = "home"
-                    else:
-                        user_servers = getattr(user, "servers", []) or []  # pyright: ignore[reportUnknownArgumentType]
-                        has_server_access = any(
-                            getattr(s, "machineIdentifier", None) == machine_id  # pyright: ignore[reportUnknownArgumentType, reportAny]
-                            for s in user_servers  # pyright: ignore[reportAny]
-                        )
-                        user_type = "shared" if has_server_access else "friend"
-
-                    result.append(
-                        ExternalUser(
-                            external_user_id=user_id,
-                            username=username,
-                            email=email,
-                            user_type=user_type,
-                        )
-                    )
-
-                return result
+                # Stream the listing instead of building MyPlexUser objects;
+                # the directory for single-user operations refetches on demand
+                self._users.invalidate()
+                return list(stream_account_users(self._account, machine_id=machine_id))
 
-            users = await asyncio.to_thread(_list_users)
+            users = await run_plex(_list_users)
 
             log.info(
                 "plex_users_listed",
@@ -0,0 +1,271 @@
+"""Dedicated thread pool and HTTP session for python-plexapi.
+
+Provides:
+- run_plex: Run a blocking plexapi call on the Plex thread pool
+- plex_session: Shared keep-alive requests.Session to pass into plexapi
+- shutdown_plex_executor: Stop the pool and close the session
+
+plexapi is synchronous. Running it through asyncio.to_thread() shares the
+default executor with every other blocking call in the app, so a sync of
+several Plex servers can leave user-facing work queued behind it. Each
+PlexServer and MyPlexAccount also creates its own requests.Session unless
+given one, which costs a new TCP/TLS connection per client.
+
+Plex calls therefore run on their own bounded pool and share one session.
+The session's connection pools are sized so every worker thread can hold
+a connection to the Plex server and to plex.tv at the same time. Calls
+that wait longer than SLOW_WAIT_SECONDS for a worker are logged as
+warnings (rate limited), and a summary is logged every
+REPORT_INTERVAL_SECONDS of activity and on shutdown. The queue depth and
+latency counters are only reported through these log events.
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, final
+
+import structlog
+
+if TYPE_CHECKING:
+    from requests import Session
+
+log: structlog.stdlib.BoundLogger = structlog.get_logger()  # pyright: ignore[reportAny]
+
+# Worker threads for plexapi calls across all Plex servers
+PLEX_MAX_WORKERS = 8
+
+# Plex server hosts with a cached connection pool, and connections per host
+PLEX_SERVER_POOL_HOSTS = 4
+PLEX_SERVER_POOL_SIZE = PLEX_MAX_WORKERS
+
+# Connections to plex.tv (friends, sharing and account endpoints)
+PLEX_TV_POOL_SIZE = PLEX_MAX_WORKERS
+
+# A call waiting longer than this for a worker thread is reported
+SLOW_WAIT_SECONDS = 0.5
+
+# Minimum seconds between slow-wait warnings
+SLOW_WAIT_LOG_INTERVAL_SECONDS = 30.0
+
+# Minimum seconds between periodic pool summaries
+REPORT_INTERVAL_SECONDS = 300.0
+
+
+def _create_session() -> Session:
+    """Create a keep-alive session with per-host connection pools."""
+    from requests import Session
+    from requests.adapters import HTTPAdapter
+
+    session = Session()
+    server_adapter = HTTPAdapter(
+        pool_connections=PLEX_SERVER_POOL_HOSTS,
+        pool_maxsize=PLEX_SERVER_POOL_SIZE,
+    )
+    session.mount("http://", server_adapter)
+    session.mount("https://", server_adapter)
+    # requests picks the longest matching prefix, so plex.tv gets its own pool
+    session.mount(
+        "https://plex.tv/",
+        HTTPAdapter(pool_connections=1, pool_maxsize=PLEX_TV_POOL_SIZE),
+    )
+    return session
+
+
+@final
+class _PlexExecutor:
+    """Bounded thread pool for plexapi calls, with wait and run timings.
+
+    Counters are updated from the event loop and from worker threads, so
+    they are guarded by a lock.
+    """
+
+    __slots__ = (
+        "_executor",
+        "_last_report",
+        "_last_slow_log",
+        "_lock",
+        "_session",
+        "calls",
+        "errors",
+        "max_run_seconds",
+        "max_wait_seconds",
+        "peak_queued",
+        "queued",
+        "running",
+        "slow_waits",
+        "total_run_seconds",
+        "total_wait_seconds",
+    )
+
+    def __init__(self) -> None:
+        self._executor: ThreadPoolExecutor | None = None
+        self._session: Session | None = None
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.errors = 0
+        self.queued = 0
+        self.peak_queued = 0
+        self.running = 0
+        self.slow_waits = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.total_run_seconds = 0.0
+        self.max_run_seconds = 0.0
+        self._last_slow_log = 0.0
+        self._last_report = time.monotonic()
+
+    @property
+    def session(self) -> Session:
+        """The shared session, created on first use."""
+        with self._lock:
+            if self._session is None:
+                self._session = _create_session()
+            return self._session
+
+    def snapshot(self) -> dict[str, int | float]:
+        """Return the current counters for logging."""
+        with self._lock:
+            started = max(self.calls - self.queued, 1)
+            finished = max(self.calls - self.queued - self.running, 1)
+            return {
+                "calls": self.calls,
+                "errors": self.errors,
+                "queued": self.queued,
+                "peak_queued": self.peak_queued,
+                "running": self.running,
+                "slow_waits": self.slow_waits,
+                "avg_wait_ms": round(self.total_wait_seconds * 1000 / started, 3),
+                "max_wait_ms": round(self.max_wait_seconds * 1000, 3),
+                "avg_run_ms": round(self.total_run_seconds * 1000 / finished, 3),
+                "max_run_ms": round(self.max_run_seconds * 1000, 3),
+            }
+
+    async def run[**P, T](
+        self, fn: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs
+    ) -> T:
+        """Run `fn(*args, **kwargs)` on the pool and await its result.
+
+        Context variables (e.g. bound log context) are copied into the
+        worker thread, as asyncio.to_thread() does.
+        """
+        submitted = time.perf_counter()
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=PLEX_MAX_WORKERS,
+                    thread_name_prefix="plexapi",
+                )
+            executor = self._executor
+            self.calls += 1
+            self.queued += 1
+            self.peak_queued = max(self.peak_queued, self.queued)
+
+        def call() -> T:
+            started = time.perf_counter()
+            self._record_start(started - submitted)
+            failed = True
+            try:
+                result = fn(*args, **kwargs)
+                failed = False
+                return result
+            finally:
+                self._record_finish(time.perf_counter() - started, failed=failed)
+
+        context = contextvars.copy_context()
+        try:
+            future = executor.submit(context.run, call)
+        except BaseException:
+            self._record_dropped()
+            raise
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # A call cancelled before a worker picked it up never runs
+            if future.cancelled():
+                self._record_dropped()
+            raise
+
+    def _record_start(self, wait_seconds: float, /) -> None:
+        with self._lock:
+            self.queued -= 1
+            self.running += 1
+            self.total_wait_seconds += wait_seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+            if wait_seconds < SLOW_WAIT_SECONDS:
+                return
+            self.slow_waits += 1
+            now = time.monotonic()
+            if now - self._last_slow_log < SLOW_WAIT_LOG_INTERVAL_SECONDS:
+                return
+            self._last_slow_log = now
+        log.warning(
+            "plex_executor_wait_slow",
+            wait_ms=round(wait_seconds * 1000, 3),
+            **self.snapshot(),
+        )
+
+    def _record_finish(self, run_seconds: float, /, *, failed: bool) -> None:
+        with self._lock:
+            self.running -= 1
+            if failed:
+                self.errors += 1
+            self.total_run_seconds += run_seconds
+            self.max_run_seconds = max(self.max_run_seconds, run_seconds)
+            if time.monotonic() - self._last_report < REPORT_INTERVAL_SECONDS:
+                return
+            self._last_report = time.monotonic()
+        log.info("plex_executor_stats", **self.snapshot())
+
+    def _record_dropped(self) -> None:
+        with self._lock:
+            self.calls -= 1
+            self.queued -= 1
+
+    def shutdown(self) -> None:
+        """Stop the worker threads once running calls finish and close the session."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            session, self._session = self._session, None
+        if executor is None and session is None:
+            return
+        log.info("plex_executor_stats", **self.snapshot())
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        if session is not None:
+            session.close()
+
+
+_executor = _PlexExecutor()
+
+
+async def run_plex[**P, T](
+    fn: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs
+) -> T:
+    """Run a blocking plexapi call on the Plex thread pool.
+
+    Args:
+        fn: The callable to run (positional-only).
+        *args: Positional arguments for `fn`.
+        **kwargs: Keyword arguments for `fn`.
+
+    Returns:
+        The callable's result.
+    """
+    return await _executor.run(fn, *args, **kwargs)
+
+
+def plex_session() -> Session:
+    """Return the shared requests.Session for PlexServer and MyPlexAccount."""
+    return _executor.session
+
+
+def shutdown_plex_executor() -> None:
+    """Stop the Plex thread pool and close the shared session (app shutdown).
+
+    Both are recreated on next use.
+    """
+    _executor.shutdown()
@@ -6,9 +6,13 @@ Implements the Plex PIN-based OAuth flow:
 3. Poll PIN status to retrieve auth token
 4. Use token to fetch user email
 
-Uses httpx for async HTTP requests to Plex.tv API.
+Uses one pooled httpx client per service for all Plex.tv requests, so PIN
+polls reuse warm connections instead of paying for DNS and TLS each time.
+Concurrent checks of the same PIN share a single upstream request.
 """
 
+import asyncio
+from collections.abc import Callable
 from datetime import datetime
 
 import httpx
@@ -22,6 +26,15 @@ PLEX_TV_PINS_URL = "https://plex.tv/api/v2/pins"
 PLEX_TV_USER_URL = "https://plex.tv/api/v2/user"
 PLEX_TV_AUTH_URL = "https://app.plex.tv/auth#"
 
+# Connection pool for plex.tv; idle connections are kept long enough to
+# span the gap between a join page's PIN polls
+_HTTP_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=20,
+    max_keepalive_connections=10,
+    keepalive_expiry=60.0,
+)
+
 
 class PlexOAuthPin(msgspec.Struct, omit_defaults=True, kw_only=True):
     """Response from PIN creation.
@@ -98,12 +111,16 @@ class PlexOAuthService:
     3. Poll PIN status to retrieve auth token
     4. Use token to fetch user email
 
+    The service is meant to be long-lived: it owns a pooled HTTP client
+    that is only released by close().
+
     Attributes:
         client_id: The X-Plex-Client-Identifier for API requests.
     """
 
     _http_client: httpx.AsyncClient
     _client_id: str
+    _pin_checks: dict[int, asyncio.Task[PlexOAuthResult]]
 
     def __init__(self, *, client_id: str) -> None:
         """Initialize the PlexOAuthService.
@@ -112,10 +129,16 @@ class PlexOAuthService:
             client_id: The X-Plex-Client-Identifier for API requests (keyword-only).
         """
         self._client_id = client_id
-        self._http_client = httpx.AsyncClient(timeout=30.0)
+        self._http_client = httpx.AsyncClient(
+            timeout=_HTTP_TIMEOUT,
+            limits=_HTTP_LIMITS,
+        )
+        self._pin_checks = {}
 
     async def close(self) -> None:
         """Close the HTTP client and release resources."""
+        for task in self._pin_checks.values():
+            _ = task.cancel()
         await self._http_client.aclose()
         log.info("plex_oauth_service_closed")
 
@@ -214,7 +237,8 @@ class PlexOAuthService:
 
         Polls the Plex.tv API to check if the user has completed
         authentication for the given PIN. If authenticated, retrieves
-        the user's email address.
+        the user's email address. Callers checking a PIN that already has
+        a check in flight wait for that request instead of sending another.
 
         Args:
             pin_id: The PIN ID to check (positional-only).
@@ -225,6 +249,30 @@ class PlexOAuthService:
         Raises:
             PlexOAuthError: If the PIN check fails.
         """
+        task = self._pin_checks.get(pin_id)
+        if task is None:
+            task = asyncio.create_task(self._check_pin(pin_id))
+            self._pin_checks[pin_id] = task
+            task.add_done_callback(self._forget_pin_check(pin_id))
+        # Shielded so one cancelled poller does not cancel the others' request
+        return await asyncio.shield(task)
+
+    def _forget_pin_check(
+        self, pin_id: int, /
+    ) -> Callable[[asyncio.Task[PlexOAuthResult]], None]:
+        """Build a done callback that drops a finished PIN check."""
+
+        def forget(task: asyncio.Task[PlexOAuthResult]) -> None:
+            if self._pin_checks.get(pin_id) is task:
+                del self._pin_checks[pin_id]
+            if not task.cancelled():
+                # Mark the error as retrieved when every waiter was cancelled
+                _ = task.exception()
+
+        return forget
+
+    async def _check_pin(self, pin_id: int, /) -> PlexOAuthResult:
+        """Query Plex.tv for a PIN's status (one upstream request)."""
         headers = {
             "X-Plex-Client-Identifier": self._client_id,
             "Accept": "application/json",
@@ -0,0 +1,143 @@
+"""Streaming listing of plex.tv account users.
+
+Provides:
+- PLEX_TV_USERS_URL: The plex.tv endpoint listing friends and home users
+- parse_account_users: Incrementally parse the users XML into ExternalUsers
+- stream_account_users: Fetch and parse the listing for a MyPlexAccount
+
+MyPlexAccount.users() parses the whole response into an element tree and
+then builds a MyPlexUser (and, on access, MyPlexServerShare objects) for
+every user. For accounts with thousands of friends that is the largest
+allocation in the process, although listing only needs four attributes
+per user. This module streams the response body through an XMLPullParser
+and discards each <User> element as soon as its ExternalUser is built, so
+memory stays flat regardless of the number of friends.
+
+Users are classified exactly as PlexClient.list_users did with plexapi:
+home users are "home", users with a <Server> share for this server's
+machine identifier are "shared", everyone else is "friend".
+"""
+
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING
+from xml.etree.ElementTree import XMLPullParser
+
+from zondarr.media.types import ExternalUser
+
+if TYPE_CHECKING:
+    from plexapi.myplex import MyPlexAccount
+
+# Same endpoint as plexapi's MyPlexUser.key
+PLEX_TV_USERS_URL = "https://plex.tv/api/users/"
+
+# Bytes read from the response per parser feed
+_CHUNK_SIZE = 64 * 1024
+
+
+def parse_account_users(
+    chunks: Iterable[bytes], /, *, machine_id: str
+) -> Iterator[ExternalUser]:
+    """Parse a plex.tv users XML document incrementally.
+
+    Args:
+        chunks: The response body in pieces (positional-only).
+        machine_id: This server's machine identifier, used to tell shared
+            users from friends without access (keyword-only).
+
+    Yields:
+        One ExternalUser per <User> element with an id, in document order.
+
+    Raises:
+        xml.etree.ElementTree.ParseError: If the document is malformed.
+    """
+    # The response comes from plex.tv over TLS, the same source plexapi
+    # parses with ElementTree; expat does not resolve external entities.
+    parser = XMLPullParser(events=("start", "end"))
+    root = None
+    in_user = False
+    has_server_access = False
+
+    def drain() -> Iterator[ExternalUser]:
+        nonlocal root, in_user, has_server_access
+        for event, elem in parser.read_events():
+            if event == "start":
+                if root is None:
+                    root = elem
+                elif elem.tag == "User":
+                    in_user = True
+                    has_server_access = False
+                elif (
+                    in_user
+                    and elem.tag == "Server"
+                    and elem.get("machineIdentifier") == machine_id
+                ):
+                    has_server_access = True
+                continue
+            if elem.tag != "User":
+                continue
+            in_user = False
+            user = _to_external_user(elem.attrib, shared=has_server_access)
+            # Drop the finished <User> subtree so parsed users do not pile up
+            if root is not None:
+                root.clear()
+            if user is not None:
+                yield user
+
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from drain()
+    parser.close()
+    yield from drain()
+
+
+def _to_external_user(
+    attrib: dict[str, str], /, *, shared: bool
+) -> ExternalUser | None:
+    user_id = attrib.get("id")
+    if not user_id:
+        return None
+    if attrib.get("home") in {"1", "true"}:
+        user_type = "home"
+    else:
+        user_type = "shared" if shared else "friend"
+    return ExternalUser(
+        external_user_id=user_id,
+        username=attrib.get("username", ""),
+        email=attrib.get("email"),
+        user_type=user_type,
+    )
+
+
+def stream_account_users(
+    account: MyPlexAccount, /, *, machine_id: str
+) -> Iterator[ExternalUser]:
+    """Fetch an account's friends and home users from plex.tv as a stream.
+
+    Uses the account's session, headers and timeout, so the request is
+    authenticated and pooled exactly like plexapi's own queries. Must be
+    called from a worker thread.
+
+    Args:
+        account: The admin MyPlexAccount (positional-only).
+        machine_id: This server's machine identifier (keyword-only).
+
+    Yields:
+        ExternalUser structs as their elements are parsed.
+
+    Raises:
+        requests.HTTPError: If plex.tv answers with an error status.
+        requests.RequestException: If the request fails.
+    """
+    # plexapi has no public API for a streamed query; reuse its private
+    # session, headers and timeout so behaviour matches account.query()
+    session = account._session  # pyright: ignore[reportPrivateUsage, reportUnknownMemberType, reportUnknownVariableType]
+    headers: dict[str, str] = account._headers()  # pyright: ignore[reportPrivateUsage, reportUnknownMemberType]
+    timeout: int = account._timeout  # pyright: ignore[reportPrivateUsage, reportUnknownMemberType]
+    with session.get(  # pyright: ignore[reportUnknownMemberType]
+        PLEX_TV_USERS_URL, headers=headers, timeout=timeout, stream=True
+    ) as response:
+        _ = response.raise_for_status()  # pyright: ignore[reportUnknownMemberType]
+        yield from parse_account_users(
+            response.iter_content(_CHUNK_SIZE),  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+            machine_id=machine_id,
+        )
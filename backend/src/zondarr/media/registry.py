@@ -8,6 +8,8 @@ enabling:
 - Client class lookups
 - Capability queries
 - Client instance creation with credential resolution
+- Pooled, connected client sessions reused across requests
+- Per-server circuit breakers that fail fast while a server is down
 - Admin auth provider lookups
 
 Example usage:
@@ -24,11 +26,26 @@ Example usage:
 
     # Create a client instance
     client = registry.create_client("provider_type", url="http://...", api_key="...")
+
+    # Borrow a connected, pooled client for a stored server
+    async with registry.client_session(server) as client:
+        await client.list_users()
 """
 
+import asyncio
 import os
-from typing import TYPE_CHECKING, ClassVar
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, ClassVar, final
+from uuid import UUID
+
+import structlog
+
+from zondarr.core.exceptions import ExternalServiceError
 
+from .circuit import CircuitBreaker, CircuitSnapshot, CircuitState
 from .exceptions import UnknownServerTypeError
 
 if TYPE_CHECKING:
@@ -46,6 +63,203 @@ if TYPE_CHECKING:
     )
     from .types import Capability
 
+log: structlog.stdlib.BoundLogger = structlog.get_logger()  # pyright: ignore[reportAny]
+
+# Pool key: server id, server type and the effective (url, api_key)
+type ClientPoolKey = tuple[UUID, str, str, str]
+
+# Defaults used when no Settings have been injected
+_DEFAULT_IDLE_SECONDS = 300
+_DEFAULT_HEALTH_CHECK_SECONDS = 60
+_DEFAULT_CIRCUIT_FAILURE_THRESHOLD = 3
+_DEFAULT_CIRCUIT_OPEN_SECONDS = 15
+
+# Shortest pause between idle-eviction sweeps (idle_seconds may be 0)
+_MIN_EVICTION_INTERVAL_SECONDS = 1.0
+_DEFAULT_CIRCUIT_MAX_OPEN_SECONDS = 600
+
+# Failures that count against a server's circuit breaker and retire its
+# pooled client
+_SERVER_DOWN_ERRORS = (ExternalServiceError, TimeoutError, ConnectionError)
+
+
+@dataclass(slots=True)
+class _PooledClient:
+    """A connected client held by the pool."""
+
+    client: MediaClient
+    last_used: float = field(default_factory=time.monotonic)
+    last_checked: float = field(default_factory=time.monotonic)
+    leases: int = 0
+    retired: bool = False
+
+
+@final
+class ClientPool:
+    """Pool of connected media clients keyed by server and credentials.
+
+    Entering a client's async context performs the provider handshake
+    (e.g. PlexServer plus MyPlexAccount for Plex), so the pool keeps
+    connected clients and lends them out to concurrent callers. A reused
+    client is health-checked at most every health_check_seconds, clients
+    idle for longer than idle_seconds are disconnected, and a client whose
+    operation fails with an ExternalServiceError, a timeout or a connection
+    error is retired so the next caller reconnects. Changing a server's
+    credentials changes its key, which retires the old client.
+    """
+
+    _entries: dict[ClientPoolKey, _PooledClient]
+    _connect_locks: dict[ClientPoolKey, asyncio.Lock]
+
+    def __init__(self) -> None:
+        """Initialize an empty pool."""
+        self._entries = {}
+        self._connect_locks = {}
+
+    def __len__(self) -> int:
+        """Return the number of pooled clients."""
+        return len(self._entries)
+
+    @asynccontextmanager
+    async def session(
+        self,
+        key: ClientPoolKey,
+        factory: Callable[[], MediaClient],
+        /,
+        *,
+        idle_seconds: float,
+        health_check_seconds: float,
+    ) -> AsyncIterator[MediaClient]:
+        """Lend a connected client for the duration of the block.
+
+        Args:
+            key: The pool key for the server (positional-only).
+            factory: Creates an unconnected client on a pool miss
+                (positional-only).
+            idle_seconds: Idle time after which clients are disconnected;
+                0 disconnects the client as soon as it is released
+                (keyword-only).
+            health_check_seconds: Minimum interval between health checks of
+                a reused client (keyword-only).
+
+        Yields:
+            A connected client.
+
+        Raises:
+            ExternalServiceError: If connecting to the media server fails.
+        """
+        await self.evict_idle(idle_seconds)
+        entry = await self._acquire(
+            key, factory, health_check_seconds=health_check_seconds
+        )
+        try:
+            yield entry.client
+        except _SERVER_DOWN_ERRORS:
+            # The connection may be broken or hung; make the next caller reconnect
+            entry.retired = True
+            raise
+        finally:
+            entry.leases -= 1
+            entry.last_used = time.monotonic()
+            if idle_seconds <= 0:
+                entry.retired = True
+            if entry.retired and entry.leases == 0:
+                await self._close(key, entry)
+
+    async def _acquire(
+        self,
+        key: ClientPoolKey,
+        factory: Callable[[], MediaClient],
+        /,
+        *,
+        health_check_seconds: float,
+    ) -> _PooledClient:
+        lock = self._connect_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            await self._retire_stale_credentials(key)
+            entry = self._entries.get(key)
+            if entry is not None and not entry.retired:
+                if time.monotonic() - entry.last_checked >= health_check_seconds:
+                    if await self._is_healthy(entry):
+                        entry.last_checked = time.monotonic()
+                    else:
+                        entry.retired = True
+                        if entry.leases == 0:
+                            await self._close(key, entry)
+                if not entry.retired:
+                    entry.leases += 1
+                    return entry
+
+            client = factory()
+            _ = await client.__aenter__()
+            entry = _PooledClient(client=client, leases=1)
+            self._entries[key] = entry
+            return entry
+
+    async def _is_healthy(self, entry: _PooledClient, /) -> bool:
+        try:
+            return await entry.client.test_connection()
+        except Exception:
+            return False
+
+    async def _retire_stale_credentials(self, key: ClientPoolKey, /) -> None:
+        """Retire clients for the same server created with other credentials."""
+        server_id = key[0]
+        for other_key, entry in list(self._entries.items()):
+            if other_key[0] == server_id and other_key != key:
+                entry.retired = True
+                if entry.leases == 0:
+                    await self._close(other_key, entry)
+
+    async def _close(self, key: ClientPoolKey, entry: _PooledClient, /) -> None:
+        if self._entries.get(key) is entry:
+            del self._entries[key]
+            lock = self._connect_locks.get(key)
+            if lock is not None and not lock.locked():
+                del self._connect_locks[key]
+        await self._disconnect(entry)
+
+    async def _disconnect(self, entry: _PooledClient, /) -> None:
+        try:
+            await entry.client.__aexit__(None, None, None)
+        except Exception as exc:
+            log.warning(
+                "Failed to disconnect pooled media client",
+                error=str(exc),
+                error_type=type(exc).__name__,
+            )
+
+    async def evict_idle(self, idle_seconds: float, /) -> int:
+        """Disconnect clients that have not been used for idle_seconds.
+
+        Args:
+            idle_seconds: Idle time after which unused clients are closed
+                (positional-only).
+
+        Returns:
+            The number of clients disconnected.
+        """
+        now = time.monotonic()
+        idle = [
+            (key, entry)
+            for key, entry in self._entries.items()
+            if entry.leases == 0 and now - entry.last_used >= idle_seconds
+        ]
+        for key, entry in idle:
+            await self._close(key, entry)
+        return len(idle)
+
+    async def close_all(self) -> None:
+        """Disconnect every pooled client.
+
+        Clients still lent out are retired and disconnected when released.
+        """
+        for key, entry in list(self._entries.items()):
+            entry.retired = True
+            if entry.leases == 0:
+                await self._close(key, entry)
+        self._connect_locks.clear()
+
 
 class ClientRegistry:
     """Singleton registry for media server provider implementations.
@@ -65,6 +279,8 @@ class ClientRegistry:
         if not hasattr(self, "_providers"):
             self._providers: dict[str, ProviderDescriptor] = {}
             self._settings: Settings | None = None
+            self._pool: ClientPool = ClientPool()
+            self._breakers: dict[ClientPoolKey, CircuitBreaker] = {}
 
     def __new__(cls) -> ClientRegistry:
         """Create or return the singleton instance."""
@@ -285,9 +501,183 @@ class ClientRegistry:
         )
         return self.create_client(server.server_type, url=url, api_key=api_key)
 
+    def client_session(
+        self, server: MediaServer, /
+    ) -> AbstractAsyncContextManager[MediaClient]:
+        """Borrow a connected client for a media server from the pool.
+
+        Clients are pooled by server id, server type and effective
+        credentials, so repeated operations against the same server reuse
+        one connection instead of repeating the provider handshake.
+
+        Each server has a circuit breaker. Connection errors and timeouts
+        count against it; once it opens, sessions fail immediately with
+        CircuitOpenError until a trial operation succeeds.
+
+        Example:
+            async with registry.client_session(server) as client:
+                await client.set_user_enabled(external_id, enabled=False)
+
+        Args:
+            server: The MediaServer entity.
+
+        Returns:
+            An async context manager yielding a connected client.
+
+        Raises:
+            UnknownServerTypeError: If no client is registered.
+        """
+        key = self._pool_key(server)
+        server_type, url, api_key = key[1], key[2], key[3]
+        idle_seconds = self._idle_seconds()
+        if self._settings is None:
+            health_check_seconds = _DEFAULT_HEALTH_CHECK_SECONDS
+        else:
+            health_check_seconds = self._settings.media_client_health_check_seconds
+
+        return self._guarded_session(
+            self._breaker(key, server.name),
+            self._pool.session(
+                key,
+                lambda: self.create_client(server_type, url=url, api_key=api_key),
+                idle_seconds=idle_seconds,
+                health_check_seconds=health_check_seconds,
+            ),
+        )
+
+    def circuit_snapshot(self, server: MediaServer, /) -> CircuitSnapshot:
+        """Return the circuit breaker state for a media server.
+
+        Args:
+            server: The MediaServer entity.
+
+        Returns:
+            The breaker's snapshot; closed if the server has not been used.
+        """
+        try:
+            key = self._pool_key(server)
+        except UnknownServerTypeError:
+            return CircuitSnapshot(state=CircuitState.CLOSED)
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            return CircuitSnapshot(state=CircuitState.CLOSED)
+        return breaker.snapshot()
+
+    def is_circuit_open(self, server: MediaServer, /) -> bool:
+        """Whether operations against the server are currently refused."""
+        return self.circuit_snapshot(server).state is CircuitState.OPEN
+
+    def _pool_key(self, server: MediaServer, /) -> ClientPoolKey:
+        server_type = server.server_type
+        _ = self.get_client_class(server_type)
+        url, api_key = self._get_effective_credentials(
+            server_type,
+            db_url=server.url,
+            db_api_key=server.api_key,
+        )
+        return (server.id, server_type, url, api_key)
+
+    def _breaker(self, key: ClientPoolKey, name: str, /) -> CircuitBreaker:
+        """Get the breaker for a pool key, creating it on first use.
+
+        New credentials for a server get a fresh, closed breaker.
+        """
+        breaker = self._breakers.get(key)
+        if breaker is not None:
+            return breaker
+        for other_key in [k for k in self._breakers if k[0] == key[0]]:
+            del self._breakers[other_key]
+        settings = self._settings
+        breaker = CircuitBreaker(
+            f"{key[1]} server '{name}'",
+            failure_threshold=(
+                settings.media_circuit_failure_threshold
+                if settings is not None
+                else _DEFAULT_CIRCUIT_FAILURE_THRESHOLD
+            ),
+            open_seconds=(
+                settings.media_circuit_open_seconds
+                if settings is not None
+                else _DEFAULT_CIRCUIT_OPEN_SECONDS
+            ),
+            max_open_seconds=(
+                settings.media_circuit_max_open_seconds
+                if settings is not None
+                else _DEFAULT_CIRCUIT_MAX_OPEN_SECONDS
+            ),
+        )
+        self._breakers[key] = breaker
+        return breaker
+
+    @staticmethod
+    @asynccontextmanager
+    async def _guarded_session(
+        breaker: CircuitBreaker,
+        session: AbstractAsyncContextManager[MediaClient],
+        /,
+    ) -> AsyncIterator[MediaClient]:
+        """Run a pooled session through the server's circuit breaker."""
+        trial = breaker.acquire()
+        try:
+            async with session as client:
+                yield client
+        except _SERVER_DOWN_ERRORS as exc:
+            breaker.record_failure(str(exc) or type(exc).__name__, trial=trial)
+            raise
+        except asyncio.CancelledError:
+            breaker.release(trial=trial)
+            raise
+        except BaseException:
+            # Any other error means the server answered
+            breaker.record_success(trial=trial)
+            raise
+        else:
+            breaker.record_success(trial=trial)
+
+    def _idle_seconds(self) -> float:
+        if self._settings is None:
+            return _DEFAULT_IDLE_SECONDS
+        return self._settings.media_client_idle_seconds
+
+    async def evict_idle_clients(self) -> int:
+        """Disconnect pooled clients that have been idle for too long.
+
+        Returns:
+            The number of clients disconnected.
+        """
+        count = await self._pool.evict_idle(self._idle_seconds())
+        if count:
+            log.debug("Evicted idle media clients", count=count)
+        return count
+
+    async def run_idle_eviction(self) -> None:
+        """Evict idle pooled clients every idle period until cancelled.
+
+        Sessions also evict on entry, but without this sweep a client
+        would stay connected for as long as no session is opened.
+        """
+        while True:
+            await asyncio.sleep(
+                max(self._idle_seconds(), _MIN_EVICTION_INTERVAL_SECONDS)
+            )
+            _ = await self.evict_idle_clients()
+
+    async def close_clients(self) -> None:
+        """Disconnect all pooled media clients (called on app shutdown)."""
+        count = len(self._pool)
+        await self._pool.close_all()
+        if count:
+            log.info("Closed pooled media clients", count=count)
+
+    async def close_providers(self) -> None:
+        """Release resources held by registered providers (called on app shutdown)."""
+        for provider in self._providers.values():
+            await provider.close()
+
     def clear(self) -> None:
-        """Clear all registered providers."""
+        """Clear all registered providers and circuit breakers."""
         self._providers.clear()
+        self._breakers.clear()
         self._settings = None
 
 
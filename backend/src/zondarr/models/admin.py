@@ -31,7 +31,9 @@ class AdminAccount(Base, UUIDPrimaryKeyMixin, TimestampMixin):
         last_login_at: Timestamp of last successful login.
         totp_enabled: Whether TOTP two-factor authentication is active.
         totp_secret_encrypted: Fernet-encrypted TOTP secret (base32).
-        totp_backup_codes: JSON array of argon2-hashed backup codes.
+        totp_backup_codes: JSON array of backup code entries, each a keyed
+            lookup tag plus argon2 hash (bare hashes from older versions
+            are still accepted).
     """
 
     __tablename__: str = "admin_accounts"
@@ -1,7 +1,8 @@
 """SyncRun model for tracking media server synchronization executions.
 
-Stores per-run metadata for both library and user sync operations so the API
-can expose last successful sync times and troubleshooting context.
+Stores per-run metadata for library and user sync operations, and for user
+expiry enforcement, so the API can expose last successful sync times and
+troubleshooting context.
 """
 
 from datetime import UTC, datetime
@@ -19,12 +20,14 @@ class SyncRun(Base, UUIDPrimaryKeyMixin, TimestampMixin):
     Attributes:
         id: UUID primary key.
         media_server_id: FK to the related media server.
-        sync_type: Sync channel ("libraries" or "users").
+        sync_type: Sync channel ("libraries", "users" or "expiry").
         trigger: Run trigger source ("automatic", "manual", or "onboarding").
         status: Run outcome ("success" or "failed").
         started_at: Timestamp when execution started.
         finished_at: Timestamp when execution finished.
         error_message: Optional failure reason for troubleshooting.
+        fingerprint: SHA-256 of the remote user list an automatic users sync
+            reconciled, used to skip the next reconcile if it is unchanged.
         created_at: Record creation time.
         updated_at: Last record update time.
     """
@@ -44,6 +47,7 @@ class SyncRun(Base, UUIDPrimaryKeyMixin, TimestampMixin):
         DateTime(), default=lambda: datetime.now(UTC)
     )
     error_message: Mapped[str | None] = mapped_column(Text, default=None)
+    fingerprint: Mapped[str | None] = mapped_column(String(64), default=None)
 
     __table_args__: tuple[
         Index, Index, CheckConstraint, CheckConstraint, CheckConstraint
@@ -56,7 +60,7 @@ class SyncRun(Base, UUIDPrimaryKeyMixin, TimestampMixin):
             "started_at",
         ),
         CheckConstraint(
-            "sync_type IN ('libraries', 'users')",
+            "sync_type IN ('libraries', 'users', 'expiry')",
             name="ck_sync_runs_sync_type",
         ),
         CheckConstraint(
@@ -8,10 +8,10 @@ for consistent error handling across the application.
 """
 
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from zondarr.core.exceptions import RepositoryError
@@ -123,6 +123,44 @@ class Repository[T: Base](ABC):
                 original=e,
             ) from e
 
+    async def bulk_insert(
+        self,
+        rows: Sequence[Mapping[str, object]],
+        /,
+        *,
+        chunk_size: int = 500,
+    ) -> int:
+        """Insert many rows with multi-row INSERT statements.
+
+        Bypasses per-object unit-of-work bookkeeping, so it is suited to
+        large imports. Rows are plain column mappings; Python-side column
+        defaults (ids, timestamps) are applied for missing keys. No ORM
+        instances are created or added to the session.
+
+        Args:
+            rows: Column-name to value mappings, one per row (positional-only).
+            chunk_size: Maximum rows per INSERT statement (keyword-only).
+
+        Returns:
+            The number of rows inserted.
+
+        Raises:
+            RepositoryError: If the database operation fails.
+        """
+        try:
+            for start in range(0, len(rows), chunk_size):
+                _ = await self.session.execute(
+                    insert(self._model_class),
+                    [dict(row) for row in rows[start : start + chunk_size]],
+                )
+            return len(rows)
+        except Exception as e:
+            raise RepositoryError(
+                f"Failed to bulk insert {self._model_class.__name__}",
+                operation="bulk_insert",
+                original=e,
+            ) from e
+
     async def delete(self, entity: T) -> None:
         """Remove an entity from the database.
 
@@ -6,14 +6,15 @@ deletion logic. Extends the generic Repository base class with
 Identity-specific functionality.
 """
 
+from collections.abc import Collection
 from typing import override
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import delete, exists, select
 from sqlalchemy.orm import selectinload
 
 from zondarr.core.exceptions import RepositoryError
-from zondarr.models.identity import Identity
+from zondarr.models.identity import Identity, User
 from zondarr.repositories.base import Repository
 
 
@@ -133,3 +134,36 @@ class IdentityRepository(Repository[Identity]):
                 operation="delete_if_no_users",
                 original=e,
             ) from e
+
+    async def delete_without_users(self, identity_ids: Collection[UUID], /) -> int:
+        """Delete those of the given identities that have no users left.
+
+        Set-based counterpart of delete_if_no_users() for bulk user removal.
+
+        Args:
+            identity_ids: IDs of the identities to check (positional-only).
+
+        Returns:
+            The number of identities deleted.
+
+        Raises:
+            RepositoryError: If the database operation fails.
+        """
+        if not identity_ids:
+            return 0
+        try:
+            result = await self.session.execute(
+                delete(Identity)
+                .where(
+                    Identity.id.in_(identity_ids),
+                    ~exists().where(User.identity_id == Identity.id),
+                )
+                .execution_options(synchronize_session=False)
+            )
+            return int(result.rowcount)  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType, reportUnknownArgumentType]
+        except Exception as e:
+            raise RepositoryError(
+                "Failed to delete identities without users",
+                operation="delete_without_users",
+                original=e,
+            ) from e
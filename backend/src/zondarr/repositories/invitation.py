@@ -15,6 +15,7 @@ from sqlalchemy.orm import selectinload
 from sqlalchemy.sql import Select
 
 from zondarr.core.exceptions import RepositoryError
+from zondarr.core.pagination import KeysetPosition, keyset_after, keyset_order_by
 from zondarr.models.invitation import Invitation
 from zondarr.models.wizard import Wizard, WizardStep
 from zondarr.repositories.base import Repository
@@ -206,37 +207,73 @@ class InvitationRepository(Repository[Invitation]):
                 original=e,
             ) from e
 
-    async def get_expired(self, now: datetime) -> Sequence[Invitation]:
-        """Retrieve all expired but still enabled invitations.
+    async def disable_expired(self, now: datetime) -> int:
+        """Disable every enabled invitation whose expires_at has passed.
 
-        Returns invitations where expires_at is in the past and enabled=True.
-        Used by the background expiration task to find invitations that need
-        to be disabled.
+        Runs as a single UPDATE statement, so no invitation rows or their
+        relationships are loaded. Used by the background expiration task.
 
         Args:
             now: The current timestamp to compare against expires_at.
 
         Returns:
-            A sequence of expired Invitation entities that are still enabled.
+            Number of invitations disabled.
 
         Raises:
             RepositoryError: If the database operation fails.
         """
         try:
-            result = await self.session.scalars(
-                select(Invitation).where(
+            stmt = (
+                update(Invitation)
+                .where(
                     Invitation.enabled == True,  # noqa: E712
                     Invitation.expires_at != None,  # noqa: E711
-                    Invitation.expires_at < now,
+                    Invitation.expires_at <= now,
+                )
+                .values(enabled=False, updated_at=now)
+                .execution_options(synchronize_session=False)
+            )
+            result = await self.session.execute(stmt)
+            return int(result.rowcount)  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType, reportUnknownArgumentType]
+        except Exception as e:
+            raise RepositoryError(
+                "Failed to disable expired invitations",
+                operation="disable_expired",
+                original=e,
+            ) from e
+
+    async def get_next_expiry(self, now: datetime) -> datetime | None:
+        """Return the earliest future expires_at among enabled invitations.
+
+        Args:
+            now: The current timestamp; only later expiries are considered.
+
+        Returns:
+            The next expiry as an aware UTC datetime, or None if no enabled
+            invitation expires in the future.
+
+        Raises:
+            RepositoryError: If the database operation fails.
+        """
+        try:
+            next_expiry = await self.session.scalar(
+                select(func.min(Invitation.expires_at)).where(
+                    Invitation.enabled == True,  # noqa: E712
+                    Invitation.expires_at > now,
                 )
             )
-            return result.all()
         except Exception as e:
             raise RepositoryError(
-                "Failed to get expired invitations",
-                operation="get_expired",
+                "Failed to get next invitation expiry",
+                operation="get_next_expiry",
                 original=e,
             ) from e
+        if next_expiry is None:
+            return None
+        # Naive values come back from drivers that drop the offset; all are UTC
+        if next_expiry.tzinfo is None:
+            return next_expiry.replace(tzinfo=UTC)
+        return next_expiry
 
     async def update(self, invitation: Invitation) -> Invitation:
         """Persist changes to an invitation.
@@ -303,10 +340,11 @@ class InvitationRepository(Repository[Invitation]):
 
             # Apply sorting
             sort_column = self._get_sort_column(sort_by)
-            if sort_order == "desc":
-                base_query = base_query.order_by(sort_column.desc())
-            else:
-                base_query = base_query.order_by(sort_column.asc())
+            base_query = base_query.order_by(
+                *keyset_order_by(
+                    sort_column, Invitation.id, descending=sort_order == "desc"
+                )
+            )
 
             # Apply pagination
             offset = (page - 1) * page_size
@@ -324,6 +362,93 @@ class InvitationRepository(Repository[Invitation]):
                 original=e,
             ) from e
 
+    async def list_after(
+        self,
+        *,
+        after: KeysetPosition | None = None,
+        page_size: int = 50,
+        enabled: bool | None = None,
+        expired: bool | None = None,
+        sort_by: SortField = "created_at",
+        sort_order: SortOrder = "desc",
+    ) -> tuple[Sequence[Invitation], bool]:
+        """Retrieve a page of invitations using keyset pagination.
+
+        Resumes after the (sort value, id) of the last row already returned,
+        so the cost of a page does not depend on how deep it is. Uses the
+        same ordering as list_paginated. No total is computed; see count().
+
+        Args:
+            after: (sort value, id) of the last row on the previous page.
+                None starts from the first row.
+            page_size: Number of items per page. Defaults to 50.
+            enabled: Filter by enabled status. None means no filter.
+            expired: Filter by expiration status. None means no filter.
+            sort_by: Field to sort by. One of: created_at, expires_at, use_count.
+            sort_order: Sort direction. One of: asc, desc.
+
+        Returns:
+            A tuple of (items, has_next) where items is the page of
+            Invitation entities and has_next tells whether more rows follow.
+
+        Raises:
+            RepositoryError: If the database operation fails.
+        """
+        try:
+            query = self._build_filtered_query(enabled=enabled, expired=expired)
+            sort_column = self._get_sort_column(sort_by)
+            descending = sort_order == "desc"
+            if after is not None:
+                query = query.where(
+                    keyset_after(
+                        sort_column, Invitation.id, after, descending=descending
+                    )
+                )
+
+            # Fetch one extra row to learn whether another page exists
+            query = query.order_by(
+                *keyset_order_by(sort_column, Invitation.id, descending=descending)
+            ).limit(page_size + 1)
+            items = (await self.session.scalars(query)).all()
+
+            return items[:page_size], len(items) > page_size
+        except Exception as e:
+            raise RepositoryError(
+                "Failed to list invitations after cursor",
+                operation="list_after",
+                original=e,
+            ) from e
+
+    async def count(
+        self,
+        *,
+        enabled: bool | None = None,
+        expired: bool | None = None,
+    ) -> int:
+        """Count invitations matching the given filters.
+
+        Args:
+            enabled: Filter by enabled status. None means no filter.
+            expired: Filter by expiration status. None means no filter.
+
+        Returns:
+            The number of matching invitations.
+
+        Raises:
+            RepositoryError: If the database operation fails.
+        """
+        try:
+            query = self._build_filtered_query(
+                enabled=enabled, expired=expired
+            ).with_only_columns(func.count(Invitation.id))
+            return await self.session.scalar(query) or 0
+        except Exception as e:
+            raise RepositoryError(
+                "Failed to count invitations",
+                operation="count",
+                original=e,
+            ) from e
+
     def _build_filtered_query(
         self,
         *,
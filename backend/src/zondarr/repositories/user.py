@@ -5,17 +5,20 @@ including queries by identity and media server. Extends the generic
 Repository base class with User-specific functionality.
 """
 
-from collections.abc import Sequence
+from collections.abc import Collection, Sequence
 from datetime import UTC, datetime
 from typing import Literal, override
 from uuid import UUID
 
-from sqlalchemy import func, select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.orm import contains_eager, lazyload, selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
 from sqlalchemy.sql import Select
 
 from zondarr.core.exceptions import RepositoryError
-from zondarr.models.identity import User
+from zondarr.core.pagination import KeysetPosition, keyset_after, keyset_order_by
+from zondarr.models.identity import Identity, User
+from zondarr.models.media_server import MediaServer
 from zondarr.repositories.base import Repository
 
 # Type alias for valid sort fields
@@ -126,6 +129,237 @@ class UserRepository(Repository[User]):
                 original=e,
             ) from e
 
+    async def get_existing_external_ids(
+        self,
+        media_server_id: UUID,
+        external_user_ids: Collection[str],
+        /,
+        *,
+        chunk_size: int = 500,
+    ) -> set[str]:
+        """Return which of the given external user IDs already exist on a server.
+
+        Resolves duplicates for a whole batch with set-based IN queries
+        instead of one lookup per user.
+
+        Args:
+            media_server_id: The UUID of the media server (positional-only).
+            external_user_ids: Candidate external user IDs (positional-only).
+            chunk_size: Maximum IDs per IN clause (keyword-only).
+
+        Returns:
+            The subset of external_user_ids present in the database.
+
+        Raises:
+            RepositoryError: If the database operation fails.
+        """
+        ids = list(external_user_ids)
+        existing: set[str] = set()
+        try:
+            for start in range(0, len(ids), chunk_size):
+                result = await self.session.scalars(
+                    select(User.external_user_id).where(
+                        User.media_server_id == media_server_id,
+                        User.external_user_id.in_(ids[start : start + chunk_size]),
+                    )
+                )
+                existing.update(result.all())
+            return existing
+        except Exception as e:
+            raise RepositoryError(
+                "Failed to get existing external user IDs",
+                operation="get_existing_external_ids",
+                original=e,
+            ) from e
+
+    async def bulk_update_external_types(
+        self,
+        updates: Sequence[tuple[UUID, str]],
+        /,
+    ) -> int:
+        """Set external_user_type for many users in one executemany UPDATE.
+
+        Args:
+            updates: Pairs of (user_id, external_user_type) (positional-only).
+
+        Returns:
+            The number of users updated.
+
+        Raises:
+            RepositoryError: If the database operation fails.
+        """
+        if not updates:
+            return 0
+        try:
+            now = datetime.now(UTC)
+            _ = await self.session.execute(
+                update(User),
+                [
+                    {"id": user_id, "external_user_type": user_type, "updated_at": now}
+                    for user_id, user_type in updates
+                ],
+            )
+            return len(updates)
+        except Exception as e:
+            raise RepositoryError(
+                "Failed to bulk update external user types",
+                operation="bulk_update_external_types",
+                original=e,
+            ) from e
+
+    async def get_expired_enabled(
+        self,
+        now: datetime,
+        /,
+        *,
+        limit: int,
+        after: KeysetPosition | None = None,
+        exclude_server_ids: Collection[UUID] = (),
+    ) -> Sequence[User]:
+        """Retrieve enabled users of enabled servers whose expires_at has passed.
+
+        A single query served by the ix_users_enabled_expires index, in
+        (expires_at, id) order. Each user's media server is joined in the
+        same query; identity and invitation are not loaded. Callers page
+        with `after` so users that could not be processed do not hold back
+        the ones behind them.
+
+        Args:
+            now: The current time (positional-only).
+            limit: Maximum number of users to return (keyword-only).
+            after: (expires_at, id) of the last user already seen (keyword-only).
+            exclude_server_ids: Servers whose users are skipped, e.g. those
+                with an open circuit breaker (keyword-only).
+
+        Returns:
+            Up to `limit` expired, still-enabled users.
+
+        Raises:
+            RepositoryError: If the database operation fails.
+        """
+        try:
+            query = (
+                select(User)
+                .join(User.media_server)
+                .where(
+                    User.enabled == True,  # noqa: E712
+                    User.expires_at != None,  # noqa: E711
+                    User.expires_at <= now,
+                    MediaServer.enabled == True,  # noqa: E712
+                )
+            )
+            if exclude_server_ids:
+                query = query.where(User.media_server_id.not_in(exclude_server_ids))
+            if after is not None:
+                query = query.where(
+                    keyset_after(User.expires_at, User.id, after, descending=False)
+                )
+            result = await self.session.scalars(
+                query.order_by(
+                    *keyset_order_by(User.expires_at, User.id, descending=False)
+                )
+                .limit(limit)
+                .options(
+                    contains_eager(User.media_server),
+                    lazyload(User.identity),
+                    lazyload(User.invitation),
+                )
+            )
+            return result.all()
+        except Exception as e:
+            raise RepositoryError(
+                "Failed to get expired users",
+                operation="get_expired_enabled",
+                original=e,
+            ) from e
+
+    async def get_next_expiry(self, now: datetime, /) -> datetime | None:
+        """Return the earliest future expires_at among enabled users.
+
+        Args:
+            now: The current time (positional-only).
+
+        Returns:
+            The next expiry, or None if no enabled user expires after `now`.
+
+        Raises:
+            RepositoryError: If the database operation fails.
+        """
+        try:
+            next_expiry = await self.session.scalar(
+                select(func.min(User.expires_at)).where(
+                    User.enabled == True,  # noqa: E712
+                    User.expires_at > now,
+                )
+            )
+        except Exception as e:
+            raise RepositoryError(
+                "Failed to get next user expiry",
+                operation="get_next_expiry",
+                original=e,
+            ) from e
+        if next_expiry is not None and next_expiry.tzinfo is None:
+            # Naive values come back from drivers that drop the offset; all are UTC
+            next_expiry = next_expiry.replace(tzinfo=UTC)
+        return next_expiry
+
+    async def disable_many(self, user_ids: Collection[UUID], /) -> int:
+        """Set enabled=False on many users with one UPDATE.
+
+        Args:
+            user_ids: IDs of the users to disable (positional-only).
+
+        Returns:
+            The number of users updated.
+
+        Raises:
+            RepositoryError: If the database operation fails.
+        """
+        if not user_ids:
+            return 0
+        try:
+            result = await self.session.execute(
+                update(User)
+                .where(User.id.in_(user_ids))
+                .values(enabled=False, updated_at=datetime.now(UTC))
+                .execution_options(synchronize_session=False)
+            )
+            return int(result.rowcount)  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType, reportUnknownArgumentType]
+        except Exception as e:
+            raise RepositoryError(
+                "Failed to disable users",
+                operation="disable_many",
+                original=e,
+            ) from e
+
+    async def delete_many(self, user_ids: Collection[UUID], /) -> int:
+        """Delete many users with one DELETE.
+
+        Args:
+            user_ids: IDs of the users to delete (positional-only).
+
+        Returns:
+            The number of users deleted.
+
+        Raises:
+            RepositoryError: If the database operation fails.
+        """
+        if not user_ids:
+            return 0
+        try:
+            result = await self.session.execute(
+                delete(User)
+                .where(User.id.in_(user_ids))
+                .execution_options(synchronize_session=False)
+            )
+            return int(result.rowcount)  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType, reportUnknownArgumentType]
+        except Exception as e:
+            raise RepositoryError(
+                "Failed to delete users",
+                operation="delete_many",
+                original=e,
+            ) from e
+
     async def update(self, user: User) -> User:
         """Update an existing user.
 
@@ -182,7 +416,8 @@ class UserRepository(Repository[User]):
 
         Returns:
             A tuple of (items, total_count) where items is the page of
-            User entities and total_count is the total matching records.
+            User entities (with identity, identity.users, media_server and
+            invitation loaded) and total_count is the total matching records.
 
         Raises:
             RepositoryError: If the database operation fails.
@@ -202,24 +437,18 @@ class UserRepository(Repository[User]):
 
             # Apply sorting
             sort_column = self._get_sort_column(sort_by)
-            if sort_order == "desc":
-                base_query = base_query.order_by(sort_column.desc())
-            else:
-                base_query = base_query.order_by(sort_column.asc())
+            base_query = base_query.order_by(
+                *keyset_order_by(sort_column, User.id, descending=sort_order == "desc")
+            )
 
             # Apply pagination
             offset = (page - 1) * page_size
             paginated_query = base_query.offset(offset).limit(page_size)
 
-            # Add eager loading for relationships
-            paginated_query = paginated_query.options(
-                selectinload(User.identity),
-                selectinload(User.media_server),
-                selectinload(User.invitation),
-            )
-
             # Execute query
-            result = await self.session.scalars(paginated_query)
+            result = await self.session.scalars(
+                paginated_query.options(*self._list_load_options())
+            )
             items = result.all()
 
             return items, total
@@ -230,6 +459,126 @@ class UserRepository(Repository[User]):
                 original=e,
             ) from e
 
+    async def list_after(
+        self,
+        *,
+        after: KeysetPosition | None = None,
+        page_size: int = 50,
+        media_server_id: UUID | None = None,
+        invitation_id: UUID | None = None,
+        enabled: bool | None = None,
+        expired: bool | None = None,
+        sort_by: UserSortField = "created_at",
+        sort_order: SortOrder = "desc",
+    ) -> tuple[Sequence[User], bool]:
+        """Retrieve a page of users using keyset pagination.
+
+        Resumes after the (sort value, id) of the last row already returned,
+        so the cost of a page does not depend on how deep it is. Uses the
+        same ordering as list_paginated. No total is computed; see count().
+
+        Args:
+            after: (sort value, id) of the last row on the previous page.
+                None starts from the first row.
+            page_size: Number of items per page. Defaults to 50.
+            media_server_id: Filter by media server ID. None means no filter.
+            invitation_id: Filter by invitation ID. None means no filter.
+            enabled: Filter by enabled status. None means no filter.
+            expired: Filter by expiration status. None means no filter.
+            sort_by: Field to sort by. One of: created_at, username, expires_at.
+            sort_order: Sort direction. One of: asc, desc.
+
+        Returns:
+            A tuple of (items, has_next) where items is the page of User
+            entities (relationships loaded as in list_paginated) and has_next
+            tells whether more rows follow.
+
+        Raises:
+            RepositoryError: If the database operation fails.
+        """
+        try:
+            query = self._build_filtered_query(
+                media_server_id=media_server_id,
+                invitation_id=invitation_id,
+                enabled=enabled,
+                expired=expired,
+            )
+            sort_column = self._get_sort_column(sort_by)
+            descending = sort_order == "desc"
+            if after is not None:
+                query = query.where(
+                    keyset_after(sort_column, User.id, after, descending=descending)
+                )
+
+            # Fetch one extra row to learn whether another page exists
+            query = (
+                query.order_by(
+                    *keyset_order_by(sort_column, User.id, descending=descending)
+                )
+                .limit(page_size + 1)
+                .options(*self._list_load_options())
+            )
+            items = (await self.session.scalars(query)).all()
+
+            return items[:page_size], len(items) > page_size
+        except Exception as e:
+            raise RepositoryError(
+                "Failed to list users after cursor",
+                operation="list_after",
+                original=e,
+            ) from e
+
+    async def count(
+        self,
+        *,
+        media_server_id: UUID | None = None,
+        invitation_id: UUID | None = None,
+        enabled: bool | None = None,
+        expired: bool | None = None,
+    ) -> int:
+        """Count users matching the given filters.
+
+        Args:
+            media_server_id: Filter by media server ID. None means no filter.
+            invitation_id: Filter by invitation ID. None means no filter.
+            enabled: Filter by enabled status. None means no filter.
+            expired: Filter by expiration status. None means no filter.
+
+        Returns:
+            The number of matching users.
+
+        Raises:
+            RepositoryError: If the database operation fails.
+        """
+        try:
+            query = self._build_filtered_query(
+                media_server_id=media_server_id,
+                invitation_id=invitation_id,
+                enabled=enabled,
+                expired=expired,
+            ).with_only_columns(func.count(User.id))
+            return await self.session.scalar(query) or 0
+        except Exception as e:
+            raise RepositoryError(
+                "Failed to count users",
+                operation="count",
+                original=e,
+            ) from e
+
+    @staticmethod
+    def _list_load_options() -> tuple[LoaderOption, ...]:
+        """Eager-load options shared by the listing queries.
+
+        Identities and their sibling users are fetched in one IN query per
+        level keyed by the distinct ids on the page, so the number of round
+        trips does not grow with page_size.
+        """
+        return (
+            selectinload(User.identity).selectinload(Identity.users),
+            selectinload(User.media_server),
+            selectinload(User.invitation),
+        )
+
     def _build_filtered_query(
         self,
         *,
@@ -14,13 +14,18 @@ from uuid import UUID
 
 import structlog
 
+from zondarr.core.auth import invalidate_admin_principal
 from zondarr.core.exceptions import AuthenticationError
 from zondarr.media.registry import registry
 from zondarr.models.admin import AdminAccount, RefreshToken
 from zondarr.repositories.admin import AdminAccountRepository, RefreshTokenRepository
 from zondarr.repositories.app_setting import AppSettingRepository
 from zondarr.services.onboarding import OnboardingService, OnboardingStep
-from zondarr.services.password import hash_password, needs_rehash, verify_password
+from zondarr.services.password import (
+    hash_password_async,
+    needs_rehash,
+    verify_password_async,
+)
 
 if TYPE_CHECKING:
     from zondarr.config import Settings
@@ -125,7 +130,7 @@ class AuthService:
 
         admin = AdminAccount(
             username=username,
-            password_hash=hash_password(password),
+            password_hash=await hash_password_async(password),
             email=email,
             auth_method="local",
             enabled=True,
@@ -162,7 +167,7 @@ class AuthService:
             AuthenticationError: If an admin already exists.
         """
         async with _setup_lock:
-            pw_hash = hash_password(password)
+            pw_hash = await hash_password_async(password)
             admin = await self.admin_repo.create_first_admin(
                 username=username,
                 password_hash=pw_hash,
@@ -200,12 +205,12 @@ class AuthService:
         if not admin.enabled:
             raise AuthenticationError("Account is disabled", "ACCOUNT_DISABLED")
 
-        if not verify_password(admin.password_hash, password):
+        if not await verify_password_async(admin.password_hash, password):
             raise AuthenticationError("Invalid credentials", "INVALID_CREDENTIALS")
 
         # Rehash if needed (updated Argon2 parameters)
         if needs_rehash(admin.password_hash):
-            admin.password_hash = hash_password(password)
+            admin.password_hash = await hash_password_async(password)
 
         admin.last_login_at = datetime.now(UTC)
         return admin
@@ -319,6 +324,9 @@ class AuthService:
                 _ = await self.token_repo.revoke_all_for_admin(
                     existing.admin_account_id
                 )
+                invalidate_admin_principal(
+                    existing.admin_account_id, session=self.token_repo.session
+                )
                 # Commit revocations before raising so they survive the
                 # provide_db_session rollback triggered by the exception.
                 await self.token_repo.session.commit()
@@ -378,6 +386,9 @@ class AuthService:
         refresh_token = await self.token_repo.get_by_token_hash(token_hash)
         if refresh_token is not None:
             refresh_token.revoked = True
+            invalidate_admin_principal(
+                refresh_token.admin_account_id, session=self.token_repo.session
+            )
 
     async def revoke_all_tokens(self, admin: AdminAccount) -> None:
         """Revoke all refresh tokens for an admin.
@@ -386,6 +397,7 @@ class AuthService:
             admin: The admin account.
         """
         _ = await self.token_repo.revoke_all_for_admin(admin.id)
+        invalidate_admin_principal(admin.id, session=self.token_repo.session)
 
     async def update_email(self, admin_id: UUID, email: str | None) -> AdminAccount:
         """Update the email address on an admin account.
@@ -404,6 +416,7 @@ class AuthService:
         if admin is None:
             raise AuthenticationError("Account not found", "ACCOUNT_NOT_FOUND")
         admin.email = email
+        invalidate_admin_principal(admin_id, session=self.admin_repo.session)
         return admin
 
     async def change_password(
@@ -435,14 +448,15 @@ class AuthService:
                 "EXTERNAL_AUTH_NO_PASSWORD",
             )
 
-        if admin.password_hash is None or not verify_password(
+        if admin.password_hash is None or not await verify_password_async(
             admin.password_hash, current_password
         ):
             raise AuthenticationError(
                 "Current password is incorrect", "INVALID_CREDENTIALS"
             )
 
-        admin.password_hash = hash_password(new_password)
+        admin.password_hash = await hash_password_async(new_password)
+        invalidate_admin_principal(admin_id, session=self.admin_repo.session)
         logger.info("admin_password_changed", admin_id=str(admin_id))
         return admin
 
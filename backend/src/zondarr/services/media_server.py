@@ -18,7 +18,7 @@ import structlog
 
 from zondarr.core.exceptions import NotFoundError, ValidationError
 from zondarr.media.registry import ClientRegistry
-from zondarr.media.types import ServerInfo
+from zondarr.media.types import LibraryInfo, ServerInfo
 from zondarr.models.media_server import Library, MediaServer
 from zondarr.repositories.media_server import MediaServerRepository
 
@@ -428,11 +428,27 @@ class MediaServerService:
         if server is None:
             raise NotFoundError("MediaServer", str(server_id))
 
-        # Fetch libraries from the media server
+        remote_libraries = await self.fetch_libraries(server)
+        return await self.apply_libraries(server_id, remote_libraries)
+
+    async def fetch_libraries(self, server: MediaServer, /) -> Sequence[LibraryInfo]:
+        """Fetch the current library list from a media server.
+
+        Performs no database access, so it can run without holding a
+        session (e.g. for several servers at once during background sync).
+
+        Args:
+            server: The MediaServer entity to query (positional-only).
+
+        Returns:
+            The libraries reported by the media server.
+
+        Raises:
+            ValidationError: If the connection to the server fails.
+        """
         try:
-            client = self.registry.create_client_for_server(server)
-            async with client:
-                remote_libraries = await client.get_libraries()
+            async with self.registry.client_session(server) as client:
+                return await client.get_libraries()
         except Exception as e:
             raise ValidationError(
                 f"Failed to fetch libraries from media server: {e}",
@@ -443,6 +459,29 @@ class MediaServerService:
                 },
             ) from e
 
+    async def apply_libraries(
+        self,
+        server_id: UUID,
+        remote_libraries: Sequence[LibraryInfo],
+        /,
+    ) -> LibrarySyncSummary:
+        """Reconcile stored libraries with a previously fetched remote list.
+
+        Args:
+            server_id: The UUID of the server to update (positional-only).
+            remote_libraries: Libraries returned by fetch_libraries (positional-only).
+
+        Returns:
+            A LibrarySyncSummary with the updated libraries and change counts.
+
+        Raises:
+            NotFoundError: If the server does not exist.
+            RepositoryError: If the database operation fails.
+        """
+        server = await self.repository.get_by_id(server_id)
+        if server is None:
+            raise NotFoundError("MediaServer", str(server_id))
+
         # Build a map of existing libraries by external_id
         existing_by_external_id: dict[str, Library] = {
             lib.external_id: lib for lib in server.libraries
@@ -2,13 +2,33 @@
 
 Thin wrappers around argon2-cffi for consistent password hashing
 throughout the application.
+
+Each Argon2id call takes tens of milliseconds and ~64 MiB, so request
+handlers use the *_async variants (or run_hashing for batches). They run
+the work on a dedicated bounded thread pool. When the pool and its queue
+are full, new work is rejected with ServiceBusyError rather than queued,
+so a login flood cannot exhaust memory or stall the event loop.
 """
 
+import asyncio
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import final
+
 from argon2 import PasswordHasher
 from argon2.exceptions import VerifyMismatchError
 
+from zondarr.core.exceptions import ServiceBusyError
+
 _hasher = PasswordHasher()
 
+# Default number of Argon2 operations running at once
+DEFAULT_HASH_MAX_CONCURRENCY = 2
+
+# Default number of Argon2 operations allowed to wait for a worker
+DEFAULT_HASH_MAX_QUEUE = 16
+
 
 def hash_password(password: str) -> str:
     """Hash a password using Argon2id.
@@ -48,3 +68,146 @@ def needs_rehash(password_hash: str) -> bool:
         True if the hash parameters are outdated and should be rehashed.
     """
     return _hasher.check_needs_rehash(password_hash)
+
+
+@final
+class _HashingExecutor:
+    """Bounded thread pool for Argon2 work with load shedding.
+
+    At most max_concurrency jobs run at once and at most max_queue more
+    wait for a worker. Work submitted beyond that is rejected immediately.
+    A job counts against the limit until its thread finishes, even if the
+    awaiting request was cancelled.
+    """
+
+    __slots__ = ("_executor", "_in_flight", "_lock", "_max_concurrency", "_max_queue")
+
+    def __init__(self, *, max_concurrency: int, max_queue: int) -> None:
+        self._max_concurrency = max_concurrency
+        self._max_queue = max_queue
+        self._executor: ThreadPoolExecutor | None = None
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of jobs running or waiting for a worker."""
+        return self._in_flight
+
+    async def run[T](self, fn: Callable[[], T], /) -> T:
+        """Run `fn` on the pool and await its result.
+
+        Raises:
+            ServiceBusyError: If the pool and its queue are full.
+        """
+        with self._lock:
+            if self._in_flight >= self._max_concurrency + self._max_queue:
+                raise ServiceBusyError(
+                    "Too many password operations in progress", resource="argon2"
+                )
+            self._in_flight += 1
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_concurrency,
+                    thread_name_prefix="argon2",
+                )
+            executor = self._executor
+
+        try:
+            future = executor.submit(fn)
+        except BaseException:
+            self._release(None)
+            raise
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def _release(self, _future: Future[object] | None) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    def configure(self, *, max_concurrency: int, max_queue: int) -> None:
+        """Apply new limits; the pool is recreated on next use."""
+        self.shutdown()
+        with self._lock:
+            self._max_concurrency = max_concurrency
+            self._max_queue = max_queue
+
+    def shutdown(self) -> None:
+        """Stop the worker threads once queued jobs finish."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+_executor = _HashingExecutor(
+    max_concurrency=DEFAULT_HASH_MAX_CONCURRENCY,
+    max_queue=DEFAULT_HASH_MAX_QUEUE,
+)
+
+
+def configure_hashing(*, max_concurrency: int, max_queue: int) -> None:
+    """Set the hashing pool limits.
+
+    Called once at application startup. Jobs already running on the old
+    pool are allowed to finish.
+
+    Args:
+        max_concurrency: Argon2 operations allowed to run at once (keyword-only).
+        max_queue: Argon2 operations allowed to wait for a worker (keyword-only).
+    """
+    _executor.configure(max_concurrency=max_concurrency, max_queue=max_queue)
+
+
+def shutdown_hashing() -> None:
+    """Stop the hashing pool's worker threads (application shutdown)."""
+    _executor.shutdown()
+
+
+async def run_hashing[T](fn: Callable[[], T], /) -> T:
+    """Run Argon2-heavy work on the bounded hashing pool.
+
+    Use for batches such as backup code hashing, so the whole batch takes
+    a single slot instead of one per hash.
+
+    Args:
+        fn: Zero-argument callable doing the work.
+
+    Returns:
+        The callable's result.
+
+    Raises:
+        ServiceBusyError: If the hashing pool and its queue are full.
+    """
+    return await _executor.run(fn)
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password on the bounded hashing pool.
+
+    Args:
+        password: The plaintext password to hash.
+
+    Returns:
+        The Argon2id hash string.
+
+    Raises:
+        ServiceBusyError: If the hashing pool and its queue are full.
+    """
+    return await _executor.run(lambda: hash_password(password))
+
+
+async def verify_password_async(password_hash: str, password: str) -> bool:
+    """Verify a password on the bounded hashing pool.
+
+    Args:
+        password_hash: The stored Argon2id hash.
+        password: The plaintext password to verify.
+
+    Returns:
+        True if the password matches, False otherwise.
+
+    Raises:
+        ServiceBusyError: If the hashing pool and its queue are full.
+    """
+    return await _executor.run(lambda: verify_password(password_hash, password))
@@ -7,7 +7,9 @@ Provides the complete redemption flow for invitation codes:
 4. Create local Identity and User records
 5. Increment the invitation use count
 
-Implements rollback on failure to ensure atomicity.
+Target servers are provisioned concurrently, so redemption takes about as
+long as the slowest server. Implements rollback on failure to ensure
+atomicity.
 
 Implements Property 15: Redemption Creates Users on All Target Servers -
 successful redemption creates exactly N User records for N target servers.
@@ -27,8 +29,10 @@ if redemption fails after creating users on some servers including Plex,
 all created users are deleted via delete_user and no local records are created.
 """
 
+import asyncio
 from collections.abc import Mapping, Sequence
 from datetime import UTC, datetime, timedelta
+from uuid import UUID
 
 import structlog
 
@@ -164,58 +168,84 @@ class RedemptionService:
 
         # Step 3: Create users on each target server
         created_external_users: list[tuple[MediaServer, ExternalUser]] = []
+        target_servers = list(invitation.target_servers)
 
-        try:
-            for server in invitation.target_servers:
-                client = registry.create_client_for_server(server)
-
-                async with client:
-                    external_user = await client.create_user(
-                        username,
-                        password,
-                        email=email,
-                        auth_token=auth_token,
-                    )
-                    created_external_users.append((server, external_user))
+        library_ids_by_server: dict[UUID, list[str]] = {}
 
-                    log.info(  # pyright: ignore[reportAny]
-                        "Created user on media server",
-                        server_name=server.name,
-                        server_type=server.server_type,
-                        username=username,
-                        external_user_id=external_user.external_user_id,
-                    )
+        # Filled in target server order as soon as each account exists, so a
+        # failure on any server rolls back every account created so far
+        created_slots: list[tuple[MediaServer, ExternalUser] | None] = [None] * len(
+            target_servers
+        )
+
+        async def provision(index: int, server: MediaServer) -> None:
+            async with registry.client_session(server) as client:
+                external_user = await client.create_user(
+                    username,
+                    password,
+                    email=email,
+                    auth_token=auth_token,
+                )
+                created_slots[index] = (server, external_user)
 
-                    # Step 4: Apply library restrictions
-                    if invitation.allowed_libraries:
-                        library_ids = [
-                            lib.external_id
-                            for lib in invitation.allowed_libraries
-                            if lib.media_server_id == server.id
-                        ]
-                        if library_ids:
-                            _ = await client.set_library_access(
-                                external_user.external_user_id,
-                                library_ids,
-                            )
-                            log.info(  # pyright: ignore[reportAny]
-                                "Applied library restrictions",
-                                server_name=server.name,
-                                library_count=len(library_ids),
-                            )
-
-                    # Step 5: Apply permissions
-                    permissions = dict(DEFAULT_PERMISSIONS)
-                    _ = await client.update_permissions(
+                log.info(  # pyright: ignore[reportAny]
+                    "Created user on media server",
+                    server_name=server.name,
+                    server_type=server.server_type,
+                    username=username,
+                    external_user_id=external_user.external_user_id,
+                )
+
+                # Step 4: Apply library restrictions
+                library_ids = library_ids_by_server.get(server.id)
+                if library_ids:
+                    _ = await client.set_library_access(
                         external_user.external_user_id,
-                        permissions=permissions,
+                        library_ids,
                     )
                     log.info(  # pyright: ignore[reportAny]
-                        "Applied permissions",
+                        "Applied library restrictions",
                         server_name=server.name,
-                        permissions=permissions,
+                        library_count=len(library_ids),
                     )
 
+                # Step 5: Apply permissions
+                permissions = dict(DEFAULT_PERMISSIONS)
+                _ = await client.update_permissions(
+                    external_user.external_user_id,
+                    permissions=permissions,
+                )
+                log.info(  # pyright: ignore[reportAny]
+                    "Applied permissions",
+                    server_name=server.name,
+                    permissions=permissions,
+                )
+
+        try:
+            # Resolve per-server library restrictions up front so concurrent
+            # provisioning never touches ORM relationships
+            for lib in invitation.allowed_libraries:
+                library_ids_by_server.setdefault(lib.media_server_id, []).append(
+                    lib.external_id
+                )
+
+            # Provision all servers concurrently. Every server is allowed to
+            # finish (no sibling cancellation) so that an account created on
+            # one server while another fails is known and can be rolled back.
+            outcomes = await asyncio.gather(
+                *(
+                    provision(index, server)
+                    for index, server in enumerate(target_servers)
+                ),
+                return_exceptions=True,
+            )
+            created_external_users.extend(
+                created for created in created_slots if created is not None
+            )
+            for outcome in outcomes:
+                if isinstance(outcome, BaseException):
+                    raise outcome
+
             # Step 6: Calculate expiration from duration_days
             expires_at: datetime | None = None
             if invitation.duration_days is not None:
@@ -293,15 +323,17 @@ class RedemptionService:
 
         Best-effort cleanup: logs but does not raise on individual failures.
         This ensures we attempt to clean up all created users even if some
-        deletions fail.
+        deletions fail. Deletions on different servers run concurrently.
 
         Args:
             created_users: List of (MediaServer, ExternalUser) tuples to delete.
         """
-        for server, external_user in created_users:
+
+        async def rollback_one(
+            server: MediaServer, external_user: ExternalUser
+        ) -> None:
             try:
-                client = registry.create_client_for_server(server)
-                async with client:
+                async with registry.client_session(server) as client:
                     deleted = await client.delete_user(external_user.external_user_id)
                     if deleted:
                         log.info(  # pyright: ignore[reportAny]
@@ -324,6 +356,13 @@ class RedemptionService:
                     error=str(e),
                 )
 
+        _ = await asyncio.gather(
+            *(
+                rollback_one(server, external_user)
+                for server, external_user in created_users
+            )
+        )
+
     def _failure_message(self, failure: InvitationValidationFailure | None) -> str:
         """Convert failure enum to user-friendly message.
 
@@ -4,17 +4,28 @@ Provides functionality to compare local User records with actual users
 on media servers, identifying discrepancies. When dry_run=False, imports
 orphaned users (those on the server but not in the local DB) by creating
 Identity and User records.
+
+Background sync fetches a server's libraries and users together through
+fetch_server_state, so each server is connected to once per cycle.
 """
 
+import asyncio
+import hashlib
+from collections.abc import Awaitable, Callable, Sequence
+from contextlib import AsyncExitStack
+from dataclasses import dataclass
 from datetime import UTC, datetime
-from uuid import UUID
+from uuid import UUID, uuid4
 
+import msgspec
 import structlog
+from sqlalchemy.orm.attributes import set_committed_value
 
 from zondarr.api.schemas import SyncResult
 from zondarr.core.exceptions import NotFoundError
 from zondarr.media.registry import registry
-from zondarr.models.identity import Identity, User
+from zondarr.media.types import ExternalUser, LibraryInfo
+from zondarr.models.media_server import MediaServer
 from zondarr.repositories.identity import IdentityRepository
 from zondarr.repositories.media_server import MediaServerRepository
 from zondarr.repositories.sync_exclusion import SyncExclusionRepository
@@ -22,6 +33,55 @@ from zondarr.repositories.user import UserRepository
 
 log = structlog.get_logger()  # pyright: ignore[reportAny]  # structlog lacks stubs
 
+# External user ids included in a log line about a possibly large set
+_LOGGED_IDS_SAMPLE_SIZE = 5
+
+
+def user_list_fingerprint(external_users: Sequence[ExternalUser], /) -> str:
+    """Hash the parts of a remote user list that reconciliation acts on.
+
+    The fingerprint covers each user's (external_user_id, username,
+    user_type), sorted so that the order the server reports users in does
+    not matter.
+
+    Args:
+        external_users: Users returned by fetch_external_users (positional-only).
+
+    Returns:
+        Hex-encoded SHA-256 digest.
+    """
+    snapshot = sorted(
+        (u.external_user_id, u.username, u.user_type or "") for u in external_users
+    )
+    return hashlib.sha256(msgspec.json.encode(snapshot)).hexdigest()
+
+
+@dataclass(slots=True)
+class RemoteServerState:
+    """Libraries and users fetched from a media server in one client session.
+
+    A part that could not be fetched is None with its error set, so the
+    other part can still be applied.
+    """
+
+    libraries: Sequence[LibraryInfo] | None = None
+    users: Sequence[ExternalUser] | None = None
+    libraries_error: Exception | None = None
+    users_error: Exception | None = None
+
+
+async def _fetch_part[T](
+    fetch: Callable[[], Awaitable[T]], what: str, /, *, timeout: float
+) -> tuple[T | None, Exception | None]:
+    """Run one bounded fetch, returning its result or the error it raised."""
+    try:
+        async with asyncio.timeout(timeout):
+            return await fetch(), None
+    except TimeoutError:
+        return None, TimeoutError(f"Timed out after {timeout}s fetching {what}")
+    except Exception as exc:
+        return None, exc
+
 
 class SyncService:
     """Synchronizes local user records with media server state.
@@ -82,7 +142,9 @@ class SyncService:
         (on server but not local) and stale users (local but not on server).
 
         When dry_run=False, imports orphaned users by creating an Identity
-        and User record for each one.
+        and User record for each one. Imports are batched: duplicates are
+        resolved with one set-based query and rows are written with
+        chunked multi-row INSERTs.
 
         Args:
             server_id: The UUID of the media server to sync (positional-only).
@@ -108,12 +170,114 @@ class SyncService:
         if server is None:
             raise NotFoundError("MediaServer", str(server_id))
 
-        # Create the appropriate client using the registry
-        client = registry.create_client_for_server(server)
+        external_users = await self.fetch_external_users(server)
+        return await self.reconcile_users(server_id, external_users, dry_run=dry_run)
+
+    async def fetch_external_users(
+        self,
+        server: MediaServer,
+        /,
+    ) -> Sequence[ExternalUser]:
+        """Fetch the full user list from a media server.
 
-        # Fetch users from the external media server
-        async with client:
-            external_users = await client.list_users()
+        Performs no database access, so it can run without holding a
+        session (e.g. for several servers at once during background sync).
+
+        Args:
+            server: The MediaServer entity to query (positional-only).
+
+        Returns:
+            The users reported by the media server.
+
+        Raises:
+            MediaClientError: If communication with the media server fails.
+        """
+        async with registry.client_session(server) as client:
+            return await client.list_users()
+
+    async def fetch_server_state(
+        self,
+        server: MediaServer,
+        /,
+        *,
+        timeout: float,
+    ) -> RemoteServerState:
+        """Fetch a server's libraries and users through one client session.
+
+        Connecting, listing libraries and listing users are each bounded by
+        `timeout`. A failed listing is recorded on the result instead of
+        raised, so one part failing does not stop the other. When both fail
+        the session is still failed, so the server's circuit breaker counts
+        it. Performs no database access.
+
+        Args:
+            server: The MediaServer entity to query (positional-only).
+            timeout: Seconds allowed for each step (keyword-only).
+
+        Returns:
+            The fetched libraries and users, or the error for each part.
+
+        Raises:
+            TimeoutError: If connecting to the server times out.
+            MediaClientError: If the client session cannot be opened.
+        """
+        result = RemoteServerState()
+        try:
+            async with AsyncExitStack() as stack:
+                try:
+                    async with asyncio.timeout(timeout):
+                        client = await stack.enter_async_context(
+                            registry.client_session(server)
+                        )
+                except TimeoutError as exc:
+                    raise TimeoutError(
+                        f"Timed out after {timeout}s connecting to the server"
+                    ) from exc
+
+                result.libraries, result.libraries_error = await _fetch_part(
+                    client.get_libraries, "libraries", timeout=timeout
+                )
+                result.users, result.users_error = await _fetch_part(
+                    client.list_users, "users", timeout=timeout
+                )
+                if (
+                    result.libraries_error is not None
+                    and result.users_error is not None
+                ):
+                    raise result.libraries_error
+        except Exception as exc:
+            # Both parts failed; the errors are already on the result
+            if exc is not result.libraries_error:
+                raise
+        return result
+
+    async def reconcile_users(
+        self,
+        server_id: UUID,
+        external_users: Sequence[ExternalUser],
+        /,
+        *,
+        dry_run: bool = True,
+    ) -> SyncResult:
+        """Compare a previously fetched remote user list with local records.
+
+        This is the database half of sync_server: it identifies orphaned,
+        stale and matched users and, when dry_run=False, imports orphans.
+
+        Args:
+            server_id: The UUID of the media server (positional-only).
+            external_users: Users returned by fetch_external_users (positional-only).
+            dry_run: If True, only report discrepancies (keyword-only).
+
+        Returns:
+            SyncResult describing the discrepancies and imports.
+
+        Raises:
+            NotFoundError: If the server_id does not exist.
+        """
+        server = await self.server_repo.get_by_id(server_id)
+        if server is None:
+            raise NotFoundError("MediaServer", str(server_id))
 
         # Build maps for comparison using external_user_id
         external_map = {u.external_user_id: u for u in external_users}
@@ -133,19 +297,24 @@ class SyncService:
         matched_ids = external_ids & local_ids
         matched_count = len(matched_ids)
 
-        # Update external_user_type for matched users whose type is missing or changed
+        # Update external_user_type for matched users whose type is missing or
+        # changed, as a single executemany UPDATE rather than a flush per row
         if matched_ids and not dry_run:
             local_user_map = {u.external_user_id: u for u in local_users}
+            type_updates: list[tuple[UUID, str]] = []
             for ext_id in matched_ids:
-                local_user = local_user_map.get(ext_id)
+                local_user = local_user_map[ext_id]
                 ext_user = external_map[ext_id]
                 if (
-                    local_user is not None
-                    and ext_user.user_type is not None
+                    ext_user.user_type is not None
                     and local_user.external_user_type != ext_user.user_type
                 ):
-                    local_user.external_user_type = ext_user.user_type
-                    _ = await self.user_repo.update(local_user)
+                    type_updates.append((local_user.id, ext_user.user_type))
+                    # Keep the loaded instance in step without marking it dirty
+                    set_committed_value(
+                        local_user, "external_user_type", ext_user.user_type
+                    )
+            _ = await self.user_repo.bulk_update_external_types(type_updates)
 
         # Filter orphaned users against sync exclusions to prevent
         # re-import of deleted users (Plex API caching bug workaround)
@@ -164,41 +333,51 @@ class SyncService:
         # Import orphaned users when not a dry run
         imported_count = 0
         if not dry_run and orphaned_ids:
+            # Dedup check: one set-based query catches users created since the
+            # local snapshot was taken (e.g. by a concurrent redemption)
+            already_imported = await self.user_repo.get_existing_external_ids(
+                server.id, orphaned_ids
+            )
+            if already_imported:
+                log.info(  # pyright: ignore[reportAny]
+                    "Skipping already-imported users during sync",
+                    server_name=server.name,
+                    count=len(already_imported),
+                    sample_external_user_ids=sorted(already_imported)[
+                        :_LOGGED_IDS_SAMPLE_SIZE
+                    ],
+                )
+                orphaned_ids -= already_imported
+                matched_count += len(already_imported)
+
+            # Create an Identity and a linked User for each orphaned user,
+            # using multi-row INSERTs instead of a flush per entity
+            identity_rows: list[dict[str, object]] = []
+            user_rows: list[dict[str, object]] = []
             for ext_id in orphaned_ids:
                 ext_user = external_map[ext_id]
-
-                # Dedup check: skip if user already exists locally
-                existing = await self.user_repo.get_by_external_and_server(
-                    ext_user.external_user_id, server.id
+                identity_id = uuid4()
+                identity_rows.append(
+                    {
+                        "id": identity_id,
+                        "display_name": ext_user.username,
+                        "email": ext_user.email,
+                        "enabled": True,
+                    }
                 )
-                if existing is not None:
-                    log.info(  # pyright: ignore[reportAny]
-                        "Skipping already-imported user during sync",
-                        external_user_id=ext_user.external_user_id,
-                        username=ext_user.username,
-                    )
-                    orphaned_ids.discard(ext_id)
-                    matched_count += 1
-                    continue
-
-                # Create an Identity for the orphaned user
-                identity = Identity()
-                identity.display_name = ext_user.username
-                identity.email = ext_user.email
-                identity.enabled = True
-                identity = await self.identity_repo.create(identity)
-
-                # Create a User linked to the identity and server
-                user = User()
-                user.identity_id = identity.id
-                user.media_server_id = server.id
-                user.external_user_id = ext_user.external_user_id
-                user.username = ext_user.username
-                user.external_user_type = ext_user.user_type
-                user.enabled = True
-                _ = await self.user_repo.create(user)
-
-                imported_count += 1
+                user_rows.append(
+                    {
+                        "identity_id": identity_id,
+                        "media_server_id": server.id,
+                        "external_user_id": ext_user.external_user_id,
+                        "username": ext_user.username,
+                        "external_user_type": ext_user.user_type,
+                        "enabled": True,
+                    }
+                )
+
+            _ = await self.identity_repo.bulk_insert(identity_rows)
+            imported_count = await self.user_repo.bulk_insert(user_rows)
 
         # Build result with usernames for human readability
         return SyncResult(
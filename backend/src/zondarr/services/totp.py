@@ -4,6 +4,8 @@ Provides TOTP setup, verification, backup code generation, and QR code
 rendering for admin accounts.
 """
 
+import hashlib
+import hmac
 import io
 import secrets
 import string
@@ -13,10 +15,14 @@ import msgspec
 import pyotp
 import segno
 import structlog
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+from sqlalchemy.orm import object_session
 
+from zondarr.core.auth import invalidate_admin_principal
 from zondarr.core.exceptions import AuthenticationError
 from zondarr.models.admin import AdminAccount
-from zondarr.services.password import hash_password, verify_password
+from zondarr.services.password import hash_password, run_hashing, verify_password
 from zondarr.services.totp_encryption import (
     InvalidToken,
     decrypt_totp_secret,
@@ -67,46 +73,162 @@ def generate_backup_codes() -> list[str]:
     return sorted(codes)
 
 
-def hash_backup_codes(codes: list[str]) -> str:
+class _BackupCodeEntry(msgspec.Struct, frozen=True):
+    """A stored backup code: keyed lookup tag plus argon2 hash.
+
+    Attributes:
+        tag: Hex HMAC-SHA256 of the normalized code under a key derived
+            from the application secret. Selects the candidate hash
+            without revealing the code.
+        hash: Argon2 hash of the normalized code.
+    """
+
+    tag: str
+    hash: str
+
+
+# Untagged entries are bare argon2 hashes written before lookup tags existed
+type _StoredBackupCode = _BackupCodeEntry | str
+
+
+def _normalize_backup_code(code: str) -> str:
+    """Normalize a backup code for hashing and tagging."""
+    return code.upper().strip()
+
+
+def _backup_code_tag_key(secret_key: str) -> bytes:
+    """Derive the HMAC key for backup code lookup tags.
+
+    Uses HKDF with a dedicated info context so the tag key is independent
+    of the TOTP secret encryption key.
+
+    Args:
+        secret_key: The application's secret key.
+
+    Returns:
+        A 32-byte HMAC key.
+    """
+    hkdf = HKDF(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=b"zondarr-totp",
+        info=b"totp-backup-code-tag",
+    )
+    return hkdf.derive(secret_key.encode())
+
+
+def _backup_code_tag(normalized_code: str, key: bytes, /) -> str:
+    """Compute the lookup tag for a normalized backup code."""
+    return hmac.new(key, normalized_code.encode(), hashlib.sha256).hexdigest()
+
+
+def _encode_backup_codes(entries: list[_StoredBackupCode], /) -> str:
+    return msgspec.json.encode(entries).decode()
+
+
+def hash_backup_codes(codes: list[str], *, secret_key: str) -> str:
     """Hash backup codes and serialize as JSON for storage.
 
     Each code is hashed with argon2 before storage so that the
-    plaintext codes cannot be recovered from the database.
+    plaintext codes cannot be recovered from the database. A keyed
+    lookup tag is stored next to each hash so verification can pick
+    the single candidate hash instead of trying all of them.
 
     Args:
         codes: List of plaintext backup codes.
+        secret_key: Application secret key used to derive the tag key.
 
     Returns:
-        JSON string containing an array of argon2 hashes.
+        JSON string containing an array of {"tag", "hash"} objects.
     """
-    hashes = [hash_password(code) for code in codes]
-    return msgspec.json.encode(hashes).decode()
+    key = _backup_code_tag_key(secret_key)
+    entries: list[_StoredBackupCode] = []
+    for code in codes:
+        normalized = _normalize_backup_code(code)
+        entries.append(
+            _BackupCodeEntry(
+                tag=_backup_code_tag(normalized, key),
+                hash=hash_password(normalized),
+            )
+        )
+    return _encode_backup_codes(entries)
 
 
-def verify_backup_code(stored_hashes_json: str, code: str) -> tuple[bool, str | None]:
+def has_untagged_backup_codes(stored_hashes_json: str) -> bool:
+    """Check whether stored backup codes predate lookup tags.
+
+    Untagged codes still verify, but each attempt against them costs
+    one argon2 check per untagged code. Regenerating the codes replaces
+    them with tagged entries.
+
+    Args:
+        stored_hashes_json: JSON string of stored backup codes.
+
+    Returns:
+        True if any stored code is a bare argon2 hash.
+    """
+    entries = msgspec.json.decode(stored_hashes_json, type=list[_StoredBackupCode])
+    return any(isinstance(entry, str) for entry in entries)
+
+
+def backup_codes_need_regeneration(admin: AdminAccount) -> bool:
+    """Check whether an admin should regenerate their backup codes.
+
+    Args:
+        admin: The admin account.
+
+    Returns:
+        True if TOTP is enabled and any stored backup code is untagged.
+    """
+    return (
+        admin.totp_enabled
+        and admin.totp_backup_codes is not None
+        and has_untagged_backup_codes(admin.totp_backup_codes)
+    )
+
+
+def verify_backup_code(
+    stored_hashes_json: str, code: str, *, secret_key: str
+) -> tuple[bool, str | None]:
     """Verify a backup code against stored hashes.
 
-    Checks the provided code against each stored hash. On match,
-    returns the updated JSON with the used hash removed.
+    Tagged entries are matched by lookup tag first, so at most one
+    argon2 check runs for them and a wrong code runs none. Untagged
+    entries (stored before tags existed) are only tried if no tag
+    matched. On match, returns the updated JSON with the used entry
+    removed.
 
     Args:
-        stored_hashes_json: JSON string of argon2 hashes.
+        stored_hashes_json: JSON string of stored backup codes.
         code: The backup code to verify.
+        secret_key: Application secret key used to derive the tag key.
 
     Returns:
         A tuple of (matched, updated_json). If matched is True,
-        updated_json contains the remaining hashes. If False,
+        updated_json contains the remaining entries. If False,
         updated_json is None.
     """
-    hashes: list[str] = msgspec.json.decode(stored_hashes_json, type=list[str])
-    normalized = code.upper().strip()
+    entries = msgspec.json.decode(stored_hashes_json, type=list[_StoredBackupCode])
+    normalized = _normalize_backup_code(code)
+    tag = _backup_code_tag(normalized, _backup_code_tag_key(secret_key))
+
+    match_index: int | None = None
+    for i, entry in enumerate(entries):
+        if isinstance(entry, _BackupCodeEntry) and hmac.compare_digest(entry.tag, tag):
+            if verify_password(entry.hash, normalized):
+                match_index = i
+            break
+    else:
+        for i, entry in enumerate(entries):
+            if isinstance(entry, str) and verify_password(entry, normalized):
+                match_index = i
+                break
 
-    for i, h in enumerate(hashes):
-        if verify_password(h, normalized):
-            remaining = hashes[:i] + hashes[i + 1 :]
-            return True, msgspec.json.encode(remaining).decode()
+    if match_index is None:
+        return False, None
 
-    return False, None
+    remaining = entries[:match_index] + entries[match_index + 1 :]
+    return True, _encode_backup_codes(remaining)
 
 
 class TOTPService:
@@ -179,7 +301,7 @@ class TOTPService:
         admin.totp_failed_attempts = 0
         admin.totp_last_failed_at = None
 
-    def generate_setup(self, admin: AdminAccount) -> tuple[str, str, list[str]]:
+    async def generate_setup(self, admin: AdminAccount) -> tuple[str, str, list[str]]:
         """Generate TOTP setup data for an admin account.
 
         Creates a new TOTP secret, encrypts and stores it on the account,
@@ -217,7 +339,9 @@ class TOTPService:
 
         # Generate and store backup codes
         backup_codes = generate_backup_codes()
-        admin.totp_backup_codes = hash_backup_codes(backup_codes)
+        admin.totp_backup_codes = await run_hashing(
+            lambda: hash_backup_codes(backup_codes, secret_key=self._secret_key)
+        )
 
         logger.info(
             "totp_setup_generated",
@@ -260,6 +384,7 @@ class TOTPService:
 
         admin.totp_enabled = True
         admin.totp_enabled_at = datetime.now(UTC)
+        invalidate_admin_principal(admin.id, session=object_session(admin))
         logger.info(
             "totp_enabled",
             admin_id=str(admin.id),
@@ -287,7 +412,7 @@ class TOTPService:
         totp = pyotp.TOTP(secret, digits=TOTP_DIGITS, interval=TOTP_INTERVAL)
         return totp.verify(code, valid_window=1)
 
-    def verify_backup_code(self, admin: AdminAccount, code: str) -> bool:
+    async def verify_backup_code(self, admin: AdminAccount, code: str) -> bool:
         """Verify and consume a backup code during login.
 
         On successful verification, the used code is removed from storage.
@@ -309,7 +434,16 @@ class TOTPService:
         if admin.totp_backup_codes is None:
             raise AuthenticationError("No backup codes available", "NO_BACKUP_CODES")
 
-        matched, updated_json = verify_backup_code(admin.totp_backup_codes, code)
+        stored = admin.totp_backup_codes
+        matched, updated_json = await run_hashing(
+            lambda: verify_backup_code(stored, code, secret_key=self._secret_key)
+        )
+        if has_untagged_backup_codes(stored):
+            logger.warning(
+                "totp_backup_codes_untagged",
+                admin_id=str(admin.id),
+                hint="Regenerate backup codes to enable constant-cost lookup",
+            )
         if matched:
             admin.totp_backup_codes = updated_json
             logger.info(
@@ -340,6 +474,7 @@ class TOTPService:
         admin.totp_enabled_at = None
         admin.totp_failed_attempts = 0
         admin.totp_last_failed_at = None
+        invalidate_admin_principal(admin.id, session=object_session(admin))
 
         logger.info(
             "totp_disabled",
@@ -347,7 +482,7 @@ class TOTPService:
             username=admin.username,
         )
 
-    def regenerate_backup_codes(self, admin: AdminAccount) -> list[str]:
+    async def regenerate_backup_codes(self, admin: AdminAccount) -> list[str]:
         """Generate a fresh set of backup codes, replacing existing ones.
 
         The caller must flush/commit the session.
@@ -365,7 +500,9 @@ class TOTPService:
             raise AuthenticationError("TOTP is not enabled", "TOTP_NOT_ENABLED")
 
         codes = generate_backup_codes()
-        admin.totp_backup_codes = hash_backup_codes(codes)
+        admin.totp_backup_codes = await run_hashing(
+            lambda: hash_backup_codes(codes, secret_key=self._secret_key)
+        )
 
         logger.info(
             "totp_backup_codes_regenerated",
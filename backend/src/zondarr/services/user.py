@@ -23,6 +23,7 @@ from uuid import UUID
 import structlog
 
 from zondarr.core.exceptions import NotFoundError, RepositoryError, ValidationError
+from zondarr.core.pagination import KeysetPosition
 from zondarr.media.exceptions import MediaClientError
 from zondarr.media.registry import registry
 from zondarr.media.types import ExternalUser
@@ -275,10 +276,10 @@ class UserService:
 
         # Update external media server first (atomicity guarantee)
         server = user.media_server
-        client = registry.create_client_for_server(server)
+        client_session = registry.client_session(server)
 
         try:
-            async with client:
+            async with client_session as client:
                 success = await client.set_user_enabled(
                     user.external_user_id,
                     enabled=enabled,
@@ -324,10 +325,10 @@ class UserService:
 
         # Delete from external media server first (atomicity guarantee)
         server = user.media_server
-        client = registry.create_client_for_server(server)
+        client_session = registry.client_session(server)
 
         try:
-            async with client:
+            async with client_session as client:
                 deleted_from_server = await client.delete_user(user.external_user_id)
                 if not deleted_from_server:
                     log.warning(  # pyright: ignore[reportAny]
@@ -463,7 +464,9 @@ class UserService:
         # Enforce page_size cap
         capped_page_size = min(page_size, 100)
 
-        users, total = await self.user_repository.list_paginated(
+        # The repository batch-loads identities and their linked users
+        # (needed for UserDetailResponse) alongside the page itself
+        return await self.user_repository.list_paginated(
             page=page,
             page_size=capped_page_size,
             media_server_id=media_server_id,
@@ -474,14 +477,81 @@ class UserService:
             sort_order=sort_order,
         )
 
-        # Load identities with all linked users for each user
-        # This is needed for the UserDetailResponse which includes identity.users
-        for user in users:
-            identity = await self.identity_repository.get_with_users(user.identity_id)
-            if identity is not None:
-                user.identity = identity
+    async def list_users_after(
+        self,
+        *,
+        after: KeysetPosition | None = None,
+        page_size: int = 50,
+        media_server_id: UUID | None = None,
+        invitation_id: UUID | None = None,
+        enabled: bool | None = None,
+        expired: bool | None = None,
+        sort_by: UserSortField = "created_at",
+        sort_order: SortOrder = "desc",
+    ) -> tuple[Sequence[User], bool]:
+        """List users with keyset pagination.
 
-        return users, total
+        Same filters and ordering as list_users, but resumes after the
+        (sort value, id) of the last row already returned instead of using
+        an offset. Enforces page_size cap of 100.
+
+        Args:
+            after: (sort value, id) of the last row on the previous page.
+                None starts from the first row (keyword-only).
+            page_size: Number of items per page. Defaults to 50, max 100 (keyword-only).
+            media_server_id: Filter by media server ID. None means no filter (keyword-only).
+            invitation_id: Filter by invitation ID. None means no filter (keyword-only).
+            enabled: Filter by enabled status. None means no filter (keyword-only).
+            expired: Filter by expiration status. None means no filter (keyword-only).
+            sort_by: Field to sort by. One of: created_at, username, expires_at (keyword-only).
+            sort_order: Sort direction. One of: asc, desc (keyword-only).
+
+        Returns:
+            A tuple of (items, has_next) where items is the page of User
+            entities with relationships loaded.
+
+        Raises:
+            RepositoryError: If the database operation fails.
+        """
+        return await self.user_repository.list_after(
+            after=after,
+            page_size=min(page_size, 100),
+            media_server_id=media_server_id,
+            invitation_id=invitation_id,
+            enabled=enabled,
+            expired=expired,
+            sort_by=sort_by,
+            sort_order=sort_order,
+        )
+
+    async def count_users(
+        self,
+        *,
+        media_server_id: UUID | None = None,
+        invitation_id: UUID | None = None,
+        enabled: bool | None = None,
+        expired: bool | None = None,
+    ) -> int:
+        """Count users matching the list_users filters.
+
+        Args:
+            media_server_id: Filter by media server ID. None means no filter (keyword-only).
+            invitation_id: Filter by invitation ID. None means no filter (keyword-only).
+            enabled: Filter by enabled status. None means no filter (keyword-only).
+            expired: Filter by expiration status. None means no filter (keyword-only).
+
+        Returns:
+            The number of matching users.
+
+        Raises:
+            RepositoryError: If the database operation fails.
+        """
+        return await self.user_repository.count(
+            media_server_id=media_server_id,
+            invitation_id=invitation_id,
+            enabled=enabled,
+            expired=expired,
+        )
 
     async def update_permissions(
         self,
@@ -536,10 +606,10 @@ class UserService:
 
         # Update external media server first (atomicity guarantee)
         server = user.media_server
-        client = registry.create_client_for_server(server)
+        client_session = registry.client_session(server)
 
         try:
-            async with client:
+            async with client_session as client:
                 success = await client.update_permissions(
                     user.external_user_id,
                     permissions=filtered_permissions,
@@ -578,10 +648,10 @@ class UserService:
             raise NotFoundError("User", str(user_id))
 
         server = user.media_server
-        client = registry.create_client_for_server(server)
+        client_session = registry.client_session(server)
 
         try:
-            async with client:
+            async with client_session as client:
                 removed = await client.remove_shared_access(user.external_user_id)
                 if not removed:
                     log.info(  # pyright: ignore[reportAny]
@@ -4,10 +4,14 @@ This module configures Hypothesis profiles for different environments
 and provides shared fixtures for property-based tests.
 """
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
 
+import msgspec
 import pytest
 from hypothesis import HealthCheck, Phase, Verbosity, settings
+from litestar.datastructures import State
 from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
@@ -18,7 +22,12 @@ from sqlalchemy.ext.asyncio import (
 from sqlalchemy.pool import ConnectionPoolEntry
 
 import zondarr.models as _zondarr_models  # Ensure all model tables are registered
+from zondarr.config import Settings
+from zondarr.core.tasks import BackgroundTaskManager
+from zondarr.media.registry import ClientRegistry
+from zondarr.media.types import Capability
 from zondarr.models.base import Base
+from zondarr.models.media_server import MediaServer
 
 _ = _zondarr_models
 
@@ -90,6 +99,75 @@ KNOWN_SERVER_TYPES: list[str] = ["jellyfin", "plex"]
 """Server types registered in the provider registry, used across test strategies."""
 
 
+# =============================================================================
+# Media Client Helpers
+# =============================================================================
+
+
+def mock_client_registry() -> MagicMock:
+    """Create a ClientRegistry mock for patching service modules.
+
+    Configure ``create_client_for_server`` with the client(s) to hand out;
+    ``client_session`` enters that client the way the real pool does when it
+    has no connected client for the server yet.
+    """
+    mock_registry = MagicMock(spec=ClientRegistry)
+
+    @asynccontextmanager
+    async def _client_session(server: MediaServer, /) -> AsyncIterator[object]:
+        client: object = mock_registry.create_client_for_server(server)
+        async with client:  # pyright: ignore[reportGeneralTypeIssues]
+            yield client
+
+    mock_registry.client_session = MagicMock(side_effect=_client_session)
+    mock_registry.is_circuit_open = MagicMock(return_value=False)
+    return mock_registry
+
+
+def mock_server_registry(
+    client: AsyncMock,
+    /,
+    *,
+    capabilities: set[Capability] | None = None,
+) -> MagicMock:
+    """Create a mock_client_registry that hands out `client` for every server.
+
+    The client is made usable as an async context manager; when
+    `capabilities` is given, ``get_capabilities`` reports them.
+    """
+    client.__aenter__ = AsyncMock(return_value=client)
+    client.__aexit__ = AsyncMock(return_value=None)
+    mock_registry = mock_client_registry()
+    mock_registry.create_client_for_server = MagicMock(return_value=client)
+    if capabilities is not None:
+        mock_registry.get_capabilities = MagicMock(return_value=capabilities)
+    return mock_registry
+
+
+# =============================================================================
+# Background Task Helpers
+# =============================================================================
+
+
+def make_task_manager(**overrides: object) -> BackgroundTaskManager:
+    """Create a BackgroundTaskManager with test settings.
+
+    Keyword arguments override Settings fields, e.g.
+    ``make_task_manager(expiration_check_interval_seconds=60)``.
+    """
+    settings = Settings(secret_key="test-secret-key-at-least-32-characters-long")
+    return BackgroundTaskManager(msgspec.structs.replace(settings, **overrides))
+
+
+def make_task_state(
+    session_factory: async_sessionmaker[AsyncSession], /
+) -> MagicMock:
+    """Create the application State a background task reads its sessions from."""
+    state = MagicMock(spec=State)
+    state.session_factory = session_factory
+    return state
+
+
 # =============================================================================
 # Database Helper Functions
 # =============================================================================
@@ -121,6 +199,27 @@ async def create_test_engine() -> AsyncEngine:
     return engine
 
 
+async def create_media_server(
+    session_factory: async_sessionmaker[AsyncSession],
+    /,
+    *,
+    server_type: str = "jellyfin",
+    enabled: bool = True,
+) -> MediaServer:
+    """Create and commit an enabled media server of `server_type`."""
+    async with session_factory() as session:
+        server = MediaServer(
+            name=server_type.capitalize(),
+            server_type=server_type,
+            url=f"http://{server_type}.local",
+            api_key="token",
+            enabled=enabled,
+        )
+        session.add(server)
+        await session.commit()
+        return server
+
+
 # =============================================================================
 # Reusable Test Database (for Hypothesis @given tests)
 # =============================================================================
@@ -15,8 +15,7 @@ import pytest
 from hypothesis import given
 from hypothesis import strategies as st
 
-from tests.conftest import TestDB
-from zondarr.media.registry import ClientRegistry
+from tests.conftest import TestDB, mock_client_registry
 from zondarr.media.types import ExternalUser
 from zondarr.models.identity import Identity, User
 from zondarr.models.media_server import MediaServer
@@ -502,7 +501,7 @@ class TestSyncSkipsAlreadyImportedUsers:
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
 
-            mock_registry = MagicMock(spec=ClientRegistry)
+            mock_registry = mock_client_registry()
             mock_registry.create_client_for_server = MagicMock(return_value=mock_client)
 
             user_repo = UserRepository(session)
@@ -4,9 +4,15 @@ Feature: jellyfin-integration
 Properties: 2, 4, 5, 6, 7
 """
 
+import asyncio
+import time
+from unittest.mock import MagicMock
+
+import pytest
 from hypothesis import given, settings
 from hypothesis import strategies as st
 
+from zondarr.media.providers.jellyfin.client import JellyfinClient
 from zondarr.media.types import LibraryInfo
 
 # Valid Jellyfin CollectionType values
@@ -576,3 +582,51 @@ class TestPermissionMappingCorrectness:
         )
 
         assert first_state == second_state
+
+
+# =============================================================================
+# Non-blocking SDK calls
+# =============================================================================
+
+
+class _SlowUsersApi:
+    """Mock jellyfin-sdk users API whose ``all`` blocks like a slow server."""
+
+    delay: float
+
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+
+    @property
+    def all(self) -> list[MockJellyfinUser]:
+        time.sleep(self.delay)
+        return [MockJellyfinUser(user_id="u1", name="alice", is_disabled=False)]
+
+
+class TestSdkCallsDoNotBlockEventLoop:
+    """Blocking jellyfin-sdk calls run off the event loop."""
+
+    @pytest.mark.asyncio
+    async def test_list_users_keeps_event_loop_responsive(self) -> None:
+        """Other coroutines keep running while a slow SDK call is in flight."""
+        client = JellyfinClient(url="http://jellyfin.local:8096", api_key="key")
+        client._api = MagicMock()  # pyright: ignore[reportPrivateUsage]
+        client._api.users = _SlowUsersApi(0.3)  # pyright: ignore[reportPrivateUsage]
+
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker_task = asyncio.create_task(ticker())
+        try:
+            users = await client.list_users()
+        finally:
+            _ = ticker_task.cancel()
+
+        assert [u.username for u in users] == ["alice"]
+        # A blocked loop would let the ticker run at most once
+        assert ticks >= 10
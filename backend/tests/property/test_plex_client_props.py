@@ -4,7 +4,12 @@ Feature: plex-integration
 Properties: 1, 2, 3
 """
 
+import json
+import time
+from collections.abc import Iterator
+from typing import Self, override
 from unittest.mock import patch
+from xml.sax.saxutils import quoteattr
 
 import pytest
 from hypothesis import given, settings
@@ -108,7 +113,7 @@ class TestContextManagerRoundTrip:
         api_key: str,
         server_name: str,
     ) -> None:
-        """Context manager initializes _server and _account on enter, cleans up on exit."""
+        """Context manager opens _server on enter, _account on demand, cleans up on exit."""
         from zondarr.media.providers.plex.client import PlexClient
 
         # Create mock server that will be returned by PlexServer constructor
@@ -123,8 +128,10 @@ class TestContextManagerRoundTrip:
 
             # Enter context
             async with client:
-                # Inside context, _server and _account should be set
+                # Inside context, _server is set; _account opens on first use
                 assert client._server is not None  # pyright: ignore[reportPrivateUsage]
+                assert client._account is None  # pyright: ignore[reportPrivateUsage]
+                await client._ensure_account()  # pyright: ignore[reportPrivateUsage]
                 assert client._account is not None  # pyright: ignore[reportPrivateUsage]
 
             # After exiting context, _server and _account should be None
@@ -1715,6 +1722,7 @@ class MockPlexServerWithLibraryAccess:
     url: str
     token: str
     friendlyName: str
+    machineIdentifier: str = "test-machine-id"
     library: MockLibraryWithSections
     _account: MockMyPlexAccountWithLibraryAccess
 
@@ -1945,6 +1953,68 @@ class TestLibraryAccessUpdateReturnValueCorrectness:
         assert exc_info.value.server_url == url
 
 
+def _users_xml(users: list[MockMyPlexUserWithHome]) -> bytes:
+    """Render mock users as the plex.tv /api/users/ XML document."""
+    parts = [f'<MediaContainer friendlyName="myPlex" size="{len(users)}">']
+    for user in users:
+        email = "" if user.email is None else f" email={quoteattr(user.email)}"
+        parts.append(
+            f'<User id="{user.id}" username={quoteattr(user.username)}{email}'
+            f' home="{int(user.home)}">'
+        )
+        parts.extend(
+            f"<Server machineIdentifier={quoteattr(share.machineIdentifier)}/>"
+            for share in user.servers
+        )
+        parts.append("</User>")
+    parts.append("</MediaContainer>")
+    return "".join(parts).encode()
+
+
+class MockPlexTvResponse:
+    """Mock requests.Response for plex.tv listings."""
+
+    _body: bytes
+
+    def __init__(self, body: bytes) -> None:
+        self._body = body
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        return None
+
+    def raise_for_status(self) -> Self:
+        return self
+
+    def iter_content(self, chunk_size: int) -> Iterator[bytes]:
+        """Yield the body in small chunks to exercise incremental parsing."""
+        del chunk_size
+        for start in range(0, len(self._body), 7):
+            yield self._body[start : start + 7]
+
+    def json(self) -> object:
+        """Decode the body as JSON."""
+        return json.loads(self._body)
+
+
+class MockPlexTvSession:
+    """Mock requests.Session serving an account's users as plex.tv XML."""
+
+    _account: MockMyPlexAccountWithPermissions | MockMyPlexAccountWithUserList
+
+    def __init__(
+        self,
+        account: MockMyPlexAccountWithPermissions | MockMyPlexAccountWithUserList,
+    ) -> None:
+        self._account = account
+
+    def get(self, url: str, **_kwargs: object) -> MockPlexTvResponse:
+        assert url == "https://plex.tv/api/users/"
+        return MockPlexTvResponse(_users_xml(self._account.list_remote_users()))
+
+
 class MockMyPlexAccountWithPermissions:
     """Mock MyPlexAccount that supports user listing and permission updates."""
 
@@ -1961,6 +2031,15 @@ class MockMyPlexAccountWithPermissions:
         self._users = users or []
         self._update_friend_error = update_friend_error
         self.update_friend_calls = []
+        self._session = MockPlexTvSession(self)
+        self._timeout = 30
+
+    def _headers(self) -> dict[str, str]:
+        return {"X-Plex-Token": "token"}
+
+    def list_remote_users(self) -> list[MockMyPlexUserWithHome]:
+        """Return the users served by the streamed plex.tv listing."""
+        return self._users
 
     def users(self) -> list[MockMyPlexUserWithHome]:
         """Return the list of mock users."""
@@ -2200,13 +2279,22 @@ class MockMyPlexAccountWithUserList:
     ) -> None:
         self._users = users or []
         self._users_error = users_error
+        self._session = MockPlexTvSession(self)
+        self._timeout = 30
 
-    def users(self) -> list[MockMyPlexUserWithHome]:
-        """Return the list of mock users."""
+    def _headers(self) -> dict[str, str]:
+        return {"X-Plex-Token": "token"}
+
+    def list_remote_users(self) -> list[MockMyPlexUserWithHome]:
+        """Return the users served by the streamed plex.tv listing."""
         if self._users_error is not None:
             raise self._users_error
         return self._users
 
+    def users(self) -> list[MockMyPlexUserWithHome]:
+        """Return the list of mock users."""
+        return self.list_remote_users()
+
 
 class MockPlexServerWithUserList:
     """Mock PlexServer that supports user listing."""
@@ -2438,6 +2526,190 @@ class TestListUsersReturnsAllUsersAsExternalUserStructs:
                 assert f"Plex ({url})" in exc_info.value.service_name
 
 
+class MockMyPlexAccountCountingUsers(MockMyPlexAccountWithPermissions):
+    """Mock MyPlexAccount that counts plex.tv user listings."""
+
+    users_calls: int
+
+    def __init__(self, *, users: list[MockMyPlexUserWithHome]) -> None:
+        super().__init__(users=users)
+        self.users_calls = 0
+
+    @override
+    def users(self) -> list[MockMyPlexUserWithHome]:
+        """Return the mock users and record the fetch."""
+        self.users_calls += 1
+        return self._users
+
+
+class MockPlexServerCountingUsers(MockPlexServerWithPermissions):
+    """Mock PlexServer exposing a machine identifier for user listing."""
+
+    machineIdentifier: str = "test-machine-id"
+
+
+class MockPlexTvSessionWithShares(MockPlexTvSession):
+    """Mock requests.Session that also serves an empty shared_servers list."""
+
+    @override
+    def get(self, url: str, **kwargs: object) -> MockPlexTvResponse:
+        if url.endswith("/shared_servers"):
+            return MockPlexTvResponse(b'{"SharedServer": []}')
+        return super().get(url, **kwargs)
+
+
+class MockMyPlexAccountRedeeming(MockMyPlexAccountCountingUsers):
+    """Mock MyPlexAccount that creates and removes Home Users."""
+
+    def __init__(self) -> None:
+        super().__init__(users=[])
+        self._session = MockPlexTvSessionWithShares(self)
+
+    def createHomeUser(
+        self, user: str, server: MockPlexServerCountingUsers
+    ) -> MockMyPlexUserWithHome:
+        """Add a Home User sharing the given server."""
+        created = MockMyPlexUserWithHome(
+            user_id=len(self._users) + 1,
+            username=user,
+            home=True,
+            servers=[
+                MockMyPlexServerShare(machine_identifier=server.machineIdentifier)
+            ],
+        )
+        self._users.append(created)
+        return created
+
+    def removeHomeUser(self, user: MockMyPlexUserWithHome) -> None:
+        """Remove a Home User from the account."""
+        self._users.remove(user)
+
+
+class TestUserDirectoryCaching:
+    """PlexClient reuses one plex.tv user listing across single-user operations."""
+
+    @settings(max_examples=25)
+    @given(
+        url=url_strategy,
+        api_key=api_key_strategy,
+        user_ids=st.lists(
+            st.integers(min_value=1, max_value=999999999),
+            min_size=2,
+            max_size=8,
+            unique=True,
+        ),
+    )
+    @pytest.mark.asyncio
+    async def test_repeated_operations_fetch_users_once(
+        self,
+        url: str,
+        api_key: str,
+        user_ids: list[int],
+    ) -> None:
+        """Lookups hit the cached directory; a mutated user is refetched."""
+        from zondarr.media.providers.plex.client import PlexClient
+
+        mock_users = [
+            MockMyPlexUserWithHome(user_id=user_id, username=f"user{user_id}")
+            for user_id in user_ids
+        ]
+        mock_account = MockMyPlexAccountCountingUsers(users=mock_users)
+        mock_server = MockPlexServerCountingUsers(url, api_key, account=mock_account)
+
+        with patch("plexapi.server.PlexServer", return_value=mock_server):
+            client = PlexClient(url=url, api_key=api_key)
+
+            async with client:
+                # The streamed listing does not build the directory
+                listed = await client.list_users()
+                assert len(listed) == len(user_ids)
+                assert mock_account.users_calls == 0
+
+                for user_id in user_ids:
+                    assert await client.update_permissions(
+                        str(user_id), permissions={"can_download": True}
+                    )
+                assert mock_account.users_calls == 1
+                assert len(mock_account.update_friend_calls) == len(user_ids)
+
+                # Permission changes leave shares alone, revoking them does not
+                assert await client.set_library_access(str(user_ids[0]), [])
+                assert mock_account.users_calls == 1
+                assert await client.update_permissions(
+                    str(user_ids[1]), permissions={"can_download": False}
+                )
+                assert mock_account.users_calls == 1
+
+                # The revoked user is stale, so its next lookup refetches
+                assert await client.update_permissions(
+                    str(user_ids[0]), permissions={"can_download": False}
+                )
+                assert mock_account.users_calls == 2
+
+                # Unknown users trigger one refresh and then report not found
+                assert not await client.update_permissions(
+                    "0", permissions={"can_download": False}
+                )
+                assert mock_account.users_calls == 3
+
+    @pytest.mark.asyncio
+    async def test_redemption_sequence_fetches_users_once(self) -> None:
+        """Creating, configuring and later deleting a user lists users once."""
+        from zondarr.media.providers.plex.client import PlexClient
+
+        mock_account = MockMyPlexAccountRedeeming()
+        mock_server = MockPlexServerCountingUsers(
+            "http://plex:32400", "token", account=mock_account
+        )
+
+        with patch("plexapi.server.PlexServer", return_value=mock_server):
+            async with PlexClient(url="http://plex:32400", api_key="token") as client:
+                created = await client.create_user("alice", "unused")
+                user_id = created.external_user_id
+
+                assert await client.set_library_access(user_id, ["1"])
+                assert await client.update_permissions(
+                    user_id, permissions={"can_download": True}
+                )
+                assert mock_account.users_calls == 1
+
+                assert await client.update_permissions(
+                    user_id, permissions={"can_download": False}
+                )
+                assert await client.delete_user(user_id)
+                assert mock_account.users_calls == 1
+                assert mock_account.users() == []
+
+    @pytest.mark.asyncio
+    async def test_directory_expires_after_ttl(self) -> None:
+        """A listing older than the TTL is fetched again."""
+        from zondarr.media.providers.plex.client import PlexClient
+
+        mock_user = MockMyPlexUserWithHome(user_id=1, username="alice")
+        mock_account = MockMyPlexAccountCountingUsers(users=[mock_user])
+        mock_server = MockPlexServerCountingUsers(
+            "http://plex:32400", "token", account=mock_account
+        )
+
+        with patch("plexapi.server.PlexServer", return_value=mock_server):
+            async with PlexClient(url="http://plex:32400", api_key="token") as client:
+                _ = await client.list_users()
+                assert await client.update_permissions(
+                    "1", permissions={"can_download": True}
+                )
+                assert mock_account.users_calls == 1
+
+                # Age the listing past its TTL without touching the user
+                directory = client._users  # pyright: ignore[reportPrivateUsage]
+                directory._fetched_at = time.monotonic() - 3600  # pyright: ignore[reportPrivateUsage]
+                directory._by_id["1"] = mock_user  # pyright: ignore[reportPrivateUsage]
+
+                assert await client.update_permissions(
+                    "1", permissions={"can_download": False}
+                )
+                assert mock_account.users_calls == 2
+
+
 # Strategy for operation names
 operation_strategy = st.sampled_from(
     [
@@ -8,6 +8,7 @@ are created, each linked to the correct MediaServer, and all linked to
 the same Identity.
 """
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import UUID, uuid4
 
@@ -16,8 +17,7 @@ from hypothesis import given, settings
 from hypothesis import strategies as st
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from tests.conftest import TestDB
-from zondarr.media.registry import ClientRegistry
+from tests.conftest import TestDB, mock_client_registry
 from zondarr.media.types import ExternalUser
 from zondarr.models import Invitation
 from zondarr.models.media_server import MediaServer
@@ -183,7 +183,7 @@ class TestRedemptionCreatesUsersOnAllServers:
         )
 
         # Create mock registry that returns mock clients for each server
-        mock_registry = MagicMock(spec=ClientRegistry)
+        mock_registry = mock_client_registry()
         server_to_external_id: dict[UUID, str] = {}
 
         def create_client_side_effect(server: MediaServer, /) -> AsyncMock:
@@ -273,7 +273,7 @@ class TestRedemptionCreatesUsersOnAllServers:
 
         # Track external IDs per server URL
         url_to_external_id: dict[str, str] = {}
-        mock_registry = MagicMock(spec=ClientRegistry)
+        mock_registry = mock_client_registry()
 
         def create_client_side_effect(
             server: MediaServer,
@@ -349,7 +349,7 @@ class TestRedemptionCreatesUsersOnAllServers:
         )
         invitation_id = invitation.id
 
-        mock_registry = MagicMock(spec=ClientRegistry)
+        mock_registry = mock_client_registry()
 
         def create_client_side_effect(server: MediaServer, /) -> AsyncMock:
             del server  # Unused but required by interface
@@ -416,7 +416,7 @@ class TestRedemptionCreatesUsersOnAllServers:
         # Create invitation targeting all servers
         _ = await create_invitation_with_servers(session_factory, code, servers)
 
-        mock_registry = MagicMock(spec=ClientRegistry)
+        mock_registry = mock_client_registry()
 
         def create_client_side_effect(server: MediaServer, /) -> AsyncMock:
             del server  # Unused but required by interface
@@ -515,7 +515,7 @@ class TestRedemptionIncrementsUseCount:
             assert invitation_before.use_count == initial_use_count
 
         # Create mock registry
-        mock_registry = MagicMock(spec=ClientRegistry)
+        mock_registry = mock_client_registry()
 
         def create_client_side_effect(server: MediaServer, /) -> AsyncMock:
             del server  # Unused but required by interface
@@ -598,7 +598,7 @@ class TestRedemptionIncrementsUseCount:
             invitation_id = invitation.id
 
         # Create mock registry
-        mock_registry = MagicMock(spec=ClientRegistry)
+        mock_registry = mock_client_registry()
 
         def create_client_side_effect(server: MediaServer, /) -> AsyncMock:
             del server  # Unused but required by interface
@@ -689,7 +689,7 @@ class TestRedemptionIncrementsUseCount:
             use_count_before = invitation_before.use_count
 
         # Create mock registry
-        mock_registry = MagicMock(spec=ClientRegistry)
+        mock_registry = mock_client_registry()
 
         def create_client_side_effect(server: MediaServer, /) -> AsyncMock:
             del server  # Unused but required by interface
@@ -790,7 +790,7 @@ class TestDurationDaysSetsExpiration:
             await sess.commit()
 
         # Create mock registry
-        mock_registry = MagicMock(spec=ClientRegistry)
+        mock_registry = mock_client_registry()
 
         def create_client_side_effect(server: MediaServer, /) -> AsyncMock:
             del server  # Unused but required by interface
@@ -888,7 +888,7 @@ class TestDurationDaysSetsExpiration:
             await sess.commit()
 
         # Create mock registry
-        mock_registry = MagicMock(spec=ClientRegistry)
+        mock_registry = mock_client_registry()
 
         def create_client_side_effect(server: MediaServer, /) -> AsyncMock:
             del server
@@ -982,7 +982,7 @@ class TestDurationDaysSetsExpiration:
             await sess.commit()
 
         # Create mock registry
-        mock_registry = MagicMock(spec=ClientRegistry)
+        mock_registry = mock_client_registry()
 
         def create_client_side_effect(server: MediaServer, /) -> AsyncMock:
             del server
@@ -1060,7 +1060,7 @@ class TestDurationDaysSetsExpiration:
             await sess.commit()
 
         # Create mock registry
-        mock_registry = MagicMock(spec=ClientRegistry)
+        mock_registry = mock_client_registry()
 
         def create_client_side_effect(server: MediaServer, /) -> AsyncMock:
             del server
@@ -1140,7 +1140,7 @@ class TestDurationDaysSetsExpiration:
             await sess.commit()
 
         # Create mock registry
-        mock_registry = MagicMock(spec=ClientRegistry)
+        mock_registry = mock_client_registry()
 
         def create_client_side_effect(server: MediaServer, /) -> AsyncMock:
             del server
@@ -1214,11 +1214,11 @@ class TestRollbackOnFailure:
         password: str,
         email: str | None,
     ) -> None:
-        """When creation fails on server N, users on servers 1..N-1 are deleted.
+        """When creation fails on server N, every other created user is deleted.
 
         Property: For any redemption that fails on server N (N > 1),
-        all users created on servers 1 through N-1 should be deleted
-        via delete_user calls.
+        all users created on the other target servers (which are
+        provisioned concurrently) should be deleted via delete_user calls.
         """
         from zondarr.core.exceptions import ValidationError
         from zondarr.media.exceptions import MediaClientError
@@ -1244,7 +1244,7 @@ class TestRollbackOnFailure:
         deleted_user_ids: list[str] = []
         create_call_count = 0
 
-        mock_registry = MagicMock(spec=ClientRegistry)
+        mock_registry = mock_client_registry()
 
         def create_client_side_effect(server: MediaServer, /) -> AsyncMock:
             del server  # Unused but required by interface
@@ -1322,9 +1322,10 @@ class TestRollbackOnFailure:
             f"but only {deleted_user_ids} were deleted"
         )
 
-        # PROPERTY ASSERTION: Number of created users equals fail_at_server
-        assert len(created_user_ids) == fail_at_server, (
-            f"Expected {fail_at_server} users to be created before failure, "
+        # PROPERTY ASSERTION: Servers are provisioned concurrently, so every
+        # server except the failing one created its user before rollback
+        assert len(created_user_ids) == num_servers - 1, (
+            f"Expected {num_servers - 1} users to be created before rollback, "
             f"got {len(created_user_ids)}"
         )
 
@@ -1383,7 +1384,7 @@ class TestRollbackOnFailure:
             invitation_id = invitation.id
 
         create_call_count = 0
-        mock_registry = MagicMock(spec=ClientRegistry)
+        mock_registry = mock_client_registry()
 
         def create_client_side_effect(server: MediaServer, /) -> AsyncMock:
             del server
@@ -1514,7 +1515,7 @@ class TestRollbackOnFailure:
             )
 
         create_call_count = 0
-        mock_registry = MagicMock(spec=ClientRegistry)
+        mock_registry = mock_client_registry()
 
         def create_client_side_effect(server: MediaServer, /) -> AsyncMock:
             del server
@@ -1614,10 +1615,10 @@ class TestRollbackOnFailure:
         username: str,
         password: str,
     ) -> None:
-        """When creation fails on the first server, no users need rollback.
+        """When creation fails on the first server, the others are rolled back.
 
-        Property: When the first server fails, no users have been created
-        yet, so no rollback deletions should occur, and no local records
+        Property: When the first server fails, the users created concurrently
+        on the remaining servers are all deleted, and no local records
         should be created.
         """
         from sqlalchemy import func, select
@@ -1658,9 +1659,10 @@ class TestRollbackOnFailure:
                 select(func.count()).select_from(UserModel)
             )
 
+        created_user_ids: list[str] = []
         delete_calls: list[str] = []
         create_call_count = 0
-        mock_registry = MagicMock(spec=ClientRegistry)
+        mock_registry = mock_client_registry()
 
         def create_client_side_effect(server: MediaServer, /) -> AsyncMock:
             del server
@@ -1686,8 +1688,10 @@ class TestRollbackOnFailure:
                         operation="create_user",
                     )
 
+                external_id = str(uuid4())
+                created_user_ids.append(external_id)
                 return ExternalUser(
-                    external_user_id=str(uuid4()),
+                    external_user_id=external_id,
                     username=uname,
                     email=email,
                 )
@@ -1727,10 +1731,11 @@ class TestRollbackOnFailure:
                         password=password,
                     )
 
-        # PROPERTY ASSERTION: No delete calls should have been made
-        assert len(delete_calls) == 0, (
-            f"No delete calls should be made when first server fails, "
-            f"but got {len(delete_calls)} calls"
+        # PROPERTY ASSERTION: Users created on the other servers are deleted
+        assert len(created_user_ids) == num_servers - 1
+        assert sorted(delete_calls) == sorted(created_user_ids), (
+            f"Created users {created_user_ids} should all be deleted, "
+            f"but got delete calls for {delete_calls}"
         )
 
         # PROPERTY ASSERTION: use_count unchanged
@@ -1847,7 +1852,7 @@ class TestPlexRedemptionRollbackOnFailure:
         created_user_ids: list[str] = []
         deleted_user_ids: list[str] = []
 
-        mock_registry = MagicMock(spec=ClientRegistry)
+        mock_registry = mock_client_registry()
 
         def create_client_side_effect(server: MediaServer, /) -> AsyncMock:
             mock_client = AsyncMock()
@@ -2014,7 +2019,7 @@ class TestPlexRedemptionRollbackOnFailure:
                 select(func.count()).select_from(UserModel)
             )
 
-        mock_registry = MagicMock(spec=ClientRegistry)
+        mock_registry = mock_client_registry()
 
         def create_client_side_effect(server: MediaServer, /) -> AsyncMock:
             mock_client = AsyncMock()
@@ -2180,7 +2185,7 @@ class TestPlexRedemptionRollbackOnFailure:
         deleted_user_ids: list[str] = []
         create_call_count = 0
 
-        mock_registry = MagicMock(spec=ClientRegistry)
+        mock_registry = mock_client_registry()
 
         def create_client_side_effect(server: MediaServer, /) -> AsyncMock:
             mock_client = AsyncMock()
@@ -2436,3 +2441,99 @@ class TestAtomicReservation:
             await sess.commit()
 
         assert result is False
+
+
+# =============================================================================
+# Concurrent Provisioning Across Target Servers
+# =============================================================================
+
+
+class TestConcurrentProvisioning:
+    """Target servers are provisioned, and rolled back, concurrently."""
+
+    @pytest.mark.asyncio
+    async def test_servers_provisioned_and_rolled_back_concurrently(
+        self, db: TestDB
+    ) -> None:
+        """All servers are in flight at once for both creation and rollback."""
+        from zondarr.core.exceptions import ValidationError
+        from zondarr.media.exceptions import MediaClientError
+
+        num_servers = 4
+        await db.clean()
+        session_factory = db.session_factory
+        servers = await create_media_servers(session_factory, num_servers)
+        _ = await create_invitation_with_servers(
+            session_factory, "PARALLEL0001", servers
+        )
+        failing_server_id = servers[-1].id
+
+        in_flight = 0
+        peak_creates = 0
+        peak_deletes = 0
+        deleted: list[str] = []
+        all_started = asyncio.Event()
+
+        def create_client_side_effect(server: MediaServer, /) -> AsyncMock:
+            mock_client = AsyncMock()
+
+            async def mock_create_user(
+                uname: str,
+                _pwd: str,
+                /,
+                *,
+                email: str | None = None,
+                auth_token: str | None = None,
+            ) -> ExternalUser:
+                _ = auth_token
+                nonlocal in_flight, peak_creates
+                in_flight += 1
+                peak_creates = max(peak_creates, in_flight)
+                if in_flight == num_servers:
+                    all_started.set()
+                # Every server waits until all are in flight; a sequential
+                # implementation would time out here
+                await asyncio.wait_for(all_started.wait(), timeout=5)
+                in_flight -= 1
+                if server.id == failing_server_id:
+                    raise MediaClientError("Simulated failure", operation="create_user")
+                return ExternalUser(
+                    external_user_id=str(server.id), username=uname, email=email
+                )
+
+            async def mock_delete_user(ext_user_id: str, /) -> bool:
+                nonlocal in_flight, peak_deletes
+                in_flight += 1
+                peak_deletes = max(peak_deletes, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                deleted.append(ext_user_id)
+                return True
+
+            mock_client.create_user = mock_create_user
+            mock_client.delete_user = mock_delete_user
+            mock_client.set_library_access = AsyncMock(return_value=True)
+            mock_client.update_permissions = AsyncMock(return_value=True)
+            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+            mock_client.__aexit__ = AsyncMock(return_value=None)
+            return mock_client
+
+        mock_registry = mock_client_registry()
+        mock_registry.create_client_for_server = MagicMock(
+            side_effect=create_client_side_effect
+        )
+
+        async with session_factory() as session:
+            redemption_service = RedemptionService(
+                InvitationService(InvitationRepository(session)),
+                UserService(UserRepository(session), IdentityRepository(session)),
+            )
+            with patch("zondarr.services.redemption.registry", mock_registry):
+                with pytest.raises(ValidationError):
+                    _ = await redemption_service.redeem(
+                        "PARALLEL0001", username="parallel", password="password123"
+                    )
+
+        assert peak_creates == num_servers
+        assert peak_deletes == num_servers - 1
+        assert sorted(deleted) == sorted(str(s.id) for s in servers[:-1])
@@ -4,7 +4,9 @@ Feature: zondarr-foundation
 Properties: 5, 6, 7
 """
 
+import asyncio
 from unittest.mock import MagicMock
+from uuid import uuid4
 
 import pytest
 from hypothesis import given, settings
@@ -12,10 +14,11 @@ from hypothesis import strategies as st
 
 from tests.conftest import KNOWN_SERVER_TYPES
 from zondarr.config import Settings
+from zondarr.core.exceptions import ExternalServiceError
 from zondarr.media.exceptions import UnknownServerTypeError
 from zondarr.media.providers.jellyfin.client import JellyfinClient
 from zondarr.media.providers.plex.client import PlexClient
-from zondarr.media.registry import ClientRegistry, registry
+from zondarr.media.registry import ClientPool, ClientRegistry, registry
 
 
 def _make_descriptor(server_type: str, client_class: type) -> MagicMock:
@@ -370,3 +373,199 @@ class TestEffectiveCredentials:
         )
         assert url == "http://db.url"
         assert api_key == "db-key"
+
+
+class _FakeClient:
+    """Minimal media client that records its connection lifecycle."""
+
+    url: str
+    api_key: str
+    connects: int
+    disconnects: int
+    healthy: bool
+
+    def __init__(self, *, url: str = "http://fake", api_key: str = "key") -> None:
+        self.url = url
+        self.api_key = api_key
+        self.connects = 0
+        self.disconnects = 0
+        self.healthy = True
+
+    async def __aenter__(self) -> _FakeClient:
+        self.connects += 1
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        self.disconnects += 1
+
+    async def test_connection(self) -> bool:
+        return self.healthy
+
+
+class TestClientPool:
+    """Connected clients are reused, health-checked, retired and closed."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_connected_client_for_same_key(self) -> None:
+        """Sequential and concurrent sessions share one connection."""
+        pool = ClientPool()
+        created: list[_FakeClient] = []
+
+        def factory() -> _FakeClient:
+            created.append(_FakeClient())
+            return created[-1]
+
+        key = (uuid4(), "fake", "http://fake", "key")
+
+        async def use() -> None:
+            async with pool.session(
+                key, factory, idle_seconds=300, health_check_seconds=60
+            ) as client:
+                assert client is created[0]
+                await asyncio.sleep(0)
+
+        await asyncio.gather(*(use() for _ in range(5)))
+        await use()
+
+        assert len(created) == 1
+        assert created[0].connects == 1
+        assert created[0].disconnects == 0
+
+        await pool.close_all()
+        assert created[0].disconnects == 1
+        assert len(pool) == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_health_check_reconnects(self) -> None:
+        """An unhealthy pooled client is closed and replaced."""
+        pool = ClientPool()
+        created: list[_FakeClient] = []
+
+        def factory() -> _FakeClient:
+            created.append(_FakeClient())
+            return created[-1]
+
+        key = (uuid4(), "fake", "http://fake", "key")
+        async with pool.session(key, factory, idle_seconds=300, health_check_seconds=0):
+            pass
+        created[0].healthy = False
+        async with pool.session(
+            key, factory, idle_seconds=300, health_check_seconds=0
+        ) as client:
+            assert client is created[1]
+
+        assert created[0].disconnects == 1
+        assert created[1].disconnects == 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "error",
+        [
+            ExternalServiceError("Fake", "connection reset"),
+            TimeoutError("timed out"),
+            ConnectionError("refused"),
+        ],
+    )
+    async def test_server_down_error_retires_client(self, error: Exception) -> None:
+        """A client whose operation failed upstream or hung is not lent out again."""
+        pool = ClientPool()
+        created: list[_FakeClient] = []
+
+        def factory() -> _FakeClient:
+            created.append(_FakeClient())
+            return created[-1]
+
+        key = (uuid4(), "fake", "http://fake", "key")
+        with pytest.raises(type(error)):
+            async with pool.session(
+                key, factory, idle_seconds=300, health_check_seconds=60
+            ):
+                raise error
+
+        assert created[0].disconnects == 1
+        async with pool.session(
+            key, factory, idle_seconds=300, health_check_seconds=60
+        ) as client:
+            assert client is created[1]
+
+    @pytest.mark.asyncio
+    async def test_idle_eviction_and_zero_idle_disables_pooling(self) -> None:
+        """Idle clients are closed; idle_seconds=0 closes on release."""
+        pool = ClientPool()
+        created: list[_FakeClient] = []
+
+        def factory() -> _FakeClient:
+            created.append(_FakeClient())
+            return created[-1]
+
+        key = (uuid4(), "fake", "http://fake", "key")
+        async with pool.session(
+            key, factory, idle_seconds=300, health_check_seconds=60
+        ):
+            pass
+        assert await pool.evict_idle(300) == 0
+        assert await pool.evict_idle(0) == 1
+        assert created[0].disconnects == 1
+
+        async with pool.session(key, factory, idle_seconds=0, health_check_seconds=60):
+            pass
+        assert created[1].disconnects == 1
+        assert len(pool) == 0
+
+    @pytest.mark.asyncio
+    async def test_registry_sweep_evicts_without_new_sessions(self) -> None:
+        """The periodic sweep closes idle clients even if no session is opened."""
+        registry.register(_make_descriptor("fake", _FakeClient))
+        registry.set_settings(
+            Settings(secret_key="a" * 32, media_client_idle_seconds=1)
+        )
+        server = MagicMock()
+        server.id = uuid4()
+        server.server_type = "fake"
+        server.url = "http://fake:1"
+        server.api_key = "key"
+
+        async with registry.client_session(server) as client:
+            pass
+        assert isinstance(client, _FakeClient)
+
+        sweep = asyncio.create_task(registry.run_idle_eviction())
+        try:
+            async with asyncio.timeout(5):
+                while client.disconnects == 0:
+                    await asyncio.sleep(0.05)
+        finally:
+            _ = sweep.cancel()
+            _ = await asyncio.gather(sweep, return_exceptions=True)
+            await registry.close_clients()
+
+        assert client.disconnects == 1
+
+    @pytest.mark.asyncio
+    async def test_registry_session_keys_on_effective_credentials(self) -> None:
+        """Changing a server's credentials retires its pooled client."""
+        registry.register(_make_descriptor("fake", _FakeClient))
+        server = MagicMock()
+        server.id = uuid4()
+        server.server_type = "fake"
+        server.url = "http://fake:1"
+        server.api_key = "old-key"
+
+        try:
+            async with registry.client_session(server) as first:
+                pass
+            async with registry.client_session(server) as again:
+                assert again is first
+
+            server.api_key = "new-key"
+            async with registry.client_session(server) as second:
+                assert second is not first
+                assert second.api_key == "new-key"
+
+            assert isinstance(first, _FakeClient)
+            assert first.disconnects == 1
+        finally:
+            await registry.close_clients()
+
+        assert isinstance(second, _FakeClient)
+        assert second.disconnects == 1
@@ -12,9 +12,13 @@ from hypothesis import given
 from hypothesis import strategies as st
 from sqlalchemy.ext.asyncio import async_sessionmaker
 
-from tests.conftest import KNOWN_SERVER_TYPES, TestDB, create_test_engine
+from tests.conftest import (
+    KNOWN_SERVER_TYPES,
+    TestDB,
+    create_test_engine,
+    mock_client_registry,
+)
 from zondarr.core.exceptions import NotFoundError, ValidationError
-from zondarr.media.registry import ClientRegistry
 from zondarr.media.types import ServerInfo
 from zondarr.models import Invitation
 from zondarr.repositories.invitation import InvitationRepository
@@ -60,7 +64,7 @@ class TestServiceValidatesBeforePersisting:
         async with db.session_factory() as session:
             repo = MediaServerRepository(session)
 
-            mock_registry = MagicMock(spec=ClientRegistry)
+            mock_registry = mock_client_registry()
             mock_registry.registered_types = MagicMock(
                 return_value=frozenset({"plex", "jellyfin"})
             )
@@ -107,7 +111,7 @@ class TestServiceValidatesBeforePersisting:
         async with db.session_factory() as session:
             repo = MediaServerRepository(session)
 
-            mock_registry = MagicMock(spec=ClientRegistry)
+            mock_registry = mock_client_registry()
             mock_registry.registered_types = MagicMock(
                 return_value=frozenset({"plex", "jellyfin"})
             )
@@ -147,7 +151,7 @@ class TestDetectAndTestBehavior:
         info_raises: bool = False,
     ) -> tuple[MagicMock, AsyncMock]:
         """Build a mock registry + client with configurable behavior."""
-        mock_registry = MagicMock(spec=ClientRegistry)
+        mock_registry = mock_client_registry()
         mock_registry.registered_types = MagicMock(
             return_value=frozenset({"plex", "jellyfin"})
         )
@@ -4,17 +4,19 @@ Feature: jellyfin-integration
 Properties: 22, 23, 24
 """
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from hypothesis import given
 from hypothesis import strategies as st
+from sqlalchemy import select
 
-from tests.conftest import TestDB
-from zondarr.media.registry import ClientRegistry
+from tests.conftest import TestDB, mock_client_registry
 from zondarr.media.types import ExternalUser
 from zondarr.models import MediaServer
 from zondarr.models.identity import Identity, User
+from zondarr.models.sync_run import SyncRun
 from zondarr.repositories.identity import IdentityRepository
 from zondarr.repositories.media_server import MediaServerRepository
 from zondarr.repositories.user import UserRepository
@@ -164,7 +166,7 @@ class TestSyncIdentifiesDiscrepanciesCorrectly:
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
 
-            mock_registry = MagicMock(spec=ClientRegistry)
+            mock_registry = mock_client_registry()
             mock_registry.create_client_for_server = MagicMock(return_value=mock_client)
 
             user_repo = UserRepository(session)
@@ -229,7 +231,7 @@ class TestSyncIdentifiesDiscrepanciesCorrectly:
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
 
-            mock_registry = MagicMock(spec=ClientRegistry)
+            mock_registry = mock_client_registry()
             mock_registry.create_client_for_server = MagicMock(return_value=mock_client)
 
             user_repo = UserRepository(session)
@@ -294,7 +296,7 @@ class TestSyncIdentifiesDiscrepanciesCorrectly:
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
 
-            mock_registry = MagicMock(spec=ClientRegistry)
+            mock_registry = mock_client_registry()
             mock_registry.create_client_for_server = MagicMock(return_value=mock_client)
 
             user_repo = UserRepository(session)
@@ -374,7 +376,7 @@ class TestSyncIsIdempotent:
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
 
-            mock_registry = MagicMock(spec=ClientRegistry)
+            mock_registry = mock_client_registry()
             mock_registry.create_client_for_server = MagicMock(return_value=mock_client)
 
             user_repo = UserRepository(session)
@@ -475,7 +477,7 @@ class TestSyncDoesNotModifyUsers:
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
 
-            mock_registry = MagicMock(spec=ClientRegistry)
+            mock_registry = mock_client_registry()
             mock_registry.create_client_for_server = MagicMock(return_value=mock_client)
 
             identity_repo = IdentityRepository(session)
@@ -551,7 +553,7 @@ class TestSyncDoesNotModifyUsers:
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
 
-            mock_registry = MagicMock(spec=ClientRegistry)
+            mock_registry = mock_client_registry()
             mock_registry.create_client_for_server = MagicMock(return_value=mock_client)
 
             user_repo = UserRepository(session)
@@ -640,7 +642,7 @@ class TestSyncTaskErrorResilience:
             mock_client.__aexit__ = AsyncMock(return_value=None)
             return mock_client
 
-        mock_registry = MagicMock(spec=ClientRegistry)
+        mock_registry = mock_client_registry()
         mock_registry.create_client_for_server = MagicMock(
             side_effect=create_mock_client
         )
@@ -714,6 +716,161 @@ class TestSyncTaskErrorResilience:
         await manager.sync_all_servers(state)
 
 
+class TestSyncTaskConcurrency:
+    """Background sync fetches several servers at once within the configured limit."""
+
+    @given(
+        num_servers=st.integers(min_value=2, max_value=6),
+        max_concurrency=st.integers(min_value=1, max_value=3),
+    )
+    @pytest.mark.asyncio
+    async def test_sync_respects_concurrency_limit(
+        self,
+        db: TestDB,
+        num_servers: int,
+        max_concurrency: int,
+    ) -> None:
+        """Remote fetches overlap up to the limit and every server is recorded."""
+        await db.clean()
+
+        async with db.session_factory() as session:
+            server_repo = MediaServerRepository(session)
+            for i in range(num_servers):
+                server = MediaServer()
+                server.name = f"Concurrent Server {i}"
+                server.server_type = "jellyfin"
+                server.url = f"http://concurrent{i}:8096"
+                server.api_key = f"api-key-{i}"
+                server.enabled = True
+                _ = await server_repo.create(server)
+            await session.commit()
+
+        in_flight = 0
+        peak_in_flight = 0
+
+        async def slow_fetch() -> list[ExternalUser]:
+            nonlocal in_flight, peak_in_flight
+            in_flight += 1
+            peak_in_flight = max(peak_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return []
+
+        def create_mock_client(_server: MediaServer, /) -> AsyncMock:
+            mock_client = AsyncMock()
+            mock_client.get_libraries = AsyncMock(side_effect=slow_fetch)
+            mock_client.list_users = AsyncMock(side_effect=slow_fetch)
+            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+            mock_client.__aexit__ = AsyncMock(return_value=None)
+            return mock_client
+
+        mock_registry = mock_client_registry()
+        mock_registry.create_client_for_server = MagicMock(
+            side_effect=create_mock_client
+        )
+
+        from zondarr.config import Settings
+        from zondarr.core.tasks import BackgroundTaskManager
+
+        settings = Settings(
+            secret_key="test-secret-key-at-least-32-characters-long",
+            sync_max_concurrency=max_concurrency,
+        )
+        manager = BackgroundTaskManager(settings)
+
+        state = MagicMock()
+        state.session_factory = db.session_factory
+
+        with (
+            patch("zondarr.services.sync.registry", mock_registry),
+            patch("zondarr.media.registry.registry", mock_registry),
+        ):
+            await manager.sync_all_servers(state)
+
+        assert peak_in_flight <= max_concurrency
+        assert peak_in_flight == min(max_concurrency, num_servers)
+
+        async with db.session_factory() as session:
+            runs = (await session.scalars(select(SyncRun))).all()
+        assert len(runs) == num_servers * 2
+        assert all(run.status == "success" for run in runs)
+
+    @pytest.mark.asyncio
+    async def test_slow_server_times_out_without_stalling_others(
+        self,
+        db: TestDB,
+    ) -> None:
+        """A server exceeding the per-server timeout fails alone."""
+        await db.clean()
+
+        async with db.session_factory() as session:
+            server_repo = MediaServerRepository(session)
+            for name in ("slow", "fast"):
+                server = MediaServer()
+                server.name = name
+                server.server_type = "jellyfin"
+                server.url = f"http://{name}:8096"
+                server.api_key = "api-key"
+                server.enabled = True
+                _ = await server_repo.create(server)
+            await session.commit()
+
+        async def hang() -> list[ExternalUser]:
+            await asyncio.sleep(60)
+            return []
+
+        def create_mock_client(server: MediaServer, /) -> AsyncMock:
+            mock_client = AsyncMock()
+            if server.name == "slow":
+                mock_client.get_libraries = AsyncMock(side_effect=hang)
+                mock_client.list_users = AsyncMock(side_effect=hang)
+            else:
+                mock_client.get_libraries = AsyncMock(return_value=[])
+                mock_client.list_users = AsyncMock(return_value=[])
+            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+            mock_client.__aexit__ = AsyncMock(return_value=None)
+            return mock_client
+
+        mock_registry = mock_client_registry()
+        mock_registry.create_client_for_server = MagicMock(
+            side_effect=create_mock_client
+        )
+
+        from zondarr.config import Settings
+        from zondarr.core.tasks import BackgroundTaskManager
+
+        # Struct construction skips Meta constraints, allowing a sub-minimum timeout
+        settings = Settings(
+            secret_key="test-secret-key-at-least-32-characters-long",
+            sync_server_timeout_seconds=0.05,  # pyright: ignore[reportArgumentType]
+        )
+        manager = BackgroundTaskManager(settings)
+
+        state = MagicMock()
+        state.session_factory = db.session_factory
+
+        with (
+            patch("zondarr.services.sync.registry", mock_registry),
+            patch("zondarr.media.registry.registry", mock_registry),
+        ):
+            await asyncio.wait_for(manager.sync_all_servers(state), timeout=10)
+
+        async with db.session_factory() as session:
+            runs = (await session.scalars(select(SyncRun))).all()
+            servers = {
+                s.id: s.name for s in await MediaServerRepository(session).get_all()
+            }
+
+        by_server = {(servers[r.media_server_id], r.sync_type): r for r in runs}
+        assert by_server["slow", "libraries"].status == "failed"
+        assert by_server["slow", "users"].status == "failed"
+        assert "Timed out" in (by_server["slow", "users"].error_message or "")
+        assert by_server["fast", "libraries"].status == "success"
+        assert by_server["fast", "users"].status == "success"
+        assert not manager.is_libraries_sync_in_progress(runs[0].media_server_id)
+        assert not manager.is_users_sync_in_progress(runs[0].media_server_id)
+
+
 # =============================================================================
 # Tests for Import Behavior (dry_run=False)
 # =============================================================================
@@ -777,7 +934,7 @@ class TestSyncImportsOrphanedUsers:
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
 
-            mock_registry = MagicMock(spec=ClientRegistry)
+            mock_registry = mock_client_registry()
             mock_registry.create_client_for_server = MagicMock(return_value=mock_client)
 
             user_repo = UserRepository(session)
@@ -807,6 +964,86 @@ class TestSyncImportsOrphanedUsers:
                     f"{imported_user.external_user_type!r}, expected {orphaned.user_type!r}"
                 )
 
+    @pytest.mark.asyncio
+    async def test_bulk_import_spans_chunks_and_updates_types(
+        self,
+        db: TestDB,
+    ) -> None:
+        """Large imports span several INSERT chunks and matched types persist."""
+        await db.clean()
+        async with db.session_factory() as session:
+            server_repo = MediaServerRepository(session)
+            server = MediaServer()
+            server.name = "Big Server"
+            server.server_type = "plex"
+            server.url = "http://localhost:32400"
+            server.api_key = "test-api-key"
+            server.enabled = True
+            server = await server_repo.create(server)
+
+            identity = Identity()
+            identity.display_name = "Existing"
+            identity.enabled = True
+            session.add(identity)
+            await session.flush()
+
+            existing = User()
+            existing.identity_id = identity.id
+            existing.media_server_id = server.id
+            existing.external_user_id = "existing"
+            existing.username = "existing"
+            existing.external_user_type = "friend"
+            existing.enabled = True
+            session.add(existing)
+            await session.commit()
+            server_id = server.id
+
+        orphan_count = 1234
+        server_users = [
+            ExternalUser(
+                external_user_id=f"ext-{i}",
+                username=f"user{i}",
+                email=f"user{i}@example.com",
+                user_type="friend",
+            )
+            for i in range(orphan_count)
+        ]
+        server_users.append(
+            ExternalUser(
+                external_user_id="existing", username="existing", user_type="home"
+            )
+        )
+        mock_client = AsyncMock()
+        mock_client.list_users = AsyncMock(return_value=server_users)
+        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+        mock_client.__aexit__ = AsyncMock(return_value=None)
+        mock_registry = mock_client_registry()
+        mock_registry.create_client_for_server = MagicMock(return_value=mock_client)
+
+        async with db.session_factory() as session:
+            sync_service = SyncService(
+                MediaServerRepository(session),
+                UserRepository(session),
+                IdentityRepository(session),
+            )
+            with patch("zondarr.services.sync.registry", mock_registry):
+                result = await sync_service.sync_server(server_id, dry_run=False)
+            await session.commit()
+
+        assert result.imported_users == orphan_count
+        assert result.matched_users == 1
+
+        async with db.session_factory() as session:
+            users = await UserRepository(session).get_by_server(server_id)
+            by_ext_id = {u.external_user_id: u for u in users}
+            assert len(users) == orphan_count + 1
+            assert by_ext_id["existing"].external_user_type == "home"
+            imported = by_ext_id["ext-1000"]
+            assert imported.identity.display_name == "user1000"
+            assert imported.identity.email == "user1000@example.com"
+            assert imported.external_user_type == "friend"
+            assert len({u.identity_id for u in users}) == orphan_count + 1
+
     @given(user_sets=user_sets_strategy())
     @pytest.mark.asyncio
     async def test_sync_import_idempotent(
@@ -859,7 +1096,7 @@ class TestSyncImportsOrphanedUsers:
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
 
-            mock_registry = MagicMock(spec=ClientRegistry)
+            mock_registry = mock_client_registry()
             mock_registry.create_client_for_server = MagicMock(return_value=mock_client)
 
             user_repo = UserRepository(session)
@@ -939,7 +1176,7 @@ class TestSyncImportsOrphanedUsers:
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
 
-            mock_registry = MagicMock(spec=ClientRegistry)
+            mock_registry = mock_client_registry()
             mock_registry.create_client_for_server = MagicMock(return_value=mock_client)
 
             identity_repo = IdentityRepository(session)
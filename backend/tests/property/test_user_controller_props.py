@@ -15,6 +15,7 @@ from uuid import uuid4
 import pytest
 from hypothesis import given, settings
 from hypothesis import strategies as st
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from tests.conftest import TestDB
@@ -380,3 +381,52 @@ class TestPageSizeIsCapped:
             assert len(items) == MAX_PAGE_SIZE, (
                 f"Expected {MAX_PAGE_SIZE} items (capped from 101), got {len(items)}"
             )
+
+
+# =============================================================================
+# Identity Loading Is Batched
+# =============================================================================
+
+
+class TestIdentityLoadingIsBatched:
+    """list_users issues a constant number of statements per page.
+
+    Identities and their linked users are loaded in batches keyed by the
+    distinct identity ids on the page rather than once per row.
+    """
+
+    async def _count_list_statements(self, db: TestDB, *, page_size: int) -> int:
+        statements: list[str] = []
+
+        def _record(*args: object) -> None:
+            statements.append(str(args[2]))
+
+        async with db.session_factory() as session:
+            user_service = UserService(
+                UserRepository(session), IdentityRepository(session)
+            )
+            event.listen(db.engine.sync_engine, "before_cursor_execute", _record)
+            try:
+                items, _ = await user_service.list_users(page=1, page_size=page_size)
+            finally:
+                event.remove(db.engine.sync_engine, "before_cursor_execute", _record)
+
+            assert len(items) == page_size
+            for user in items:
+                assert [u.id for u in user.identity.users] == [user.id]
+
+        return len(statements)
+
+    @pytest.mark.asyncio
+    async def test_statement_count_independent_of_page_size(
+        self,
+        db: TestDB,
+    ) -> None:
+        """A page of 5 and a page of 60 cost the same number of queries."""
+        await db.clean()
+        await create_test_users(db.session_factory, count=60)
+
+        small = await self._count_list_statements(db, page_size=5)
+        large = await self._count_list_statements(db, page_size=60)
+
+        assert small == large
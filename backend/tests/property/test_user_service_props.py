@@ -22,10 +22,9 @@ from hypothesis import given, settings
 from hypothesis import strategies as st
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from tests.conftest import TestDB
+from tests.conftest import TestDB, mock_client_registry
 from zondarr.core.exceptions import ValidationError
 from zondarr.media.exceptions import MediaClientError
-from zondarr.media.registry import ClientRegistry
 from zondarr.models.identity import Identity, User
 from zondarr.models.media_server import MediaServer
 from zondarr.repositories.identity import IdentityRepository
@@ -268,7 +267,7 @@ class TestEnableDisableAtomicity:
         user_id = user.id
 
         # Create mock registry that returns successful client
-        mock_registry = MagicMock(spec=ClientRegistry)
+        mock_registry = mock_client_registry()
         mock_registry.create_client_for_server = MagicMock(
             return_value=create_mock_client_success(enabled=target_enabled)
         )
@@ -334,7 +333,7 @@ class TestEnableDisableAtomicity:
         user_id = user.id
 
         # Create mock registry that returns failing client
-        mock_registry = MagicMock(spec=ClientRegistry)
+        mock_registry = mock_client_registry()
         mock_registry.create_client_for_server = MagicMock(
             return_value=create_mock_client_failure(
                 error_message="Jellyfin server unavailable"
@@ -400,7 +399,7 @@ class TestEnableDisableAtomicity:
         user_id = user.id
 
         # Create mock registry that returns "user not found" response
-        mock_registry = MagicMock(spec=ClientRegistry)
+        mock_registry = mock_client_registry()
         mock_registry.create_client_for_server = MagicMock(
             return_value=create_mock_client_user_not_found()
         )
@@ -462,7 +461,7 @@ class TestEnableDisableAtomicity:
         user_id = user.id
 
         # Create mock registry that returns successful client
-        mock_registry = MagicMock(spec=ClientRegistry)
+        mock_registry = mock_client_registry()
         mock_registry.create_client_for_server = MagicMock(
             return_value=create_mock_client_success(enabled=initial_enabled)
         )
@@ -518,7 +517,7 @@ class TestEnableDisableAtomicity:
         target_enabled = not initial_enabled
 
         # Create mock registry that returns successful client
-        mock_registry = MagicMock(spec=ClientRegistry)
+        mock_registry = mock_client_registry()
         mock_registry.create_client_for_server = MagicMock(
             return_value=create_mock_client_success(enabled=target_enabled)
         )
@@ -590,7 +589,7 @@ class TestUserDeletionAtomicity:
         user_id = user.id
 
         # Create mock registry that returns successful delete client
-        mock_registry = MagicMock(spec=ClientRegistry)
+        mock_registry = mock_client_registry()
         mock_registry.create_client_for_server = MagicMock(
             return_value=create_mock_client_delete_success()
         )
@@ -645,7 +644,7 @@ class TestUserDeletionAtomicity:
         user_id = user.id
 
         # Create mock registry that returns failing delete client
-        mock_registry = MagicMock(spec=ClientRegistry)
+        mock_registry = mock_client_registry()
         mock_registry.create_client_for_server = MagicMock(
             return_value=create_mock_client_delete_failure(
                 error_message="Jellyfin server unavailable"
@@ -711,7 +710,7 @@ class TestUserDeletionAtomicity:
         user_id = user.id
 
         # Create mock registry that returns "user not found" response
-        mock_registry = MagicMock(spec=ClientRegistry)
+        mock_registry = mock_client_registry()
         mock_registry.create_client_for_server = MagicMock(
             return_value=create_mock_client_delete_user_not_found()
         )
@@ -781,7 +780,7 @@ class TestUserDeletionAtomicity:
         mock_client.__aenter__ = AsyncMock(return_value=mock_client)
         mock_client.__aexit__ = AsyncMock(return_value=None)
 
-        mock_registry = MagicMock(spec=ClientRegistry)
+        mock_registry = mock_client_registry()
         mock_registry.create_client_for_server = MagicMock(return_value=mock_client)
 
         # Execute delete operation - should fail
@@ -848,7 +847,7 @@ class TestUserDeletionAtomicity:
         mock_client.__aenter__ = AsyncMock(return_value=mock_client)
         mock_client.__aexit__ = AsyncMock(return_value=None)
 
-        mock_registry = MagicMock(spec=ClientRegistry)
+        mock_registry = mock_client_registry()
         mock_registry.create_client_for_server = MagicMock(return_value=mock_client)
 
         # Execute delete operation
@@ -978,7 +977,7 @@ class TestIdentityCascade:
         identity_id = identity.id
 
         # Create mock registry that returns successful delete client
-        mock_registry = MagicMock(spec=ClientRegistry)
+        mock_registry = mock_client_registry()
         mock_registry.create_client_for_server = MagicMock(
             return_value=create_mock_client_delete_success()
         )
@@ -1051,7 +1050,7 @@ class TestIdentityCascade:
         identity_id = identity.id
 
         # Create mock registry that returns successful delete client
-        mock_registry = MagicMock(spec=ClientRegistry)
+        mock_registry = mock_client_registry()
         mock_registry.create_client_for_server = MagicMock(
             return_value=create_mock_client_delete_success()
         )
@@ -1122,7 +1121,7 @@ class TestIdentityCascade:
         identity_id = identity.id
 
         # Create mock registry that returns failing delete client
-        mock_registry = MagicMock(spec=ClientRegistry)
+        mock_registry = mock_client_registry()
         mock_registry.create_client_for_server = MagicMock(
             return_value=create_mock_client_delete_failure(
                 error_message="Jellyfin server unavailable"
@@ -1202,7 +1201,7 @@ class TestIdentityCascade:
         identity_id = identity.id
 
         # Create mock registry that returns successful delete client
-        mock_registry = MagicMock(spec=ClientRegistry)
+        mock_registry = mock_client_registry()
         mock_registry.create_client_for_server = MagicMock(
             return_value=create_mock_client_delete_success()
         )
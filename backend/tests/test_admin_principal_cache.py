@@ -0,0 +1,194 @@
+"""Tests for the admin principal cache behind retrieve_user_handler.
+
+Tests cover:
+- Repeated authentication served from the cache without a DB session
+- Invalidation deferred until the session holding the change commits
+- Account changes in AuthService and TOTPService dropping the principal
+"""
+
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from uuid import UUID
+
+import pytest
+from litestar.security.jwt import Token
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from tests.conftest import create_test_engine
+from zondarr.core.auth import (
+    AdminUser,
+    _principal_cache,  # pyright: ignore[reportPrivateUsage]
+    invalidate_admin_principal,
+    retrieve_user_handler,
+)
+from zondarr.models.admin import AdminAccount
+from zondarr.repositories.admin import AdminAccountRepository, RefreshTokenRepository
+from zondarr.repositories.app_setting import AppSettingRepository
+from zondarr.services.auth import AuthService
+from zondarr.services.password import hash_password
+from zondarr.services.totp import TOTPService
+
+TEST_SECRET_KEY = "test-secret-key-for-totp-at-least-32-chars-long!"  # noqa: S105
+
+
+class _CountingSessionFactory:
+    """Session factory wrapper that counts opened sessions."""
+
+    def __init__(self, factory: async_sessionmaker[AsyncSession]) -> None:
+        self.factory = factory
+        self.opened = 0
+
+    def __call__(self) -> AsyncSession:
+        self.opened += 1
+        return self.factory()
+
+
+async def _authenticate(
+    session_factory: _CountingSessionFactory, admin_id: UUID
+) -> AdminUser | None:
+    """Run retrieve_user_handler for an access token of `admin_id`."""
+    token = Token(sub=str(admin_id), exp=datetime.now(UTC) + timedelta(minutes=5))
+    connection = SimpleNamespace(
+        app=SimpleNamespace(state=SimpleNamespace(session_factory=session_factory))
+    )
+    return await retrieve_user_handler(token, connection)  # pyright: ignore[reportArgumentType]
+
+
+async def _create_admin(session: AsyncSession) -> AdminAccount:
+    """Create and persist an enabled local AdminAccount."""
+    admin = AdminAccount(
+        username="admin",
+        password_hash=hash_password("testpassword123"),
+        auth_method="local",
+        enabled=True,
+    )
+    session.add(admin)
+    await session.commit()
+    return admin
+
+
+def _make_auth_service(session: AsyncSession) -> AuthService:
+    """Create an AuthService bound to `session`."""
+    return AuthService(
+        admin_repo=AdminAccountRepository(session),
+        token_repo=RefreshTokenRepository(session),
+        app_setting_repo=AppSettingRepository(session),
+    )
+
+
+class TestPrincipalCache:
+    """Tests for retrieve_user_handler caching."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_requests_skip_the_database(self) -> None:
+        engine = await create_test_engine()
+        try:
+            factory = async_sessionmaker(engine, expire_on_commit=False)
+            async with factory() as session:
+                admin = await _create_admin(session)
+
+            counting = _CountingSessionFactory(factory)
+            first = await _authenticate(counting, admin.id)
+            second = await _authenticate(counting, admin.id)
+
+            assert first is not None
+            assert second == first
+            assert counting.opened == 1
+        finally:
+            _principal_cache.invalidate()
+            await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_invalidation_repeats_after_commit(self) -> None:
+        """A reload between the change and its commit is not kept."""
+        engine = await create_test_engine()
+        try:
+            factory = async_sessionmaker(engine, expire_on_commit=False)
+            async with factory() as session:
+                admin = await _create_admin(session)
+
+            counting = _CountingSessionFactory(factory)
+            assert await _authenticate(counting, admin.id) is not None
+
+            async with factory() as session:
+                stored = await session.get(AdminAccount, admin.id)
+                assert stored is not None
+                stored.enabled = False
+                invalidate_admin_principal(admin.id, session=session)
+
+                # Another request re-reads the still-enabled committed row
+                assert await _authenticate(counting, admin.id) is not None
+
+                await session.commit()
+
+            assert await _authenticate(counting, admin.id) is None
+        finally:
+            _principal_cache.invalidate()
+            await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_password_change_invalidates(self) -> None:
+        engine = await create_test_engine()
+        try:
+            factory = async_sessionmaker(engine, expire_on_commit=False)
+            async with factory() as session:
+                admin = await _create_admin(session)
+
+            counting = _CountingSessionFactory(factory)
+            _ = await _authenticate(counting, admin.id)
+
+            async with factory() as session:
+                _ = await _make_auth_service(session).change_password(
+                    admin.id, "testpassword123", "newpassword456"
+                )
+                await session.commit()
+
+            assert _principal_cache.get(admin.id) is None
+            _ = await _authenticate(counting, admin.id)
+            assert counting.opened == 2
+        finally:
+            _principal_cache.invalidate()
+            await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_revoking_tokens_invalidates(self) -> None:
+        engine = await create_test_engine()
+        try:
+            factory = async_sessionmaker(engine, expire_on_commit=False)
+            async with factory() as session:
+                admin = await _create_admin(session)
+
+            _ = await _authenticate(_CountingSessionFactory(factory), admin.id)
+            assert _principal_cache.get(admin.id) is not None
+
+            async with factory() as session:
+                await _make_auth_service(session).revoke_all_tokens(admin)
+                await session.commit()
+
+            assert _principal_cache.get(admin.id) is None
+        finally:
+            _principal_cache.invalidate()
+            await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_totp_disable_invalidates(self) -> None:
+        engine = await create_test_engine()
+        try:
+            factory = async_sessionmaker(engine, expire_on_commit=False)
+            async with factory() as session:
+                admin = await _create_admin(session)
+
+            _ = await _authenticate(_CountingSessionFactory(factory), admin.id)
+            assert _principal_cache.get(admin.id) is not None
+
+            async with factory() as session:
+                stored = await session.get(AdminAccount, admin.id)
+                assert stored is not None
+                stored.totp_enabled = True
+                TOTPService(secret_key=TEST_SECRET_KEY).disable(stored)
+                await session.commit()
+
+            assert _principal_cache.get(admin.id) is None
+        finally:
+            _principal_cache.invalidate()
+            await engine.dispose()
@@ -0,0 +1,290 @@
+"""Tests for per-server media circuit breakers.
+
+Tests cover:
+- Opening after consecutive failures and failing fast while open
+- A single half-open trial; reopening with a doubled period on failure
+- Operations admitted before the circuit opened not reopening or closing it
+- Client sessions counting connection failures, not other errors
+- Circuit state reported by the servers API
+"""
+
+import asyncio
+from collections.abc import AsyncGenerator
+from datetime import UTC, datetime, timedelta
+from types import TracebackType
+from typing import Self
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from litestar import Litestar
+from litestar.datastructures import State
+from litestar.di import Provide
+from litestar.testing import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from tests.conftest import create_test_engine
+from zondarr.api.servers import ServerController
+from zondarr.config import Settings
+from zondarr.core.exceptions import ExternalServiceError
+from zondarr.media.circuit import CircuitBreaker, CircuitState
+from zondarr.media.exceptions import CircuitOpenError, MediaClientError
+from zondarr.media.providers.jellyfin import JellyfinProvider
+from zondarr.media.registry import ClientRegistry, registry
+from zondarr.models.media_server import MediaServer
+
+
+def _make_breaker(*, open_seconds: float = 60.0) -> CircuitBreaker:
+    return CircuitBreaker(
+        "jellyfin server 'Test'",
+        failure_threshold=2,
+        open_seconds=open_seconds,
+        max_open_seconds=open_seconds * 3,
+    )
+
+
+class _UnreachableClient:
+    """Client whose connect step always fails like a down server."""
+
+    connects: int = 0
+
+    async def __aenter__(self) -> Self:
+        type(self).connects += 1
+        # Yield like a real connect attempt so concurrent callers interleave
+        await asyncio.sleep(0)
+        raise ExternalServiceError("Jellyfin (http://down)", "Connection refused")
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        return None
+
+
+def _make_server() -> MediaServer:
+    return MediaServer(
+        id=uuid4(),
+        name="Down",
+        server_type="jellyfin",
+        url="http://down:8096",
+        api_key="token",
+        enabled=True,
+    )
+
+
+@pytest.fixture
+def client_registry() -> ClientRegistry:
+    registry.register(JellyfinProvider())
+    registry.set_settings(
+        Settings(
+            secret_key="a" * 32,
+            media_circuit_failure_threshold=2,
+            media_circuit_open_seconds=60,
+        )
+    )
+    return registry
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker state transitions."""
+
+    def test_opens_after_threshold_and_fails_fast(self) -> None:
+        breaker = _make_breaker()
+
+        breaker.record_failure("refused")
+        assert breaker.state is CircuitState.CLOSED
+        assert not breaker.acquire()
+        breaker.record_failure("refused")
+
+        assert breaker.state is CircuitState.OPEN
+        with pytest.raises(CircuitOpenError) as exc_info:
+            _ = breaker.acquire()
+        assert 0 < exc_info.value.retry_after <= 60
+        snapshot = breaker.snapshot()
+        assert snapshot.consecutive_failures == 2
+        assert snapshot.retry_at is not None
+        assert snapshot.last_error == "refused"
+
+    @pytest.mark.asyncio
+    async def test_half_open_admits_one_trial(self) -> None:
+        breaker = _make_breaker(open_seconds=0.05)
+        breaker.record_failure("refused")
+        breaker.record_failure("refused")
+        await asyncio.sleep(0.06)
+
+        assert breaker.state is CircuitState.HALF_OPEN
+        trial = breaker.acquire()
+        with pytest.raises(CircuitOpenError):
+            _ = breaker.acquire()
+
+        assert trial
+        breaker.record_success(trial=trial)
+        assert breaker.snapshot().state is CircuitState.CLOSED
+        assert breaker.snapshot().consecutive_failures == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_trial_doubles_open_period(self) -> None:
+        breaker = _make_breaker(open_seconds=0.05)
+        breaker.record_failure("refused")
+        breaker.record_failure("refused")
+        await asyncio.sleep(0.06)
+
+        trial = breaker.acquire()
+        breaker.record_failure("still refused", trial=trial)
+        await asyncio.sleep(0.06)
+
+        # The second open period is 0.1 s
+        assert breaker.state is CircuitState.OPEN
+        await asyncio.sleep(0.05)
+        assert breaker.state is CircuitState.HALF_OPEN
+
+    @pytest.mark.asyncio
+    async def test_operations_admitted_before_opening_do_not_trip_again(
+        self,
+    ) -> None:
+        breaker = _make_breaker(open_seconds=0.05)
+        admitted = [breaker.acquire() for _ in range(4)]
+
+        for trial in admitted[:3]:
+            breaker.record_failure("refused", trial=trial)
+        # A late answer from before the outage does not close the circuit
+        breaker.record_success(trial=admitted[3])
+
+        assert breaker.state is CircuitState.OPEN
+        assert breaker.snapshot().consecutive_failures == 3
+        # Opened once, so the first 0.05 s period applies
+        await asyncio.sleep(0.06)
+        assert breaker.state is CircuitState.HALF_OPEN
+
+
+class TestGuardedClientSession:
+    """Tests for circuit breaking in ClientRegistry.client_session."""
+
+    @pytest.mark.asyncio
+    async def test_down_server_stops_being_contacted(
+        self, client_registry: ClientRegistry
+    ) -> None:
+        server = _make_server()
+        _UnreachableClient.connects = 0
+
+        with patch.object(
+            client_registry, "create_client", return_value=_UnreachableClient()
+        ):
+            for _ in range(2):
+                with pytest.raises(ExternalServiceError):
+                    async with client_registry.client_session(server):
+                        pass
+            for _ in range(3):
+                with pytest.raises(CircuitOpenError):
+                    async with client_registry.client_session(server):
+                        pass
+
+        assert _UnreachableClient.connects == 2
+        assert client_registry.is_circuit_open(server)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_failures_open_the_circuit_once(
+        self, client_registry: ClientRegistry
+    ) -> None:
+        server = _make_server()
+        _UnreachableClient.connects = 0
+
+        async def attempt() -> None:
+            with pytest.raises(ExternalServiceError):
+                async with client_registry.client_session(server):
+                    pass
+
+        with patch.object(
+            client_registry, "create_client", return_value=_UnreachableClient()
+        ):
+            # All five are admitted before the first failure is recorded
+            _ = await asyncio.gather(*(attempt() for _ in range(5)))
+
+        snapshot = client_registry.circuit_snapshot(server)
+        assert _UnreachableClient.connects == 5
+        assert snapshot.state is CircuitState.OPEN
+        assert snapshot.consecutive_failures == 5
+        # One trip: the first 60 s period, not doubled toward the maximum
+        assert snapshot.retry_at is not None
+        assert snapshot.retry_at - datetime.now(UTC) <= timedelta(seconds=60)
+
+    @pytest.mark.asyncio
+    async def test_client_errors_do_not_trip(
+        self, client_registry: ClientRegistry
+    ) -> None:
+        server = _make_server()
+        client = MagicMock()
+        client.__aenter__ = MagicMock(side_effect=lambda: _ready(client))
+        client.__aexit__ = MagicMock(side_effect=lambda *_: _ready(None))
+
+        with patch.object(client_registry, "create_client", return_value=client):
+            for _ in range(3):
+                with pytest.raises(MediaClientError):
+                    async with client_registry.client_session(server):
+                        raise MediaClientError("Username taken", operation="x")
+
+        assert client_registry.circuit_snapshot(server).state is CircuitState.CLOSED
+        await client_registry.close_clients()
+
+
+async def _ready[T](value: T) -> T:
+    return value
+
+
+class TestCircuitInServersApi:
+    """Tests for the circuit field of server responses."""
+
+    @pytest.fixture
+    async def session_factory(self) -> AsyncGenerator[async_sessionmaker[AsyncSession]]:
+        engine = await create_test_engine()
+        yield async_sessionmaker(engine, expire_on_commit=False)
+        await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_is_listed(
+        self,
+        client_registry: ClientRegistry,
+        session_factory: async_sessionmaker[AsyncSession],
+    ) -> None:
+        async with session_factory() as session:
+            server = _make_server()
+            session.add(server)
+            await session.commit()
+
+        with patch.object(
+            client_registry, "create_client", return_value=_UnreachableClient()
+        ):
+            for _ in range(2):
+                with pytest.raises(ExternalServiceError):
+                    async with client_registry.client_session(server):
+                        pass
+
+        async def provide_session() -> AsyncGenerator[AsyncSession]:
+            async with session_factory() as session:
+                yield session
+
+        def provide_settings(state: State) -> Settings:
+            return state.settings  # pyright: ignore[reportAny]
+
+        app = Litestar(
+            route_handlers=[ServerController],
+            state=State({"settings": Settings(secret_key="a" * 32)}),
+            dependencies={
+                "session": Provide(provide_session),
+                "settings": Provide(provide_settings, sync_to_thread=False),
+            },
+        )
+        with TestClient(app) as client:
+            payload: list[dict[str, object]] = client.get("/api/v1/servers").json()  # pyright: ignore[reportAny]
+            detail: dict[str, object] = client.get(  # pyright: ignore[reportAny]
+                f"/api/v1/servers/{server.id}"
+            ).json()
+
+        for circuit in (payload[0]["circuit"], detail["circuit"]):
+            assert isinstance(circuit, dict)
+            assert circuit["state"] == "open"
+            assert circuit["consecutive_failures"] == 2
+            assert circuit["retry_at"] is not None
+            assert "Connection refused" in str(circuit["last_error"])
@@ -4,12 +4,13 @@ Integration tests via TestClient following test_settings_controller.py pattern.
 """
 
 from collections.abc import AsyncGenerator
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 
 import pytest
 from litestar import Litestar
 from litestar.di import Provide
 from litestar.testing import TestClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from tests.conftest import create_test_engine
@@ -184,3 +185,89 @@ class TestGetDashboardStats:
                 assert "libraries" in str(sync_activities[0]["description"])
         finally:
             await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_recent_activity_merges_and_limits_feed(self) -> None:
+        engine = await create_test_engine()
+        try:
+            session_factory = async_sessionmaker(engine, expire_on_commit=False)
+            base = datetime(2025, 1, 1, tzinfo=UTC)
+
+            async with session_factory() as session:
+                server = MediaServer(
+                    name="Newest",
+                    server_type="jellyfin",
+                    url="http://jf:8096",
+                    api_key="key1",
+                    enabled=True,
+                    created_at=base + timedelta(days=30),
+                )
+                session.add(server)
+                await session.flush()
+                identity = Identity(display_name="Feed")
+                session.add(identity)
+                await session.flush()
+                session.add_all(
+                    User(
+                        identity_id=identity.id,
+                        media_server_id=server.id,
+                        external_user_id=f"ext{i}",
+                        username=f"user{i:02d}",
+                        created_at=base + timedelta(days=i),
+                    )
+                    for i in range(12)
+                )
+                session.add(
+                    Invitation(code="FEEDCODE", created_at=base + timedelta(days=20))
+                )
+                await session.commit()
+
+            app = _make_test_app(session_factory)
+
+            with TestClient(app) as client:
+                data: dict[str, object] = client.get("/api/v1/dashboard/stats").json()  # pyright: ignore[reportAny]
+
+            activities: list[dict[str, object]] = data["recent_activity"]  # pyright: ignore[reportAssignmentType]
+            assert len(activities) == 10
+            assert [a["type"] for a in activities[:2]] == [
+                "server_added",
+                "invitation_created",
+            ]
+            assert activities[0]["description"] == "Server 'Newest' was added"
+            assert activities[2]["description"] == "User 'user11' was created"
+            timestamps = [str(a["timestamp"]) for a in activities]
+            assert timestamps == sorted(timestamps, reverse=True)
+        finally:
+            await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_stats_cached_until_write_commits(self) -> None:
+        engine = await create_test_engine()
+        try:
+            session_factory = async_sessionmaker(engine, expire_on_commit=False)
+            app = _make_test_app(session_factory)
+
+            statements: list[str] = []
+
+            def _record(*args: object) -> None:
+                statements.append(str(args[2]))
+
+            event.listen(engine.sync_engine, "before_cursor_execute", _record)
+
+            with TestClient(app) as client:
+                first = client.get("/api/v1/dashboard/stats").json()  # pyright: ignore[reportAny]
+                # One aggregate statement plus one activity UNION
+                assert len(statements) == 2
+
+                second = client.get("/api/v1/dashboard/stats").json()  # pyright: ignore[reportAny]
+                assert second == first
+                assert len(statements) == 2
+
+                async with session_factory() as session:
+                    session.add(Invitation(code="NEWCODE1", enabled=True))
+                    await session.commit()
+
+                third: dict[str, object] = client.get("/api/v1/dashboard/stats").json()  # pyright: ignore[reportAny]
+                assert third["total_invitations"] == 1
+        finally:
+            await engine.dispose()
@@ -0,0 +1,190 @@
+"""Tests for the set-based invitation expiration sweep and its scheduler.
+
+Tests cover:
+- Expired invitations disabled with a single UPDATE, without loading rows
+- Next-expiry lookup ignoring disabled and already-expired invitations
+- The scheduler disabling an invitation at its deadline, well before the
+  fallback interval
+- Committed invitation edits waking the scheduler to reschedule
+"""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.engine import Connection, ExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from tests.conftest import make_task_manager, make_task_state
+from zondarr.models.invitation import Invitation
+from zondarr.repositories.invitation import InvitationRepository
+
+
+async def _add_invitation(
+    session_factory: async_sessionmaker[AsyncSession],
+    code: str,
+    /,
+    *,
+    expires_at: datetime | None,
+    enabled: bool = True,
+) -> None:
+    async with session_factory() as session:
+        invitation = Invitation()
+        invitation.code = code
+        invitation.enabled = enabled
+        invitation.expires_at = expires_at
+        invitation.use_count = 0
+        session.add(invitation)
+        await session.commit()
+
+
+async def _enabled(
+    session_factory: async_sessionmaker[AsyncSession], code: str, /
+) -> bool:
+    async with session_factory() as session:
+        enabled = await session.scalar(
+            select(Invitation.enabled).where(Invitation.code == code)
+        )
+        return bool(enabled)
+
+
+class TestExpirationSweep:
+    """Tests for the repository-level sweep."""
+
+    @pytest.mark.asyncio
+    async def test_sweep_is_one_update(
+        self,
+        test_engine: AsyncEngine,
+        session_factory: async_sessionmaker[AsyncSession],
+    ) -> None:
+        now = datetime.now(UTC)
+        for i in range(5):
+            await _add_invitation(
+                session_factory, f"OLD{i}", expires_at=now - timedelta(days=1)
+            )
+        await _add_invitation(
+            session_factory, "FUTURE", expires_at=now + timedelta(days=1)
+        )
+        await _add_invitation(session_factory, "FOREVER", expires_at=None)
+
+        statements: list[str] = []
+
+        def _record(
+            _conn: Connection,
+            _cursor: object,
+            statement: str,
+            _parameters: object,
+            _context: ExecutionContext | None,
+            _executemany: bool,
+        ) -> None:
+            statements.append(statement.split(None, 1)[0].upper())
+
+        event.listen(test_engine.sync_engine, "before_cursor_execute", _record)
+        try:
+            async with session_factory() as session:
+                disabled = await InvitationRepository(session).disable_expired(now)
+                await session.commit()
+        finally:
+            event.remove(test_engine.sync_engine, "before_cursor_execute", _record)
+
+        assert disabled == 5
+        assert statements == ["UPDATE"]
+        assert not await _enabled(session_factory, "OLD0")
+        assert await _enabled(session_factory, "FUTURE")
+        assert await _enabled(session_factory, "FOREVER")
+
+    @pytest.mark.asyncio
+    async def test_next_expiry_skips_disabled_and_past(
+        self, session_factory: async_sessionmaker[AsyncSession]
+    ) -> None:
+        now = datetime.now(UTC)
+        soonest = now + timedelta(hours=1)
+        await _add_invitation(
+            session_factory, "PAST", expires_at=now - timedelta(hours=1)
+        )
+        await _add_invitation(
+            session_factory,
+            "DISABLED",
+            expires_at=now + timedelta(minutes=5),
+            enabled=False,
+        )
+        await _add_invitation(session_factory, "SOON", expires_at=soonest)
+        await _add_invitation(
+            session_factory, "LATER", expires_at=now + timedelta(days=2)
+        )
+
+        async with session_factory() as session:
+            next_expiry = await InvitationRepository(session).get_next_expiry(now)
+
+        assert next_expiry is not None
+        assert abs((next_expiry - soonest).total_seconds()) < 0.001
+
+    @pytest.mark.asyncio
+    async def test_next_expiry_none_without_candidates(
+        self, session_factory: async_sessionmaker[AsyncSession]
+    ) -> None:
+        await _add_invitation(session_factory, "FOREVER", expires_at=None)
+
+        async with session_factory() as session:
+            repo = InvitationRepository(session)
+            assert await repo.get_next_expiry(datetime.now(UTC)) is None
+
+
+class TestExpirationScheduler:
+    """Tests for the deadline-driven expiration task."""
+
+    @pytest.mark.asyncio
+    async def test_disables_at_deadline_not_interval(
+        self, session_factory: async_sessionmaker[AsyncSession]
+    ) -> None:
+        await _add_invitation(
+            session_factory,
+            "SHORT",
+            expires_at=datetime.now(UTC) + timedelta(seconds=0.3),
+        )
+        manager = make_task_manager(expiration_check_interval_seconds=3600)
+        manager._running = True  # pyright: ignore[reportPrivateUsage]
+        task = asyncio.create_task(
+            manager._run_expiration_task(make_task_state(session_factory))  # pyright: ignore[reportPrivateUsage]
+        )
+        try:
+            await asyncio.sleep(1.0)
+            assert not await _enabled(session_factory, "SHORT")
+        finally:
+            _ = task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+    @pytest.mark.asyncio
+    async def test_committed_edit_wakes_scheduler(
+        self, session_factory: async_sessionmaker[AsyncSession]
+    ) -> None:
+        await _add_invitation(
+            session_factory,
+            "EDITED",
+            expires_at=datetime.now(UTC) + timedelta(days=7),
+        )
+        manager = make_task_manager(expiration_check_interval_seconds=3600)
+        manager._running = True  # pyright: ignore[reportPrivateUsage]
+        task = asyncio.create_task(
+            manager._run_expiration_task(make_task_state(session_factory))  # pyright: ignore[reportPrivateUsage]
+        )
+        try:
+            # Let the first sweep schedule a sleep of the full interval
+            await asyncio.sleep(0.2)
+
+            async with session_factory() as session:
+                invitation = await session.scalar(
+                    select(Invitation).where(Invitation.code == "EDITED")
+                )
+                assert invitation is not None
+                invitation.expires_at = datetime.now(UTC) + timedelta(seconds=0.3)
+                await session.commit()
+
+            await asyncio.sleep(1.0)
+            assert not await _enabled(session_factory, "EDITED")
+        finally:
+            _ = task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
@@ -0,0 +1,267 @@
+"""Tests for cursor (keyset) pagination on the users and invitations lists.
+
+Integration tests via TestClient following test_settings_controller.py pattern.
+"""
+
+from collections.abc import AsyncGenerator
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from litestar import Litestar
+from litestar.di import Provide
+from litestar.testing import TestClient
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from tests.conftest import create_test_engine
+from zondarr.api.errors import validation_error_handler
+from zondarr.api.invitations import InvitationController
+from zondarr.api.users import UserController
+from zondarr.core.exceptions import ValidationError
+from zondarr.media.providers.jellyfin import JellyfinProvider
+from zondarr.media.registry import registry
+from zondarr.models.identity import Identity, User
+from zondarr.models.invitation import Invitation
+from zondarr.models.media_server import MediaServer
+
+
+def _make_test_app(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> Litestar:
+    """Create a Litestar test app with the user and invitation controllers."""
+    registry.register(JellyfinProvider())
+
+    async def provide_session() -> AsyncGenerator[AsyncSession]:
+        async with session_factory() as session:
+            try:
+                yield session
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
+    return Litestar(
+        route_handlers=[UserController, InvitationController],
+        dependencies={
+            "session": Provide(provide_session),
+        },
+        exception_handlers={ValidationError: validation_error_handler},
+    )
+
+
+async def _seed_users(
+    session_factory: async_sessionmaker[AsyncSession], *, count: int
+) -> None:
+    """Create users where several share created_at and some lack expires_at."""
+    base = datetime(2024, 1, 1, tzinfo=UTC)
+    async with session_factory() as session:
+        server_id = uuid4()
+        session.add(
+            MediaServer(
+                id=server_id,
+                name="TestServer",
+                server_type="jellyfin",
+                url="http://jellyfin.local:8096",
+                api_key="test-api-key",
+                enabled=True,
+            )
+        )
+        for i in range(count):
+            identity_id = uuid4()
+            session.add(Identity(id=identity_id, display_name=f"user{i}"))
+            session.add(
+                User(
+                    identity_id=identity_id,
+                    media_server_id=server_id,
+                    external_user_id=f"external-{i}",
+                    username=f"user{i:03d}",
+                    created_at=base + timedelta(minutes=i // 3),
+                    expires_at=None if i % 4 == 0 else base + timedelta(days=i % 5),
+                )
+            )
+        await session.commit()
+
+
+def _walk(client: TestClient[Litestar], path: str, **params: str) -> list[str]:
+    """Follow next_cursor from the first page to the end and collect ids."""
+    response = client.get(path, params=params)
+    assert response.status_code == 200
+    data: dict[str, object] = response.json()  # pyright: ignore[reportAny]
+    ids = [item["id"] for item in data["items"]]  # pyright: ignore[reportUnknownVariableType, reportIndexIssue, reportGeneralTypeIssues]
+    expected_page = 1
+    while data["next_cursor"] is not None:
+        assert data["has_next"] is True
+        response = client.get(
+            path, params={**params, "cursor": str(data["next_cursor"])}
+        )
+        assert response.status_code == 200
+        data = response.json()  # pyright: ignore[reportAny]
+        expected_page += 1
+        assert data["page"] == expected_page
+        ids.extend(item["id"] for item in data["items"])  # pyright: ignore[reportUnknownMemberType, reportIndexIssue, reportGeneralTypeIssues, reportUnknownArgumentType]
+    assert data["has_next"] is False
+    return ids  # pyright: ignore[reportUnknownVariableType]
+
+
+class TestUserCursorPagination:
+    """Tests for GET /api/v1/users with cursor."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("sort_by", ["created_at", "username", "expires_at"])
+    @pytest.mark.parametrize("sort_order", ["asc", "desc"])
+    async def test_cursor_walk_matches_offset_pages(
+        self, sort_by: str, sort_order: str
+    ) -> None:
+        engine = await create_test_engine()
+        try:
+            session_factory = async_sessionmaker(engine, expire_on_commit=False)
+            await _seed_users(session_factory, count=23)
+            app = _make_test_app(session_factory)
+
+            with TestClient(app) as client:
+                params = {"sort_by": sort_by, "sort_order": sort_order}
+                cursor_ids = _walk(client, "/api/v1/users", page_size="5", **params)
+
+                offset_ids: list[str] = []
+                for page in range(1, 6):
+                    data: dict[str, object] = client.get(  # pyright: ignore[reportAny]
+                        "/api/v1/users",
+                        params={**params, "page": page, "page_size": 5},
+                    ).json()
+                    offset_ids.extend(item["id"] for item in data["items"])  # pyright: ignore[reportUnknownMemberType, reportIndexIssue, reportGeneralTypeIssues, reportUnknownArgumentType]
+
+                assert len(cursor_ids) == 23
+                assert len(set(cursor_ids)) == 23
+                assert cursor_ids == offset_ids
+        finally:
+            await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_cursor_pages_reuse_cached_total(self) -> None:
+        engine = await create_test_engine()
+        try:
+            session_factory = async_sessionmaker(engine, expire_on_commit=False)
+            await _seed_users(session_factory, count=12)
+            app = _make_test_app(session_factory)
+
+            statements = _record_statements(engine)
+
+            with TestClient(app) as client:
+                first = client.get("/api/v1/users", params={"page_size": 5}).json()  # pyright: ignore[reportAny]
+                assert first["total"] == 12
+
+                statements.clear()
+                second = client.get(
+                    "/api/v1/users",
+                    params={"page_size": 5, "cursor": first["next_cursor"]},
+                ).json()  # pyright: ignore[reportAny]
+                assert second["total"] == 12
+                assert second["page"] == 2
+                assert not any("count(" in s.lower() for s in statements)
+
+                # A committed write drops the cached total
+                async with session_factory() as session:
+                    await _add_user(session)
+                    await session.commit()
+
+                statements.clear()
+                third = client.get(
+                    "/api/v1/users",
+                    params={"page_size": 5, "cursor": second["next_cursor"]},
+                ).json()  # pyright: ignore[reportAny]
+                assert third["total"] == 13
+                assert any("count(" in s.lower() for s in statements)
+        finally:
+            await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_invalid_or_mismatched_cursor_is_rejected(self) -> None:
+        engine = await create_test_engine()
+        try:
+            session_factory = async_sessionmaker(engine, expire_on_commit=False)
+            await _seed_users(session_factory, count=6)
+            app = _make_test_app(session_factory)
+
+            with TestClient(app) as client:
+                response = client.get(
+                    "/api/v1/users", params={"cursor": "not-a-cursor"}
+                )
+                assert response.status_code == 400
+
+                first = client.get("/api/v1/users", params={"page_size": 2}).json()  # pyright: ignore[reportAny]
+                response = client.get(
+                    "/api/v1/users",
+                    params={
+                        "page_size": 2,
+                        "sort_by": "username",
+                        "cursor": first["next_cursor"],
+                    },
+                )
+                assert response.status_code == 400
+        finally:
+            await engine.dispose()
+
+
+class TestInvitationCursorPagination:
+    """Tests for GET /api/v1/invitations with cursor."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("sort_by", ["created_at", "expires_at", "use_count"])
+    async def test_cursor_walk_visits_every_invitation_once(self, sort_by: str) -> None:
+        engine = await create_test_engine()
+        try:
+            session_factory = async_sessionmaker(engine, expire_on_commit=False)
+            base = datetime(2024, 1, 1, tzinfo=UTC)
+            async with session_factory() as session:
+                for i in range(17):
+                    session.add(
+                        Invitation(
+                            code=f"CODE{i:04d}",
+                            created_at=base + timedelta(hours=i // 4),
+                            use_count=i % 2,
+                        )
+                    )
+                await session.commit()
+            app = _make_test_app(session_factory)
+
+            with TestClient(app) as client:
+                ids = _walk(
+                    client,
+                    "/api/v1/invitations",
+                    page_size="4",
+                    sort_by=sort_by,
+                    sort_order="asc",
+                )
+
+            assert len(ids) == 17
+            assert len(set(ids)) == 17
+        finally:
+            await engine.dispose()
+
+
+def _record_statements(engine: AsyncEngine) -> list[str]:
+    """Collect the SQL of every statement executed on `engine`."""
+    statements: list[str] = []
+
+    def _record(*args: object) -> None:
+        statements.append(str(args[2]))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _record)
+    return statements
+
+
+async def _add_user(session: AsyncSession) -> None:
+    """Add one more user on the existing media server."""
+    server_id = await session.scalar(select(MediaServer.id))
+    assert server_id is not None
+    identity = Identity(id=uuid4(), display_name="late")
+    session.add(identity)
+    session.add(
+        User(
+            identity_id=identity.id,
+            media_server_id=server_id,
+            external_user_id="external-late",
+            username="late",
+        )
+    )
@@ -0,0 +1,84 @@
+"""Tests for the in-memory LogBuffer ring.
+
+Tests cover:
+- Slicing entries after a sequence number, before and after wraparound
+- Cursors older than the retained window and ahead of the buffer
+- JSON encoding cached on each LogEntry
+"""
+
+import msgspec
+import pytest
+
+from zondarr.core.log_buffer import LogBuffer, LogEntry
+
+
+def _fill(buffer: LogBuffer, count: int, /) -> None:
+    """Append `count` entries whose message is their 1-based index."""
+    for i in range(1, count + 1):
+        buffer.append_entry(
+            timestamp="2024-01-01T00:00:00Z",
+            level="INFO",
+            logger_name="zondarr.test",
+            message=str(i),
+            fields={"i": str(i)},
+        )
+
+
+def _seqs(entries: list[LogEntry], /) -> list[int]:
+    return [entry.seq for entry in entries]
+
+
+class TestGetEntriesSince:
+    """Tests for LogBuffer.get_entries_since."""
+
+    def test_empty_buffer(self) -> None:
+        assert LogBuffer(maxlen=4).get_entries_since(0) == ([], 0)
+
+    def test_before_wraparound(self) -> None:
+        buffer = LogBuffer(maxlen=8)
+        _fill(buffer, 5)
+
+        entries, current = buffer.get_entries_since(2)
+
+        assert current == 5
+        assert _seqs(entries) == [3, 4, 5]
+        assert [entry.message for entry in entries] == ["3", "4", "5"]
+
+    @pytest.mark.parametrize("after_seq", range(0, 25))
+    def test_after_wraparound_matches_linear_scan(self, after_seq: int) -> None:
+        buffer = LogBuffer(maxlen=7)
+        _fill(buffer, 23)
+
+        entries, current = buffer.get_entries_since(after_seq)
+
+        retained = range(23 - 7 + 1, 23 + 1)
+        assert current == 23
+        assert _seqs(entries) == [seq for seq in retained if seq > after_seq]
+        assert all(entry.message == str(entry.seq) for entry in entries)
+
+    def test_full_ring_boundary(self) -> None:
+        buffer = LogBuffer(maxlen=4)
+        _fill(buffer, 8)
+
+        assert _seqs(buffer.get_entries_since(0)[0]) == [5, 6, 7, 8]
+        assert _seqs(buffer.get_entries_since(7)[0]) == [8]
+        assert buffer.get_entries_since(8)[0] == []
+
+
+class TestLogEntryJson:
+    """Tests for the cached JSON encoding on LogEntry."""
+
+    def test_json_is_computed_once(self) -> None:
+        buffer = LogBuffer(maxlen=4)
+        _fill(buffer, 1)
+        entry = buffer.get_entries_since(0)[0][0]
+
+        assert entry.json is entry.json
+        assert msgspec.json.decode(entry.json) == {
+            "seq": 1,
+            "timestamp": "2024-01-01T00:00:00Z",
+            "level": "INFO",
+            "logger_name": "zondarr.test",
+            "message": "1",
+            "fields": {"i": "1"},
+        }
@@ -0,0 +1,157 @@
+"""Tests for the shared SSE log fan-out hub.
+
+Tests cover:
+- Level and source pre-filtering per subscriber
+- Bounded subscriber queues reporting dropped entries
+- Entries overwritten in the ring reported as dropped
+- One dispatcher batching entries for every subscriber
+"""
+
+import asyncio
+
+import pytest
+
+from zondarr.core.log_buffer import LogBuffer, LogEntry
+from zondarr.core.log_stream import LEVEL_ORDER, LogStreamHub, LogSubscriber
+
+
+def _append(
+    buffer: LogBuffer,
+    count: int,
+    /,
+    *,
+    level: str = "INFO",
+    logger_name: str = "zondarr.test",
+) -> None:
+    """Append `count` entries to `buffer`."""
+    for i in range(count):
+        buffer.append_entry(
+            timestamp="2024-01-01T00:00:00Z",
+            level=level,
+            logger_name=logger_name,
+            message=f"line {i}",
+            fields={},
+        )
+
+
+def _entries(buffer: LogBuffer, /) -> list[LogEntry]:
+    return buffer.get_entries_since(0)[0]
+
+
+class TestLogSubscriber:
+    """Tests for LogSubscriber filtering and backpressure."""
+
+    @pytest.mark.asyncio
+    async def test_filters_by_level_and_source(self) -> None:
+        buffer = LogBuffer(maxlen=100)
+        _append(buffer, 2, level="DEBUG")
+        _append(buffer, 2, level="ERROR", logger_name="zondarr.sync")
+        _append(buffer, 2, level="ERROR", logger_name="litestar")
+        subscriber = LogSubscriber(
+            after_seq=0,
+            min_level=LEVEL_ORDER["WARNING"],
+            source="zondarr.",
+            max_pending=100,
+        )
+
+        subscriber.offer(_entries(buffer))
+        batch, dropped = await subscriber.next_batch(timeout=0)
+
+        assert [entry.seq for entry in batch] == [3, 4]
+        assert dropped == 0
+        assert subscriber.after_seq == 6
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_oldest_and_reports_count(self) -> None:
+        buffer = LogBuffer(maxlen=100)
+        _append(buffer, 10)
+        subscriber = LogSubscriber(after_seq=0, min_level=0, source=None, max_pending=4)
+
+        subscriber.offer(_entries(buffer)[:6])
+        subscriber.offer(_entries(buffer)[6:])
+        batch, dropped = await subscriber.next_batch(timeout=0)
+
+        assert [entry.seq for entry in batch] == [7, 8, 9, 10]
+        assert dropped == 6
+
+    @pytest.mark.asyncio
+    async def test_overwritten_entries_count_as_dropped(self) -> None:
+        buffer = LogBuffer(maxlen=5)
+        _append(buffer, 12)
+        subscriber = LogSubscriber(
+            after_seq=2, min_level=0, source=None, max_pending=100
+        )
+
+        subscriber.offer(_entries(buffer))
+        batch, dropped = await subscriber.next_batch(timeout=0)
+
+        assert [entry.seq for entry in batch] == [8, 9, 10, 11, 12]
+        assert dropped == 5
+
+    @pytest.mark.asyncio
+    async def test_times_out_without_entries(self) -> None:
+        subscriber = LogSubscriber(
+            after_seq=0, min_level=0, source=None, max_pending=10
+        )
+
+        assert await subscriber.next_batch(timeout=0.01) == ([], 0)
+
+
+class TestLogStreamHub:
+    """Tests for LogStreamHub dispatching."""
+
+    @pytest.mark.asyncio
+    async def test_one_read_per_tick_serves_all_subscribers(self) -> None:
+        buffer = LogBuffer(maxlen=100)
+        buffer.bind_loop(asyncio.get_running_loop())
+        hub = LogStreamHub(buffer, tick=0.05)
+        reads = 0
+        original = buffer.get_entries_since
+
+        def _counting(after_seq: int) -> tuple[list[LogEntry], int]:
+            nonlocal reads
+            reads += 1
+            return original(after_seq)
+
+        buffer.get_entries_since = _counting  # pyright: ignore[reportAttributeAccessIssue]
+        try:
+            everything = hub.subscribe(after_seq=0, min_level=0, source=None)
+            errors = hub.subscribe(
+                after_seq=0, min_level=LEVEL_ORDER["ERROR"], source=None
+            )
+
+            _append(buffer, 20)
+            _append(buffer, 1, level="ERROR")
+
+            all_batch, _ = await everything.next_batch(timeout=2.0)
+            error_batch, _ = await errors.next_batch(timeout=2.0)
+
+            assert len(all_batch) == 21
+            assert [entry.level for entry in error_batch] == ["ERROR"]
+            assert reads == 1
+
+            hub.unsubscribe(everything)
+            hub.unsubscribe(errors)
+            assert hub.subscriber_count == 0
+        finally:
+            await hub.stop()
+            buffer.unbind_loop()
+
+    @pytest.mark.asyncio
+    async def test_subscriber_starts_after_its_backfill(self) -> None:
+        buffer = LogBuffer(maxlen=100)
+        buffer.bind_loop(asyncio.get_running_loop())
+        hub = LogStreamHub(buffer, tick=0.01)
+        try:
+            _append(buffer, 5)
+            _, last_seq = buffer.get_entries_since(0)
+            subscriber = hub.subscribe(after_seq=last_seq, min_level=0, source=None)
+
+            _append(buffer, 2)
+            batch, dropped = await subscriber.next_batch(timeout=2.0)
+
+            assert [entry.seq for entry in batch] == [6, 7]
+            assert dropped == 0
+        finally:
+            await hub.stop()
+            buffer.unbind_loop()
@@ -0,0 +1,116 @@
+"""Tests for the bounded Argon2 hashing pool.
+
+Tests cover:
+- Async hash/verify roundtrip on the hashing pool
+- Load shedding once running and queued work reach the limits
+- Slots released after completion and after caller cancellation
+- ServiceBusyError mapped to HTTP 503 with Retry-After
+"""
+
+import asyncio
+import threading
+from collections.abc import Callable
+
+import pytest
+from litestar import Litestar, get
+from litestar.testing import TestClient
+
+from zondarr.api.errors import service_busy_error_handler
+from zondarr.core.exceptions import ServiceBusyError
+from zondarr.services.password import (
+    _HashingExecutor,  # pyright: ignore[reportPrivateUsage]
+    hash_password_async,
+    verify_password_async,
+)
+
+
+async def _wait_until(predicate: Callable[[], bool], /) -> None:
+    """Yield to the loop until `predicate()` is true (bounded)."""
+    for _ in range(200):
+        if predicate():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("condition not reached")
+
+
+class TestAsyncHashing:
+    """Tests for the async password helpers."""
+
+    @pytest.mark.asyncio
+    async def test_hash_and_verify_roundtrip(self) -> None:
+        password_hash = await hash_password_async("correct horse")
+
+        assert await verify_password_async(password_hash, "correct horse") is True
+        assert await verify_password_async(password_hash, "wrong horse") is False
+
+
+class TestHashingExecutor:
+    """Tests for _HashingExecutor limits."""
+
+    @pytest.mark.asyncio
+    async def test_sheds_load_beyond_concurrency_and_queue(self) -> None:
+        executor = _HashingExecutor(max_concurrency=1, max_queue=1)
+        gate = threading.Event()
+        try:
+            running = asyncio.create_task(executor.run(gate.wait))
+            queued = asyncio.create_task(executor.run(gate.wait))
+            await _wait_until(lambda: executor.in_flight == 2)
+
+            # The event loop stays responsive while workers are busy
+            await asyncio.sleep(0)
+
+            with pytest.raises(ServiceBusyError) as exc_info:
+                _ = await executor.run(lambda: None)
+            assert exc_info.value.error_code == "SERVICE_BUSY"
+
+            gate.set()
+            assert await running is True
+            assert await queued is True
+            await _wait_until(lambda: executor.in_flight == 0)
+
+            assert await executor.run(lambda: 42) == 42
+        finally:
+            gate.set()
+            executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_holds_slot_until_work_finishes(self) -> None:
+        executor = _HashingExecutor(max_concurrency=1, max_queue=0)
+        gate = threading.Event()
+        try:
+            task = asyncio.create_task(executor.run(gate.wait))
+            await _wait_until(lambda: executor.in_flight == 1)
+            _ = task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+            # The thread is still hashing, so the slot is still taken
+            with pytest.raises(ServiceBusyError):
+                _ = await executor.run(lambda: None)
+
+            gate.set()
+            await _wait_until(lambda: executor.in_flight == 0)
+            assert await executor.run(lambda: "ok") == "ok"
+        finally:
+            gate.set()
+            executor.shutdown()
+
+
+class TestServiceBusyHandler:
+    """Tests for the ServiceBusyError HTTP mapping."""
+
+    def test_returns_503_with_retry_after(self) -> None:
+        @get("/busy")
+        async def busy() -> None:
+            raise ServiceBusyError("saturated", resource="argon2")
+
+        app = Litestar(
+            route_handlers=[busy],
+            exception_handlers={ServiceBusyError: service_busy_error_handler},
+        )
+        with TestClient(app) as client:
+            response = client.get("/busy")
+
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "1"
+        assert response.json()["error_code"] == "SERVICE_BUSY"  # pyright: ignore[reportAny]
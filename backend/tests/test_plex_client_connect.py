@@ -0,0 +1,172 @@
+"""Tests for PlexClient connection setup.
+
+Runs real plexapi objects against a recording session to measure which
+hosts each path contacts.
+
+Tests cover:
+- Entering the context and library sync touching only the local server
+- The plex.tv account opened once, on the first user operation
+- Server-local operations working while plex.tv is down
+- Closing the client not waiting on an unfinished plex.tv sign-in
+"""
+
+import asyncio
+import io
+import threading
+import time
+from typing import override
+from urllib.parse import urlsplit
+
+import pytest
+import requests
+
+from zondarr.core.exceptions import ExternalServiceError
+from zondarr.media.providers.plex.client import PlexClient
+
+SERVER_URL = "http://plex.local:32400"
+
+_SERVER_XML = (
+    b'<MediaContainer friendlyName="Test Server" machineIdentifier="this-server"'
+    b' version="1.41.0" myPlex="1" myPlexUsername="admin"/>'
+)
+_LIBRARY_XML = b'<MediaContainer title1="Plex Library"/>'
+_SECTIONS_XML = (
+    b'<MediaContainer size="2">'
+    b'<Directory key="1" type="movie" title="Movies" uuid="m"/>'
+    b'<Directory key="2" type="show" title="TV Shows" uuid="s"/>'
+    b"</MediaContainer>"
+)
+_ACCOUNT_XML = (
+    b'<user id="1" uuid="admin" username="admin" email="admin@example.com"'
+    b' scrobbleTypes=""><subscription active="0"/><profile/></user>'
+)
+_USERS_XML = (
+    b'<MediaContainer size="1"><User id="7" username="friend" home="0">'
+    b'<Server machineIdentifier="this-server"/></User></MediaContainer>'
+)
+
+
+class RecordingSession(requests.Session):
+    """Session serving a Plex server and plex.tv offline, recording requests."""
+
+    requests_made: list[tuple[str, str]]
+    plex_tv_status: int
+
+    def __init__(self, *, plex_tv_status: int = 200) -> None:
+        super().__init__()
+        self.requests_made = []
+        self.plex_tv_status = plex_tv_status
+
+    @override
+    def request(  # pyright: ignore[reportIncompatibleMethodOverride]
+        self, method: str, url: str, *_args: object, **_kwargs: object
+    ) -> requests.Response:
+        parts = urlsplit(url)
+        self.requests_made.append((parts.netloc, parts.path))
+        response = requests.Response()
+        response.url = url
+        response.status_code = 200
+        response.encoding = "utf-8"
+        response.headers["Content-Type"] = "application/xml; charset=utf-8"
+        if parts.netloc == "plex.tv":
+            response.status_code = self.plex_tv_status
+            body = _USERS_XML if parts.path == "/api/users/" else _ACCOUNT_XML
+        else:
+            body = {
+                "/library": _LIBRARY_XML,
+                "/library/sections": _SECTIONS_XML,
+            }.get(parts.path, _SERVER_XML)
+        response.raw = io.BytesIO(body)
+        return response
+
+    def hosts(self) -> set[str]:
+        return {host for host, _ in self.requests_made}
+
+    def count(self, path: str, /) -> int:
+        return sum(1 for _, p in self.requests_made if p == path)
+
+
+@pytest.fixture
+def session(monkeypatch: pytest.MonkeyPatch) -> RecordingSession:
+    recording = RecordingSession()
+    monkeypatch.setattr(
+        "zondarr.media.providers.plex.client.plex_session", lambda: recording
+    )
+    return recording
+
+
+class TestLazyAccount:
+    """PlexClient opens the plex.tv account only when an operation needs it."""
+
+    @pytest.mark.asyncio
+    async def test_library_sync_only_contacts_local_server(
+        self, session: RecordingSession
+    ) -> None:
+        async with PlexClient(url=SERVER_URL, api_key="token") as client:
+            assert await client.test_connection()
+            info = await client.get_server_info()
+            libraries = await client.get_libraries()
+
+        assert info.server_name == "Test Server"
+        assert [lib.name for lib in libraries] == ["Movies", "TV Shows"]
+        assert session.hosts() == {"plex.local:32400"}
+
+    @pytest.mark.asyncio
+    async def test_account_opened_once_on_first_user_operation(
+        self, session: RecordingSession
+    ) -> None:
+        async with PlexClient(url=SERVER_URL, api_key="token") as client:
+            _ = await client.get_libraries()
+            assert session.count("/api/v2/user") == 0
+
+            first = await client.list_users()
+            second = await client.list_users()
+
+        assert [u.user_type for u in first] == ["shared"]
+        assert first == second
+        assert session.count("/api/v2/user") == 1
+        assert session.count("/api/users/") == 2
+
+    @pytest.mark.asyncio
+    async def test_plex_tv_outage_only_fails_user_operations(
+        self, session: RecordingSession
+    ) -> None:
+        session.plex_tv_status = 503
+
+        async with PlexClient(url=SERVER_URL, api_key="token") as client:
+            libraries = await client.get_libraries()
+            with pytest.raises(ExternalServiceError):
+                _ = await client.list_users()
+
+        assert len(libraries) == 2
+
+    @pytest.mark.asyncio
+    async def test_exit_during_slow_sign_in_does_not_block_loop(
+        self, session: RecordingSession
+    ) -> None:
+        release = threading.Event()
+        original = session.request
+
+        def slow_plex_tv(
+            method: str, url: str, *args: object, **kwargs: object
+        ) -> requests.Response:
+            if "plex.tv" in url:
+                _ = release.wait(timeout=5)
+            return original(method, url, *args, **kwargs)
+
+        session.request = slow_plex_tv  # pyright: ignore[reportAttributeAccessIssue]
+        client = PlexClient(url=SERVER_URL, api_key="token")
+        _ = await client.__aenter__()
+        sign_in = asyncio.create_task(client.list_users())
+        await asyncio.sleep(0.1)
+
+        # The pool closing the client must not wait for plex.tv
+        started = time.monotonic()
+        await client.__aexit__(None, None, None)
+        elapsed = time.monotonic() - started
+        release.set()
+
+        with pytest.raises(ExternalServiceError):
+            _ = await sign_in
+        assert elapsed < 1
+        assert client._account is None  # pyright: ignore[reportPrivateUsage]
@@ -0,0 +1,117 @@
+"""Tests for the dedicated plexapi thread pool and shared session.
+
+Tests cover:
+- Calls running on the Plex pool with the caller's context variables
+- Queue depth, running count and error counters while the pool is saturated
+- Separate connection pools for Plex servers and plex.tv
+- PlexClient and PlexProvider using and releasing the shared resources
+"""
+
+import asyncio
+import contextvars
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from requests.adapters import HTTPAdapter
+
+from zondarr.media.providers.plex import PlexProvider
+from zondarr.media.providers.plex.client import PlexClient
+from zondarr.media.providers.plex import executor
+from zondarr.media.providers.plex.executor import (
+    PLEX_MAX_WORKERS,
+    PLEX_TV_POOL_SIZE,
+    plex_session,
+    run_plex,
+    shutdown_plex_executor,
+)
+
+_request_id: contextvars.ContextVar[str] = contextvars.ContextVar("request_id")
+
+
+def _stats() -> dict[str, int | float]:
+    """Read the counters the pool reports in its plex_executor_stats log event."""
+    return executor._executor.snapshot()  # pyright: ignore[reportPrivateUsage]
+
+
+@pytest.fixture(autouse=True)
+def fresh_executor() -> None:
+    shutdown_plex_executor()
+
+
+class TestRunPlex:
+    """Tests for run_plex."""
+
+    @pytest.mark.asyncio
+    async def test_runs_on_plex_pool_with_context(self) -> None:
+        _ = _request_id.set("abc")
+
+        def work(suffix: str, *, sep: str) -> tuple[str, str]:
+            return threading.current_thread().name, _request_id.get() + sep + suffix
+
+        thread_name, value = await run_plex(work, "def", sep="-")
+
+        assert thread_name.startswith("plexapi")
+        assert value == "abc-def"
+
+    @pytest.mark.asyncio
+    async def test_stats_track_queue_depth_and_errors(self) -> None:
+        release = threading.Event()
+        before = _stats()
+
+        def blocked() -> None:
+            _ = release.wait(timeout=5)
+
+        def failing() -> None:
+            raise RuntimeError("plex.tv said no")
+
+        tasks = [
+            asyncio.create_task(run_plex(blocked)) for _ in range(PLEX_MAX_WORKERS + 2)
+        ]
+        await asyncio.sleep(0.1)
+        saturated = _stats()
+        release.set()
+        _ = await asyncio.gather(*tasks)
+        with pytest.raises(RuntimeError):
+            await run_plex(failing)
+        after = _stats()
+
+        assert saturated["running"] == PLEX_MAX_WORKERS
+        assert saturated["queued"] == 2
+        assert saturated["peak_queued"] >= 2
+        assert after["queued"] == after["running"] == 0
+        assert after["calls"] == before["calls"] + PLEX_MAX_WORKERS + 3
+        assert after["errors"] == before["errors"] + 1
+        assert after["max_wait_ms"] > 0
+
+
+class TestPlexSession:
+    """Tests for the shared requests session."""
+
+    def test_plex_tv_has_its_own_pool(self) -> None:
+        session = plex_session()
+
+        plex_tv = session.get_adapter("https://plex.tv/api/v2/user")
+        server = session.get_adapter("http://plex.local:32400/library/sections")
+
+        assert plex_session() is session
+        assert isinstance(plex_tv, HTTPAdapter)
+        assert plex_tv is not server
+        assert plex_tv._pool_maxsize == PLEX_TV_POOL_SIZE  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType]
+
+    @pytest.mark.asyncio
+    async def test_client_passes_shared_session(self) -> None:
+        server = MagicMock()
+        with patch("plexapi.server.PlexServer", return_value=server) as plex_server:
+            async with PlexClient(url="http://plex.local:32400", api_key="token"):
+                pass
+
+        assert plex_server.call_args.kwargs["session"] is plex_session()
+
+    @pytest.mark.asyncio
+    async def test_provider_close_releases_session(self) -> None:
+        session = plex_session()
+
+        await PlexProvider().close()
+
+        assert plex_session() is not session
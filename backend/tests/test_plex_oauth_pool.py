@@ -0,0 +1,97 @@
+"""Tests for the shared, pooled Plex OAuth service.
+
+Tests cover:
+- Concurrent checks of one PIN coalesced into a single plex.tv request
+- Checks of different PINs, and later polls, sent separately
+- One cancelled poller leaving the shared request running for the others
+- PlexProvider reusing one service across flows until closed
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from zondarr.config import Settings
+from zondarr.media.providers.plex import PlexProvider
+from zondarr.media.providers.plex.oauth_service import PlexOAuthService
+
+SETTINGS = Settings(secret_key="a" * 32)
+
+
+def _pending_pin_get(delay: float = 0.05) -> AsyncMock:
+    """Mock httpx GET answering every PIN poll with an unclaimed PIN."""
+    response = MagicMock()
+    response.raise_for_status = MagicMock(return_value=response)
+    response.json = MagicMock(return_value={"id": 1, "authToken": None})
+
+    async def get(*_args: object, **_kwargs: object) -> MagicMock:
+        await asyncio.sleep(delay)
+        return response
+
+    return AsyncMock(side_effect=get)
+
+
+class TestPinCheckCoalescing:
+    """Tests for PlexOAuthService.check_pin request coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_polls_share_one_request(self) -> None:
+        mock_get = _pending_pin_get()
+        service = PlexOAuthService(client_id="zondarr-test")
+        try:
+            with patch.object(httpx.AsyncClient, "get", mock_get):
+                results = await asyncio.gather(
+                    *(service.check_pin(42) for _ in range(5))
+                )
+                assert mock_get.await_count == 1
+
+                _ = await asyncio.gather(service.check_pin(42), service.check_pin(7))
+        finally:
+            await service.close()
+
+        assert all(not result.authenticated for result in results)
+        assert mock_get.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_cancelled_poller_does_not_cancel_others(self) -> None:
+        mock_get = _pending_pin_get(delay=0.1)
+        service = PlexOAuthService(client_id="zondarr-test")
+        try:
+            with patch.object(httpx.AsyncClient, "get", mock_get):
+                first = asyncio.create_task(service.check_pin(42))
+                second = asyncio.create_task(service.check_pin(42))
+                await asyncio.sleep(0.01)
+                _ = first.cancel()
+
+                result = await second
+        finally:
+            await service.close()
+
+        assert first.cancelled()
+        assert not result.authenticated
+        assert mock_get.await_count == 1
+
+
+class TestPlexProviderOAuthLifecycle:
+    """Tests for the provider-owned OAuth service."""
+
+    @pytest.mark.asyncio
+    async def test_flows_share_service_until_closed(self) -> None:
+        provider = PlexProvider()
+
+        first = provider.create_oauth_flow_provider(SETTINGS)
+        second = provider.create_oauth_flow_provider(SETTINGS)
+        assert first._service is second._service  # pyright: ignore[reportPrivateUsage]
+
+        with patch.object(
+            PlexOAuthService, "close", new_callable=AsyncMock
+        ) as mock_close:
+            await provider.close()
+            await provider.close()
+        mock_close.assert_awaited_once()
+
+        third = provider.create_oauth_flow_provider(SETTINGS)
+        assert third._service is not first._service  # pyright: ignore[reportPrivateUsage]
+        await provider.close()
@@ -0,0 +1,182 @@
+"""Tests for streaming the plex.tv users listing.
+
+Tests cover:
+- Home, shared and friend classification from the raw XML
+- Results independent of how the response body is chunked
+- Parity with the plexapi MyPlexAccount.users() path on the same response
+- HTTP errors surfacing from the streamed request
+"""
+
+import io
+from typing import override
+from xml.sax.saxutils import quoteattr
+
+import pytest
+import requests
+from hypothesis import given, settings
+from hypothesis import strategies as st
+from plexapi.myplex import MyPlexAccount
+
+from zondarr.media.providers.plex.users_xml import (
+    parse_account_users,
+    stream_account_users,
+)
+from zondarr.media.types import ExternalUser
+
+MACHINE_ID = "this-server"
+
+# Minimal plex.tv v2 account document accepted by MyPlexAccount
+_ACCOUNT_XML = (
+    b'<user id="1" uuid="admin" username="admin" email="admin@example.com"'
+    b' scrobbleTypes=""><subscription active="0"/><profile/></user>'
+)
+
+
+class FakePlexTvSession(requests.Session):
+    """Session answering plex.tv account and users requests offline."""
+
+    users_body: bytes
+    status_code: int
+
+    def __init__(self, users_body: bytes, *, status_code: int = 200) -> None:
+        super().__init__()
+        self.users_body = users_body
+        self.status_code = status_code
+
+    @override
+    def request(  # pyright: ignore[reportIncompatibleMethodOverride]
+        self, method: str, url: str, *_args: object, **_kwargs: object
+    ) -> requests.Response:
+        response = requests.Response()
+        response.url = url
+        response.headers["Content-Type"] = "application/xml; charset=utf-8"
+        response.encoding = "utf-8"
+        if "/api/v2/user" in url:
+            response.status_code = 200
+            response._content = _ACCOUNT_XML  # pyright: ignore[reportPrivateUsage]
+        else:
+            response.status_code = self.status_code
+            response.raw = io.BytesIO(self.users_body)
+        return response
+
+
+def users_xml(users: list[tuple[int, str, str | None, bool, list[str]]]) -> bytes:
+    """Render (id, username, email, home, server machine ids) as plex.tv XML."""
+    parts = ['<?xml version="1.0" encoding="UTF-8"?>\n<MediaContainer size="0">']
+    for user_id, username, email, home, servers in users:
+        email_attr = "" if email is None else f" email={quoteattr(email)}"
+        parts.append(
+            f'<User id="{user_id}" title={quoteattr(username)}'
+            f" username={quoteattr(username)}{email_attr} home={quoteattr(str(int(home)))}>"
+        )
+        parts.extend(
+            f'<Server id="9" machineIdentifier={quoteattr(machine)} numLibraries="2"/>'
+            for machine in servers
+        )
+        parts.append("</User>")
+    parts.append("</MediaContainer>")
+    return "".join(parts).encode()
+
+
+def _classify_with_plexapi(account: MyPlexAccount) -> list[ExternalUser]:
+    """The plexapi-based listing PlexClient.list_users used before streaming."""
+    result: list[ExternalUser] = []
+    for user in account.users():  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+        if user.home:  # pyright: ignore[reportUnknownMemberType]
+            user_type = "home"
+        elif any(s.machineIdentifier == MACHINE_ID for s in user.servers):  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+            user_type = "shared"
+        else:
+            user_type = "friend"
+        result.append(
+            ExternalUser(
+                external_user_id=str(user.id),  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+                username=user.username or "",  # pyright: ignore[reportUnknownMemberType]
+                email=user.email,  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+                user_type=user_type,
+            )
+        )
+    return result
+
+
+_users_strategy = st.lists(
+    st.tuples(
+        st.integers(min_value=1, max_value=999_999_999),
+        st.text(alphabet=st.characters(categories=("L", "N", "P", "Zs")), max_size=20),
+        st.one_of(st.none(), st.emails()),
+        st.booleans(),
+        st.lists(st.sampled_from([MACHINE_ID, "other-server"]), max_size=2),
+    ),
+    max_size=15,
+)
+
+
+class TestParseAccountUsers:
+    """Tests for parse_account_users."""
+
+    def test_classifies_users(self) -> None:
+        body = users_xml(
+            [
+                (1, "home", None, True, [MACHINE_ID]),
+                (2, "shared", "s@example.com", False, ["other-server", MACHINE_ID]),
+                (3, "friend", "f@example.com", False, ["other-server"]),
+                (4, "lonely", None, False, []),
+            ]
+        )
+
+        users = list(parse_account_users([body], machine_id=MACHINE_ID))
+
+        assert [(u.external_user_id, u.user_type) for u in users] == [
+            ("1", "home"),
+            ("2", "shared"),
+            ("3", "friend"),
+            ("4", "friend"),
+        ]
+        assert users[1].email == "s@example.com"
+        assert users[0].email is None
+
+    def test_skips_users_without_id(self) -> None:
+        body = b'<MediaContainer><User username="ghost"/><User id="7" username="x"/></MediaContainer>'
+
+        users = list(parse_account_users([body], machine_id=MACHINE_ID))
+
+        assert [u.external_user_id for u in users] == ["7"]
+
+    @settings(max_examples=50)
+    @given(users=_users_strategy, chunk_size=st.integers(min_value=1, max_value=64))
+    def test_chunking_does_not_matter(
+        self,
+        users: list[tuple[int, str, str | None, bool, list[str]]],
+        chunk_size: int,
+    ) -> None:
+        body = users_xml(users)
+        chunks = [body[i : i + chunk_size] for i in range(0, len(body), chunk_size)]
+
+        assert list(parse_account_users(chunks, machine_id=MACHINE_ID)) == list(
+            parse_account_users([body], machine_id=MACHINE_ID)
+        )
+
+
+class TestStreamAccountUsers:
+    """Tests for stream_account_users against a MyPlexAccount."""
+
+    @settings(max_examples=50)
+    @given(users=_users_strategy)
+    def test_matches_plexapi_listing(
+        self, users: list[tuple[int, str, str | None, bool, list[str]]]
+    ) -> None:
+        session = FakePlexTvSession(users_xml(users))
+        account = MyPlexAccount(token="token", session=session)
+        expected = _classify_with_plexapi(account)
+
+        session.users_body = users_xml(users)
+        streamed = list(stream_account_users(account, machine_id=MACHINE_ID))
+
+        assert streamed == expected
+
+    def test_http_error_raised(self) -> None:
+        session = FakePlexTvSession(b"Unauthorized", status_code=401)
+        account = MyPlexAccount(token="token", session=session)
+
+        with pytest.raises(requests.HTTPError, match="401"):
+            _ = list(stream_account_users(account, machine_id=MACHINE_ID))
@@ -0,0 +1,174 @@
+"""Tests for the combined per-server library and user sync.
+
+Tests cover:
+- One client session per server fetching libraries and users together
+- Both diffs and both sync runs committed in one transaction
+- A failed part recorded as a failed run while the other part is applied
+- Failures of both parts still failing the client session
+"""
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from tests.conftest import (
+    create_media_server,
+    make_task_manager,
+    make_task_state,
+    mock_client_registry,
+    mock_server_registry,
+)
+from zondarr.media.types import ExternalUser, LibraryInfo
+from zondarr.models.identity import User
+from zondarr.models.media_server import Library, MediaServer
+from zondarr.models.sync_run import SyncRun
+from zondarr.services.sync import SyncService
+
+ALICE = ExternalUser(external_user_id="1", username="alice", user_type="shared")
+MOVIES = LibraryInfo(external_id="1", name="Movies", library_type="movie")
+
+
+def _make_client(
+    *,
+    libraries: list[LibraryInfo] | Exception,
+    users: list[ExternalUser] | Exception,
+) -> AsyncMock:
+    client = AsyncMock()
+    client.get_libraries = AsyncMock(
+        side_effect=libraries if isinstance(libraries, Exception) else None,
+        return_value=libraries,
+    )
+    client.list_users = AsyncMock(
+        side_effect=users if isinstance(users, Exception) else None,
+        return_value=users,
+    )
+    return client
+
+
+async def _runs(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> dict[str, SyncRun]:
+    async with session_factory() as session:
+        return {run.sync_type: run for run in await session.scalars(select(SyncRun))}
+
+
+class TestCombinedServerSync:
+    """Tests for BackgroundTaskManager syncing a server in one pass."""
+
+    @pytest.mark.asyncio
+    async def test_one_session_and_one_transaction(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+    ) -> None:
+        server = await create_media_server(session_factory, server_type="plex")
+        registry = mock_server_registry(_make_client(libraries=[MOVIES], users=[ALICE]))
+        manager = make_task_manager()
+
+        with patch("zondarr.services.sync.registry", registry):
+            await manager.sync_all_servers(make_task_state(session_factory))
+
+        registry.client_session.assert_called_once()
+        async with session_factory() as session:
+            libraries = list(await session.scalars(select(Library.name)))
+            users = list(await session.scalars(select(User.username)))
+        runs = await _runs(session_factory)
+        assert libraries == ["Movies"]
+        assert users == ["alice"]
+        assert {t: r.status for t, r in runs.items()} == {
+            "libraries": "success",
+            "users": "success",
+        }
+        # Both runs were written by the same commit
+        assert runs["libraries"].finished_at == runs["users"].finished_at
+        assert runs["users"].fingerprint is not None
+        assert not manager.is_libraries_sync_in_progress(server.id)
+        assert not manager.is_users_sync_in_progress(server.id)
+
+    @pytest.mark.asyncio
+    async def test_failed_part_does_not_block_the_other(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+    ) -> None:
+        _ = await create_media_server(session_factory, server_type="plex")
+        registry = mock_server_registry(
+            _make_client(
+                libraries=RuntimeError("library scan in progress"), users=[ALICE]
+            )
+        )
+        manager = make_task_manager()
+
+        with patch("zondarr.services.sync.registry", registry):
+            await manager.sync_all_servers(make_task_state(session_factory))
+
+        async with session_factory() as session:
+            users = list(await session.scalars(select(User.username)))
+        runs = await _runs(session_factory)
+        assert users == ["alice"]
+        assert runs["libraries"].status == "failed"
+        assert runs["libraries"].error_message == "library scan in progress"
+        assert runs["users"].status == "success"
+
+    @pytest.mark.asyncio
+    async def test_database_failure_records_both_runs_failed(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+    ) -> None:
+        _ = await create_media_server(session_factory, server_type="plex")
+        registry = mock_server_registry(_make_client(libraries=[MOVIES], users=[ALICE]))
+        manager = make_task_manager()
+
+        with (
+            patch("zondarr.services.sync.registry", registry),
+            patch.object(
+                SyncService,
+                "reconcile_users",
+                AsyncMock(side_effect=RuntimeError("disk full")),
+            ),
+        ):
+            await manager.sync_all_servers(make_task_state(session_factory))
+
+        async with session_factory() as session:
+            libraries = list(await session.scalars(select(Library.name)))
+        runs = await _runs(session_factory)
+        assert libraries == []
+        assert {t: (r.status, r.error_message) for t, r in runs.items()} == {
+            "libraries": ("failed", "disk full"),
+            "users": ("failed", "disk full"),
+        }
+
+
+class TestFetchServerState:
+    """Tests for SyncService.fetch_server_state."""
+
+    @pytest.mark.asyncio
+    async def test_both_parts_failing_fails_the_session(
+        self, session_factory: async_sessionmaker[AsyncSession]
+    ) -> None:
+        server = await create_media_server(session_factory, server_type="plex")
+        client = _make_client(
+            libraries=ConnectionError("refused"), users=ConnectionError("refused")
+        )
+        seen: list[BaseException] = []
+
+        @asynccontextmanager
+        async def client_session(_server: MediaServer, /) -> AsyncIterator[object]:
+            try:
+                yield client
+            except BaseException as exc:
+                seen.append(exc)
+                raise
+
+        registry = mock_client_registry()
+        registry.client_session = MagicMock(side_effect=client_session)
+        service = SyncService(MagicMock(), MagicMock(), MagicMock())
+
+        with patch("zondarr.services.sync.registry", registry):
+            remote = await service.fetch_server_state(server, timeout=5)
+
+        assert remote.libraries is None and remote.users is None
+        assert str(remote.libraries_error) == str(remote.users_error) == "refused"
+        assert seen == [remote.libraries_error]
@@ -0,0 +1,265 @@
+"""Tests for the SQLite performance profile and the opt-in read-only pool.
+
+Tests cover:
+- Performance-mode pragmas applied to every connection
+- Opted-in reads served while another connection holds the write lock
+- Opted-in sessions refusing writes; other GET and POST sessions writing
+- Auth endpoints that write onboarding state on GET working with the pool on
+- In-memory databases falling back to a single pool
+"""
+
+import sqlite3
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+from litestar import Litestar, get, post
+from litestar.datastructures import State
+from litestar.di import Provide
+from litestar.security.jwt import Token
+from litestar.testing import TestClient
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from zondarr.api.auth import AuthController
+from zondarr.app import provide_settings
+from zondarr.config import Settings
+from zondarr.core.auth import create_jwt_auth
+from zondarr.core.database import (
+    READ_ONLY_SESSION,
+    create_engine_from_url,
+    create_session_factory,
+    db_lifespan,
+    is_sqlite_file_url,
+    provide_db_session,
+    sqlite_pragmas,
+)
+from zondarr.models.admin import AdminAccount
+from zondarr.models.app_setting import AppSetting
+from zondarr.models.base import Base
+from zondarr.services.onboarding import ONBOARDING_STEP_KEY
+
+TEST_SECRET_KEY = "test-secret-key-for-sqlite-at-least-32-chars!"  # noqa: S105
+
+
+@get("/items/count", opt={READ_ONLY_SESSION: True})
+async def count_items(session: AsyncSession) -> dict[str, int]:
+    total = await session.scalar(text("SELECT count(*) FROM items"))
+    return {"total": int(total or 0)}
+
+
+@get("/items/write-attempt", opt={READ_ONLY_SESSION: True})
+async def write_in_read_only(session: AsyncSession) -> None:
+    _ = await session.execute(text("INSERT INTO items DEFAULT VALUES"))
+
+
+@get("/items/get-write")
+async def write_in_get(session: AsyncSession) -> None:
+    _ = await session.execute(text("INSERT INTO items DEFAULT VALUES"))
+
+
+@post("/items")
+async def add_item(session: AsyncSession) -> None:
+    _ = await session.execute(text("INSERT INTO items DEFAULT VALUES"))
+
+
+def _make_app(settings: Settings) -> Litestar:
+    """Create an app using the real database lifespan and session provider."""
+    return Litestar(
+        route_handlers=[count_items, write_in_read_only, write_in_get, add_item],
+        dependencies={"session": Provide(provide_db_session)},
+        lifespan=[db_lifespan],
+        state=State({"settings": settings}),
+    )
+
+
+def _create_database(path: Path, rows: int) -> None:
+    with sqlite3.connect(path) as conn:
+        _ = conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+        _ = conn.executemany("INSERT INTO items DEFAULT VALUES", [()] * rows)
+
+
+class TestSQLitePragmas:
+    """Tests for connect-time pragmas."""
+
+    @pytest.mark.asyncio
+    async def test_performance_mode_pragmas_applied(self, tmp_path: Path) -> None:
+        settings = Settings(
+            database_url=f"sqlite+aiosqlite:///{tmp_path / 'z.db'}",
+            secret_key=TEST_SECRET_KEY,
+            sqlite_cache_size_kib=2048,
+        )
+        engine = create_engine_from_url(
+            settings.database_url, sqlite_pragmas=sqlite_pragmas(settings)
+        )
+        try:
+            async with engine.connect() as conn:
+                pragma = {
+                    name: (await conn.execute(text(f"PRAGMA {name}"))).scalar()
+                    for name in (
+                        "journal_mode",
+                        "synchronous",
+                        "cache_size",
+                        "temp_store",
+                        "foreign_keys",
+                    )
+                }
+        finally:
+            await engine.dispose()
+
+        assert pragma == {
+            "journal_mode": "wal",
+            "synchronous": 1,
+            "cache_size": -2048,
+            "temp_store": 2,
+            "foreign_keys": 1,
+        }
+
+    def test_performance_mode_off(self) -> None:
+        settings = Settings(secret_key=TEST_SECRET_KEY, sqlite_performance_mode=False)
+
+        assert sqlite_pragmas(settings) == {}
+
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            ("sqlite+aiosqlite:///./zondarr.db", True),
+            ("sqlite+aiosqlite:///:memory:", False),
+            ("sqlite+aiosqlite://", False),
+            ("postgresql+asyncpg://u:p@localhost/zondarr", False),
+        ],
+    )
+    def test_is_sqlite_file_url(self, url: str, expected: bool) -> None:
+        assert is_sqlite_file_url(url) is expected
+
+
+async def _create_app_database(path: Path) -> str:
+    """Create the app schema with one admin and no onboarding_step row."""
+    engine = create_engine_from_url(f"sqlite+aiosqlite:///{path}")
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with create_session_factory(engine)() as session:
+            admin = AdminAccount(username="admin", auth_method="local", enabled=True)
+            session.add(admin)
+            await session.commit()
+            return str(admin.id)
+    finally:
+        await engine.dispose()
+
+
+class TestReadPool:
+    """Tests for handlers that opt in to the query-only pool."""
+
+    def test_reads_proceed_while_writer_holds_lock(self, tmp_path: Path) -> None:
+        path = tmp_path / "z.db"
+        _create_database(path, rows=3)
+        app = _make_app(
+            Settings(
+                database_url=f"sqlite+aiosqlite:///{path}",
+                secret_key=TEST_SECRET_KEY,
+            )
+        )
+
+        with TestClient(app) as client:
+            assert client.get("/items/count").json() == {"total": 3}
+
+            # A long write transaction, like a background sync, in progress
+            writer = sqlite3.connect(path, isolation_level=None)
+            try:
+                _ = writer.execute("BEGIN EXCLUSIVE")
+                _ = writer.execute("INSERT INTO items DEFAULT VALUES")
+
+                started = time.monotonic()
+                responses = [client.get("/items/count") for _ in range(5)]
+                elapsed = time.monotonic() - started
+
+                # Readers see the last committed snapshot without waiting
+                # for the 30 s busy timeout
+                assert [r.json() for r in responses] == [{"total": 3}] * 5
+                assert elapsed < 5
+
+                _ = writer.execute("COMMIT")
+            finally:
+                writer.close()
+
+            assert client.get("/items/count").json() == {"total": 4}
+
+    def test_get_sessions_are_query_only(self, tmp_path: Path) -> None:
+        path = tmp_path / "z.db"
+        _create_database(path, rows=0)
+        app = _make_app(
+            Settings(
+                database_url=f"sqlite+aiosqlite:///{path}",
+                secret_key=TEST_SECRET_KEY,
+            )
+        )
+
+        with TestClient(app) as client:
+            assert client.get("/items/write-attempt").status_code == 500
+            assert client.get("/items/get-write").status_code == 200
+            assert client.post("/items").status_code == 201
+            assert client.get("/items/count").json() == {"total": 2}
+
+    @pytest.mark.asyncio
+    async def test_auth_endpoints_persist_missing_onboarding_step(
+        self, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "z.db"
+        admin_id = await _create_app_database(path)
+        settings = Settings(
+            database_url=f"sqlite+aiosqlite:///{path}",
+            secret_key=TEST_SECRET_KEY,
+        )
+        app = Litestar(
+            route_handlers=[AuthController],
+            dependencies={
+                "session": Provide(provide_db_session),
+                "settings": Provide(provide_settings, sync_to_thread=False),
+            },
+            lifespan=[db_lifespan],
+            on_app_init=[create_jwt_auth(settings).on_app_init],
+            state=State({"settings": settings}),
+        )
+        token = Token(
+            sub=admin_id,
+            exp=datetime.now(UTC) + timedelta(minutes=5),
+            iss="zondarr",
+        ).encode(secret=TEST_SECRET_KEY, algorithm="HS256")
+
+        with TestClient(app) as client:
+            methods = client.get("/api/auth/methods")
+            me = client.get("/api/auth/me", cookies={"zondarr_access_token": token})
+
+        assert methods.status_code == 200
+        assert methods.json()["onboarding_step"] == "security"  # pyright: ignore[reportAny]
+        assert me.status_code == 200
+        assert me.json()["onboarding_step"] == "security"  # pyright: ignore[reportAny]
+
+        engine = create_engine_from_url(settings.database_url)
+        try:
+            async with create_session_factory(engine)() as session:
+                step = await session.scalar(
+                    select(AppSetting.value).where(
+                        AppSetting.key == ONBOARDING_STEP_KEY
+                    )
+                )
+        finally:
+            await engine.dispose()
+        assert step == "security"
+
+    def test_read_pool_disabled_shares_write_pool(self, tmp_path: Path) -> None:
+        path = tmp_path / "z.db"
+        _create_database(path, rows=0)
+        app = _make_app(
+            Settings(
+                database_url=f"sqlite+aiosqlite:///{path}",
+                secret_key=TEST_SECRET_KEY,
+                sqlite_read_pool_size=0,
+            )
+        )
+
+        with TestClient(app) as client:
+            assert app.state.read_session_factory is app.state.session_factory  # pyright: ignore[reportAny]
+            assert client.get("/items/write-attempt").status_code == 200
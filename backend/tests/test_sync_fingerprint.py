@@ -0,0 +1,120 @@
+"""Tests for skipping unchanged user syncs by remote list fingerprint.
+
+Tests cover:
+- Fingerprints independent of remote ordering, sensitive to user changes
+- A repeated automatic sync of an unchanged list skipping the reconcile
+- A changed list, or a manual run in between, reconciling in full
+"""
+
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, patch
+from uuid import UUID
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from tests.conftest import (
+    create_media_server,
+    make_task_manager,
+    make_task_state,
+    mock_server_registry,
+)
+from zondarr.api.schemas import SyncResult
+from zondarr.media.types import ExternalUser
+from zondarr.models.identity import User
+from zondarr.models.sync_run import SyncRun
+from zondarr.services.sync import SyncService, user_list_fingerprint
+
+ALICE = ExternalUser(external_user_id="1", username="alice", user_type="shared")
+BOB = ExternalUser(external_user_id="2", username="bob", user_type="shared")
+
+
+class TestUserListFingerprint:
+    """Tests for user_list_fingerprint."""
+
+    def test_order_independent(self) -> None:
+        assert user_list_fingerprint([ALICE, BOB]) == user_list_fingerprint(
+            [BOB, ALICE]
+        )
+
+    def test_changes_with_user_type(self) -> None:
+        friend = ExternalUser(
+            external_user_id="1", username="alice", user_type="friend"
+        )
+
+        assert user_list_fingerprint([ALICE]) != user_list_fingerprint([friend])
+
+
+class TestFingerprintedUserSync:
+    """Tests for the automatic users sync skipping unchanged lists."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_list_skips_reconcile(
+        self, session_factory: async_sessionmaker[AsyncSession]
+    ) -> None:
+        server = await create_media_server(session_factory)
+        manager = make_task_manager()
+        state = make_task_state(session_factory)
+        reconciles = 0
+        original = SyncService.reconcile_users
+
+        async def _counting(
+            service: SyncService,
+            server_id: UUID,
+            external_users: Sequence[ExternalUser],
+            /,
+            *,
+            dry_run: bool = True,
+        ) -> SyncResult:
+            nonlocal reconciles
+            reconciles += 1
+            return await original(service, server_id, external_users, dry_run=dry_run)
+
+        async def _sync(users: list[ExternalUser]) -> None:
+            client = AsyncMock()
+            client.get_libraries = AsyncMock(return_value=[])
+            client.list_users = AsyncMock(return_value=users)
+            with (
+                patch("zondarr.services.sync.registry", mock_server_registry(client)),
+                patch.object(SyncService, "reconcile_users", _counting),
+            ):
+                await manager._sync_server(state, server)  # pyright: ignore[reportPrivateUsage]
+
+        await _sync([ALICE, BOB])
+        await _sync([BOB, ALICE])
+        assert reconciles == 1
+
+        await _sync([ALICE, BOB, ExternalUser(external_user_id="3", username="eve")])
+        assert reconciles == 2
+
+        async with session_factory() as session:
+            session.add(
+                SyncRun(
+                    media_server_id=server.id,
+                    sync_type="users",
+                    trigger="manual",
+                    status="success",
+                    started_at=datetime.now(UTC),
+                    finished_at=datetime.now(UTC),
+                )
+            )
+            await session.commit()
+
+        # The manual run carries no fingerprint, so the next run reconciles
+        await _sync([ALICE, BOB, ExternalUser(external_user_id="3", username="eve")])
+        assert reconciles == 3
+
+        async with session_factory() as session:
+            usernames = set(await session.scalars(select(User.username)))
+            runs = list(
+                await session.scalars(
+                    select(SyncRun).where(
+                        SyncRun.trigger == "automatic", SyncRun.sync_type == "users"
+                    )
+                )
+            )
+        assert usernames == {"alice", "bob", "eve"}
+        assert len(runs) == 4
+        assert all(run.fingerprint is not None for run in runs)
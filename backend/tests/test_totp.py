@@ -12,6 +12,7 @@ from datetime import UTC, datetime, timedelta
 from unittest.mock import patch
 from uuid import uuid4
 
+import msgspec
 import pyotp
 import pytest
 from litestar import Litestar
@@ -20,7 +21,7 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from tests.conftest import create_test_engine
 from zondarr.core.exceptions import AuthenticationError
 from zondarr.models.admin import AdminAccount
-from zondarr.services.password import hash_password
+from zondarr.services.password import hash_password, verify_password
 from zondarr.services.totp import (
     BACKUP_CODE_COUNT,
     MAX_FAILED_ATTEMPTS,
@@ -28,7 +29,9 @@ from zondarr.services.totp import (
     TOTP_DIGITS,
     TOTP_INTERVAL,
     TOTPService,
+    backup_codes_need_regeneration,
     generate_backup_codes,
+    has_untagged_backup_codes,
     hash_backup_codes,
     verify_backup_code,
 )
@@ -77,7 +80,9 @@ def _setup_totp_for_admin(admin: AdminAccount) -> str:
         secret, secret_key=TEST_SECRET_KEY
     )
     backup_codes = generate_backup_codes()
-    admin.totp_backup_codes = hash_backup_codes(backup_codes)
+    admin.totp_backup_codes = hash_backup_codes(
+        backup_codes, secret_key=TEST_SECRET_KEY
+    )
     return secret
 
 
@@ -166,56 +171,122 @@ class TestBackupCodeHelpers:
     def test_hash_and_verify_backup_code(self) -> None:
         """A valid backup code matches its hash and is consumed."""
         codes = generate_backup_codes()
-        hashed_json = hash_backup_codes(codes)
+        hashed_json = hash_backup_codes(codes, secret_key=TEST_SECRET_KEY)
 
         # Verify the first code
-        matched, updated_json = verify_backup_code(hashed_json, codes[0])
+        matched, updated_json = verify_backup_code(
+            hashed_json, codes[0], secret_key=TEST_SECRET_KEY
+        )
         assert matched is True
         assert updated_json is not None
 
         # The used code should no longer match
-        matched2, _ = verify_backup_code(updated_json, codes[0])
+        matched2, _ = verify_backup_code(
+            updated_json, codes[0], secret_key=TEST_SECRET_KEY
+        )
         assert matched2 is False
 
     def test_verify_backup_code_case_insensitive(self) -> None:
         """Verification is case-insensitive."""
         codes = generate_backup_codes()
-        hashed_json = hash_backup_codes(codes)
+        hashed_json = hash_backup_codes(codes, secret_key=TEST_SECRET_KEY)
 
-        matched, _ = verify_backup_code(hashed_json, codes[0].lower())
+        matched, _ = verify_backup_code(
+            hashed_json, codes[0].lower(), secret_key=TEST_SECRET_KEY
+        )
         assert matched is True
 
     def test_verify_backup_code_with_whitespace(self) -> None:
         """Verification strips whitespace."""
         codes = generate_backup_codes()
-        hashed_json = hash_backup_codes(codes)
+        hashed_json = hash_backup_codes(codes, secret_key=TEST_SECRET_KEY)
 
-        matched, _ = verify_backup_code(hashed_json, f"  {codes[0]}  ")
+        matched, _ = verify_backup_code(
+            hashed_json, f"  {codes[0]}  ", secret_key=TEST_SECRET_KEY
+        )
         assert matched is True
 
     def test_verify_invalid_backup_code(self) -> None:
         """An invalid code returns (False, None)."""
         codes = generate_backup_codes()
-        hashed_json = hash_backup_codes(codes)
+        hashed_json = hash_backup_codes(codes, secret_key=TEST_SECRET_KEY)
 
-        matched, updated_json = verify_backup_code(hashed_json, "ZZZZ-ZZZZ")
+        matched, updated_json = verify_backup_code(
+            hashed_json, "ZZZZ-ZZZZ", secret_key=TEST_SECRET_KEY
+        )
         assert matched is False
         assert updated_json is None
 
     def test_all_backup_codes_can_be_consumed(self) -> None:
         """All backup codes can be verified and consumed one by one."""
         codes = generate_backup_codes()
-        hashed_json = hash_backup_codes(codes)
+        hashed_json = hash_backup_codes(codes, secret_key=TEST_SECRET_KEY)
 
         for code in codes:
-            matched, hashed_json = verify_backup_code(hashed_json, code)  # type: ignore[arg-type]
+            matched, hashed_json = verify_backup_code(
+                hashed_json, code, secret_key=TEST_SECRET_KEY
+            )  # type: ignore[arg-type]
             assert matched is True
             assert hashed_json is not None
 
         # After all consumed, nothing should match
-        matched, _ = verify_backup_code(hashed_json, codes[0])
+        matched, _ = verify_backup_code(
+            hashed_json, codes[0], secret_key=TEST_SECRET_KEY
+        )
+        assert matched is False
+
+    def test_wrong_code_runs_no_argon2_check(self) -> None:
+        """Tagged codes pick their hash by tag; misses skip argon2 entirely."""
+        codes = generate_backup_codes()
+        hashed_json = hash_backup_codes(codes, secret_key=TEST_SECRET_KEY)
+
+        with patch(
+            "zondarr.services.totp.verify_password", wraps=verify_password
+        ) as spy:
+            matched, _ = verify_backup_code(
+                hashed_json, "ZZZZ-ZZZZ", secret_key=TEST_SECRET_KEY
+            )
+            assert matched is False
+            assert spy.call_count == 0
+
+            matched, _ = verify_backup_code(
+                hashed_json, codes[-1], secret_key=TEST_SECRET_KEY
+            )
+            assert matched is True
+            assert spy.call_count == 1
+
+    def test_tags_depend_on_secret_key(self) -> None:
+        """Codes tagged under another secret key do not match."""
+        codes = generate_backup_codes()
+        hashed_json = hash_backup_codes(codes, secret_key=TEST_SECRET_KEY)
+
+        assert codes[0] not in hashed_json
+        matched, _ = verify_backup_code(
+            hashed_json, codes[0], secret_key="another-secret-key-at-least-32-chars!!"
+        )
+        assert matched is False
+
+    def test_untagged_legacy_codes_still_verify(self) -> None:
+        """Bare argon2 hashes from older versions verify via fallback scan."""
+        codes = generate_backup_codes()[:3]
+        legacy_json = msgspec.json.encode(
+            [hash_password(code) for code in codes]
+        ).decode()
+        assert has_untagged_backup_codes(legacy_json) is True
+
+        matched, updated_json = verify_backup_code(
+            legacy_json, codes[1], secret_key=TEST_SECRET_KEY
+        )
+        assert matched is True
+        assert updated_json is not None
+        matched, _ = verify_backup_code(
+            updated_json, codes[1], secret_key=TEST_SECRET_KEY
+        )
         assert matched is False
 
+        tagged_json = hash_backup_codes(codes, secret_key=TEST_SECRET_KEY)
+        assert has_untagged_backup_codes(tagged_json) is False
+
 
 # =============================================================================
 # TOTPService Tests
@@ -240,7 +311,7 @@ class TestTOTPServiceSetup:
                 with patch("zondarr.services.totp.segno") as mock_segno:
                     mock_qr = mock_segno.make.return_value  # pyright: ignore[reportAny]
                     mock_qr.save.side_effect = lambda buf, **_kw: buf.write(fake_svg)  # pyright: ignore[reportAny, reportUnknownMemberType, reportUnknownLambdaType]
-                    uri, qr_svg, backup_codes = service.generate_setup(admin)
+                    uri, qr_svg, backup_codes = await service.generate_setup(admin)
 
                 assert uri.startswith("otpauth://totp/")
                 assert "Zondarr" in uri
@@ -264,7 +335,7 @@ class TestTOTPServiceSetup:
                 service = TOTPService(secret_key=TEST_SECRET_KEY)
 
                 with pytest.raises(AuthenticationError, match="already enabled"):
-                    service.generate_setup(admin)  # pyright: ignore[reportUnusedCallResult]
+                    await service.generate_setup(admin)  # pyright: ignore[reportUnusedCallResult]
         finally:
             await engine.dispose()
 
@@ -410,12 +481,12 @@ class TestTOTPServiceVerify:
                 service.confirm_setup(admin, code)  # pyright: ignore[reportUnusedCallResult]
 
                 # Get backup codes by regenerating
-                backup_codes = service.regenerate_backup_codes(admin)
+                backup_codes = await service.regenerate_backup_codes(admin)
                 first_code = backup_codes[0]
 
-                assert service.verify_backup_code(admin, first_code) is True
+                assert await service.verify_backup_code(admin, first_code) is True
                 # Same code should fail now (consumed)
-                assert service.verify_backup_code(admin, first_code) is False
+                assert await service.verify_backup_code(admin, first_code) is False
         finally:
             await engine.dispose()
 
@@ -430,7 +501,7 @@ class TestTOTPServiceVerify:
                 service = TOTPService(secret_key=TEST_SECRET_KEY)
 
                 with pytest.raises(AuthenticationError, match="not enabled"):
-                    service.verify_backup_code(admin, "ABCD-1234")  # pyright: ignore[reportUnusedCallResult]
+                    await service.verify_backup_code(admin, "ABCD-1234")  # pyright: ignore[reportUnusedCallResult]
         finally:
             await engine.dispose()
 
@@ -446,7 +517,7 @@ class TestTOTPServiceVerify:
                 service = TOTPService(secret_key=TEST_SECRET_KEY)
 
                 with pytest.raises(AuthenticationError, match="No backup codes"):
-                    service.verify_backup_code(admin, "ABCD-1234")  # pyright: ignore[reportUnusedCallResult]
+                    await service.verify_backup_code(admin, "ABCD-1234")  # pyright: ignore[reportUnusedCallResult]
         finally:
             await engine.dispose()
 
@@ -514,13 +585,36 @@ class TestTOTPServiceRegenerateBackupCodes:
                 service.confirm_setup(admin, code)  # pyright: ignore[reportUnusedCallResult]
 
                 old_backup_json = admin.totp_backup_codes
-                new_codes = service.regenerate_backup_codes(admin)
+                new_codes = await service.regenerate_backup_codes(admin)
 
                 assert len(new_codes) == BACKUP_CODE_COUNT
                 assert admin.totp_backup_codes != old_backup_json
 
                 # New codes should be verifiable
-                assert service.verify_backup_code(admin, new_codes[0]) is True
+                assert await service.verify_backup_code(admin, new_codes[0]) is True
+        finally:
+            await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_untagged_codes_flagged_until_regenerated(self) -> None:
+        """Legacy untagged codes ask for regeneration; fresh codes do not."""
+        engine = await create_test_engine()
+        try:
+            sf = async_sessionmaker(engine, expire_on_commit=False)
+            async with sf() as session:
+                admin = await _create_admin(session)
+                service = TOTPService(secret_key=TEST_SECRET_KEY)
+                secret = _setup_totp_for_admin(admin)
+                service.confirm_setup(admin, _get_valid_totp_code(secret))  # pyright: ignore[reportUnusedCallResult]
+                assert backup_codes_need_regeneration(admin) is False
+
+                admin.totp_backup_codes = msgspec.json.encode(
+                    [hash_password(code) for code in generate_backup_codes()[:2]]
+                ).decode()
+                assert backup_codes_need_regeneration(admin) is True
+
+                _ = await service.regenerate_backup_codes(admin)
+                assert backup_codes_need_regeneration(admin) is False
         finally:
             await engine.dispose()
 
@@ -535,7 +629,7 @@ class TestTOTPServiceRegenerateBackupCodes:
                 service = TOTPService(secret_key=TEST_SECRET_KEY)
 
                 with pytest.raises(AuthenticationError, match="not enabled"):
-                    service.regenerate_backup_codes(admin)  # pyright: ignore[reportUnusedCallResult]
+                    await service.regenerate_backup_codes(admin)  # pyright: ignore[reportUnusedCallResult]
         finally:
             await engine.dispose()
 
@@ -0,0 +1,395 @@
+"""Tests for background enforcement of User.expires_at.
+
+Tests cover:
+- Expired users disabled through one client session per server
+- The delete action removing users and identities left without users
+- Plex users having their library shares removed instead of being disabled
+- Transient failures, also wrapped ones, retried in a fresh session;
+  exhausted retries recorded
+- Next-expiry lookup for scheduling the following pass
+- Disabled and circuit-open servers, and failing users, not stalling a pass
+- Committed user expiry changes waking the task early
+"""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from litestar.datastructures import State
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from tests.conftest import make_task_manager, make_task_state, mock_server_registry
+from zondarr.core.exceptions import ExternalServiceError
+from zondarr.media.exceptions import MediaClientError
+from zondarr.media.types import Capability
+from zondarr.models.identity import Identity, User
+from zondarr.models.media_server import MediaServer
+from zondarr.models.sync_run import SyncRun
+
+JELLYFIN_CAPABILITIES = {
+    Capability.CREATE_USER,
+    Capability.DELETE_USER,
+    Capability.ENABLE_DISABLE_USER,
+}
+PLEX_CAPABILITIES = {
+    Capability.CREATE_USER,
+    Capability.DELETE_USER,
+    Capability.REMOVE_SHARED_ACCESS,
+}
+
+
+async def _seed(
+    session_factory: async_sessionmaker[AsyncSession],
+    /,
+    *,
+    server_type: str = "jellyfin",
+    expired: int = 3,
+    enabled: bool = True,
+    prefix: str = "",
+    older_by: timedelta = timedelta(),
+) -> MediaServer:
+    """Create a server with `expired` expired users, one active and one disabled.
+
+    Usernames start with `prefix`, and expiries are moved back by `older_by`.
+    """
+    now = datetime.now(UTC) - older_by
+    async with session_factory() as session:
+        server = MediaServer(
+            name=f"{prefix}Media",
+            server_type=server_type,
+            url="http://media.local:8096",
+            api_key="token",
+            enabled=enabled,
+        )
+        session.add(server)
+        await session.flush()
+
+        def add_user(name: str, *, expires_at: datetime, enabled: bool) -> None:
+            identity = Identity(display_name=name, enabled=True)
+            session.add(identity)
+            session.add(
+                User(
+                    identity=identity,
+                    media_server_id=server.id,
+                    external_user_id=f"ext-{name}",
+                    username=name,
+                    external_user_type="shared",
+                    expires_at=expires_at,
+                    enabled=enabled,
+                )
+            )
+
+        for i in range(expired):
+            add_user(
+                f"{prefix}expired{i}",
+                expires_at=now - timedelta(hours=i + 1),
+                enabled=True,
+            )
+        add_user(f"{prefix}active", expires_at=now + timedelta(days=3), enabled=True)
+        add_user(f"{prefix}already", expires_at=now - timedelta(days=3), enabled=False)
+        await session.commit()
+        return server
+
+
+async def _users(session_factory: async_sessionmaker[AsyncSession]) -> dict[str, User]:
+    async with session_factory() as session:
+        users = await session.scalars(select(User))
+        return {user.username: user for user in users.unique()}
+
+
+async def _sync_runs(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> list[SyncRun]:
+    async with session_factory() as session:
+        return list(await session.scalars(select(SyncRun)))
+
+
+class TestUserExpiryEnforcement:
+    """Tests for BackgroundTaskManager.enforce_user_expiry."""
+
+    @pytest.mark.asyncio
+    async def test_disables_expired_users_in_one_session(
+        self, session_factory: async_sessionmaker[AsyncSession]
+    ) -> None:
+        _ = await _seed(session_factory)
+        client = AsyncMock()
+        client.set_user_enabled = AsyncMock(return_value=True)
+        registry = mock_server_registry(client, capabilities=JELLYFIN_CAPABILITIES)
+        manager = make_task_manager()
+
+        with patch("zondarr.core.tasks.registry", registry):
+            next_expiry, backlog = await manager.enforce_user_expiry(
+                make_task_state(session_factory)
+            )
+
+        assert registry.client_session.call_count == 1
+        assert client.set_user_enabled.await_count == 3
+        assert not backlog
+        assert next_expiry is not None
+        assert next_expiry > datetime.now(UTC) + timedelta(days=2)
+
+        users = await _users(session_factory)
+        assert [u.enabled for n, u in sorted(users.items()) if "expired" in n] == [
+            False,
+            False,
+            False,
+        ]
+        assert users["active"].enabled
+
+        (run,) = await _sync_runs(session_factory)
+        assert (run.sync_type, run.status, run.error_message) == (
+            "expiry",
+            "success",
+            None,
+        )
+
+    @pytest.mark.asyncio
+    async def test_delete_action_removes_users_and_identities(
+        self, session_factory: async_sessionmaker[AsyncSession]
+    ) -> None:
+        _ = await _seed(session_factory, expired=2)
+        client = AsyncMock()
+        client.delete_user = AsyncMock(return_value=True)
+        registry = mock_server_registry(client, capabilities=JELLYFIN_CAPABILITIES)
+        manager = make_task_manager(user_expiry_action="delete")
+
+        with patch("zondarr.core.tasks.registry", registry):
+            _ = await manager.enforce_user_expiry(make_task_state(session_factory))
+
+        assert set(await _users(session_factory)) == {"active", "already"}
+        async with session_factory() as session:
+            names = set(await session.scalars(select(Identity.display_name)))
+        assert names == {"active", "already"}
+
+    @pytest.mark.asyncio
+    async def test_plex_users_lose_library_shares(
+        self, session_factory: async_sessionmaker[AsyncSession]
+    ) -> None:
+        _ = await _seed(session_factory, server_type="plex", expired=1)
+        client = AsyncMock()
+        client.remove_shared_access = AsyncMock(return_value=True)
+        registry = mock_server_registry(client, capabilities=PLEX_CAPABILITIES)
+        manager = make_task_manager()
+
+        with patch("zondarr.core.tasks.registry", registry):
+            _ = await manager.enforce_user_expiry(make_task_state(session_factory))
+
+        client.set_user_enabled.assert_not_awaited()
+        user = (await _users(session_factory))["expired0"]
+        assert not user.enabled
+        assert user.external_user_type == "friend"
+
+    @pytest.mark.asyncio
+    async def test_transient_failure_retried_in_new_session(
+        self, session_factory: async_sessionmaker[AsyncSession]
+    ) -> None:
+        _ = await _seed(session_factory)
+        client = AsyncMock()
+        client.set_user_enabled = AsyncMock(
+            side_effect=[True, ExternalServiceError("Jellyfin", "down"), True, True]
+        )
+        registry = mock_server_registry(client, capabilities=JELLYFIN_CAPABILITIES)
+        manager = make_task_manager()
+
+        with (
+            patch("zondarr.core.tasks.registry", registry),
+            patch("zondarr.core.tasks._EXPIRY_RETRY_BASE_SECONDS", 0),
+        ):
+            _ = await manager.enforce_user_expiry(make_task_state(session_factory))
+
+        assert registry.client_session.call_count == 2
+        users = await _users(session_factory)
+        assert not any(u.enabled for n, u in users.items() if "expired" in n)
+        (run,) = await _sync_runs(session_factory)
+        assert run.status == "success"
+
+    @pytest.mark.asyncio
+    async def test_wrapped_connection_error_retried_in_new_session(
+        self, session_factory: async_sessionmaker[AsyncSession]
+    ) -> None:
+        _ = await _seed(session_factory)
+        wrapped = MediaClientError("Update failed", operation="set_user_enabled")
+        wrapped.__cause__ = ConnectionError("connection reset by peer")
+        client = AsyncMock()
+        client.set_user_enabled = AsyncMock(side_effect=[True, wrapped, True, True])
+        registry = mock_server_registry(client, capabilities=JELLYFIN_CAPABILITIES)
+        manager = make_task_manager()
+
+        with (
+            patch("zondarr.core.tasks.registry", registry),
+            patch("zondarr.core.tasks._EXPIRY_RETRY_BASE_SECONDS", 0),
+        ):
+            _ = await manager.enforce_user_expiry(make_task_state(session_factory))
+
+        assert registry.client_session.call_count == 2
+        users = await _users(session_factory)
+        assert not any(u.enabled for n, u in users.items() if "expired" in n)
+        (run,) = await _sync_runs(session_factory)
+        assert run.status == "success"
+
+    @pytest.mark.asyncio
+    async def test_exhausted_retries_leave_users_enabled(
+        self, session_factory: async_sessionmaker[AsyncSession]
+    ) -> None:
+        _ = await _seed(session_factory)
+        client = AsyncMock()
+        client.set_user_enabled = AsyncMock(
+            side_effect=[True, *[ExternalServiceError("Jellyfin", "down")] * 2]
+        )
+        registry = mock_server_registry(client, capabilities=JELLYFIN_CAPABILITIES)
+        manager = make_task_manager(user_expiry_max_attempts=2)
+
+        with (
+            patch("zondarr.core.tasks.registry", registry),
+            patch("zondarr.core.tasks._EXPIRY_RETRY_BASE_SECONDS", 0),
+        ):
+            _ = await manager.enforce_user_expiry(make_task_state(session_factory))
+
+        users = await _users(session_factory)
+        assert sum(u.enabled for n, u in users.items() if "expired" in n) == 2
+        (run,) = await _sync_runs(session_factory)
+        assert run.status == "failed"
+        assert run.error_message is not None
+        assert run.error_message.startswith("2 of 3 expired users not processed")
+
+    @pytest.mark.asyncio
+    async def test_nothing_expired_touches_no_server(
+        self, session_factory: async_sessionmaker[AsyncSession]
+    ) -> None:
+        _ = await _seed(session_factory, expired=0)
+        registry = mock_server_registry(AsyncMock(), capabilities=JELLYFIN_CAPABILITIES)
+        manager = make_task_manager()
+
+        with patch("zondarr.core.tasks.registry", registry):
+            next_expiry, backlog = await manager.enforce_user_expiry(
+                make_task_state(session_factory)
+            )
+
+        registry.client_session.assert_not_called()
+        assert next_expiry is not None
+        assert not backlog
+        assert await _sync_runs(session_factory) == []
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("blocked_by", ["disabled", "circuit"])
+    async def test_unavailable_servers_do_not_fill_the_batch(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        blocked_by: str,
+    ) -> None:
+        # The blocked server's users expired first and would fill the batch
+        blocked = await _seed(
+            session_factory,
+            expired=2,
+            enabled=blocked_by != "disabled",
+            prefix="blocked-",
+            older_by=timedelta(days=1),
+        )
+        _ = await _seed(session_factory, expired=2)
+        client = AsyncMock()
+        client.set_user_enabled = AsyncMock(return_value=True)
+        registry = mock_server_registry(client, capabilities=JELLYFIN_CAPABILITIES)
+        registry.is_circuit_open = MagicMock(
+            side_effect=lambda server: (
+                blocked_by == "circuit" and server.id == blocked.id
+            )
+        )
+        manager = make_task_manager(user_expiry_batch_size=2)
+
+        with patch("zondarr.core.tasks.registry", registry):
+            _ = await manager.enforce_user_expiry(make_task_state(session_factory))
+
+        users = await _users(session_factory)
+        assert not users["expired0"].enabled
+        assert not users["expired1"].enabled
+        assert users["blocked-expired0"].enabled
+        assert users["blocked-expired1"].enabled
+
+    @pytest.mark.asyncio
+    async def test_failing_users_are_paged_past(
+        self, session_factory: async_sessionmaker[AsyncSession]
+    ) -> None:
+        server = await _seed(session_factory)
+        rejected = MediaClientError(
+            "rejected", operation="set_user_enabled", server_url=server.url
+        )
+        client = AsyncMock()
+        # Oldest first: expired2 and expired1 fail, expired0 succeeds
+        client.set_user_enabled = AsyncMock(side_effect=[rejected, rejected, True])
+        registry = mock_server_registry(client, capabilities=JELLYFIN_CAPABILITIES)
+        manager = make_task_manager(user_expiry_batch_size=2)
+        state = make_task_state(session_factory)
+
+        with patch("zondarr.core.tasks.registry", registry):
+            _, first_backlog = await manager.enforce_user_expiry(state)
+            _, second_backlog = await manager.enforce_user_expiry(state)
+
+        assert first_backlog
+        assert not second_backlog
+        users = await _users(session_factory)
+        assert not users["expired0"].enabled
+        assert users["expired1"].enabled
+        assert users["expired2"].enabled
+
+
+class TestUserExpiryScheduler:
+    """Tests for the deadline-driven user expiry task."""
+
+    @pytest.mark.asyncio
+    async def test_committed_user_expiry_wakes_task(
+        self, session_factory: async_sessionmaker[AsyncSession]
+    ) -> None:
+        server = await _seed(session_factory, expired=0)
+        client = AsyncMock()
+        client.set_user_enabled = AsyncMock(return_value=True)
+        registry = mock_server_registry(client, capabilities=JELLYFIN_CAPABILITIES)
+        manager = make_task_manager(expiration_check_interval_seconds=3600)
+        manager._running = True  # pyright: ignore[reportPrivateUsage]
+        # Each finished pass is queued so the test only touches the database
+        # while the task is waiting
+        passes = asyncio.Queue[None]()
+        enforce = manager._enforce_user_expiry  # pyright: ignore[reportPrivateUsage]
+
+        async def recorded(state: State, /) -> tuple[datetime | None, bool]:
+            try:
+                return await enforce(state)
+            finally:
+                passes.put_nowait(None)
+
+        with (
+            patch("zondarr.core.tasks.registry", registry),
+            patch.object(manager, "_enforce_user_expiry", recorded),
+        ):
+            task = asyncio.create_task(
+                manager._run_user_expiry_task(  # pyright: ignore[reportPrivateUsage]
+                    make_task_state(session_factory)
+                )
+            )
+            try:
+                # The first pass schedules a sleep until "active" expires
+                async with asyncio.timeout(5):
+                    await passes.get()
+
+                async with session_factory() as session:
+                    identity = Identity(display_name="redeemed", enabled=True)
+                    session.add(
+                        User(
+                            identity=identity,
+                            media_server_id=server.id,
+                            external_user_id="ext-redeemed",
+                            username="redeemed",
+                            expires_at=datetime.now(UTC) + timedelta(seconds=0.3),
+                            enabled=True,
+                        )
+                    )
+                    await session.commit()
+
+                async with asyncio.timeout(5):
+                    while (await _users(session_factory))["redeemed"].enabled:
+                        await passes.get()
+            finally:
+                _ = task.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await task
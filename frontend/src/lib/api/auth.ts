@@ -47,6 +47,7 @@ export interface AdminMeResponse {
 	email: string | null;
 	auth_method: string;
 	totp_enabled: boolean;
+	backup_codes_need_regeneration?: boolean;
 	onboarding_required: boolean;
 	onboarding_step: OnboardingStep;
 }
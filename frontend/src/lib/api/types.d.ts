@@ -1102,6 +1102,7 @@ export interface components {
 			page: number;
 			page_size: number;
 			has_next: boolean;
+			next_cursor?: string | null;
 		};
 		/** InvitationResponse */
 		InvitationResponse: {
@@ -1181,6 +1182,7 @@ export interface components {
 			sync_status: components['schemas']['ServerSyncStatusResponse'];
 			updated_at?: string | null;
 			supported_permissions?: string[] | null;
+			circuit?: components['schemas']['ServerCircuitResponse'] | null;
 		};
 		/** MediaServerResponse */
 		MediaServerResponse: {
@@ -1208,6 +1210,7 @@ export interface components {
 			libraries: components['schemas']['LibraryResponse'][];
 			updated_at?: string | null;
 			supported_permissions?: string[] | null;
+			circuit?: components['schemas']['ServerCircuitResponse'] | null;
 		};
 		/** OAuthCheckResponse */
 		OAuthCheckResponse: {
@@ -1341,6 +1344,14 @@ export interface components {
 		RefreshRequest: {
 			refresh_token: string;
 		};
+		/** ServerCircuitResponse */
+		ServerCircuitResponse: {
+			state: string;
+			/** @default 0 */
+			consecutive_failures: number;
+			retry_at?: string | null;
+			last_error?: string | null;
+		};
 		/** ServerSyncStatusResponse */
 		ServerSyncStatusResponse: {
 			libraries: components['schemas']['SyncChannelStatusResponse'];
@@ -1461,6 +1472,7 @@ export interface components {
 			page: number;
 			page_size: number;
 			has_next: boolean;
+			next_cursor?: string | null;
 		};
 		/** UserResponse */
 		UserResponse: {
@@ -1950,6 +1962,8 @@ export interface operations {
 				sort_by?: string;
 				/** @description Sort order (asc, desc) */
 				sort_order?: string;
+				/** @description Opaque next_cursor from a previous page. When set, page is ignored and the page is fetched by keyset */
+				cursor?: string | null;
 			};
 			header?: never;
 			path?: never;
@@ -3054,6 +3068,8 @@ export interface operations {
 				sort_by?: string;
 				/** @description Sort order (asc, desc) */
 				sort_order?: string;
+				/** @description Opaque next_cursor from a previous page. When set, page is ignored and the page is fetched by keyset */
+				cursor?: string | null;
 			};
 			header?: never;
 			path?: never;
@@ -43,6 +43,7 @@ let _connected = $state(false);
 let _loading = $state(false);
 let _error = $state<string | null>(null);
 let _lastSeq = 0;
+let _lastMarkerSeq = 0;
 
 let _eventSource: EventSource | null = null;
 let _pending: LogEntry[] = [];
@@ -71,6 +72,50 @@ function flushPending(): void {
 	}
 }
 
+function receiveEntry(entry: LogEntry): void {
+	// Detect seq regression: if the backend restarts, its seq counter
+	// resets to 0 while _lastSeq stays high. A large backward jump
+	// (>50%) indicates a restart rather than normal backfill overlap.
+	if (_lastSeq > 0 && entry.seq < _lastSeq && entry.seq < _lastSeq / 2) {
+		_lastSeq = 0;
+		_entries = [];
+		_pending = [];
+	}
+
+	// Deduplicate by seq on reconnect
+	if (entry.seq <= _lastSeq) return;
+	_lastSeq = entry.seq;
+
+	_pending.push(entry);
+	// Cap pending buffer to prevent unbounded growth when tab is backgrounded
+	if (_pending.length > MAX_ENTRIES) {
+		_pending = _pending.slice(-MAX_ENTRIES);
+	}
+}
+
+/**
+ * Insert a row marking where the server skipped lines for this client.
+ *
+ * The marker sits between the last received entry and the next one. Its
+ * fractional seq never collides with a real entry or an earlier marker,
+ * and leaves `_lastSeq` (used for dedup) untouched.
+ */
+function receiveDroppedMarker(dropped: number): void {
+	const seq =
+		_lastMarkerSeq > _lastSeq && _lastMarkerSeq < _lastSeq + 1
+			? (_lastMarkerSeq + _lastSeq + 1) / 2
+			: _lastSeq + 0.5;
+	_lastMarkerSeq = seq;
+	_pending.push({
+		seq,
+		timestamp: new Date().toISOString(),
+		level: 'WARNING',
+		logger_name: 'zondarr.api.logs',
+		message: `${dropped} log lines were skipped because the stream fell behind.`,
+		fields: {}
+	});
+}
+
 // =============================================================================
 // API
 // =============================================================================
@@ -101,33 +146,34 @@ export function connect(): void {
 	// Fallback flush for when RAF is paused (backgrounded tab)
 	_flushTimer = setInterval(flushPending, 2000);
 
-	es.addEventListener('log', (event: MessageEvent<string>) => {
+	es.addEventListener('logs', (event: MessageEvent<string>) => {
+		let batch: LogEntry[];
+		try {
+			batch = JSON.parse(event.data) as LogEntry[];
+		} catch {
+			// Ignore malformed events
+			return;
+		}
+		for (const entry of batch) {
+			receiveEntry(entry);
+		}
+		if (_rafId === null && _pending.length > 0) {
+			_rafId = requestAnimationFrame(flushPending);
+		}
+	});
+
+	// The server skipped lines because this client fell behind
+	es.addEventListener('dropped', (event: MessageEvent<string>) => {
+		let dropped: number;
 		try {
-			const entry = JSON.parse(event.data) as LogEntry;
-
-			// Detect seq regression: if the backend restarts, its seq counter
-			// resets to 0 while _lastSeq stays high. A large backward jump
-			// (>50%) indicates a restart rather than normal backfill overlap.
-			if (_lastSeq > 0 && entry.seq < _lastSeq && entry.seq < _lastSeq / 2) {
-				_lastSeq = 0;
-				_entries = [];
-				_pending = [];
-			}
-
-			// Deduplicate by seq on reconnect
-			if (entry.seq <= _lastSeq) return;
-			_lastSeq = entry.seq;
-
-			_pending.push(entry);
-			// Cap pending buffer to prevent unbounded growth when tab is backgrounded
-			if (_pending.length > MAX_ENTRIES) {
-				_pending = _pending.slice(-MAX_ENTRIES);
-			}
-			if (_rafId === null) {
-				_rafId = requestAnimationFrame(flushPending);
-			}
+			({ dropped } = JSON.parse(event.data) as { dropped: number });
 		} catch {
 			// Ignore malformed events
+			return;
+		}
+		receiveDroppedMarker(dropped);
+		if (_rafId === null) {
+			_rafId = requestAnimationFrame(flushPending);
 		}
 	});
 